@@ -0,0 +1,553 @@
+"""
+Ruth AI Runtime - Offline Model Benchmark
+
+Reproducible in-process benchmark for every model plugin under ai/models.
+No server, no network: each plugin is discovered and loaded through the
+same DiscoveryScanner / ModelLoader / SandboxManager path the runtime
+uses, then driven with JPEG frames at realistic resolutions.
+
+Measured per model, resolution, concurrency and batch size:
+- decode, preprocess, inference, postprocess and end-to-end latency
+  percentiles (p50/p90/p99, mean, max) in milliseconds
+- throughput (frames/second)
+- whether the model answered in stub mode (no weights deployed), in which
+  case its numbers do not reflect real inference
+
+Results are written as JSON and can be compared against a stored baseline;
+the process exits non-zero when a regression exceeds the tolerance.
+
+Design Principles:
+- Deterministic inputs (seeded synthetic scenes or bundled frames)
+- Same code path as production (server decode + sandbox execution)
+- CPU by default (GPUs hidden unless --device is given), so numbers are
+  comparable across machines of a class
+- Batch sizes > 1 only for models whose contract declares batch input
+
+Usage:
+    python -m ai.benchmark --output bench.json
+    python -m ai.benchmark --models fall_detection --concurrency 1 4
+    python -m ai.benchmark --baseline baseline.json --tolerance 0.15
+    python -m ai.benchmark --device cuda
+"""
+
+import argparse
+import base64
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from ai.runtime.discovery import DiscoveryScanner
+from ai.runtime.loader import ModelLoader
+from ai.runtime.models import InputType, LoadState, ModelVersionDescriptor
+from ai.runtime.sandbox import SandboxManager
+from ai.server.routes.inference import _decode_frame
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SCHEMA_VERSION = "1.0"
+
+DEFAULT_RESOLUTIONS = ((1280, 720), (1920, 1080))
+DEFAULT_CONCURRENCY = (1, 2, 4)
+DEFAULT_BATCH_SIZES = (1,)
+DEFAULT_WARMUP = 3
+DEFAULT_REQUESTS = 30
+DEFAULT_TOLERANCE = 0.15
+
+STAGES = ("decode", "preprocess", "inference", "postprocess", "end_to_end")
+
+# Compared against the baseline: (stage, statistic) where higher is worse
+REGRESSION_LATENCY_METRICS = (("end_to_end", "p50"), ("end_to_end", "p99"), ("inference", "p50"))
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+@dataclass
+class LatencyStats:
+    """Latency distribution for one stage, in milliseconds."""
+
+    p50: float
+    p90: float
+    p99: float
+    mean: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float]) -> "LatencyStats":
+        if not samples:
+            return cls(0.0, 0.0, 0.0, 0.0, 0.0)
+        values = np.asarray(samples, dtype=np.float64)
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        return cls(
+            p50=round(float(p50), 3),
+            p90=round(float(p90), 3),
+            p99=round(float(p99), 3),
+            mean=round(float(values.mean()), 3),
+            max=round(float(values.max()), 3),
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        return {"p50": self.p50, "p90": self.p90, "p99": self.p99, "mean": self.mean, "max": self.max}
+
+
+@dataclass
+class ScenarioResult:
+    """Result of one (resolution, concurrency, batch size) run."""
+
+    resolution: str
+    concurrency: int
+    batch_size: int
+    requests: int
+    errors: int
+    throughput_fps: float
+    stages: dict[str, LatencyStats] = field(default_factory=dict)
+    first_error: Optional[str] = None
+    stub_responses: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.resolution}/c{self.concurrency}/b{self.batch_size}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "resolution": self.resolution,
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_fps": self.throughput_fps,
+            "stages_ms": {name: stats.to_dict() for name, stats in self.stages.items()},
+            "first_error": self.first_error,
+            "stub_responses": self.stub_responses,
+        }
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline by more than the tolerance."""
+
+    model: str
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "scenario": self.scenario,
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "current": self.current,
+            "change_percent": round(self.change * 100, 1),
+        }
+
+
+# =============================================================================
+# FRAMES
+# =============================================================================
+
+
+def synthetic_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """
+    Build a deterministic BGR scene: gradient background, solid shapes and
+    mild sensor noise. Compresses like a camera frame, unlike pure noise.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = (x * 0.6 + y * 0.2).astype(np.uint8)
+    frame[..., 1] = (y * 0.7).astype(np.uint8)
+    frame[..., 2] = (255 - x * 0.5).astype(np.uint8)
+
+    for _ in range(12):
+        x1, y1 = int(rng.integers(0, width)), int(rng.integers(0, height))
+        x2 = min(width - 1, x1 + int(rng.integers(width // 20 + 1, width // 4 + 2)))
+        y2 = min(height - 1, y1 + int(rng.integers(height // 20 + 1, height // 3 + 2)))
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness=-1)
+
+    noise = rng.normal(0, 4, frame.shape)
+    return np.clip(frame + noise, 0, 255).astype(np.uint8)
+
+
+def encode_jpeg(frame: np.ndarray, quality: int = 85) -> bytes:
+    """Encode a BGR frame as JPEG, like the VAS frame tap does."""
+    ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Failed to encode benchmark frame")
+    return buffer.tobytes()
+
+
+def load_frames(
+    resolutions: Sequence[tuple[int, int]],
+    frames_dir: Optional[Path] = None,
+) -> dict[str, list[str]]:
+    """
+    Prepare base64 JPEG frames per resolution.
+
+    Bundled frames (any image in frames_dir) are resized to each resolution;
+    otherwise a few seeded synthetic scenes are generated.
+    """
+    sources: list[np.ndarray] = []
+    if frames_dir is not None:
+        for path in sorted(frames_dir.iterdir()):
+            image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if image is not None:
+                sources.append(image)
+        if not sources:
+            raise ValueError(f"No readable images in {frames_dir}")
+
+    frames: dict[str, list[str]] = {}
+    for width, height in resolutions:
+        if sources:
+            images = [cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA) for image in sources]
+        else:
+            images = [synthetic_frame(width, height, seed) for seed in range(4)]
+        frames[f"{width}x{height}"] = [
+            base64.b64encode(encode_jpeg(image)).decode("ascii") for image in images
+        ]
+    return frames
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+class ModelBenchmark:
+    """
+    Loads model plugins in-process and measures them.
+
+    Usage:
+        bench = ModelBenchmark(Path("ai/models"))
+        report = bench.run(model_ids=["fall_detection"])
+    """
+
+    def __init__(
+        self,
+        models_root: Path,
+        resolutions: Sequence[tuple[int, int]] = DEFAULT_RESOLUTIONS,
+        concurrency: Sequence[int] = DEFAULT_CONCURRENCY,
+        batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+        warmup: int = DEFAULT_WARMUP,
+        requests: int = DEFAULT_REQUESTS,
+        frames_dir: Optional[Path] = None,
+        device: str = "cpu",
+    ):
+        self.models_root = Path(models_root)
+        self.resolutions = tuple(resolutions)
+        self.concurrency = tuple(concurrency)
+        self.batch_sizes = tuple(batch_sizes)
+        self.warmup = warmup
+        self.requests = requests
+        self.frames_dir = frames_dir
+        self.device = device
+
+        self.loader = ModelLoader(warmup_enabled=False)
+        self.sandbox_manager = SandboxManager()
+
+    def run(self, model_ids: Optional[Sequence[str]] = None) -> dict[str, Any]:
+        """Benchmark every valid model version (or only model_ids) and return the report."""
+        frames = load_frames(self.resolutions, self.frames_dir)
+        discovery = DiscoveryScanner(self.models_root).scan()
+
+        models: dict[str, Any] = {}
+        try:
+            for descriptor in discovery.discovered_versions:
+                if model_ids and descriptor.model_id not in model_ids:
+                    continue
+                if descriptor.state == LoadState.INVALID:
+                    continue
+                models[descriptor.qualified_id] = self._benchmark_model(descriptor, frames)
+        finally:
+            self.sandbox_manager.shutdown_all()
+
+        return {
+            "schema_version": BENCHMARK_SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "environment": _environment(),
+            "config": {
+                "resolutions": [f"{w}x{h}" for w, h in self.resolutions],
+                "concurrency": list(self.concurrency),
+                "batch_sizes": list(self.batch_sizes),
+                "warmup": self.warmup,
+                "requests": self.requests,
+                "frames": "bundled" if self.frames_dir else "synthetic",
+                "device": self.device,
+            },
+            "models": models,
+            "stub_models": sorted(m for m, r in models.items() if r.get("stub_mode")),
+        }
+
+    def _benchmark_model(
+        self, descriptor: ModelVersionDescriptor, frames: dict[str, list[str]]
+    ) -> dict[str, Any]:
+        logger.info("Benchmarking %s", descriptor.qualified_id)
+        load_result = self.loader.load(descriptor)
+        if not load_result.success:
+            return {"error": str(load_result.error)}
+
+        self.sandbox_manager.create_sandbox(load_result.loaded_model, descriptor)
+        scenarios: list[dict[str, Any]] = []
+        skipped: list[str] = []
+        try:
+            for resolution, encoded in frames.items():
+                for batch_size in self.batch_sizes:
+                    if batch_size > 1 and not _accepts_batch(descriptor, batch_size):
+                        skipped.append(f"{resolution}/b{batch_size}: model does not accept batch input")
+                        continue
+                    for concurrency in self.concurrency:
+                        result = self._run_scenario(
+                            descriptor, resolution, encoded, concurrency, batch_size
+                        )
+                        scenarios.append(result.to_dict())
+        finally:
+            self.sandbox_manager.remove_sandbox(descriptor.model_id, descriptor.version)
+            self.loader.unload(descriptor.model_id, descriptor.version)
+
+        return {
+            "load_time_ms": load_result.load_time_ms,
+            "device": load_result.loaded_model.device,
+            "stub_mode": any(s["stub_responses"] for s in scenarios),
+            "scenarios": scenarios,
+            "skipped": skipped,
+        }
+
+    def _run_scenario(
+        self,
+        descriptor: ModelVersionDescriptor,
+        resolution: str,
+        encoded: list[str],
+        concurrency: int,
+        batch_size: int,
+    ) -> ScenarioResult:
+        max_side = descriptor.input_spec.decode_max_side
+
+        def one_request(index: int) -> dict[str, Any]:
+            started = time.perf_counter()
+            batch = [encoded[(index + i) % len(encoded)] for i in range(batch_size)]
+            decoded = [_decode_frame(data, "jpeg", max_side)[0] for data in batch]
+            decode_ms = (time.perf_counter() - started) * 1000
+
+            result = self.sandbox_manager.execute(
+                model_id=descriptor.model_id,
+                version=descriptor.version,
+                frame=decoded if batch_size > 1 else decoded[0],
+                request_id=f"bench-{index}",
+            )
+            return {
+                "success": result.success,
+                "error": str(result.error) if result.error else None,
+                "decode": decode_ms,
+                "preprocess": result.preprocess_ms,
+                "inference": result.inference_ms,
+                "postprocess": result.postprocess_ms,
+                "end_to_end": (time.perf_counter() - started) * 1000,
+                "stub": _is_stub_output(result.output),
+            }
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+            list(pool.map(one_request, range(self.warmup)))
+
+            wall_started = time.perf_counter()
+            samples = list(pool.map(one_request, range(self.requests)))
+            wall_seconds = time.perf_counter() - wall_started
+
+        succeeded = [s for s in samples if s["success"]]
+        errors = [s for s in samples if not s["success"]]
+        return ScenarioResult(
+            resolution=resolution,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            requests=len(samples),
+            errors=len(errors),
+            throughput_fps=round(len(succeeded) * batch_size / wall_seconds, 2) if wall_seconds else 0.0,
+            stages={
+                stage: LatencyStats.from_samples([s[stage] for s in succeeded]) for stage in STAGES
+            },
+            first_error=errors[0]["error"] if errors else None,
+            stub_responses=sum(1 for s in succeeded if s["stub"]),
+        )
+
+
+def _accepts_batch(descriptor: ModelVersionDescriptor, batch_size: int) -> bool:
+    spec = descriptor.input_spec
+    if spec.type != InputType.BATCH:
+        return False
+    if spec.batch_min_size is not None and batch_size < spec.batch_min_size:
+        return False
+    return spec.batch_max_size is None or batch_size <= spec.batch_max_size
+
+
+def _is_stub_output(output: Optional[dict[str, Any]]) -> bool:
+    """Plugins without weights answer with metadata.mode == "stub"."""
+    if not isinstance(output, dict):
+        return False
+    metadata = output.get("metadata")
+    return isinstance(metadata, dict) and metadata.get("mode") == "stub"
+
+
+def _select_device(device: str) -> None:
+    """
+    Hide GPUs for CPU runs. Must run before any plugin imports torch, since
+    CUDA reads CUDA_VISIBLE_DEVICES once when it initializes.
+    """
+    if device != "cpu":
+        return
+    if "torch" in sys.modules:
+        logger.warning("torch was imported before device selection; GPUs may still be visible")
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+
+def _environment() -> dict[str, Any]:
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "cuda_visible_devices": os.environ.get("CUDA_VISIBLE_DEVICES"),
+    }
+    try:
+        import torch
+
+        environment["torch"] = torch.__version__
+        environment["torch_threads"] = torch.get_num_threads()
+    except ImportError:
+        pass
+    return environment
+
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Regression]:
+    """
+    Compare a report against a baseline report.
+
+    A regression is a latency metric more than `tolerance` above the
+    baseline, or throughput more than `tolerance` below it. Scenarios
+    missing from either report are ignored.
+    """
+    regressions: list[Regression] = []
+    for model, model_report in current.get("models", {}).items():
+        baseline_scenarios = {
+            s["key"]: s for s in baseline.get("models", {}).get(model, {}).get("scenarios", [])
+        }
+        for scenario in model_report.get("scenarios", []):
+            reference = baseline_scenarios.get(scenario["key"])
+            if reference is None:
+                continue
+
+            for stage, statistic in REGRESSION_LATENCY_METRICS:
+                before = reference["stages_ms"][stage][statistic]
+                after = scenario["stages_ms"][stage][statistic]
+                if before > 0 and after > before * (1 + tolerance):
+                    regressions.append(
+                        Regression(model, scenario["key"], f"{stage}.{statistic}_ms", before, after)
+                    )
+
+            before = reference["throughput_fps"]
+            after = scenario["throughput_fps"]
+            if before > 0 and after < before * (1 - tolerance):
+                regressions.append(Regression(model, scenario["key"], "throughput_fps", before, after))
+
+    return regressions
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def _parse_resolution(value: str) -> tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark; returns 1 if regressions were found."""
+    parser = argparse.ArgumentParser(description="Offline benchmark for Ruth AI model plugins")
+    parser.add_argument("--models-root", type=Path, default=Path(__file__).parent / "models")
+    parser.add_argument("--models", nargs="*", help="Model IDs to benchmark (default: all)")
+    parser.add_argument("--resolutions", nargs="*", type=_parse_resolution, default=DEFAULT_RESOLUTIONS)
+    parser.add_argument("--concurrency", nargs="*", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--batch-sizes", nargs="*", type=int, default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--frames-dir", type=Path, help="Directory of bundled frames (default: synthetic)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--device", default="cpu", help="cpu (default, GPUs hidden) or e.g. cuda to let plugins use GPUs"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    _select_device(args.device)
+
+    bench = ModelBenchmark(
+        models_root=args.models_root,
+        resolutions=args.resolutions,
+        concurrency=args.concurrency,
+        batch_sizes=args.batch_sizes,
+        warmup=args.warmup,
+        requests=args.requests,
+        frames_dir=args.frames_dir,
+        device=args.device,
+    )
+    report = bench.run(model_ids=args.models)
+    for model in report["stub_models"]:
+        logger.warning("%s ran in stub mode (no weights); its numbers are not real inference", model)
+
+    regressions: list[Regression] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        report["regressions"] = [r.to_dict() for r in regressions]
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    for regression in regressions:
+        logger.warning(
+            "Regression %s %s %s: %.2f -> %.2f (%+.1f%%)",
+            regression.model, regression.scenario, regression.metric,
+            regression.baseline, regression.current, regression.change * 100,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,12 +20,15 @@ _loaded_model = None
 _weights_available = False
 
 
-def infer(frame: np.ndarray, **kwargs) -> Dict[str, Any]:
+def infer(frame: np.ndarray, model: Any = None, **kwargs) -> Dict[str, Any]:
     """
     Run fall detection inference.
 
     Args:
         frame: Raw BGR frame as numpy array (H, W, 3)
+        model: Model instance from loader.py, as optimized by the runtime
+            (eager, fp16 or ONNX Runtime). Without it the model is loaded
+            lazily here, or stub output is returned if weights are missing.
 
     Returns:
         Detection results matching the model.yaml output schema
@@ -42,6 +45,11 @@ def infer(frame: np.ndarray, **kwargs) -> Dict[str, Any]:
     if not isinstance(frame, np.ndarray):
         raise ValueError(f"Frame must be numpy array, got {type(frame)}")
 
+    # The runtime's instance is authoritative. Errors propagate so a broken
+    # optimized model fails visibly instead of answering with stub output.
+    if model is not None:
+        return _run_inference_with_model(frame, model)
+
     # Try to load model on first inference
     if _loaded_model is None and not _weights_available:
         try:
@@ -155,12 +163,12 @@ def _run_inference_with_model(frame: np.ndarray, model) -> Dict[str, Any]:
     # from the weights rather than a global keeps CPU fallback working
     # untouched. Postprocessing is device-safe: output_to_keypoint already
     # does .cpu().numpy() on both boxes and keypoints.
-    model_device = next(model.parameters()).device
-    img_tensor = img_tensor.to(model_device)
+    model_device, model_dtype = _input_placement(model)
+    img_tensor = img_tensor.to(device=model_device, dtype=model_dtype)
 
-    # Inference
+    # Inference. NMS runs in fp32 whatever precision the model used.
     with torch.no_grad():
-        predictions = model(img_tensor)[0]
+        predictions = model(img_tensor)[0].float()
 
     # Post-process
     output = non_max_suppression_kpt(
@@ -235,6 +243,25 @@ def _run_inference_with_model(frame: np.ndarray, model) -> Dict[str, Any]:
     }
 
 
+def _input_placement(model) -> Tuple[Any, Any]:
+    """
+    Device and dtype the model expects its input tensor on.
+
+    Eager and TorchScript modules report it through their weights, which
+    the runtime's optimizer may have cast to fp16. The ONNX Runtime wrapper
+    has no parameters; it takes CPU tensors and casts to the dtype of its
+    graph itself.
+    """
+    import torch
+
+    parameters = getattr(model, "parameters", None)
+    if callable(parameters):
+        first = next(iter(parameters()), None)
+        if first is not None:
+            return first.device, first.dtype
+    return torch.device("cpu"), torch.float32
+
+
 def _analyze_pose_for_fall(keypoints: List[Dict]) -> Tuple[bool, float, Optional[str]]:
     """
     Analyze pose keypoints to detect falls.
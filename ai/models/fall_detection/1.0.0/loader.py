@@ -26,7 +26,8 @@ def load(weights_path: Path, device: str = "cpu") -> Any:
             call when `device` is absent).
 
     Returns:
-        Loaded model instance ready for inference
+        Loaded model instance ready for inference, or None when the weights
+        are not deployed (inference.py then answers in stub mode)
     """
     # Add lib directory to path for model imports
     model_dir = weights_path.parent
@@ -35,14 +36,17 @@ def load(weights_path: Path, device: str = "cpu") -> Any:
     if str(lib_dir) not in sys.path:
         sys.path.insert(0, str(lib_dir))
 
-    # Import after adding to path
-    from models.experimental import attempt_load
-
     # Find the weights file
     weights_file = weights_path / "yolov7-w6-pose.pt"
 
     if not weights_file.exists():
-        raise FileNotFoundError(f"Model weights not found: {weights_file}")
+        # Keep the model servable without weights, as before the loader
+        # was declared: infer() without a model falls back to stub mode
+        logger.warning(f"Model weights not found: {weights_file}; using stub mode")
+        return None
+
+    # Import after adding to path
+    from models.experimental import attempt_load
 
     logger.info(f"Loading YOLOv7-Pose model from {weights_file} on {device}")
 
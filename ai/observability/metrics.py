@@ -13,8 +13,10 @@ Metrics Exposed:
 - gpu_memory_used_bytes: Gauge of GPU memory usage per device
 - gpu_memory_total_bytes: Gauge of total GPU memory per device
 - gpu_utilization_percent: Gauge of GPU compute utilization per device
+- gpu_power_watts: Gauge of GPU power draw per device
 - concurrent_requests_active: Gauge of currently executing requests
 - frame_decode_duration_seconds: Histogram of frame decoding latencies
+- inference_stage_duration_seconds: Histogram of per-stage latencies by model and stage
 
 Usage:
     from ai.observability.metrics import record_inference, record_inference_latency
@@ -68,6 +70,14 @@ inference_queue_size = Gauge(
     registry=metrics_registry,
 )
 
+inference_stage_duration_seconds = Histogram(
+    name="inference_stage_duration_seconds",
+    documentation="Inference request stage duration in seconds",
+    labelnames=["model_id", "stage"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    registry=metrics_registry,
+)
+
 concurrent_requests_active = Gauge(
     name="concurrent_requests_active",
     documentation="Number of currently executing inference requests",
@@ -145,6 +155,13 @@ gpu_temperature_celsius = Gauge(
     registry=metrics_registry,
 )
 
+gpu_power_watts = Gauge(
+    name="gpu_power_watts",
+    documentation="GPU power draw in watts",
+    labelnames=["device"],
+    registry=metrics_registry,
+)
+
 # =============================================================================
 # FRAME PROCESSING METRICS
 # =============================================================================
@@ -190,6 +207,25 @@ def record_inference_latency(model_id: str, duration_seconds: float) -> None:
     inference_duration_seconds.labels(model_id=model_id).observe(duration_seconds)
 
 
+def record_inference_stages(model_id: str, timing_ms: dict) -> None:
+    """
+    Record per-stage inference latencies.
+
+    Args:
+        model_id: Model identifier
+        timing_ms: Stage durations in milliseconds, keyed "<stage>_ms"
+            (e.g. {"decode_ms": 4.1, "inference_ms": 80.2}). "total_ms"
+            is skipped; it is recorded by record_inference_latency.
+    """
+    for key, value in timing_ms.items():
+        if key == "total_ms" or value is None:
+            continue
+        stage = key[:-3] if key.endswith("_ms") else key
+        inference_stage_duration_seconds.labels(model_id=model_id, stage=stage).observe(
+            value / 1000.0
+        )
+
+
 def record_frame_decode_latency(duration_seconds: float) -> None:
     """
     Record frame decode latency.
@@ -295,6 +331,7 @@ def update_gpu_metrics(device_id: int, stats: dict) -> None:
             - reserved_memory_mb: Reserved memory in MB
             - utilization_percent: GPU utilization (0-100)
             - temperature_c: Temperature in Celsius
+            - power_w: Power draw in watts
     """
     device_label = str(device_id)
 
@@ -326,6 +363,10 @@ def update_gpu_metrics(device_id: int, stats: dict) -> None:
             stats["temperature_c"]
         )
 
+    # Power
+    if stats.get("power_w") is not None:
+        gpu_power_watts.labels(device=device_label).set(stats["power_w"])
+
 
 def clear_model_metrics(model_id: str, version: str) -> None:
     """
@@ -0,0 +1,174 @@
+"""
+Ruth AI Unified Runtime - On-Demand Profiling
+
+Stack sampling, cProfile capture, asyncio task dumps and executor queue
+state for the /debug endpoints.
+
+Design Principles:
+- Zero cost when idle: no thread, hook or timer exists until a profile is requested
+- One profile at a time: a second request fails fast instead of stacking samplers
+- Sampling runs on its own thread so the event loop it observes keeps serving
+- Collapsed-stack output feeds flamegraph.pl, speedscope and inferno unchanged
+"""
+
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+# Only one profile may run per process
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another is running."""
+
+
+# =============================================================================
+# STACK SAMPLING
+# =============================================================================
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename.replace(os.sep, "/").rsplit("/", 2)
+    return f"{code.co_name} ({'/'.join(path[-2:])}:{frame.f_lineno})"
+
+
+def _collapse(thread_name: str, frame: Optional[FrameType]) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(duration_s: float, interval_s: float = 0.01) -> Dict[str, Any]:
+    """
+    Sample every thread's stack for duration_s seconds.
+
+    Blocking; call it from a worker thread (asyncio.to_thread) so the event
+    loop being profiled keeps running.
+
+    Returns:
+        {"stacks": {collapsed_stack: count}, "samples": n, "duration_s": s}
+
+    Raises:
+        ProfilerBusyError: Another profile is already running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        started = time.monotonic()
+        deadline = started + duration_s
+
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stacks[_collapse(names.get(ident, f"thread-{ident}"), frame)] += 1
+            samples += 1
+            time.sleep(interval_s)
+
+        return {
+            "stacks": dict(stacks),
+            "samples": samples,
+            "duration_s": round(time.monotonic() - started, 3),
+        }
+    finally:
+        _profile_lock.release()
+
+
+def format_collapsed(stacks: Dict[str, int]) -> str:
+    """Render {stack: count} as collapsed-stack lines, heaviest first."""
+    ordered = sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+    return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+# =============================================================================
+# CPROFILE
+# =============================================================================
+
+
+async def profile_event_loop(
+    duration_s: float,
+    sort_by: str = "cumulative",
+    limit: int = 50,
+) -> str:
+    """
+    Deterministically profile the event loop thread for duration_s seconds.
+
+    cProfile hooks only the thread it is enabled on, so this captures every
+    coroutine step and callback the loop runs while the caller sleeps. Work
+    offloaded to executor threads is not included; use sample_stacks for that.
+
+    Returns:
+        pstats report text
+
+    Raises:
+        ProfilerBusyError: Another profile is already running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(duration_s)
+        finally:
+            profiler.disable()
+    finally:
+        _profile_lock.release()
+
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort_by).print_stats(limit)
+    return out.getvalue()
+
+
+# =============================================================================
+# TASKS AND EXECUTORS
+# =============================================================================
+
+
+def dump_asyncio_tasks(max_frames: int = 10) -> List[Dict[str, Any]]:
+    """Describe every pending task on the running loop with its suspended stack."""
+    tasks = []
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        tasks.append({
+            "name": task.get_name(),
+            "coro": getattr(coro, "__qualname__", repr(coro)),
+            "done": task.done(),
+            "stack": [_frame_label(frame) for frame in task.get_stack(limit=max_frames)],
+        })
+    return sorted(tasks, key=lambda t: t["name"])
+
+
+def thread_pool_state(executor: Optional[ThreadPoolExecutor]) -> Optional[Dict[str, Any]]:
+    """Queue depth and worker count of a ThreadPoolExecutor (None if absent)."""
+    if executor is None:
+        return None
+    return {
+        "max_workers": executor._max_workers,
+        "threads": len(executor._threads),
+        "queued": executor._work_queue.qsize(),
+    }
+
+
+def default_executor_state() -> Optional[Dict[str, Any]]:
+    """State of the running loop's default executor (asyncio.to_thread, run_in_executor)."""
+    loop = asyncio.get_running_loop()
+    return thread_pool_state(getattr(loop, "_default_executor", None))
@@ -58,6 +58,7 @@ from ai.runtime.models import (
     OutputSpecification,
     OutputField,
     EntryPoints,
+    OptimizationSpec,
     is_valid_model_id,
     is_valid_version,
 )
@@ -88,6 +89,26 @@ from ai.runtime.loader import (
     LoadedModel,
     LoadResult,
 )
+from ai.runtime.optimizer import (
+    ModelOptimizer,
+    OptimizationResult,
+    OnnxRuntimeModule,
+)
+from ai.runtime.startup import (
+    ParallelModelLoader,
+    ModelLoadOutcome,
+    StartupLoadReport,
+)
+from ai.runtime.residency import (
+    ModelResidencyManager,
+    ResidentModel,
+)
+from ai.runtime.hotswap import (
+    HotSwapManager,
+    TrafficRouter,
+    ShadowConfig,
+    SwapResult,
+)
 from ai.runtime.discovery import (
     DiscoveryScanner,
     DiscoveryResult,
@@ -142,6 +163,8 @@ from ai.runtime.reporting import (
     VersionCapability,
     ModelCapabilityReport,
     RuntimeCapacityReport,
+    CapacitySignal,
+    CAPACITY_HEADER,
     FullCapabilityReport,
     ModelStatus,
     PublishTrigger,
@@ -188,6 +211,7 @@ __all__ = [
     "OutputSpecification",
     "OutputField",
     "EntryPoints",
+    "OptimizationSpec",
     # Data models - Validation helpers
     "is_valid_model_id",
     "is_valid_version",
@@ -216,6 +240,22 @@ __all__ = [
     "ModelLoader",
     "LoadedModel",
     "LoadResult",
+    # Optimizer - Load-time compiled variants
+    "ModelOptimizer",
+    "OptimizationResult",
+    "OnnxRuntimeModule",
+    # Startup - Parallel model loading
+    "ParallelModelLoader",
+    "ModelLoadOutcome",
+    "StartupLoadReport",
+    # Residency - Lazy loading with LRU eviction
+    "ModelResidencyManager",
+    "ResidentModel",
+    # Hot-swap - Blue/green version swaps
+    "HotSwapManager",
+    "TrafficRouter",
+    "ShadowConfig",
+    "SwapResult",
     # Discovery
     "DiscoveryScanner",
     "DiscoveryResult",
@@ -265,6 +305,8 @@ __all__ = [
     "VersionCapability",
     "ModelCapabilityReport",
     "RuntimeCapacityReport",
+    "CapacitySignal",
+    "CAPACITY_HEADER",
     "FullCapabilityReport",
     "ModelStatus",
     "PublishTrigger",
@@ -20,10 +20,12 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from ai.runtime.errors import (
     DiscoveryError,
@@ -156,7 +158,7 @@ class DiscoveryScanner:
             return result
 
         # Scan for models
-        for model_path in self._iter_model_dirs():
+        for model_path in self.iter_model_dirs():
             model_id = model_path.name
 
             # Validate model_id
@@ -183,7 +185,7 @@ class DiscoveryScanner:
 
             # Scan for versions
             versions_found = False
-            for version_path in self._iter_version_dirs(model_path):
+            for version_path in self.iter_version_dirs(model_path):
                 version = version_path.name
 
                 # Validate version format
@@ -205,57 +207,13 @@ class DiscoveryScanner:
                 result.versions_found += 1
                 versions_found = True
 
-                # Validate contract
-                validation = self.validator.validate(
-                    version_path=version_path,
-                    expected_model_id=model_id,
-                    expected_version=version,
-                )
-
-                if validation.is_valid:
-                    descriptor = validation.descriptor
-                    if descriptor:
-                        model.add_version(descriptor)
-                        result.discovered_versions.append(descriptor)
-                        result.versions_valid += 1
-
-                        logger.info(
-                            "Version discovered and validated",
-                            extra={
-                                "model_id": model_id,
-                                "version": version,
-                                "display_name": descriptor.display_name,
-                            },
-                        )
-                else:
-                    # Create descriptor in INVALID state
-                    descriptor = ModelVersionDescriptor(
-                        model_id=model_id,
-                        version=version,
-                        display_name=f"{model_id} (invalid)",
-                        directory_path=version_path,
-                        state=LoadState.INVALID,
-                        last_error="; ".join(
-                            e.message for e in validation.errors[:3]
-                        ),
-                        last_error_code=(
-                            validation.errors[0].code.value
-                            if validation.errors
-                            else None
-                        ),
-                    )
-                    model.add_version(descriptor)
-                    result.discovered_versions.append(descriptor)
+                descriptor = self.scan_version(model_id, version_path)
+                model.add_version(descriptor)
+                result.discovered_versions.append(descriptor)
+                if descriptor.state == LoadState.INVALID:
                     result.versions_invalid += 1
-
-                    logger.warning(
-                        "Version discovered but invalid",
-                        extra={
-                            "model_id": model_id,
-                            "version": version,
-                            "errors": [e.message for e in validation.errors],
-                        },
-                    )
+                else:
+                    result.versions_valid += 1
 
             # Check if any versions were found
             if not versions_found:
@@ -287,6 +245,64 @@ class DiscoveryScanner:
 
         return result
 
+    def scan_version(self, model_id: str, version_path: Path) -> ModelVersionDescriptor:
+        """
+        Validate a single version directory.
+
+        Used by scan() and by DirectoryWatcher to revalidate only the
+        version directories that changed.
+
+        Args:
+            model_id: Parent model identifier
+            version_path: Version directory
+
+        Returns:
+            Validated descriptor, or a descriptor in INVALID state
+        """
+        version = version_path.name
+
+        validation = self.validator.validate(
+            version_path=version_path,
+            expected_model_id=model_id,
+            expected_version=version,
+        )
+
+        if validation.is_valid and validation.descriptor:
+            descriptor = validation.descriptor
+            logger.info(
+                "Version discovered and validated",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "display_name": descriptor.display_name,
+                },
+            )
+            return descriptor
+
+        # Create descriptor in INVALID state
+        descriptor = ModelVersionDescriptor(
+            model_id=model_id,
+            version=version,
+            display_name=f"{model_id} (invalid)",
+            directory_path=version_path,
+            state=LoadState.INVALID,
+            last_error="; ".join(e.message for e in validation.errors[:3]),
+            last_error_code=(
+                validation.errors[0].code.value if validation.errors else None
+            ),
+        )
+
+        logger.warning(
+            "Version discovered but invalid",
+            extra={
+                "model_id": model_id,
+                "version": version,
+                "errors": [e.message for e in validation.errors],
+            },
+        )
+
+        return descriptor
+
     def scan_into_registry(self, registry: ModelRegistry) -> DiscoveryResult:
         """
         Scan and register discovered models directly into registry.
@@ -351,7 +367,7 @@ class DiscoveryScanner:
 
         return None
 
-    def _iter_model_dirs(self) -> Iterator[Path]:
+    def iter_model_dirs(self) -> Iterator[Path]:
         """
         Iterate over model directories in models_root.
 
@@ -395,7 +411,7 @@ class DiscoveryScanner:
                 extra={"path": str(self.models_root), "error": str(e)},
             )
 
-    def _iter_version_dirs(self, model_path: Path) -> Iterator[Path]:
+    def iter_version_dirs(self, model_path: Path) -> Iterator[Path]:
         """
         Iterate over version directories within a model.
 
@@ -471,44 +487,136 @@ class DiscoveryScanner:
 # WATCH MODE (OPTIONAL)
 # =============================================================================
 
+# Fingerprint of a version directory: sorted (relative path, size, mtime_ns)
+VersionFingerprint = tuple[tuple[str, int, int], ...]
 
-class DirectoryWatcher:
+# Directories that never affect a model contract
+_FINGERPRINT_SKIP_DIRS = frozenset({"__pycache__", ".git", ".ipynb_checkpoints"})
+
+
+def fingerprint_version_dir(version_path: Path) -> VersionFingerprint:
+    """
+    Build a stat-only fingerprint of a version directory.
+
+    Only file metadata is read (no hashing, no YAML parsing), so this is
+    cheap enough to run on every poll. Any added, removed, resized or
+    touched file changes the fingerprint.
     """
-    Optional filesystem watcher for hot-reloading models.
+    entries: list[tuple[str, int, int]] = []
+
+    for dirpath, dirnames, filenames in os.walk(version_path):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in _FINGERPRINT_SKIP_DIRS and not d.startswith(".")
+        ]
+        for filename in filenames:
+            if filename.startswith(".") or filename.endswith(".pyc"):
+                continue
+            full_path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue  # Removed while walking
+            entries.append(
+                (os.path.relpath(full_path, version_path), stat.st_size, stat.st_mtime_ns)
+            )
 
-    This is a placeholder for future implementation.
-    Production use would integrate with watchdog or inotify.
+    return tuple(sorted(entries))
+
+
+class DirectoryWatcher:
+    """
+    Filesystem watcher for hot-adding and revalidating model versions.
+
+    Instead of re-running a full scan (which re-validates every version and
+    re-parses every model.yaml), the watcher keeps a manifest of stat-only
+    fingerprints per version directory and revalidates only the versions
+    whose fingerprint changed.
+
+    Change detection:
+    - Native events (inotify/FSEvents via the optional ``watchdog`` package):
+      affected version directories are checked as soon as events settle
+    - Manifest polling: a stat-only sweep every poll_interval_seconds. This
+      is the fallback when watchdog is not installed and a safety net for
+      missed events (e.g. on network filesystems)
+
+    Registry updates are incremental:
+    - New version directories are validated and registered
+    - Changed versions that are not loaded are revalidated and re-registered
+    - Changed versions that are loaded are only reported (on_changed); they
+      keep serving until explicitly reloaded
+    - Removed versions are reported (on_removed) but not auto-unregistered
     """
 
+    # States in which a changed version can be replaced in the registry
+    REPLACEABLE_STATES = (
+        LoadState.DISCOVERED,
+        LoadState.INVALID,
+        LoadState.FAILED,
+        LoadState.UNLOADED,
+    )
+
     def __init__(
         self,
         scanner: DiscoveryScanner,
         registry: ModelRegistry,
         poll_interval_seconds: float = 30.0,
+        use_native_events: bool = True,
+        debounce_seconds: float = 0.2,
+        on_added: Optional[Callable[[ModelVersionDescriptor], None]] = None,
+        on_changed: Optional[Callable[[ModelVersionDescriptor], None]] = None,
+        on_removed: Optional[Callable[[str, str], None]] = None,
     ):
         """
         Initialize the directory watcher.
 
         Args:
-            scanner: Scanner to use for re-scanning
+            scanner: Scanner used to validate individual version directories
             registry: Registry to update
-            poll_interval_seconds: How often to check for changes
+            poll_interval_seconds: Interval of the stat-only manifest sweep
+            use_native_events: Use watchdog filesystem events when installed
+            debounce_seconds: Quiet period before handling native events
+            on_added: Callback for newly registered versions
+            on_changed: Callback for revalidated versions
+            on_removed: Callback for removed version directories
         """
         self.scanner = scanner
         self.registry = registry
         self.poll_interval_seconds = poll_interval_seconds
+        self.use_native_events = use_native_events
+        self.debounce_seconds = debounce_seconds
+        self.on_added = on_added
+        self.on_changed = on_changed
+        self.on_removed = on_removed
+
         self._running = False
-        self._thread: Optional[object] = None
+        self._thread: Optional[threading.Thread] = None
+        self._observer: Optional[Any] = None
+        self._wakeup = threading.Event()
+        self._dirty_lock = threading.Lock()
+        self._dirty: set[tuple[str, str]] = set()
+        self._manifest: dict[tuple[str, str], VersionFingerprint] = {}
+
+    @property
+    def native_events(self) -> bool:
+        """True if filesystem events are delivered by watchdog."""
+        return self._observer is not None
 
     def start(self) -> None:
         """Start watching for changes."""
-        import threading
-
         if self._running:
             return
 
+        # Baseline: whatever is on disk now is already in the registry
+        self._manifest = self._build_manifest()
+
         self._running = True
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        if self.use_native_events:
+            self._observer = self._start_observer()
+
+        self._thread = threading.Thread(
+            target=self._watch_loop, name="model-dir-watcher", daemon=True
+        )
         self._thread.start()
 
         logger.info(
@@ -516,27 +624,79 @@ class DirectoryWatcher:
             extra={
                 "models_root": str(self.scanner.models_root),
                 "poll_interval": self.poll_interval_seconds,
+                "native_events": self.native_events,
+                "versions_tracked": len(self._manifest),
             },
         )
 
     def stop(self) -> None:
         """Stop watching."""
         self._running = False
+        self._wakeup.set()
+
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2.0)
+            except Exception:
+                pass
+            self._observer = None
+
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
 
         logger.info("Directory watcher stopped")
 
+    def notify_path(self, path: Path | str) -> None:
+        """
+        Mark the version directory containing ``path`` as possibly changed.
+
+        Called from native filesystem events; may also be called directly
+        (e.g. by a deployment hook after copying a model).
+        """
+        try:
+            relative = Path(path).resolve().relative_to(self.scanner.models_root.resolve())
+        except (ValueError, OSError):
+            return
+
+        parts = relative.parts
+        if not parts:
+            return
+
+        with self._dirty_lock:
+            if len(parts) >= 2:
+                self._dirty.add((parts[0], parts[1]))
+            else:
+                # Model directory itself created/removed: check all its versions
+                self._dirty.add((parts[0], ""))
+        self._wakeup.set()
+
+    # =========================================================================
+    # Watch loop
+    # =========================================================================
+
     def _watch_loop(self) -> None:
-        """Main watch loop - polls for changes."""
-        import time
+        """Main watch loop - handles events and periodic manifest sweeps."""
+        next_sweep = time.monotonic() + self.poll_interval_seconds
 
         while self._running:
-            time.sleep(self.poll_interval_seconds)
+            timeout = max(0.0, next_sweep - time.monotonic())
+            woken = self._wakeup.wait(timeout)
 
             if not self._running:
                 break
 
             try:
-                self._check_for_changes()
+                if woken:
+                    # Let bursts of events (file copies) settle first
+                    self._wakeup.clear()
+                    while self._wakeup.wait(self.debounce_seconds):
+                        self._wakeup.clear()
+                    self._check_dirty()
+                else:
+                    self._check_for_changes()
+                    next_sweep = time.monotonic() + self.poll_interval_seconds
             except Exception as e:
                 logger.error(
                     "Error checking for model changes",
@@ -545,46 +705,212 @@ class DirectoryWatcher:
 
     def _check_for_changes(self) -> None:
         """
-        Check for new, removed, or modified models.
+        Sweep the whole tree and apply changes (stat-only, no validation).
 
-        This is a simple implementation that re-scans everything.
-        A production implementation would use proper file watching.
+        Only version directories whose fingerprint differs from the manifest
+        are revalidated.
         """
-        # Get current state
-        current_versions = {
-            v.qualified_id for v in self.registry.get_all_versions()
-        }
+        current = self._build_manifest()
+        self._apply_changes(current, set(current) | set(self._manifest))
+
+    def _check_dirty(self) -> None:
+        """Apply changes for version directories reported by events."""
+        with self._dirty_lock:
+            dirty = self._dirty
+            self._dirty = set()
+
+        keys: set[tuple[str, str]] = set()
+        current: dict[tuple[str, str], VersionFingerprint] = {}
+
+        for model_id, version in dirty:
+            if version:
+                keys.add((model_id, version))
+                version_path = self.scanner.models_root / model_id / version
+                if self._is_version_dir(version_path):
+                    current[(model_id, version)] = fingerprint_version_dir(version_path)
+            else:
+                keys.update(k for k in self._manifest if k[0] == model_id)
+                model_path = self.scanner.models_root / model_id
+                if model_path.is_dir() and is_valid_model_id(model_id):
+                    for version_path in self.scanner.iter_version_dirs(model_path):
+                        if is_valid_version(version_path.name):
+                            key = (model_id, version_path.name)
+                            keys.add(key)
+                            current[key] = fingerprint_version_dir(version_path)
+
+        self._apply_changes(current, keys)
+
+    # =========================================================================
+    # Manifest
+    # =========================================================================
+
+    def _build_manifest(self) -> dict[tuple[str, str], VersionFingerprint]:
+        """Fingerprint every version directory under models_root."""
+        manifest: dict[tuple[str, str], VersionFingerprint] = {}
+
+        if not self.scanner.models_root.is_dir():
+            return manifest
+
+        for model_path in self.scanner.iter_model_dirs():
+            if not is_valid_model_id(model_path.name):
+                continue
+            for version_path in self.scanner.iter_version_dirs(model_path):
+                if not is_valid_version(version_path.name):
+                    continue
+                key = (model_path.name, version_path.name)
+                manifest[key] = fingerprint_version_dir(version_path)
 
-        # Re-scan
-        result = self.scanner.scan()
+        return manifest
 
-        # Find new versions
-        discovered_ids = {
-            v.qualified_id for v in result.discovered_versions
-        }
+    def _is_version_dir(self, version_path: Path) -> bool:
+        """Check that a path is a watchable version directory."""
+        return (
+            version_path.is_dir()
+            and is_valid_model_id(version_path.parent.name)
+            and is_valid_version(version_path.name)
+        )
 
-        new_versions = discovered_ids - current_versions
-        removed_versions = current_versions - discovered_ids
-
-        # Register new versions
-        for version in result.discovered_versions:
-            if version.qualified_id in new_versions:
-                self.registry.register_version(version)
-                logger.info(
-                    "New model version detected",
-                    extra={
-                        "model_id": version.model_id,
-                        "version": version.version,
-                    },
-                )
+    def _apply_changes(
+        self,
+        current: dict[tuple[str, str], VersionFingerprint],
+        keys: set[tuple[str, str]],
+    ) -> None:
+        """Diff ``current`` against the manifest for ``keys`` and update the registry."""
+        for key in sorted(keys):
+            model_id, version = key
+            old = self._manifest.get(key)
+            new = current.get(key)
+
+            if old == new:
+                continue
+
+            if new is None:
+                del self._manifest[key]
+                self._handle_removed(model_id, version)
+                continue
+
+            self._manifest[key] = new
+            version_path = self.scanner.models_root / model_id / version
+            if old is None:
+                self._handle_added(model_id, version_path)
+            else:
+                self._handle_changed(model_id, version_path)
+
+    # =========================================================================
+    # Registry updates
+    # =========================================================================
+
+    def _handle_added(self, model_id: str, version_path: Path) -> None:
+        """Validate and register a new version directory."""
+        existing = self.registry.get_version(model_id, version_path.name)
+        if existing is not None:
+            # Registered out of band (e.g. startup scan raced the baseline)
+            return
+
+        descriptor = self.scanner.scan_version(model_id, version_path)
+        self.registry.register_version(descriptor)
+
+        logger.info(
+            "New model version detected",
+            extra={
+                "model_id": model_id,
+                "version": descriptor.version,
+                "state": descriptor.state.value,
+            },
+        )
 
-        # Log removed (but don't auto-unregister - that requires explicit action)
-        for qualified_id in removed_versions:
-            model_id, version = qualified_id.split(":")
+        if self.on_added:
+            self._safe_callback(self.on_added, descriptor)
+
+    def _handle_changed(self, model_id: str, version_path: Path) -> None:
+        """Revalidate a changed version directory."""
+        version = version_path.name
+        existing = self.registry.get_version(model_id, version)
+
+        if existing is not None and existing.state not in self.REPLACEABLE_STATES:
+            # Loaded (or loading): keep serving; reloading is an explicit action
             logger.warning(
-                "Model version directory removed",
+                "Loaded model version changed on disk",
                 extra={
                     "model_id": model_id,
                     "version": version,
+                    "state": existing.state.value,
                 },
             )
+            if self.on_changed:
+                self._safe_callback(self.on_changed, existing)
+            return
+
+        descriptor = self.scanner.scan_version(model_id, version_path)
+        self.registry.register_version(descriptor)
+
+        logger.info(
+            "Model version revalidated",
+            extra={
+                "model_id": model_id,
+                "version": version,
+                "state": descriptor.state.value,
+            },
+        )
+
+        if self.on_changed:
+            self._safe_callback(self.on_changed, descriptor)
+
+    def _handle_removed(self, model_id: str, version: str) -> None:
+        """Report a removed version directory (not auto-unregistered)."""
+        logger.warning(
+            "Model version directory removed",
+            extra={
+                "model_id": model_id,
+                "version": version,
+            },
+        )
+
+        if self.on_removed:
+            self._safe_callback(self.on_removed, model_id, version)
+
+    @staticmethod
+    def _safe_callback(callback: Callable[..., None], *args: Any) -> None:
+        """Invoke a callback without letting it break the watcher."""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.warning("Directory watcher callback failed", extra={"error": str(e)})
+
+    # =========================================================================
+    # Native events (optional watchdog dependency)
+    # =========================================================================
+
+    def _start_observer(self) -> Optional[Any]:
+        """Start a watchdog observer, or return None if unavailable."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info(
+                "watchdog not installed - using manifest polling",
+                extra={"poll_interval": self.poll_interval_seconds},
+            )
+            return None
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                watcher.notify_path(event.src_path)
+                dest_path = getattr(event, "dest_path", None)
+                if dest_path:
+                    watcher.notify_path(dest_path)
+
+        try:
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.scanner.models_root), recursive=True)
+            observer.daemon = True
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.warning(
+                "Failed to start filesystem observer - using manifest polling",
+                extra={"error": str(e)},
+            )
+            return None
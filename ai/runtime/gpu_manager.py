@@ -33,7 +33,10 @@ import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ai.runtime.gpu_telemetry import GPUTelemetrySampler
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +129,7 @@ class GPUManager:
         self._torch_available = False
         self._cuda_available = False
         self._status = GPUStatus.UNAVAILABLE
+        self._telemetry: Optional["GPUTelemetrySampler"] = None
 
         # Initialize GPU detection
         self._detect_gpus()
@@ -202,11 +206,24 @@ class GPUManager:
         with self._lock:
             return self._devices.get(device_id)
 
+    def attach_telemetry(self, sampler: "GPUTelemetrySampler") -> None:
+        """Read utilization and temperature from a running telemetry sampler."""
+        self._telemetry = sampler
+
+    @property
+    def telemetry(self) -> Optional["GPUTelemetrySampler"]:
+        """The attached telemetry sampler, if any."""
+        return self._telemetry
+
     def update_device_stats(self) -> None:
         """Update GPU device statistics (memory usage, utilization)."""
         if not self.is_available or not self._torch_available:
             return
 
+        # Utilization and temperature come from the sampler's last reading;
+        # NVML is never queried on this path.
+        latest = self._telemetry.latest() if self._telemetry else {}
+
         try:
             import torch
 
@@ -216,20 +233,10 @@ class GPUManager:
                     used_memory = torch.cuda.memory_allocated(device_id) / (1024 * 1024)
                     device.used_memory_mb = used_memory
 
-                    # Get utilization if pynvml available
-                    try:
-                        import pynvml
-                        handle = pynvml.nvmlDeviceGetHandleByIndex(device_id)
-                        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                        device.utilization_percent = util.gpu
-
-                        temp = pynvml.nvmlDeviceGetTemperature(
-                            handle, pynvml.NVML_TEMPERATURE_GPU
-                        )
-                        device.temperature_c = temp
-                    except (ImportError, Exception):
-                        # pynvml not available or failed, skip
-                        pass
+                    sample = latest.get(device_id)
+                    if sample is not None:
+                        device.utilization_percent = sample.utilization_percent
+                        device.temperature_c = sample.temperature_c
 
         except Exception as e:
             logger.error(f"Error updating GPU stats: {e}")
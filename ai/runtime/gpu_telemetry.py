@@ -0,0 +1,294 @@
+"""
+Ruth AI Runtime - GPU Telemetry Sampler
+
+Polls NVML on one background thread at a fixed rate into a ring buffer of
+recent samples per device. /metrics, /health and scheduling read from
+memory instead of querying the driver per call.
+
+Design Principles:
+- NVML is initialised and device handles opened once, not per query
+- Readers never touch NVML; they copy from the ring buffer
+- No GPU, no pynvml, or a driver error: the sampler stays idle and
+  readers get empty results - nothing raises
+- Bounded memory: history_seconds / interval_seconds samples per device
+
+Usage:
+    sampler = GPUTelemetrySampler(interval_seconds=1.0, history_seconds=300)
+    sampler.start()
+
+    sampler.latest()              # {0: GPUSample(...)}
+    sampler.window_stats(60)      # {0: {"utilization_percent": {"min":..,"avg":..,"max":..}, ...}}
+
+    sampler.stop()
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fields summarised by window_stats()
+WINDOW_FIELDS = ("utilization_percent", "memory_used_mb", "temperature_c", "power_w")
+
+
+# =============================================================================
+# SAMPLE
+# =============================================================================
+
+
+@dataclass
+class GPUSample:
+    """One NVML reading for one device."""
+
+    timestamp: float  # time.time()
+    device_id: int
+    utilization_percent: float
+    memory_used_mb: float
+    memory_total_mb: float
+    temperature_c: Optional[float] = None
+    power_w: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+# =============================================================================
+# SAMPLER
+# =============================================================================
+
+
+class GPUTelemetrySampler:
+    """
+    Background NVML sampler with a per-device ring buffer.
+
+    Thread-safe: the sampler thread appends, any thread reads.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 1.0,
+        history_seconds: float = 300.0,
+        on_sample: Optional[Callable[[GPUSample], None]] = None,
+        nvml: Any = None,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            interval_seconds: Polling period
+            history_seconds: How much history the ring buffer keeps
+            on_sample: Called on the sampler thread with each new sample
+                (e.g. to update Prometheus gauges)
+            nvml: NVML module to use (defaults to pynvml); injectable for tests
+        """
+        self.interval_seconds = interval_seconds
+        self.history_seconds = history_seconds
+        self._on_sample = on_sample
+        self._nvml = nvml
+        self._maxlen = max(1, math.ceil(history_seconds / interval_seconds))
+
+        self._lock = threading.Lock()
+        self._history: Dict[int, Deque[GPUSample]] = {}
+        self._handles: Dict[int, Any] = {}
+        self._names: Dict[int, str] = {}
+        self._errors = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def _init_nvml(self) -> bool:
+        if self._nvml is None:
+            try:
+                import pynvml
+                self._nvml = pynvml
+            except ImportError:
+                logger.info("pynvml not installed, GPU telemetry disabled")
+                return False
+
+        try:
+            self._nvml.nvmlInit()
+            for device_id in range(self._nvml.nvmlDeviceGetCount()):
+                handle = self._nvml.nvmlDeviceGetHandleByIndex(device_id)
+                name = self._nvml.nvmlDeviceGetName(handle)
+                self._handles[device_id] = handle
+                self._names[device_id] = name.decode() if isinstance(name, bytes) else name
+                self._history[device_id] = deque(maxlen=self._maxlen)
+        except Exception as e:
+            logger.info(f"NVML unavailable, GPU telemetry disabled: {e}")
+            self._handles.clear()
+            return False
+
+        return bool(self._handles)
+
+    def start(self) -> bool:
+        """
+        Initialise NVML and start sampling.
+
+        Returns:
+            True if sampling started, False if no GPU telemetry is available
+        """
+        if self._thread is not None:
+            return True
+        if not self._init_nvml():
+            return False
+
+        self._stop.clear()
+        self.sample_once()
+        self._thread = threading.Thread(
+            target=self._run, name="gpu-telemetry", daemon=True
+        )
+        self._thread.start()
+
+        logger.info("GPU telemetry sampler started", extra={
+            "devices": len(self._handles),
+            "interval_seconds": self.interval_seconds,
+            "history_seconds": self.history_seconds,
+        })
+        return True
+
+    def stop(self) -> None:
+        """Stop sampling and shut NVML down."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 1.0)
+            self._thread = None
+        if self._handles:
+            try:
+                self._nvml.nvmlShutdown()
+            except Exception:
+                pass
+            self._handles.clear()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.sample_once()
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    def _read(self, device_id: int, handle: Any) -> GPUSample:
+        nvml = self._nvml
+        utilization = nvml.nvmlDeviceGetUtilizationRates(handle)
+        memory = nvml.nvmlDeviceGetMemoryInfo(handle)
+
+        try:
+            temperature = float(
+                nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
+            )
+        except Exception:
+            temperature = None
+        try:
+            power = nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW -> W
+        except Exception:
+            power = None
+
+        return GPUSample(
+            timestamp=time.time(),
+            device_id=device_id,
+            utilization_percent=float(utilization.gpu),
+            memory_used_mb=memory.used / (1024 * 1024),
+            memory_total_mb=memory.total / (1024 * 1024),
+            temperature_c=temperature,
+            power_w=power,
+        )
+
+    def sample_once(self) -> None:
+        """Take one reading of every device (called by the sampler thread)."""
+        for device_id, handle in self._handles.items():
+            try:
+                sample = self._read(device_id, handle)
+            except Exception as e:
+                self._errors += 1
+                logger.debug(f"GPU {device_id} telemetry read failed: {e}")
+                continue
+
+            with self._lock:
+                self._history[device_id].append(sample)
+
+            if self._on_sample is not None:
+                try:
+                    self._on_sample(sample)
+                except Exception as e:
+                    logger.debug(f"GPU telemetry callback failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Readers
+    # -------------------------------------------------------------------------
+
+    @property
+    def available(self) -> bool:
+        """Whether telemetry is being collected."""
+        return bool(self._handles)
+
+    def device_name(self, device_id: int) -> Optional[str]:
+        """NVML device name."""
+        return self._names.get(device_id)
+
+    def latest(self) -> Dict[int, GPUSample]:
+        """Most recent sample per device."""
+        with self._lock:
+            return {d: h[-1] for d, h in self._history.items() if h}
+
+    def mean_utilization(self) -> Optional[float]:
+        """Latest utilization averaged across devices, as a 0.0-1.0 fraction."""
+        latest = self.latest()
+        if not latest:
+            return None
+        return sum(s.utilization_percent for s in latest.values()) / len(latest) / 100.0
+
+    def samples(self, device_id: int, window_seconds: Optional[float] = None) -> List[GPUSample]:
+        """Samples for a device, oldest first, optionally limited to a window."""
+        with self._lock:
+            history = list(self._history.get(device_id, ()))
+        if window_seconds is None:
+            return history
+        cutoff = time.time() - window_seconds
+        return [s for s in history if s.timestamp >= cutoff]
+
+    def window_stats(self, window_seconds: float = 60.0) -> Dict[int, Dict[str, Any]]:
+        """
+        Min/avg/max of each field over the last window_seconds, per device.
+
+        Fields with no readings in the window (e.g. power on boards that
+        don't report it) are omitted.
+        """
+        stats: Dict[int, Dict[str, Any]] = {}
+        for device_id in list(self._history):
+            window = self.samples(device_id, window_seconds)
+            if not window:
+                continue
+            device_stats: Dict[str, Any] = {"samples": len(window)}
+            for name in WINDOW_FIELDS:
+                values = [getattr(s, name) for s in window if getattr(s, name) is not None]
+                if values:
+                    device_stats[name] = {
+                        "min": round(min(values), 2),
+                        "avg": round(sum(values) / len(values), 2),
+                        "max": round(max(values), 2),
+                    }
+            stats[device_id] = device_stats
+        return stats
+
+    def get_status(self, window_seconds: float = 60.0) -> Dict[str, Any]:
+        """Summary for health endpoints."""
+        return {
+            "available": self.available,
+            "interval_seconds": self.interval_seconds,
+            "read_errors": self._errors,
+            "window_seconds": window_seconds,
+            "latest": {d: s.to_dict() for d, s in self.latest().items()},
+            "window": self.window_stats(window_seconds),
+        }
@@ -0,0 +1,454 @@
+"""
+Ruth AI Runtime - Blue/Green Model Hot-Swap
+
+This module swaps the version serving a model without failing requests.
+
+Swap sequence (blue = currently serving, green = new version):
+1. Load and warm up green alongside blue (both sandboxes exist)
+2. Atomically flip the routing pointer for the model to green
+3. Drain: wait for in-flight requests on blue to finish
+4. Unload blue and release its GPU memory
+
+Optionally, before flipping, a percentage of traffic can be shadowed to
+green: the request is answered by blue and a copy is executed on green in
+the background so its latency and error rate can be observed.
+
+Design Principles:
+- Requests never see a missing sandbox: the old version is only torn down
+  after its in-flight count reaches zero (or the drain timeout expires)
+- Routing is explicit: requests without a version use the router's pointer
+- Failure isolation: if green fails to load, blue keeps serving untouched
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional
+
+from ai.runtime.loader import ModelLoader
+from ai.runtime.models import HealthStatus, LoadState
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.sandbox import SandboxManager
+from ai.runtime.versioning import VersionLifecycleManager
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class ShadowConfig:
+    """Traffic shadowing to a candidate version."""
+
+    version: str
+    percent: float  # 0-100
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    mirrored: int = 0
+    failures: int = 0
+    total_time_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for status endpoints."""
+        succeeded = self.mirrored - self.failures
+        return {
+            "version": self.version,
+            "percent": self.percent,
+            "started_at": self.started_at.isoformat(),
+            "mirrored": self.mirrored,
+            "failures": self.failures,
+            "avg_time_ms": round(self.total_time_ms / succeeded, 2) if succeeded else None,
+        }
+
+
+@dataclass
+class SwapResult:
+    """Result of a blue/green swap."""
+
+    model_id: str
+    from_version: Optional[str]
+    to_version: str
+    success: bool
+    drained: bool = True
+    load_time_ms: int = 0
+    drain_time_ms: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/API responses."""
+        return {
+            "model_id": self.model_id,
+            "from_version": self.from_version,
+            "to_version": self.to_version,
+            "success": self.success,
+            "drained": self.drained,
+            "load_time_ms": self.load_time_ms,
+            "drain_time_ms": self.drain_time_ms,
+            "error": self.error,
+        }
+
+
+# =============================================================================
+# TRAFFIC ROUTER
+# =============================================================================
+
+
+class TrafficRouter:
+    """
+    Routing pointer and in-flight accounting per model version.
+
+    Usage:
+        with router.route("fall_detection", request.model_version, fallback) as version:
+            sandbox_manager.execute(model_id="fall_detection", version=version, ...)
+    """
+
+    def __init__(self):
+        """Initialize an empty router (no pointers, no shadows)."""
+        self._lock = threading.Lock()
+        self._drained = threading.Condition(self._lock)
+        self._active: dict[str, str] = {}
+        self._shadows: dict[str, ShadowConfig] = {}
+        self._in_flight: dict[str, int] = {}
+
+    def set_active(self, model_id: str, version: str) -> Optional[str]:
+        """Atomically point a model at a version. Returns the previous version."""
+        with self._lock:
+            previous = self._active.get(model_id)
+            self._active[model_id] = version
+            return previous
+
+    def clear_active(self, model_id: str) -> None:
+        """Remove the routing pointer for a model."""
+        with self._lock:
+            self._active.pop(model_id, None)
+
+    def get_active(self, model_id: str) -> Optional[str]:
+        """Return the routing pointer for a model."""
+        with self._lock:
+            return self._active.get(model_id)
+
+    # -------------------------------------------------------------------------
+    # In-flight accounting
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def route(
+        self,
+        model_id: str,
+        requested_version: Optional[str] = None,
+        fallback_version: Optional[str] = None,
+    ) -> Iterator[Optional[str]]:
+        """
+        Pick the serving version and count the request in flight on it.
+
+        Resolution and the in-flight increment happen under the same lock
+        as set_active(), so once a swap has flipped the pointer no new
+        unpinned request can land on the old version.
+
+        Yields:
+            requested_version, else the pointer, else fallback_version
+        """
+        with self._lock:
+            version = requested_version or self._active.get(model_id) or fallback_version
+            if version is not None:
+                self._enter(f"{model_id}:{version}")
+        try:
+            yield version
+        finally:
+            if version is not None:
+                self._exit(f"{model_id}:{version}")
+
+    @contextmanager
+    def track(self, model_id: str, version: str) -> Iterator[None]:
+        """Count a request as in flight on a version for its duration."""
+        qualified_id = f"{model_id}:{version}"
+        with self._lock:
+            self._enter(qualified_id)
+        try:
+            yield
+        finally:
+            self._exit(qualified_id)
+
+    def _enter(self, qualified_id: str) -> None:
+        """Increment the in-flight count. Caller holds _lock."""
+        self._in_flight[qualified_id] = self._in_flight.get(qualified_id, 0) + 1
+
+    def _exit(self, qualified_id: str) -> None:
+        """Decrement the in-flight count and wake drain waiters."""
+        with self._lock:
+            remaining = self._in_flight.get(qualified_id, 1) - 1
+            if remaining:
+                self._in_flight[qualified_id] = remaining
+            else:
+                self._in_flight.pop(qualified_id, None)
+                self._drained.notify_all()
+
+    def in_flight(self, model_id: str, version: str) -> int:
+        """Number of requests currently executing on a version."""
+        with self._lock:
+            return self._in_flight.get(f"{model_id}:{version}", 0)
+
+    def wait_drained(self, model_id: str, version: str, timeout: float) -> bool:
+        """
+        Block until no requests are in flight on a version.
+
+        Returns:
+            True if drained, False on timeout
+        """
+        qualified_id = f"{model_id}:{version}"
+        with self._lock:
+            return self._drained.wait_for(
+                lambda: qualified_id not in self._in_flight, timeout=timeout
+            )
+
+    # -------------------------------------------------------------------------
+    # Shadow traffic
+    # -------------------------------------------------------------------------
+
+    def set_shadow(self, model_id: str, version: str, percent: float) -> None:
+        """Mirror ``percent`` of a model's traffic to a candidate version."""
+        with self._lock:
+            self._shadows[model_id] = ShadowConfig(
+                version=version, percent=max(0.0, min(100.0, percent))
+            )
+
+    def clear_shadow(self, model_id: str) -> Optional[ShadowConfig]:
+        """Stop shadowing. Returns the final shadow statistics."""
+        with self._lock:
+            return self._shadows.pop(model_id, None)
+
+    def pick_shadow(self, model_id: str, serving_version: str) -> Optional[str]:
+        """Decide whether this request is mirrored; returns the shadow version."""
+        with self._lock:
+            shadow = self._shadows.get(model_id)
+            if shadow is None or shadow.version == serving_version:
+                return None
+            if random.uniform(0.0, 100.0) >= shadow.percent:
+                return None
+            return shadow.version
+
+    def record_shadow(self, model_id: str, success: bool, duration_ms: float) -> None:
+        """Record the outcome of a mirrored request."""
+        with self._lock:
+            shadow = self._shadows.get(model_id)
+            if shadow is None:
+                return
+            shadow.mirrored += 1
+            if success:
+                shadow.total_time_ms += duration_ms
+            else:
+                shadow.failures += 1
+
+    def get_status(self) -> dict[str, Any]:
+        """Return routing state for status endpoints."""
+        with self._lock:
+            return {
+                "active": dict(self._active),
+                "shadows": {m: s.to_dict() for m, s in self._shadows.items()},
+                "in_flight": dict(self._in_flight),
+            }
+
+
+# =============================================================================
+# HOT-SWAP MANAGER
+# =============================================================================
+
+
+class HotSwapManager:
+    """
+    Performs blue/green swaps between versions of a model.
+
+    Usage:
+        swapper = HotSwapManager(loader, registry, sandbox_manager, router)
+        swapper.start_shadow("fall_detection", "1.1.0", percent=10)
+        ...
+        result = swapper.swap("fall_detection", "1.1.0")
+    """
+
+    def __init__(
+        self,
+        loader: ModelLoader,
+        registry: ModelRegistry,
+        sandbox_manager: SandboxManager,
+        router: TrafficRouter,
+        drain_timeout_seconds: float = 30.0,
+        on_swapped: Optional[Callable[[SwapResult], None]] = None,
+    ):
+        """
+        Initialize the hot-swap manager.
+
+        Args:
+            loader: Model loader (owns GPU allocation via its GPUManager)
+            registry: Registry whose states are updated during the swap
+            sandbox_manager: Sandbox manager for both versions
+            router: Routing pointer shared with the inference route
+            drain_timeout_seconds: Max wait for in-flight requests on the old version
+            on_swapped: Optional callback after a successful swap
+        """
+        self.loader = loader
+        self.registry = registry
+        self.sandbox_manager = sandbox_manager
+        self.router = router
+        self.lifecycle = VersionLifecycleManager(registry)
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self.on_swapped = on_swapped
+
+        # One swap per model at a time
+        self._swap_locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def prepare(self, model_id: str, version: str) -> Optional[str]:
+        """
+        Load and warm up a version alongside the serving one.
+
+        Returns:
+            None on success (or if already READY), else an error message
+        """
+        descriptor = self.registry.get_version(model_id, version)
+        if descriptor is None:
+            return f"Version not found: {model_id}:{version}"
+
+        if descriptor.state == LoadState.READY:
+            return None
+
+        # FAILED/ERROR/UNLOADED versions go back through DISCOVERED first
+        if self.lifecycle.can_reload(model_id, version):
+            self.lifecycle.prepare_reload(model_id, version)
+        if descriptor.state != LoadState.DISCOVERED:
+            return f"Cannot load {model_id}:{version} from state {descriptor.state.value}"
+
+        self.registry.update_state(model_id, version, LoadState.LOADING)
+        try:
+            result = self.loader.load(descriptor)  # includes warmup
+        except Exception as e:
+            self.lifecycle.mark_failed(model_id, version, str(e))
+            return str(e)
+
+        if not (result.success and result.loaded_model):
+            message = result.error.message if result.error else "Unknown error"
+            code = result.error.code.value if result.error else None
+            self.lifecycle.mark_failed(model_id, version, message, code)
+            return message
+
+        self.sandbox_manager.create_sandbox(result.loaded_model, descriptor)
+        self.lifecycle.mark_ready(model_id, version, result.load_time_ms)
+        self.registry.update_health(model_id, version, HealthStatus.HEALTHY)
+        return None
+
+    def start_shadow(self, model_id: str, version: str, percent: float) -> Optional[str]:
+        """
+        Load a candidate version and mirror a share of traffic to it.
+
+        Returns:
+            None on success, else an error message
+        """
+        error = self.prepare(model_id, version)
+        if error is None:
+            self.router.set_shadow(model_id, version, percent)
+            logger.info(
+                "Shadow traffic started",
+                extra={"model_id": model_id, "version": version, "percent": percent},
+            )
+        return error
+
+    def stop_shadow(self, model_id: str) -> Optional[ShadowConfig]:
+        """Stop mirroring traffic (the candidate stays loaded)."""
+        return self.router.clear_shadow(model_id)
+
+    def swap(self, model_id: str, to_version: str) -> SwapResult:
+        """
+        Make ``to_version`` the serving version of a model.
+
+        The previous version is drained and unloaded after the flip.
+        """
+        with self._lock_for(model_id):
+            from_version = self.router.get_active(model_id) or self._serving_version(model_id)
+            result = SwapResult(
+                model_id=model_id,
+                from_version=from_version,
+                to_version=to_version,
+                success=False,
+            )
+
+            # 1. Load green next to blue
+            start = time.monotonic()
+            error = self.prepare(model_id, to_version)
+            result.load_time_ms = int((time.monotonic() - start) * 1000)
+            if error is not None:
+                result.error = error
+                logger.error("Hot-swap aborted, old version keeps serving", extra=result.to_dict())
+                return result
+
+            # 2. Flip the routing pointer
+            self.router.set_active(model_id, to_version)
+            shadow = self.router.clear_shadow(model_id)
+            result.success = True
+
+            # 3 + 4. Drain and retire blue
+            if from_version and from_version != to_version:
+                start = time.monotonic()
+                result.drained = self.router.wait_drained(
+                    model_id, from_version, self.drain_timeout_seconds
+                )
+                result.drain_time_ms = int((time.monotonic() - start) * 1000)
+                self._retire(model_id, from_version, result.drained)
+
+            logger.info(
+                "Hot-swap completed",
+                extra={
+                    **result.to_dict(),
+                    "shadow": shadow.to_dict() if shadow else None,
+                },
+            )
+
+        if self.on_swapped:
+            try:
+                self.on_swapped(result)
+            except Exception as e:
+                logger.warning("Hot-swap callback failed", extra={"error": str(e)})
+
+        return result
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _lock_for(self, model_id: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._swap_locks.setdefault(model_id, threading.Lock())
+
+    def _serving_version(self, model_id: str) -> Optional[str]:
+        """Version the inference route uses when no pointer is set."""
+        for descriptor in self.registry.get_all_versions():
+            if descriptor.model_id == model_id:
+                return descriptor.version if descriptor.state == LoadState.READY else None
+        return None
+
+    def _retire(self, model_id: str, version: str, drained: bool) -> None:
+        """Unload the old version and release its memory."""
+        if not drained:
+            logger.warning(
+                "Drain timed out, unloading with requests in flight",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "in_flight": self.router.in_flight(model_id, version),
+                },
+            )
+
+        self.lifecycle.mark_unloading(model_id, version)
+        self.sandbox_manager.remove_sandbox(model_id, version)
+        self.loader.unload(model_id, version)  # releases GPU allocation
+        self.lifecycle.mark_unloaded(model_id, version)
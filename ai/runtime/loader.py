@@ -21,6 +21,7 @@ from __future__ import annotations
 import importlib.util
 import logging
 import sys
+import threading
 import time
 import traceback
 from dataclasses import dataclass
@@ -36,6 +37,7 @@ from ai.runtime.models import (
     LoadState,
     ModelVersionDescriptor,
 )
+from ai.runtime.optimizer import ModelOptimizer
 
 # Optional GPU manager import - may not be available in all environments
 try:
@@ -96,6 +98,7 @@ class LoadedModel:
     model_instance: Any = None  # For models that need persistent state
     load_time_ms: int = 0
     device: str = "cpu"  # Device the model is loaded on ("cpu", "cuda:0", etc.)
+    optimizations: tuple[str, ...] = ()  # Applied load-time optimizations (model.yaml optimize:)
 
     def __repr__(self) -> str:
         return f"LoadedModel({self.model_id}:{self.version}, device={self.device})"
@@ -159,6 +162,7 @@ class ModelLoader:
         warmup_timeout_ms: int = 30000,
         gpu_manager: Optional["GPUManager"] = None,
         default_memory_estimate_mb: float = 2048.0,
+        optimizer: Optional[ModelOptimizer] = None,
     ):
         """
         Initialize the model loader.
@@ -169,16 +173,22 @@ class ModelLoader:
             warmup_timeout_ms: Maximum time for warmup (default 30s)
             gpu_manager: Optional GPU manager for memory allocation
             default_memory_estimate_mb: Default memory estimate when not specified in model contract
+            optimizer: Applies model.yaml ``optimize:`` settings (default: temp-dir artifact cache)
         """
         self.load_timeout_ms = load_timeout_ms
         self.warmup_enabled = warmup_enabled
         self.warmup_timeout_ms = warmup_timeout_ms
         self.gpu_manager = gpu_manager
         self.default_memory_estimate_mb = default_memory_estimate_mb
+        self.optimizer = optimizer or ModelOptimizer()
 
         # Track loaded modules for cleanup
         self._loaded_modules: dict[str, list[str]] = {}
 
+        # Serializes sys.path/sys.modules mutation and _loaded_modules
+        # bookkeeping across parallel loads
+        self._import_lock = threading.Lock()
+
         # Track GPU allocations for cleanup on unload
         self._gpu_allocations: dict[str, str] = {}  # qualified_id -> device
 
@@ -224,6 +234,15 @@ class ModelLoader:
             # Step 4: Load model instance if custom loader exists
             model_instance = self._load_model_instance(descriptor, device=device)
 
+            # Step 4b: Apply optional optimizations (falls back to eager)
+            optimizations: tuple[str, ...] = ()
+            if model_instance is not None and descriptor.optimize.enabled:
+                optimized = self.optimizer.optimize(
+                    model_instance, descriptor, device=device
+                )
+                model_instance = optimized.model
+                optimizations = tuple(optimized.applied)
+
             # Calculate load time
             load_time_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -237,6 +256,7 @@ class ModelLoader:
                 model_instance=model_instance,
                 load_time_ms=load_time_ms,
                 device=device,
+                optimizations=optimizations,
             )
 
             # Step 5: Warmup if enabled
@@ -256,6 +276,7 @@ class ModelLoader:
                     "version": version,
                     "load_time_ms": total_time_ms,
                     "device": device,
+                    "optimizations": list(optimizations),
                 },
             )
 
@@ -303,18 +324,18 @@ class ModelLoader:
         """
         qualified_id = f"{model_id}:{version}"
 
-        if qualified_id not in self._loaded_modules:
-            logger.warning(
-                "Model not found for unload",
-                extra={"model_id": model_id, "version": version},
-            )
-            return False
+        with self._import_lock:
+            if qualified_id not in self._loaded_modules:
+                logger.warning(
+                    "Model not found for unload",
+                    extra={"model_id": model_id, "version": version},
+                )
+                return False
 
-        # Remove imported modules from sys.modules
-        module_names = self._loaded_modules.pop(qualified_id, [])
-        for module_name in module_names:
-            if module_name in sys.modules:
-                del sys.modules[module_name]
+            # Remove imported modules from sys.modules
+            module_names = self._loaded_modules.pop(qualified_id, [])
+            for module_name in module_names:
+                sys.modules.pop(module_name, None)
 
         # Release GPU memory if allocated
         self._release_device(model_id, version)
@@ -599,35 +620,40 @@ class ModelLoader:
 
         Uses importlib to load modules without affecting the global
         namespace. Tracks loaded modules for later cleanup.
+
+        Runs under the loader's import lock: while a module executes, its
+        model directory is at the front of sys.path, and a parallel load
+        must not resolve its own sibling imports against it.
         """
         qualified_id = descriptor.qualified_id
 
         # Create unique module name to avoid conflicts
         module_name = f"ruth_model_{descriptor.model_id}_{descriptor.version}_{module_type}"
 
-        # Track for cleanup
-        if qualified_id not in self._loaded_modules:
-            self._loaded_modules[qualified_id] = []
-        self._loaded_modules[qualified_id].append(module_name)
+        with self._import_lock:
+            # Track for cleanup
+            if qualified_id not in self._loaded_modules:
+                self._loaded_modules[qualified_id] = []
+            self._loaded_modules[qualified_id].append(module_name)
 
-        # Load module from file
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot create module spec for {path}")
+            # Load module from file
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot create module spec for {path}")
 
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
 
-        # Add model directory to path temporarily for relative imports
-        model_dir = str(descriptor.directory_path)
-        sys.path.insert(0, model_dir)
+            # Add model directory to path temporarily for relative imports
+            model_dir = str(descriptor.directory_path)
+            sys.path.insert(0, model_dir)
 
-        try:
-            spec.loader.exec_module(module)
-        finally:
-            # Remove from path
-            if model_dir in sys.path:
-                sys.path.remove(model_dir)
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                # Remove from path
+                if model_dir in sys.path:
+                    sys.path.remove(model_dir)
 
         return module
 
@@ -708,6 +734,17 @@ class ModelLoader:
     # GPU Memory Management
     # =========================================================================
 
+    def estimate_memory_mb(self, descriptor: ModelVersionDescriptor) -> float:
+        """
+        Return the GPU memory a model is expected to need.
+
+        Uses limits.max_memory_mb from the model contract, or the loader's
+        default estimate when the contract does not declare one.
+        """
+        if descriptor.limits and descriptor.limits.max_memory_mb:
+            return float(descriptor.limits.max_memory_mb)
+        return self.default_memory_estimate_mb
+
     def _allocate_device(self, descriptor: ModelVersionDescriptor) -> str:
         """
         Allocate a device for the model.
@@ -731,10 +768,7 @@ class ModelLoader:
             )
             return "cpu"
 
-        # Get memory requirement from model contract or use default estimate
-        required_mb = self.default_memory_estimate_mb
-        if descriptor.limits and descriptor.limits.max_memory_mb:
-            required_mb = float(descriptor.limits.max_memory_mb)
+        required_mb = self.estimate_memory_mb(descriptor)
 
         model_id = descriptor.model_id
         version = descriptor.version
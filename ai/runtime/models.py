@@ -214,6 +214,10 @@ class InputSpecification:
     max_height: Optional[int] = None
     channels: int = 3
 
+    # Reduced-scale JPEG decode: frames whose longest side is at least
+    # 2x this are decoded at 1/2, 1/4 or 1/8 scale (None = full resolution)
+    decode_max_side: Optional[int] = None
+
     # Batch-specific settings
     batch_min_size: Optional[int] = None
     batch_max_size: Optional[int] = None
@@ -262,6 +266,29 @@ class ModelCapabilities:
     provides_keypoints: bool = False
 
 
+@dataclass(frozen=True)
+class OptimizationSpec:
+    """
+    Optional load-time optimizations from model.yaml (``optimize:`` section).
+
+    Every flag is a request, not a guarantee: the loader falls back to the
+    eager model whenever an optimization cannot be applied on this host.
+    """
+
+    fp16: bool = False
+    channels_last: bool = False
+    torchscript: bool = False
+    onnx: bool = False
+    onnx_opset: int = 17
+    input_size: tuple[int, int] = (640, 640)  # (height, width) used for tracing/export
+    cache_artifacts: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if any optimization is requested."""
+        return self.fp16 or self.channels_last or self.torchscript or self.onnx
+
+
 @dataclass(frozen=True)
 class EntryPoints:
     """Entry point file paths (relative to version directory)."""
@@ -301,6 +328,7 @@ class ModelVersionDescriptor:
     limits: ResourceLimits = field(default_factory=ResourceLimits)
     capabilities: ModelCapabilities = field(default_factory=ModelCapabilities)
     entry_points: EntryPoints = field(default_factory=EntryPoints)
+    optimize: OptimizationSpec = field(default_factory=OptimizationSpec)
 
     # Dynamic state (mutable)
     state: LoadState = LoadState.DISCOVERED
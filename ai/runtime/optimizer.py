@@ -0,0 +1,520 @@
+"""
+Ruth AI Runtime - Load-Time Model Optimizer
+
+This module applies the optional ``optimize:`` section of model.yaml to a
+model instance returned by a model's loader.py:
+
+- fp16: cast weights to half precision (CUDA devices only)
+- channels_last: NHWC memory format for convolution-heavy models
+- torchscript: trace the eager module into a TorchScript graph
+- onnx: export to ONNX and execute with ONNX Runtime (CPU execution provider)
+
+Compiled artifacts (TorchScript / ONNX files) are cached on disk, keyed by a
+hash of the weights directory plus the optimization variant, so that only
+the first load after a weights change pays the export cost.
+
+Design Principles:
+- Never fatal: every failure falls back to the eager model
+- Optional dependencies: torch / onnxruntime are imported lazily
+- Model-agnostic: works on the opaque object returned by loader.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from ai.runtime.models import ModelVersionDescriptor, OptimizationSpec
+
+logger = logging.getLogger(__name__)
+
+# Attributes copied from the eager module onto compiled wrappers so that
+# model code reading e.g. ``model.stride`` keeps working.
+_PASSTHROUGH_ATTRS = ("stride", "names", "nc", "task")
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class OptimizationResult:
+    """Outcome of applying load-time optimizations to a model instance."""
+
+    model: Any
+    applied: list[str] = field(default_factory=list)
+    skipped: dict[str, str] = field(default_factory=dict)  # name -> reason
+    cache_hit: bool = False
+
+    @property
+    def is_eager(self) -> bool:
+        """Return True if no optimization was applied."""
+        return not self.applied
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "applied": list(self.applied),
+            "skipped": dict(self.skipped),
+            "cache_hit": self.cache_hit,
+        }
+
+
+# =============================================================================
+# ONNX RUNTIME WRAPPER
+# =============================================================================
+
+
+class OnnxRuntimeModule:
+    """
+    Callable wrapper presenting an ONNX Runtime session like a torch module.
+
+    Accepts a torch tensor or NumPy array and returns outputs of the same
+    kind, so inference code written against the eager module does not need
+    to know which backend is executing.
+    """
+
+    def __init__(self, session: Any, source: Any = None):
+        self.session = session
+        inputs = session.get_inputs()
+        self.input_name = inputs[0].name
+        self.input_type = inputs[0].type  # e.g. "tensor(float)"
+
+        for attr in _PASSTHROUGH_ATTRS:
+            if source is not None and hasattr(source, attr):
+                setattr(self, attr, getattr(source, attr))
+
+    def __call__(self, x: Any, *args: Any, **kwargs: Any) -> Any:
+        import numpy as np
+
+        is_tensor = hasattr(x, "detach") and hasattr(x, "cpu")
+        arr = x.detach().cpu().numpy() if is_tensor else np.asarray(x)
+
+        dtype = np.float16 if self.input_type == "tensor(float16)" else np.float32
+        if arr.dtype != dtype:
+            arr = arr.astype(dtype)
+
+        outputs = self.session.run(None, {self.input_name: arr})
+
+        if is_tensor:
+            import torch
+
+            outputs = [torch.from_numpy(o) for o in outputs]
+
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    def eval(self) -> "OnnxRuntimeModule":
+        """No-op for API compatibility with torch modules."""
+        return self
+
+    def to(self, *args: Any, **kwargs: Any) -> "OnnxRuntimeModule":
+        """No-op: ONNX Runtime sessions are bound to their execution provider."""
+        return self
+
+    def __repr__(self) -> str:
+        return f"OnnxRuntimeModule(input={self.input_name}, type={self.input_type})"
+
+
+# =============================================================================
+# MODEL OPTIMIZER
+# =============================================================================
+
+
+class ModelOptimizer:
+    """
+    Applies the ``optimize:`` contract section to loaded model instances.
+
+    Two kinds of model instance are understood:
+    - torch.nn.Module (e.g. YOLOv7 from attempt_load)
+    - Ultralytics-style models exposing ``export()`` and ``predict()``
+
+    Anything else is returned unchanged.
+
+    Usage:
+        optimizer = ModelOptimizer(cache_dir="/var/cache/ruth-ai/compiled")
+        result = optimizer.optimize(model_instance, descriptor, device="cpu")
+        model_instance = result.model
+    """
+
+    def __init__(self, cache_dir: Optional[Path | str] = None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            cache_dir: Directory for compiled artifacts. Defaults to a
+                directory under the system temp dir.
+        """
+        if cache_dir is None:
+            cache_dir = Path(tempfile.gettempdir()) / "ruth_ai_compiled"
+        self.cache_dir = Path(cache_dir)
+
+        # (path, size, mtime_ns) signature -> hex digest
+        self._hash_cache: dict[tuple, str] = {}
+
+    def optimize(
+        self,
+        model: Any,
+        descriptor: ModelVersionDescriptor,
+        device: str = "cpu",
+    ) -> OptimizationResult:
+        """
+        Apply requested optimizations, falling back to eager on failure.
+
+        Args:
+            model: Model instance returned by loader.py
+            descriptor: Model version descriptor (provides optimize spec)
+            device: Device the model was loaded on
+
+        Returns:
+            OptimizationResult with the (possibly unchanged) model
+        """
+        spec = descriptor.optimize
+        result = OptimizationResult(model=model)
+
+        if model is None or not spec.enabled:
+            return result
+
+        try:
+            if _is_ultralytics_model(model):
+                self._optimize_ultralytics(model, descriptor, spec, device, result)
+            else:
+                self._optimize_torch(model, descriptor, spec, device, result)
+        except Exception as e:
+            # Last line of defence - a bug here must never fail the load
+            logger.warning(
+                "Model optimization failed, using eager model",
+                extra={
+                    "model_id": descriptor.model_id,
+                    "version": descriptor.version,
+                    "error": str(e),
+                },
+            )
+            result.model = model
+            result.applied.clear()
+            result.skipped["all"] = f"unexpected error: {e}"
+
+        logger.info(
+            "Model optimization complete",
+            extra={
+                "model_id": descriptor.model_id,
+                "version": descriptor.version,
+                "device": device,
+                **result.to_dict(),
+            },
+        )
+
+        return result
+
+    # =========================================================================
+    # Torch modules
+    # =========================================================================
+
+    def _optimize_torch(
+        self,
+        model: Any,
+        descriptor: ModelVersionDescriptor,
+        spec: OptimizationSpec,
+        device: str,
+        result: OptimizationResult,
+    ) -> None:
+        """Optimize a torch.nn.Module instance in place on ``result``."""
+        try:
+            import torch
+        except ImportError:
+            _skip_all(spec, result, "torch not installed")
+            return
+
+        if not isinstance(model, torch.nn.Module):
+            _skip_all(spec, result, f"unsupported model type {type(model).__name__}")
+            return
+
+        is_cuda = device.startswith("cuda")
+        current = model
+
+        if spec.channels_last:
+            try:
+                current = current.to(memory_format=torch.channels_last)
+                result.applied.append("channels_last")
+            except Exception as e:
+                result.skipped["channels_last"] = str(e)
+
+        use_fp16 = False
+        if spec.fp16:
+            if is_cuda:
+                try:
+                    current = current.half()
+                    use_fp16 = True
+                    result.applied.append("fp16")
+                except Exception as e:
+                    result.skipped["fp16"] = str(e)
+            else:
+                result.skipped["fp16"] = "requires a CUDA device"
+
+        result.model = current
+
+        if not (spec.torchscript or spec.onnx):
+            return
+
+        height, width = spec.input_size
+        dtype = torch.float16 if use_fp16 else torch.float32
+        memory_format = (
+            torch.channels_last if "channels_last" in result.applied
+            else torch.contiguous_format
+        )
+
+        def example_input() -> Any:
+            return torch.zeros(
+                (1, 3, height, width), dtype=dtype, device=device
+            ).to(memory_format=memory_format)
+
+        if spec.torchscript:
+            variant = self._variant_token(spec, device, "torchscript", torch.__version__)
+            path = self._artifact_path(descriptor, variant, ".ts")
+            try:
+                if path is not None and path.exists():
+                    compiled = torch.jit.load(str(path), map_location=device)
+                    result.cache_hit = True
+                else:
+                    with torch.no_grad():
+                        compiled = torch.jit.trace(current, example_input(), strict=False)
+                    if path is not None:
+                        _atomic_write(path, lambda tmp: torch.jit.save(compiled, tmp))
+                _copy_passthrough_attrs(current, compiled)
+                result.model = compiled
+                result.applied.append("torchscript")
+            except Exception as e:
+                result.skipped["torchscript"] = str(e)
+
+        if spec.onnx:
+            if is_cuda:
+                result.skipped["onnx"] = "ONNX Runtime path uses the CPU execution provider"
+                return
+            try:
+                import onnxruntime as ort
+            except ImportError:
+                result.skipped["onnx"] = "onnxruntime not installed"
+                return
+
+            variant = self._variant_token(spec, device, "onnx", torch.__version__)
+            path = self._artifact_path(descriptor, variant, ".onnx")
+            scratch_dir: Optional[Path] = None
+            if path is None:
+                # ONNX Runtime needs a file; use a throwaway one when not
+                # caching. The session keeps the graph in memory, so the
+                # directory is removed once the session is built.
+                scratch_dir = Path(tempfile.mkdtemp(prefix="ruth_onnx_"))
+                path = scratch_dir / "model.onnx"
+            try:
+                if path.exists():
+                    result.cache_hit = True
+                else:
+                    def export(tmp: str) -> None:
+                        with torch.no_grad():
+                            torch.onnx.export(
+                                current,
+                                example_input(),
+                                tmp,
+                                opset_version=spec.onnx_opset,
+                                input_names=["images"],
+                                dynamic_axes={"images": {0: "batch"}},
+                            )
+
+                    _atomic_write(path, export)
+
+                session = ort.InferenceSession(
+                    str(path), providers=["CPUExecutionProvider"]
+                )
+                result.model = OnnxRuntimeModule(session, source=current)
+                result.applied.append("onnx")
+            except Exception as e:
+                result.skipped["onnx"] = str(e)
+            finally:
+                if scratch_dir is not None:
+                    shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    # =========================================================================
+    # Ultralytics models
+    # =========================================================================
+
+    def _optimize_ultralytics(
+        self,
+        model: Any,
+        descriptor: ModelVersionDescriptor,
+        spec: OptimizationSpec,
+        device: str,
+        result: OptimizationResult,
+    ) -> None:
+        """
+        Optimize an Ultralytics model via its own exporter.
+
+        Ultralytics can load its exported formats back through the same
+        model class, so the returned object keeps the predict() API.
+        """
+        if spec.channels_last:
+            result.skipped["channels_last"] = "not supported for exported Ultralytics models"
+
+        is_cuda = device.startswith("cuda")
+        half = spec.fp16 and is_cuda
+        if spec.fp16 and not is_cuda:
+            result.skipped["fp16"] = "requires a CUDA device"
+
+        if spec.onnx:
+            fmt, suffix = "onnx", ".onnx"
+        elif spec.torchscript:
+            fmt, suffix = "torchscript", ".torchscript"
+        else:
+            if spec.fp16 and is_cuda:
+                result.skipped["fp16"] = "Ultralytics applies fp16 only on export"
+            return
+
+        variant = self._variant_token(spec, device, fmt)
+        path = self._artifact_path(descriptor, variant, suffix)
+
+        try:
+            if path is not None and path.exists():
+                result.cache_hit = True
+                source = path
+            else:
+                exported = model.export(
+                    format=fmt,
+                    imgsz=list(spec.input_size),
+                    half=half,
+                    device=device.replace("cuda:", "") if is_cuda else "cpu",
+                    opset=spec.onnx_opset if fmt == "onnx" else None,
+                )
+                source = Path(str(exported))
+                if path is not None:
+                    # Move rather than copy: Ultralytics exports next to the
+                    # weights, which would otherwise change the weights hash.
+                    _atomic_write(path, lambda tmp: shutil.move(str(source), tmp))
+                    source = path
+
+            task = getattr(model, "task", None)
+            compiled = type(model)(str(source), task=task) if task else type(model)(str(source))
+            result.model = compiled
+            result.applied.append(fmt)
+            if half:
+                result.applied.append("fp16")
+        except Exception as e:
+            result.skipped[fmt] = str(e)
+
+    # =========================================================================
+    # Artifact cache
+    # =========================================================================
+
+    def weights_hash(self, weights_path: Path) -> str:
+        """
+        Compute a content hash of a weights file or directory.
+
+        Results are memoized per (path, size, mtime) so repeated loads of
+        unchanged weights do not re-read hundreds of megabytes.
+        """
+        weights_path = Path(weights_path)
+        files = (
+            sorted(p for p in weights_path.rglob("*") if p.is_file())
+            if weights_path.is_dir()
+            else [weights_path]
+        )
+
+        signature = tuple(
+            (str(p), st.st_size, st.st_mtime_ns)
+            for p in files
+            for st in (p.stat(),)
+        )
+        cached = self._hash_cache.get(signature)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.sha256()
+        for p in files:
+            digest.update(str(p.relative_to(weights_path.parent)).encode())
+            with open(p, "rb") as fh:
+                for chunk in iter(lambda: fh.read(_HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+
+        value = digest.hexdigest()
+        self._hash_cache[signature] = value
+        return value
+
+    def _artifact_path(
+        self,
+        descriptor: ModelVersionDescriptor,
+        variant: str,
+        suffix: str,
+    ) -> Optional[Path]:
+        """Return the cache path for an artifact, or None if caching is off."""
+        if not descriptor.optimize.cache_artifacts:
+            return None
+
+        weights_digest = self.weights_hash(descriptor.weights_path)[:16]
+        name = f"{descriptor.model_id}-{descriptor.version}-{weights_digest}-{variant}{suffix}"
+        return self.cache_dir / name
+
+    @staticmethod
+    def _variant_token(spec: OptimizationSpec, device: str, fmt: str, *extra: str) -> str:
+        """Short hash identifying everything that changes the compiled artifact."""
+        parts = [
+            fmt,
+            "cuda" if device.startswith("cuda") else "cpu",
+            f"fp16={spec.fp16}",
+            f"cl={spec.channels_last}",
+            f"size={spec.input_size[0]}x{spec.input_size[1]}",
+            f"opset={spec.onnx_opset}",
+            *extra,
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _is_ultralytics_model(model: Any) -> bool:
+    """Return True for Ultralytics-style models (export + predict API)."""
+    return callable(getattr(model, "export", None)) and callable(
+        getattr(model, "predict", None)
+    )
+
+
+def _skip_all(spec: OptimizationSpec, result: OptimizationResult, reason: str) -> None:
+    """Record every requested optimization as skipped."""
+    for name in ("fp16", "channels_last", "torchscript", "onnx"):
+        if getattr(spec, name):
+            result.skipped[name] = reason
+
+
+def _copy_passthrough_attrs(source: Any, target: Any) -> None:
+    """Copy well-known metadata attributes from eager to compiled module."""
+    for attr in _PASSTHROUGH_ATTRS:
+        if hasattr(source, attr) and not hasattr(target, attr):
+            try:
+                setattr(target, attr, getattr(source, attr))
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+
+
+def _atomic_write(path: Path, write: Any) -> None:
+    """
+    Write an artifact via a temp file and rename it into place.
+
+    Concurrent loaders of the same model never observe a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix + ".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
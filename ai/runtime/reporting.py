@@ -291,6 +291,10 @@ class RuntimeCapacityReport:
     gpu_memory_used_mb: Optional[int] = None
     gpu_memory_available_mb: Optional[int] = None
 
+    # Pacing signal (same values as the X-Runtime-Capacity header)
+    utilization: Optional[float] = None  # 0.0-1.0, GPU busy fraction
+    service_time_ms: dict[str, float] = field(default_factory=dict)  # model_id -> EWMA
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API payload."""
         result = {
@@ -305,6 +309,8 @@ class RuntimeCapacityReport:
                 "queue_depth": self.queue_depth,
                 "queue_capacity": self.queue_capacity,
             },
+            "utilization": self.utilization,
+            "service_time_ms": self.service_time_ms,
         }
 
         if self.memory_used_mb is not None:
@@ -322,6 +328,39 @@ class RuntimeCapacityReport:
         return result
 
 
+# Response header carrying the compact capacity signal
+CAPACITY_HEADER = "X-Runtime-Capacity"
+
+
+@dataclass
+class CapacitySignal:
+    """
+    Compact capacity signal attached to every runtime response.
+
+    Lets the backend pace cameras from what the runtime measures instead
+    of inferring capacity from its own round-trip times.
+
+    Header form:
+        free=2;queue=0;util=0.63;svc=fall_detection:83.1,ppe_detection:295.0
+    """
+
+    free_slots: int
+    queue_depth: int
+    utilization: Optional[float] = None  # 0.0-1.0, omitted when unknown
+    service_time_ms: dict[str, float] = field(default_factory=dict)
+
+    def to_header(self) -> str:
+        """Serialize to the X-Runtime-Capacity header value."""
+        parts = [f"free={self.free_slots}", f"queue={self.queue_depth}"]
+        if self.utilization is not None:
+            parts.append(f"util={self.utilization:.2f}")
+        if self.service_time_ms:
+            parts.append("svc=" + ",".join(
+                f"{model_id}:{ms:.1f}" for model_id, ms in self.service_time_ms.items()
+            ))
+        return ";".join(parts)
+
+
 @dataclass
 class FullCapabilityReport:
     """
@@ -376,16 +415,29 @@ class HealthAggregator:
       - All UNHEALTHY or no ready versions → model is UNAVAILABLE
 
     The aggregator is stateless - it computes health on demand.
+
+    With advertise_on_demand (lazy model residency), versions that are not
+    loaded but can be loaded on first request (DISCOVERED/UNLOADED/LOADING)
+    are advertised as well, so the backend keeps routing to them.
     """
 
-    def __init__(self, registry: ModelRegistry):
+    # States of versions that are loadable on demand
+    ON_DEMAND_STATES = (LoadState.DISCOVERED, LoadState.LOADING, LoadState.UNLOADED)
+
+    def __init__(self, registry: ModelRegistry, advertise_on_demand: bool = False):
         """
         Initialize the health aggregator.
 
         Args:
             registry: Model registry for reading version states
+            advertise_on_demand: Also advertise versions loadable on demand
         """
         self.registry = registry
+        self.advertise_on_demand = advertise_on_demand
+
+    def _is_on_demand(self, version: ModelVersionDescriptor) -> bool:
+        """Check if a non-resident version should still be advertised."""
+        return self.advertise_on_demand and version.state in self.ON_DEMAND_STATES
 
     def get_version_health(
         self,
@@ -421,7 +473,12 @@ class HealthAggregator:
         degraded_count = 0
         ready_count = 0
 
+        on_demand_count = 0
+
         for version in model.versions.values():
+            if self._is_on_demand(version):
+                on_demand_count += 1
+                continue
             if version.state != LoadState.READY:
                 continue
 
@@ -437,6 +494,9 @@ class HealthAggregator:
             return HealthStatus.HEALTHY
         if degraded_count > 0:
             return HealthStatus.DEGRADED
+        if on_demand_count > 0 and ready_count == 0:
+            # Not loaded yet, but nothing indicates it would not load
+            return HealthStatus.HEALTHY
         if ready_count == 0:
             return HealthStatus.UNKNOWN
 
@@ -450,7 +510,8 @@ class HealthAggregator:
         Get versions that should be advertised to backend.
 
         Only READY versions with HEALTHY or DEGRADED health are advertised.
-        UNHEALTHY versions are NOT advertised.
+        UNHEALTHY versions are NOT advertised. On-demand versions are
+        advertised when advertise_on_demand is enabled.
         """
         model = self.registry.get_model(model_id)
         if model is None:
@@ -458,6 +519,9 @@ class HealthAggregator:
 
         advertisable = []
         for version in model.versions.values():
+            if self._is_on_demand(version):
+                advertisable.append(version)
+                continue
             if version.state != LoadState.READY:
                 continue
             if version.health in (HealthStatus.HEALTHY, HealthStatus.DEGRADED):
@@ -554,11 +618,15 @@ class RuntimeCapacityTracker:
     SOFT_THRESHOLD = 0.6  # 60% queue utilization
     HARD_THRESHOLD = 0.8  # 80% queue utilization
 
+    # Smoothing for per-model service time (weight of the newest sample)
+    SERVICE_TIME_EWMA_ALPHA = 0.2
+
     def __init__(
         self,
         max_concurrent: int = 10,
         queue_capacity: int = 100,
         concurrency_manager: Optional["ConcurrencyManager"] = None,
+        utilization_source: Optional[Callable[[], Optional[float]]] = None,
     ):
         """
         Initialize capacity tracker.
@@ -567,8 +635,11 @@ class RuntimeCapacityTracker:
             max_concurrent: Maximum concurrent inferences (ignored if concurrency_manager provided)
             queue_capacity: Maximum queue depth before hard backpressure
             concurrency_manager: Optional ConcurrencyManager to use as source of truth
+            utilization_source: Returns current GPU utilization (0.0-1.0) or
+                None when unknown; must not block (e.g. reads a telemetry sampler)
         """
         self._concurrency_manager = concurrency_manager
+        self._utilization_source = utilization_source
         self.queue_capacity = queue_capacity
 
         # Use concurrency manager limits if available
@@ -584,6 +655,10 @@ class RuntimeCapacityTracker:
         self._per_model_active: dict[str, int] = {}
         self._lock = threading.Lock()
 
+        # Pacing signal state (requests counted at the HTTP handler)
+        self._in_flight = 0
+        self._service_time_ms: dict[str, float] = {}
+
     def set_model_limit(self, model_id: str, max_concurrent: int) -> None:
         """Set per-model concurrency limit."""
         if self._concurrency_manager is not None:
@@ -697,8 +772,75 @@ class RuntimeCapacityTracker:
                 return "soft"
             return "none"
 
+    # -------------------------------------------------------------------------
+    # Pacing signal
+    # -------------------------------------------------------------------------
+
+    def request_started(self) -> None:
+        """Count an inference request entering the handler."""
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self) -> None:
+        """Count an inference request leaving the handler."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def record_service_time(self, model_id: str, service_ms: float) -> None:
+        """Fold one measured service time into the model's EWMA."""
+        with self._lock:
+            previous = self._service_time_ms.get(model_id)
+            if previous is None:
+                self._service_time_ms[model_id] = service_ms
+            else:
+                alpha = self.SERVICE_TIME_EWMA_ALPHA
+                self._service_time_ms[model_id] = alpha * service_ms + (1 - alpha) * previous
+
+    def _read_utilization(self) -> Optional[float]:
+        if self._utilization_source is None:
+            return None
+        try:
+            return self._utilization_source()
+        except Exception as e:
+            logger.debug(f"Utilization source failed: {e}")
+            return None
+
+    def get_signal(self) -> CapacitySignal:
+        """
+        Build the compact pacing signal.
+
+        Free slots count both admission-controlled slots and requests
+        currently in the inference handler; requests beyond the slot
+        limit are reported as queued.
+        """
+        if self._concurrency_manager is not None:
+            active = self._concurrency_manager.get_global_stats()["global_active"]
+        else:
+            active = None
+
+        with self._lock:
+            busy = max(self._in_flight, self._active_count if active is None else active)
+            waiting = max(0, self._in_flight - self.max_concurrent)
+            signal = CapacitySignal(
+                free_slots=max(0, self.max_concurrent - busy),
+                queue_depth=self._queue_depth + waiting,
+                service_time_ms={
+                    model_id: round(ms, 1) for model_id, ms in self._service_time_ms.items()
+                },
+            )
+
+        signal.utilization = self._read_utilization()
+        return signal
+
     def get_report(self) -> RuntimeCapacityReport:
         """Build a capacity report."""
+        report = self._build_report()
+        signal = self.get_signal()
+        report.utilization = signal.utilization
+        report.service_time_ms = signal.service_time_ms
+        return report
+
+    def _build_report(self) -> RuntimeCapacityReport:
         if self._concurrency_manager is not None:
             # Use concurrency manager as source of truth
             global_stats = self._concurrency_manager.get_global_stats()
@@ -720,13 +862,15 @@ class RuntimeCapacityTracker:
                     queue_capacity=self.queue_capacity,
                 )
 
+        # Read before taking the lock: get_backpressure_level() takes it too
+        backpressure_level = self.get_backpressure_level()
         with self._lock:
             return RuntimeCapacityReport(
                 max_concurrent_inferences=self.max_concurrent,
                 active_inferences=self._active_count,
                 available_slots=max(0, self.max_concurrent - self._active_count),
                 per_model_limits=dict(self._per_model_limits),
-                backpressure_level=self.get_backpressure_level(),
+                backpressure_level=backpressure_level,
                 queue_depth=self._queue_depth,
                 queue_capacity=self.queue_capacity,
             )
@@ -1353,6 +1497,8 @@ def create_reporting_stack(
     queue_capacity: int = 100,
     runtime_id: Optional[str] = None,
     concurrency_manager: Optional["ConcurrencyManager"] = None,
+    advertise_on_demand: bool = False,
+    capacity_tracker: Optional[RuntimeCapacityTracker] = None,
 ) -> tuple[CapabilityPublisher, HealthReporter, RuntimeCapacityTracker]:
     """
     Create a complete reporting stack.
@@ -1366,6 +1512,9 @@ def create_reporting_stack(
         queue_capacity: Queue capacity for backpressure
         runtime_id: Optional runtime identifier
         concurrency_manager: Optional ConcurrencyManager for integrated slot tracking
+        advertise_on_demand: Advertise versions loadable on demand (lazy residency)
+        capacity_tracker: Existing tracker to report from (e.g. one the
+            inference handler already feeds); created if not provided
 
     Returns:
         Tuple of (publisher, reporter, capacity_tracker)
@@ -1385,12 +1534,13 @@ def create_reporting_stack(
         # Now InferencePipeline can use admission controller,
         # and CapabilityPublisher reports consistent capacity info
     """
-    aggregator = HealthAggregator(registry)
-    capacity_tracker = RuntimeCapacityTracker(
-        max_concurrent=max_concurrent,
-        queue_capacity=queue_capacity,
-        concurrency_manager=concurrency_manager,
-    )
+    aggregator = HealthAggregator(registry, advertise_on_demand=advertise_on_demand)
+    if capacity_tracker is None:
+        capacity_tracker = RuntimeCapacityTracker(
+            max_concurrent=max_concurrent,
+            queue_capacity=queue_capacity,
+            concurrency_manager=concurrency_manager,
+        )
 
     publisher = CapabilityPublisher(
         registry=registry,
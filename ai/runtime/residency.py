@@ -0,0 +1,551 @@
+"""
+Ruth AI Runtime - Model Residency Manager
+
+This module keeps only the models that are actually used resident in
+memory. Instead of loading every discovered version at startup, versions
+are loaded on first inference request and evicted in least-recently-used
+order when a memory budget would otherwise be exceeded.
+
+Budgets (any combination may be configured):
+- max_resident_models: maximum number of loaded versions
+- ram_budget_mb: host RAM budget (estimated from hardware.min_ram_mb or
+  limits.max_memory_mb in model.yaml)
+- GPU memory: GPUManager.can_allocate() must have room for the new model
+
+Pinned models (by "model_id" or "model_id:version") are never evicted and
+are expected to be loaded eagerly at startup.
+
+Design Principles:
+- Single-flight: concurrent requests for the same cold model share one load
+- Loads in progress reserve their estimated footprint, so concurrent cold
+  loads of different models cannot overcommit a budget between them
+- Never evict a model with requests in flight
+- Failure isolation: a failed on-demand load marks only that version FAILED
+- Same activation semantics as startup loading (states, sandboxes, GPU)
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from ai.runtime.loader import LoadedModel, ModelLoader
+from ai.runtime.models import HealthStatus, LoadState, ModelVersionDescriptor
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.sandbox import SandboxManager
+
+logger = logging.getLogger(__name__)
+
+# States from which a version can be loaded on demand
+ON_DEMAND_STATES = (LoadState.DISCOVERED, LoadState.UNLOADED)
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class ResidentModel:
+    """Bookkeeping for a loaded (resident) model version."""
+
+    model_id: str
+    version: str
+    device: str = "cpu"
+    memory_mb: float = 0.0
+    ram_mb: float = 0.0
+    pinned: bool = False
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+    @property
+    def qualified_id(self) -> str:
+        """Return fully qualified identifier: model_id:version."""
+        return f"{self.model_id}:{self.version}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for status endpoints."""
+        return {
+            "model_id": self.model_id,
+            "version": self.version,
+            "device": self.device,
+            "memory_mb": self.memory_mb,
+            "ram_mb": self.ram_mb,
+            "pinned": self.pinned,
+            "loaded_at": self.loaded_at.isoformat(),
+            "idle_seconds": round(time.monotonic() - self.last_used, 3),
+            "in_flight": self.in_flight,
+        }
+
+
+# =============================================================================
+# MODEL RESIDENCY MANAGER
+# =============================================================================
+
+
+class ModelResidencyManager:
+    """
+    Loads model versions on demand and evicts idle ones under memory pressure.
+
+    Usage:
+        residency = ModelResidencyManager(
+            loader=loader,
+            registry=registry,
+            sandbox_manager=sandbox_manager,
+            pinned=["fall_detection"],
+            max_resident_models=4,
+        )
+
+        if residency.acquire("helmet_detection", "1.0.0"):
+            try:
+                sandbox_manager.execute(...)
+            finally:
+                residency.release("helmet_detection", "1.0.0")
+    """
+
+    def __init__(
+        self,
+        loader: ModelLoader,
+        registry: ModelRegistry,
+        sandbox_manager: SandboxManager,
+        pinned: Iterable[str] = (),
+        max_resident_models: Optional[int] = None,
+        ram_budget_mb: Optional[float] = None,
+        load_timeout_seconds: float = 120.0,
+        on_loaded: Optional[Callable[[ModelVersionDescriptor, LoadedModel], None]] = None,
+        on_evicted: Optional[Callable[[str, str], None]] = None,
+    ):
+        """
+        Initialize the residency manager.
+
+        Args:
+            loader: Model loader (owns GPU allocation via its GPUManager)
+            registry: Registry whose states are updated on load/evict
+            sandbox_manager: Sandbox manager for resident models
+            pinned: Model ids or qualified ids that are never evicted
+            max_resident_models: Maximum number of resident versions (None = unlimited)
+            ram_budget_mb: Host RAM budget for resident models (None = unlimited)
+            load_timeout_seconds: How long a request waits for an on-demand load
+            on_loaded: Optional callback after a version becomes resident
+            on_evicted: Optional callback after a version is evicted
+        """
+        self.loader = loader
+        self.registry = registry
+        self.sandbox_manager = sandbox_manager
+        self.pinned = frozenset(pinned)
+        self.max_resident_models = max_resident_models
+        self.ram_budget_mb = ram_budget_mb
+        self.load_timeout_seconds = load_timeout_seconds
+        self.on_loaded = on_loaded
+        self.on_evicted = on_evicted
+
+        self._lock = threading.Lock()
+        self._resident: dict[str, ResidentModel] = {}
+        self._loading: dict[str, threading.Event] = {}
+        # Estimated footprint of loads in progress: qualified_id -> entry
+        # (device unknown until loaded; memory_mb is the GPU estimate)
+        self._reserved: dict[str, ResidentModel] = {}
+        self._load_count = 0
+        self._eviction_count = 0
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def is_pinned(self, model_id: str, version: str) -> bool:
+        """Check whether a version is pinned by model id or qualified id."""
+        return model_id in self.pinned or f"{model_id}:{version}" in self.pinned
+
+    def is_resident(self, model_id: str, version: str) -> bool:
+        """Check whether a version is currently loaded."""
+        with self._lock:
+            return f"{model_id}:{version}" in self._resident
+
+    def register_resident(
+        self,
+        descriptor: ModelVersionDescriptor,
+        loaded_model: LoadedModel,
+    ) -> None:
+        """
+        Track a version that was loaded elsewhere (e.g. pinned at startup).
+
+        Args:
+            descriptor: Version descriptor
+            loaded_model: The loaded model returned by ModelLoader
+        """
+        entry = self._make_entry(descriptor, loaded_model)
+        with self._lock:
+            self._resident[entry.qualified_id] = entry
+
+    def ensure_resident(self, model_id: str, version: str) -> bool:
+        """
+        Make sure a version is loaded, loading it (and evicting) if needed.
+
+        Blocks until the version is resident, its load failed, or the load
+        timeout expires. Concurrent callers share a single load.
+
+        Returns:
+            True if the version is resident
+        """
+        qualified_id = f"{model_id}:{version}"
+
+        while True:
+            with self._lock:
+                if qualified_id in self._resident:
+                    return True
+
+                event = self._loading.get(qualified_id)
+                owner = event is None
+                if owner:
+                    descriptor = self.registry.get_version(model_id, version)
+                    if descriptor is None:
+                        return False
+                    if descriptor.state == LoadState.READY:
+                        # Loaded outside the manager and not tracked (yet)
+                        return True
+                    if descriptor.state not in ON_DEMAND_STATES:
+                        return False
+                    event = threading.Event()
+                    self._loading[qualified_id] = event
+
+            if owner:
+                try:
+                    return self._load(descriptor)
+                finally:
+                    with self._lock:
+                        self._loading.pop(qualified_id, None)
+                    event.set()
+
+            if not event.wait(self.load_timeout_seconds):
+                logger.warning(
+                    "Timed out waiting for on-demand model load",
+                    extra={"model_id": model_id, "version": version},
+                )
+                return False
+
+            with self._lock:
+                if qualified_id in self._resident:
+                    return True
+            # Load failed or the model was evicted before we got here:
+            # only retry if it is loadable again.
+            descriptor = self.registry.get_version(model_id, version)
+            if descriptor is None or descriptor.state not in ON_DEMAND_STATES:
+                return False
+
+    def acquire(self, model_id: str, version: str) -> bool:
+        """
+        Ensure a version is resident and mark one request in flight.
+
+        A version with requests in flight is never evicted. Every successful
+        acquire() must be paired with release().
+
+        Returns:
+            True if the version is resident and acquired
+        """
+        qualified_id = f"{model_id}:{version}"
+
+        # A concurrent eviction can slip in between load and acquire; retry once.
+        for _ in range(2):
+            if not self.ensure_resident(model_id, version):
+                return False
+            with self._lock:
+                entry = self._resident.get(qualified_id)
+                if entry is not None:
+                    entry.in_flight += 1
+                    entry.last_used = time.monotonic()
+                    return True
+            descriptor = self.registry.get_version(model_id, version)
+            if descriptor is not None and descriptor.state == LoadState.READY:
+                return True  # untracked; release() is a no-op
+        return False
+
+    def release(self, model_id: str, version: str) -> None:
+        """Mark a request on this version as finished."""
+        with self._lock:
+            entry = self._resident.get(f"{model_id}:{version}")
+            if entry is not None:
+                entry.in_flight = max(0, entry.in_flight - 1)
+                entry.last_used = time.monotonic()
+
+    def evict(self, model_id: str, version: str) -> bool:
+        """
+        Unload a resident version and release its memory.
+
+        Pinned versions and versions with requests in flight are not evicted.
+
+        Returns:
+            True if the version was evicted
+        """
+        with self._lock:
+            entry = self._resident.get(f"{model_id}:{version}")
+            if entry is None or entry.pinned or entry.in_flight > 0:
+                return False
+            self._detach(entry)
+
+        self._unload(entry)
+        return True
+
+    def get_status(self) -> dict[str, Any]:
+        """Return residency state for health/debug endpoints."""
+        with self._lock:
+            resident = [e.to_dict() for e in self._resident.values()]
+            loading = list(self._loading)
+            return {
+                "resident": resident,
+                "loading": loading,
+                "pinned": sorted(self.pinned),
+                "max_resident_models": self.max_resident_models,
+                "ram_budget_mb": self.ram_budget_mb,
+                "ram_used_mb": sum(e.ram_mb for e in self._resident.values()),
+                "loads": self._load_count,
+                "evictions": self._eviction_count,
+            }
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def _load(self, descriptor: ModelVersionDescriptor) -> bool:
+        """Evict as needed, then load and activate a version."""
+        model_id = descriptor.model_id
+        version = descriptor.version
+
+        self._make_room(descriptor)
+        self.registry.update_state(model_id, version, LoadState.LOADING)
+
+        try:
+            return self._load_reserved(descriptor)
+        finally:
+            with self._lock:
+                self._reserved.pop(descriptor.qualified_id, None)
+
+    def _load_reserved(self, descriptor: ModelVersionDescriptor) -> bool:
+        """Load and activate a version whose footprint _make_room reserved."""
+        model_id = descriptor.model_id
+        version = descriptor.version
+
+        try:
+            load_result = self.loader.load(descriptor)
+
+            if not (load_result.success and load_result.loaded_model):
+                error = load_result.error
+                self.registry.update_state(
+                    model_id,
+                    version,
+                    LoadState.FAILED,
+                    error.message if error else "Unknown error",
+                    error.code.value if error else None,
+                )
+                logger.error(
+                    "On-demand model load failed",
+                    extra={
+                        "model_id": model_id,
+                        "version": version,
+                        "error": error.message if error else "Unknown error",
+                    },
+                )
+                return False
+
+            loaded = load_result.loaded_model
+            self.sandbox_manager.create_sandbox(loaded, descriptor)
+            entry = self._make_entry(descriptor, loaded)
+            with self._lock:
+                self._resident[entry.qualified_id] = entry
+                self._load_count += 1
+
+            self.registry.update_state(model_id, version, LoadState.READY)
+            self.registry.update_health(model_id, version, HealthStatus.HEALTHY)
+
+            if self.on_loaded:
+                self._safe_callback(self.on_loaded, descriptor, loaded)
+
+            logger.info(
+                "Model loaded on demand",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "device": loaded.device,
+                    "load_time_ms": load_result.load_time_ms,
+                },
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "On-demand model load exception",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "error": str(e),
+                    "traceback": traceback.format_exc(),
+                },
+            )
+            self.registry.update_state(model_id, version, LoadState.FAILED, str(e))
+            return False
+
+    def _make_entry(
+        self,
+        descriptor: ModelVersionDescriptor,
+        loaded_model: LoadedModel,
+    ) -> ResidentModel:
+        """Build a residency record for a loaded version."""
+        return ResidentModel(
+            model_id=descriptor.model_id,
+            version=descriptor.version,
+            device=loaded_model.device,
+            memory_mb=self.loader.estimate_memory_mb(descriptor),
+            ram_mb=self._estimate_ram_mb(descriptor),
+            pinned=self.is_pinned(descriptor.model_id, descriptor.version),
+        )
+
+    # =========================================================================
+    # Eviction
+    # =========================================================================
+
+    def _make_room(self, descriptor: ModelVersionDescriptor) -> None:
+        """
+        Evict least-recently-used idle versions until the new one fits, then
+        reserve its estimated footprint until the load finishes.
+
+        The check and the reservation happen under one lock, so a concurrent
+        cold load of another model sees this one as already using its share.
+        If nothing evictable is left the load proceeds anyway; the loader
+        falls back to CPU exactly as startup loading would.
+        """
+        reservation = ResidentModel(
+            model_id=descriptor.model_id,
+            version=descriptor.version,
+            memory_mb=self.loader.estimate_memory_mb(descriptor),
+            ram_mb=self._estimate_ram_mb(descriptor),
+        )
+
+        while True:
+            with self._lock:
+                if self._fits(reservation):
+                    self._reserved[reservation.qualified_id] = reservation
+                    return
+                victim = self._pick_victim()
+                if victim is None:
+                    logger.warning(
+                        "No evictable model to make room",
+                        extra={
+                            "model_id": descriptor.model_id,
+                            "version": descriptor.version,
+                            "resident": len(self._resident),
+                            "loading": len(self._reserved),
+                        },
+                    )
+                    self._reserved[reservation.qualified_id] = reservation
+                    return
+                self._detach(victim)
+
+            self._unload(victim)
+
+    def _fits(self, reservation: ResidentModel) -> bool:
+        """
+        Check a new version against all configured budgets. Caller holds _lock.
+
+        Loads already in progress count as if they were resident.
+        """
+        resident = list(self._resident.values())
+        reserved = list(self._reserved.values())
+
+        if self.max_resident_models is not None:
+            if len(resident) + len(reserved) >= self.max_resident_models:
+                return False
+
+        if self.ram_budget_mb is not None:
+            used = sum(e.ram_mb for e in resident) + sum(e.ram_mb for e in reserved)
+            if used + reservation.ram_mb > self.ram_budget_mb:
+                return False
+
+        gpu_manager = self.loader.gpu_manager
+        if gpu_manager is not None and gpu_manager.is_available:
+            # Loads in progress have not allocated from the GPU manager yet
+            required_mb = reservation.memory_mb + sum(e.memory_mb for e in reserved)
+            if not gpu_manager.can_allocate(reservation.model_id, required_mb):
+                # Evicting only helps if something resident holds GPU memory
+                return not any(e.device.startswith("cuda") for e in resident)
+
+        return True
+
+    def _pick_victim(self) -> Optional[ResidentModel]:
+        """Return the least recently used evictable version. Caller holds _lock."""
+        candidates = [
+            e for e in self._resident.values() if not e.pinned and e.in_flight == 0
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda e: e.last_used)
+
+    def _detach(self, entry: ResidentModel) -> None:
+        """
+        Stop routing requests to a version. Caller holds _lock.
+
+        The state moves to UNLOADING in the same critical section so that
+        acquire() cannot mistake it for an untracked READY version.
+        """
+        del self._resident[entry.qualified_id]
+        self.registry.update_state(entry.model_id, entry.version, LoadState.UNLOADING)
+
+    def _unload(self, entry: ResidentModel) -> None:
+        """Tear down a version that has already been detached."""
+        model_id = entry.model_id
+        version = entry.version
+
+        try:
+            self.sandbox_manager.remove_sandbox(model_id, version)
+            self.loader.unload(model_id, version)
+        except Exception as e:
+            logger.warning(
+                "Error while evicting model",
+                extra={"model_id": model_id, "version": version, "error": str(e)},
+            )
+        self.registry.update_state(model_id, version, LoadState.UNLOADED)
+        self.registry.update_health(model_id, version, HealthStatus.UNKNOWN)
+
+        # Drop the last references to weights so memory is actually returned
+        gc.collect()
+
+        with self._lock:
+            self._eviction_count += 1
+
+        if self.on_evicted:
+            self._safe_callback(self.on_evicted, model_id, version)
+
+        logger.info(
+            "Model evicted",
+            extra={
+                "model_id": model_id,
+                "version": version,
+                "idle_seconds": round(time.monotonic() - entry.last_used, 3),
+            },
+        )
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _estimate_ram_mb(descriptor: ModelVersionDescriptor) -> float:
+        """Estimate host RAM used by a version from its contract."""
+        if descriptor.hardware.min_ram_mb:
+            return float(descriptor.hardware.min_ram_mb)
+        if descriptor.limits.max_memory_mb:
+            return float(descriptor.limits.max_memory_mb)
+        return 0.0
+
+    @staticmethod
+    def _safe_callback(callback: Callable[..., None], *args: Any) -> None:
+        """Invoke a callback without letting it break loading/eviction."""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.warning("Residency callback failed", extra={"error": str(e)})
@@ -0,0 +1,414 @@
+"""
+Ruth AI Runtime - Parallel Startup Loader
+
+This module loads all discovered model versions concurrently at runtime
+startup, instead of one after another.
+
+Each model becomes available for inference (READY + sandbox) the moment its
+own load and warmup finish, so the HTTP server can start serving while
+slower models are still loading.
+
+Concurrency is bounded by:
+- A worker limit (number of loads in flight)
+- The GPU memory budget: a load is only started when GPUManager.can_allocate
+  reports room for it on top of in-flight loads that have not yet reserved
+  their memory. If nothing is in flight the load starts anyway and the
+  loader falls back to CPU as before.
+
+Design Principles:
+- Failure isolation: one model's failure never blocks the others
+- Non-blocking: start() returns immediately, wait() is optional
+- Same semantics as sequential loading (states, sandboxes, GPU fallback)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from ai.runtime.loader import LoadResult, ModelLoader
+from ai.runtime.models import HealthStatus, LoadState, ModelVersionDescriptor
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.sandbox import SandboxManager
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class ModelLoadOutcome:
+    """Outcome of loading a single model version at startup."""
+
+    model_id: str
+    version: str
+    success: bool
+    device: str = "cpu"
+    load_time_ms: int = 0
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+
+    @property
+    def qualified_id(self) -> str:
+        """Return fully qualified identifier: model_id:version."""
+        return f"{self.model_id}:{self.version}"
+
+
+@dataclass
+class StartupLoadReport:
+    """Aggregate result of a parallel startup load."""
+
+    outcomes: list[ModelLoadOutcome] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)  # qualified_ids not attempted
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+    duration_ms: int = 0
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of versions loaded successfully."""
+        return sum(1 for o in self.outcomes if o.success)
+
+    @property
+    def failed_count(self) -> int:
+        """Number of versions that failed to load."""
+        return sum(1 for o in self.outcomes if not o.success)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "loaded": self.loaded_count,
+            "failed": self.failed_count,
+            "skipped": len(self.skipped),
+            "duration_ms": self.duration_ms,
+            "sum_load_time_ms": sum(o.load_time_ms for o in self.outcomes),
+        }
+
+
+# =============================================================================
+# PARALLEL MODEL LOADER
+# =============================================================================
+
+
+class ParallelModelLoader:
+    """
+    Loads model versions concurrently and activates each one when ready.
+
+    Usage:
+        startup = ParallelModelLoader(
+            loader=loader,
+            registry=registry,
+            sandbox_manager=sandbox_manager,
+            max_workers=2,
+        )
+        startup.start(discovery_result.discovered_versions)  # returns immediately
+        ...
+        startup.wait(timeout=300)  # optional
+        report = startup.report
+    """
+
+    def __init__(
+        self,
+        loader: ModelLoader,
+        registry: ModelRegistry,
+        sandbox_manager: SandboxManager,
+        max_workers: int = 2,
+        on_loaded: Optional[Callable[[ModelVersionDescriptor, LoadResult], None]] = None,
+        on_failed: Optional[Callable[[ModelVersionDescriptor, str], None]] = None,
+    ):
+        """
+        Initialize the parallel loader.
+
+        Args:
+            loader: Model loader (owns GPU allocation via its GPUManager)
+            registry: Registry whose states are updated as models load
+            sandbox_manager: Sandbox manager for READY models
+            max_workers: Maximum number of concurrent loads
+            on_loaded: Optional callback after a model becomes READY
+            on_failed: Optional callback after a model fails to load
+        """
+        self.loader = loader
+        self.registry = registry
+        self.sandbox_manager = sandbox_manager
+        self.max_workers = max(1, max_workers)
+        self.on_loaded = on_loaded
+        self.on_failed = on_failed
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self._pending: list[ModelVersionDescriptor] = []
+        self._in_flight: dict[str, ModelVersionDescriptor] = {}
+        self._report = StartupLoadReport()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def start(self, descriptors: list[ModelVersionDescriptor]) -> None:
+        """
+        Start loading in a background thread and return immediately.
+
+        Args:
+            descriptors: Discovered version descriptors (INVALID ones are skipped)
+        """
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self.load_all,
+            args=(descriptors,),
+            name="model-startup-loader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def load_all(self, descriptors: list[ModelVersionDescriptor]) -> StartupLoadReport:
+        """
+        Load all loadable descriptors, blocking until done.
+
+        Args:
+            descriptors: Discovered version descriptors (INVALID ones are skipped)
+
+        Returns:
+            StartupLoadReport with per-model outcomes
+        """
+        start_time = time.monotonic()
+        self._report = StartupLoadReport()
+        self._done.clear()
+
+        with self._lock:
+            self._pending = [d for d in descriptors if d.state != LoadState.INVALID]
+
+        logger.info(
+            "Starting parallel model load",
+            extra={
+                "model_count": len(self._pending),
+                "max_workers": self.max_workers,
+            },
+        )
+
+        futures: dict[Future, ModelVersionDescriptor] = {}
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="model-load"
+            ) as pool:
+                while True:
+                    with self._lock:
+                        if self._cancelled.is_set():
+                            self._report.skipped.extend(d.qualified_id for d in self._pending)
+                            self._pending.clear()
+
+                        for descriptor in self._schedulable():
+                            self._pending.remove(descriptor)
+                            self._in_flight[descriptor.qualified_id] = descriptor
+                            futures[pool.submit(self._load_one, descriptor)] = descriptor
+
+                        if not futures:
+                            break
+
+                    done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        descriptor = futures.pop(future)
+                        outcome = future.result()
+                        with self._lock:
+                            self._in_flight.pop(descriptor.qualified_id, None)
+                            self._report.outcomes.append(outcome)
+        finally:
+            self._report.completed_at = datetime.utcnow()
+            self._report.duration_ms = int((time.monotonic() - start_time) * 1000)
+            self._done.set()
+
+        logger.info("Parallel model load completed", extra=self._report.to_dict())
+
+        return self._report
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all loads have finished.
+
+        Returns:
+            True if loading completed, False on timeout
+        """
+        if self._thread is None and not self._done.is_set():
+            return True
+        return self._done.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stop scheduling new loads; in-flight loads run to completion."""
+        self._cancelled.set()
+
+    @property
+    def is_running(self) -> bool:
+        """True while loads are pending or in flight."""
+        return self._thread is not None and not self._done.is_set()
+
+    @property
+    def report(self) -> StartupLoadReport:
+        """Report of the most recent load_all() run."""
+        return self._report
+
+    def get_status(self) -> dict[str, Any]:
+        """Return loading progress for health/debug endpoints."""
+        with self._lock:
+            return {
+                "running": self.is_running,
+                "pending": [d.qualified_id for d in self._pending],
+                "in_flight": list(self._in_flight),
+                **self._report.to_dict(),
+            }
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    def _schedulable(self) -> list[ModelVersionDescriptor]:
+        """
+        Select pending descriptors that can start now. Caller holds _lock.
+
+        Not strictly FIFO: a small model that fits the GPU budget may start
+        ahead of a large one that has to wait for in-flight loads.
+        """
+        selected: list[ModelVersionDescriptor] = []
+        in_flight = list(self._in_flight.values())
+
+        for descriptor in list(self._pending):
+            if len(in_flight) + len(selected) >= self.max_workers:
+                break
+            if self._fits_budget(descriptor, in_flight + selected):
+                selected.append(descriptor)
+
+        return selected
+
+    def _fits_budget(
+        self,
+        descriptor: ModelVersionDescriptor,
+        in_flight: list[ModelVersionDescriptor],
+    ) -> bool:
+        """Check whether a load can start without oversubscribing the GPU."""
+        gpu_manager = self.loader.gpu_manager
+        if gpu_manager is None or not gpu_manager.is_available:
+            return True
+
+        # In-flight loads that have not reserved their memory yet
+        pending_mb = sum(
+            self.loader.estimate_memory_mb(d)
+            for d in in_flight
+            if gpu_manager.get_allocation(d.model_id, d.version) is None
+        )
+        required_mb = self.loader.estimate_memory_mb(descriptor)
+
+        if gpu_manager.can_allocate(descriptor.model_id, required_mb + pending_mb):
+            return True
+
+        # Nothing in flight can free memory - start it and let the loader
+        # fall back to CPU, exactly as sequential loading would.
+        return not in_flight
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def _load_one(self, descriptor: ModelVersionDescriptor) -> ModelLoadOutcome:
+        """Load, activate and report a single model version."""
+        model_id = descriptor.model_id
+        version = descriptor.version
+
+        self.registry.update_state(model_id, version, LoadState.LOADING)
+
+        try:
+            load_result = self.loader.load(descriptor)
+
+            if not (load_result.success and load_result.loaded_model):
+                error = load_result.error
+                message = error.message if error else "Unknown error"
+                code = error.code.value if error else None
+                return self._fail(descriptor, message, code)
+
+            loaded = load_result.loaded_model
+            self.sandbox_manager.create_sandbox(loaded, descriptor)
+            self.registry.update_state(model_id, version, LoadState.READY)
+            self.registry.update_health(model_id, version, HealthStatus.HEALTHY)
+
+            if self.on_loaded:
+                self._safe_callback(self.on_loaded, descriptor, load_result)
+
+            logger.info(
+                "Model ready",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "device": loaded.device,
+                    "load_time_ms": load_result.load_time_ms,
+                },
+            )
+
+            return ModelLoadOutcome(
+                model_id=model_id,
+                version=version,
+                success=True,
+                device=loaded.device,
+                load_time_ms=load_result.load_time_ms,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Model load exception",
+                extra={
+                    "model_id": model_id,
+                    "version": version,
+                    "error": str(e),
+                    "traceback": traceback.format_exc(),
+                },
+            )
+            return self._fail(descriptor, str(e), None)
+
+    def _fail(
+        self,
+        descriptor: ModelVersionDescriptor,
+        message: str,
+        code: Optional[str],
+    ) -> ModelLoadOutcome:
+        """Record a failed load."""
+        self.registry.update_state(
+            descriptor.model_id, descriptor.version, LoadState.FAILED, message, code
+        )
+
+        if self.on_failed:
+            self._safe_callback(self.on_failed, descriptor, message)
+
+        logger.error(
+            "Model load failed",
+            extra={
+                "model_id": descriptor.model_id,
+                "version": descriptor.version,
+                "error": message,
+            },
+        )
+
+        return ModelLoadOutcome(
+            model_id=descriptor.model_id,
+            version=descriptor.version,
+            success=False,
+            error=message,
+            error_code=code,
+        )
+
+    @staticmethod
+    def _safe_callback(callback: Callable[..., None], *args: Any) -> None:
+        """Invoke a callback without letting it break the load."""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.warning("Startup loader callback failed", extra={"error": str(e)})
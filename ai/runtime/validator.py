@@ -41,6 +41,7 @@ from ai.runtime.models import (
     InputType,
     ModelCapabilities,
     ModelVersionDescriptor,
+    OptimizationSpec,
     OutputSpecification,
     PerformanceHints,
     ResourceLimits,
@@ -162,6 +163,9 @@ class ContractValidator:
         limits = self._parse_limits(contract_data.get("limits", {}))
         capabilities = self._parse_capabilities(contract_data.get("capabilities", {}))
         entry_points = self._parse_entry_points(contract_data.get("entry_points", {}))
+        optimize = self._parse_optimize(
+            contract_data.get("optimize") or {}, contract_path, result
+        )
 
         # Stage 6: Validate conditional requirements
         self._validate_conditional_requirements(
@@ -195,6 +199,7 @@ class ContractValidator:
                 limits=limits,
                 capabilities=capabilities,
                 entry_points=entry_points,
+                optimize=optimize,
             )
 
         return result
@@ -380,6 +385,27 @@ class ContractValidator:
             )
             input_format = InputFormat.JPEG
 
+        # Parse reduced-scale decode hint
+        decode_max_side = data.get("decode_max_side")
+        if decode_max_side is not None and (
+            isinstance(decode_max_side, bool)
+            or not isinstance(decode_max_side, int)
+            or decode_max_side < 1
+        ):
+            result.add_error(
+                validation_error(
+                    ErrorCode.VAL_FIELD_OUT_OF_RANGE,
+                    "input.decode_max_side must be a positive integer",
+                    model_id=result.model_id,
+                    version=result.version,
+                    path=path,
+                    field_name="input.decode_max_side",
+                    expected="positive integer",
+                    actual=str(decode_max_side),
+                )
+            )
+            decode_max_side = None
+
         # Parse batch settings if applicable
         batch_data = data.get("batch", {})
         temporal_data = data.get("temporal", {})
@@ -392,6 +418,7 @@ class ContractValidator:
             max_width=data.get("max_width"),
             max_height=data.get("max_height"),
             channels=data.get("channels", 3),
+            decode_max_side=decode_max_side,
             batch_min_size=batch_data.get("min_size"),
             batch_max_size=batch_data.get("max_size"),
             batch_recommended_size=batch_data.get("recommended_size"),
@@ -514,6 +541,54 @@ class ContractValidator:
             loader=data.get("loader"),
         )
 
+    def _parse_optimize(
+        self, data: dict[str, Any], path: Path, result: ValidationResult
+    ) -> OptimizationSpec:
+        """Parse optional load-time optimizations (all optional)."""
+        if data.get("torchscript") and data.get("onnx"):
+            result.add_error(
+                contract_error(
+                    ErrorCode.CONTRACT_CONDITIONAL_ERROR,
+                    "optimize.torchscript and optimize.onnx are mutually exclusive",
+                    model_id=result.model_id,
+                    version=result.version,
+                    path=path,
+                    field_name="optimize",
+                )
+            )
+
+        input_size = data.get("input_size", [640, 640])
+        if isinstance(input_size, int):
+            input_size = [input_size, input_size]
+        if (
+            not isinstance(input_size, (list, tuple))
+            or len(input_size) != 2
+            or not all(isinstance(v, int) and v > 0 for v in input_size)
+        ):
+            result.add_error(
+                validation_error(
+                    ErrorCode.VAL_INVALID_FIELD_TYPE,
+                    f"Invalid optimize.input_size: {input_size}",
+                    model_id=result.model_id,
+                    version=result.version,
+                    path=path,
+                    field_name="optimize.input_size",
+                    expected="[height, width] of positive integers",
+                    actual=str(input_size),
+                )
+            )
+            input_size = [640, 640]
+
+        return OptimizationSpec(
+            fp16=bool(data.get("fp16", False)),
+            channels_last=bool(data.get("channels_last", False)),
+            torchscript=bool(data.get("torchscript", False)),
+            onnx=bool(data.get("onnx", False)),
+            onnx_opset=data.get("onnx_opset", 17),
+            input_size=(int(input_size[0]), int(input_size[1])),
+            cache_artifacts=bool(data.get("cache_artifacts", True)),
+        )
+
     def _validate_conditional_requirements(
         self,
         data: dict[str, Any],
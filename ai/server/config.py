@@ -28,12 +28,30 @@ Environment Variables:
     GPU_MEMORY_RESERVE_MB: Memory to reserve for PyTorch (default: 512)
     GPU_FALLBACK_TO_CPU: Fall back to CPU when GPU unavailable (default: true)
 
+    # Models
+    MODEL_ARTIFACT_CACHE_DIR: Cache for compiled (TorchScript/ONNX) model artifacts
+    MODEL_LOAD_CONCURRENCY: Models loaded in parallel at startup (default: 2)
+    MODEL_LOAD_BLOCKING: Wait for all models before serving (default: false)
+    MODEL_RESIDENCY_MODE: eager (load all at startup) or lazy (load on demand) - default: eager
+    MODEL_PINNED: JSON list of model ids / model_id:version always resident in lazy mode
+    MODEL_MAX_RESIDENT: Max loaded versions in lazy mode (default: unlimited)
+    MODEL_RAM_BUDGET_MB: Host RAM budget for loaded models in lazy mode (default: unlimited)
+    MODEL_LAZY_LOAD_TIMEOUT_SECONDS: Max wait for an on-demand load (default: 120)
+    MODEL_WATCH_ENABLED: Detect added/changed model versions while running (default: false)
+    MODEL_WATCH_POLL_INTERVAL_SECONDS: Stat-only manifest sweep interval (default: 1.0)
+    HOT_SWAP_DRAIN_TIMEOUT_SECONDS: Drain timeout for blue/green version swaps (default: 30)
+
     # Metrics
     METRICS_ENABLED: Enable Prometheus metrics (default: true)
+    GPU_TELEMETRY_INTERVAL_SECONDS: NVML sampling period (default: 1.0)
+    GPU_TELEMETRY_HISTORY_SECONDS: Telemetry ring buffer length (default: 300)
 
     # Observability
     REQUEST_ID_HEADER: Header name for request ID (default: X-Request-ID)
 
+    # Internal API
+    INTERNAL_API_KEY: Shared secret for /internal and /debug endpoints (disabled when unset)
+
     # Shutdown
     GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS: Timeout for graceful shutdown (default: 30)
 
@@ -151,6 +169,20 @@ class RuntimeConfig(BaseSettings):
         description="Enable Prometheus metrics collection"
     )
 
+    gpu_telemetry_interval_seconds: float = Field(
+        default=1.0,
+        ge=0.1,
+        le=60.0,
+        description="NVML sampling period for the GPU telemetry sampler"
+    )
+
+    gpu_telemetry_history_seconds: float = Field(
+        default=300.0,
+        ge=10.0,
+        le=3600.0,
+        description="How much GPU telemetry history the ring buffer keeps"
+    )
+
     metrics_update_interval_seconds: float = Field(
         default=15.0,
         ge=1.0,
@@ -186,6 +218,68 @@ class RuntimeConfig(BaseSettings):
         description="Model loading timeout (milliseconds)"
     )
 
+    model_load_concurrency: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum number of models loaded in parallel at startup"
+    )
+
+    model_load_blocking: bool = Field(
+        default=False,
+        description="Wait for all models to load before serving requests"
+    )
+
+    model_residency_mode: str = Field(
+        default="eager",
+        description="eager: load all models at startup; lazy: load on first request, evict LRU"
+    )
+
+    model_pinned: list[str] = Field(
+        default_factory=list,
+        description="Model ids or model_id:version kept resident in lazy mode"
+    )
+
+    model_max_resident: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of loaded model versions in lazy mode"
+    )
+
+    model_ram_budget_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Host RAM budget for loaded models in lazy mode (MB)"
+    )
+
+    model_lazy_load_timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Maximum time a request waits for an on-demand model load"
+    )
+
+    model_watch_enabled: bool = Field(
+        default=False,
+        description="Watch models root and register added/changed versions at runtime"
+    )
+
+    model_watch_poll_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Interval of the stat-only manifest sweep (fallback/safety net for inotify)"
+    )
+
+    hot_swap_drain_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Max wait for in-flight requests on the old version during a hot-swap"
+    )
+
+    model_artifact_cache_dir: str = Field(
+        default="/tmp/ruth_ai_compiled",
+        description="Directory for compiled model artifacts (model.yaml optimize:)"
+    )
+
     # =========================================================================
     # Shutdown Configuration
     # =========================================================================
@@ -242,6 +336,15 @@ class RuntimeConfig(BaseSettings):
         description="Backend read timeout"
     )
 
+    # =========================================================================
+    # Internal API Configuration
+    # =========================================================================
+
+    internal_api_key: Optional[str] = Field(
+        default=None,
+        description="Shared secret for /internal and /debug endpoints (disabled when unset)"
+    )
+
     # =========================================================================
     # Pydantic Configuration
     # =========================================================================
@@ -4,13 +4,19 @@ Ruth AI Unified Runtime - FastAPI Dependencies
 Provides dependency injection for runtime components.
 """
 
+import hmac
 from typing import Optional
 
+from fastapi import Header, HTTPException, status
+
 from ai.runtime.registry import ModelRegistry
 from ai.runtime.pipeline import InferencePipeline
-from ai.runtime.reporting import HealthReporter, CapabilityPublisher
+from ai.runtime.reporting import HealthReporter, CapabilityPublisher, RuntimeCapacityTracker
 from ai.runtime.sandbox import SandboxManager
+from ai.runtime.residency import ModelResidencyManager
+from ai.runtime.hotswap import HotSwapManager, TrafficRouter
 from ai.runtime.backend_client import HTTPBackendClient
+from ai.server.config import get_config
 
 # Global runtime components (initialized at startup)
 _registry: Optional[ModelRegistry] = None
@@ -19,6 +25,10 @@ _reporter: Optional[HealthReporter] = None
 _sandbox_manager: Optional[SandboxManager] = None
 _backend_client: Optional[HTTPBackendClient] = None
 _capability_publisher: Optional[CapabilityPublisher] = None
+_residency_manager: Optional[ModelResidencyManager] = None
+_traffic_router: Optional[TrafficRouter] = None
+_hot_swap_manager: Optional[HotSwapManager] = None
+_capacity_tracker: Optional[RuntimeCapacityTracker] = None
 
 
 def set_registry(registry: ModelRegistry) -> None:
@@ -87,13 +97,78 @@ def get_capability_publisher() -> Optional[CapabilityPublisher]:
     return _capability_publisher
 
 
+def set_residency_manager(manager: ModelResidencyManager) -> None:
+    """Set the global residency manager instance (lazy loading mode)."""
+    global _residency_manager
+    _residency_manager = manager
+
+
+def get_residency_manager() -> Optional[ModelResidencyManager]:
+    """Get the global residency manager instance (None in eager mode)."""
+    return _residency_manager
+
+
+def set_traffic_router(router: TrafficRouter) -> None:
+    """Set the global traffic router instance."""
+    global _traffic_router
+    _traffic_router = router
+
+
+def get_traffic_router() -> Optional[TrafficRouter]:
+    """Get the global traffic router instance."""
+    return _traffic_router
+
+
+def set_hot_swap_manager(manager: HotSwapManager) -> None:
+    """Set the global hot-swap manager instance."""
+    global _hot_swap_manager
+    _hot_swap_manager = manager
+
+
+def get_hot_swap_manager() -> Optional[HotSwapManager]:
+    """Get the global hot-swap manager instance."""
+    return _hot_swap_manager
+
+
+def set_capacity_tracker(tracker: RuntimeCapacityTracker) -> None:
+    """Set the global capacity tracker instance."""
+    global _capacity_tracker
+    _capacity_tracker = tracker
+
+
+def get_capacity_tracker() -> Optional[RuntimeCapacityTracker]:
+    """Get the global capacity tracker instance."""
+    return _capacity_tracker
+
+
+def require_internal_api_key(
+    x_internal_api_key: Optional[str] = Header(default=None),
+) -> None:
+    """
+    Guard for internal/admin endpoints.
+
+    Endpoints are disabled (404) unless INTERNAL_API_KEY is configured, and
+    require a matching X-Internal-API-Key header (403 otherwise).
+    """
+    expected = get_config().internal_api_key
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if not x_internal_api_key or not hmac.compare_digest(x_internal_api_key, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal API key")
+
+
 def clear_all() -> None:
     """Clear all global instances during shutdown."""
     global _registry, _pipeline, _reporter, _sandbox_manager
-    global _backend_client, _capability_publisher
+    global _backend_client, _capability_publisher, _residency_manager
+    global _traffic_router, _hot_swap_manager, _capacity_tracker
     _registry = None
     _pipeline = None
     _reporter = None
     _sandbox_manager = None
     _backend_client = None
     _capability_publisher = None
+    _residency_manager = None
+    _traffic_router = None
+    _hot_swap_manager = None
+    _capacity_tracker = None
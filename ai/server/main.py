@@ -29,16 +29,22 @@ import uvicorn
 # Add ai/ to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ai.runtime.discovery import DiscoveryScanner
+from ai.runtime.discovery import DiscoveryScanner, DirectoryWatcher
 from ai.runtime.registry import ModelRegistry
 from ai.runtime.loader import ModelLoader
-from ai.runtime.models import LoadState, HealthStatus
+from ai.runtime.optimizer import ModelOptimizer
+from ai.runtime.startup import ParallelModelLoader
+from ai.runtime.residency import ModelResidencyManager
+from ai.runtime.hotswap import HotSwapManager, TrafficRouter
+from ai.runtime.models import LoadState
 from ai.runtime.validator import ContractValidator
 from ai.runtime.sandbox import SandboxManager
 from ai.runtime.pipeline import InferencePipeline
 from ai.runtime.concurrency import ConcurrencyManager, AdmissionController
 from ai.runtime.gpu_manager import GPUManager
+from ai.runtime.gpu_telemetry import GPUTelemetrySampler
 from ai.runtime.reporting import (
+    CAPACITY_HEADER,
     CapabilityPublisher,
     HealthAggregator,
     RuntimeCapacityTracker,
@@ -48,7 +54,7 @@ from ai.runtime.backend_client import HTTPBackendClient, BackendClientConfig
 
 from ai.server import dependencies
 from ai.server.config import get_config
-from ai.server.routes import health, capabilities, inference, metrics
+from ai.server.routes import health, capabilities, inference, internal, metrics, debug
 
 from ai.observability.logging import configure_logging, get_logger, set_request_id, clear_request_id
 from ai.observability.metrics import (
@@ -61,6 +67,17 @@ from ai.observability.metrics import (
 logger = None
 
 
+def _publish_gpu_sample(sample) -> None:
+    """Mirror a telemetry sample into the Prometheus GPU gauges."""
+    update_gpu_metrics(sample.device_id, {
+        "used_memory_mb": sample.memory_used_mb,
+        "total_memory_mb": sample.memory_total_mb,
+        "utilization_percent": sample.utilization_percent,
+        "temperature_c": sample.temperature_c,
+        "power_w": sample.power_w,
+    })
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifecycle manager - handles startup and shutdown."""
@@ -111,11 +128,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         for device in gpu_stats["devices"]:
             update_gpu_metrics(device["device_id"], device)
 
+    # GPU telemetry: one NVML sampler thread feeds /metrics, /health and
+    # the GPU manager from memory. Stays idle without a GPU or pynvml.
+    gpu_telemetry = GPUTelemetrySampler(
+        interval_seconds=config.gpu_telemetry_interval_seconds,
+        history_seconds=config.gpu_telemetry_history_seconds,
+        on_sample=_publish_gpu_sample if config.metrics_enabled else None,
+    )
+    if config.enable_gpu and gpu_telemetry.start():
+        gpu_manager.attach_telemetry(gpu_telemetry)
+
     # Initialize core components
     registry = ModelRegistry()
     validator = ContractValidator()
-    loader = ModelLoader(gpu_manager=gpu_manager)
+    loader = ModelLoader(
+        gpu_manager=gpu_manager,
+        optimizer=ModelOptimizer(cache_dir=config.model_artifact_cache_dir),
+    )
     sandbox_manager = SandboxManager()
+    lazy_residency = config.model_residency_mode == "lazy"
 
     # Concurrency management (limit concurrent inferences)
     concurrency_manager = ConcurrencyManager(
@@ -124,6 +155,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     admission_controller = AdmissionController(manager=concurrency_manager)
 
+    # Capacity signal: fed by the inference handler, published on every
+    # response (X-Runtime-Capacity) and in capability reports
+    capacity_tracker = RuntimeCapacityTracker(
+        max_concurrent=config.max_concurrent_inferences,
+        concurrency_manager=concurrency_manager,
+        utilization_source=gpu_telemetry.mean_utilization,
+    )
+    dependencies.set_capacity_tracker(capacity_tracker)
+
     # Inference pipeline
     pipeline = InferencePipeline(
         registry=registry,
@@ -164,6 +204,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             max_concurrent=config.max_concurrent_inferences,
             runtime_id=config.runtime_id,
             concurrency_manager=concurrency_manager,
+            advertise_on_demand=lazy_residency,
+            capacity_tracker=capacity_tracker,
         )
 
         # Store in dependencies
@@ -175,10 +217,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     else:
         logger.info("Backend integration disabled by configuration")
 
+    # Blue/green routing pointer and hot-swap (versions served side by side)
+    traffic_router = TrafficRouter()
+    hot_swap_manager = HotSwapManager(
+        loader=loader,
+        registry=registry,
+        sandbox_manager=sandbox_manager,
+        router=traffic_router,
+        drain_timeout_seconds=config.hot_swap_drain_timeout_seconds,
+    )
+
     # Store in global dependencies
     dependencies.set_registry(registry)
     dependencies.set_pipeline(pipeline)
     dependencies.set_sandbox_manager(sandbox_manager)
+    dependencies.set_traffic_router(traffic_router)
+    dependencies.set_hot_swap_manager(hot_swap_manager)
 
     # Store GPU manager
     app.state.gpu_manager = gpu_manager
@@ -207,91 +261,115 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "version": version_desc.version
             })
 
-        # Load valid models
-        if discovery_result.versions_valid > 0:
-            logger.info("Loading valid models...", extra={
-                "valid_count": discovery_result.versions_valid
+        # Load valid models in parallel. Each model is served as soon as it
+        # is READY; the server does not wait for the slowest model.
+        def record_model_loaded(version_desc, loaded_model) -> None:
+            if config.metrics_enabled:
+                set_model_load_status(version_desc.model_id, version_desc.version, loaded=True)
+                set_model_health_status(version_desc.model_id, version_desc.version, "healthy")
+
+        def on_model_loaded(version_desc, load_result) -> None:
+            if residency_manager is not None:
+                residency_manager.register_resident(version_desc, load_result.loaded_model)
+            record_model_loaded(version_desc, load_result.loaded_model)
+
+        def on_model_failed(version_desc, error_msg: str) -> None:
+            if config.metrics_enabled:
+                set_model_load_status(version_desc.model_id, version_desc.version, loaded=False)
+
+        def on_model_evicted(model_id: str, version: str) -> None:
+            if config.metrics_enabled:
+                set_model_load_status(model_id, version, loaded=False)
+
+        # Lazy residency: only pinned models load at startup, the rest load
+        # on first request and are evicted LRU under memory pressure.
+        residency_manager = None
+        startup_versions = discovery_result.discovered_versions
+        if lazy_residency:
+            residency_manager = ModelResidencyManager(
+                loader=loader,
+                registry=registry,
+                sandbox_manager=sandbox_manager,
+                pinned=config.model_pinned,
+                max_resident_models=config.model_max_resident,
+                ram_budget_mb=config.model_ram_budget_mb,
+                load_timeout_seconds=config.model_lazy_load_timeout_seconds,
+                on_loaded=record_model_loaded,
+                on_evicted=on_model_evicted,
+            )
+            dependencies.set_residency_manager(residency_manager)
+            startup_versions = [
+                v for v in startup_versions
+                if residency_manager.is_pinned(v.model_id, v.version)
+            ]
+            logger.info("Lazy model residency enabled", extra={
+                "pinned": config.model_pinned,
+                "max_resident": config.model_max_resident,
+                "ram_budget_mb": config.model_ram_budget_mb,
             })
 
-            for version_desc in discovery_result.discovered_versions:
-                # Discovered versions are already validated
-                model_id = version_desc.model_id
-                version = version_desc.version
-
-                try:
-                    logger.info("Loading model", extra={
-                        "model_id": model_id,
-                        "version": version
-                    })
-
-                    load_result = loader.load(version_desc)
-
-                    if load_result.success and load_result.loaded_model:
-                        # Create sandbox for the loaded model
-                        sandbox_manager.create_sandbox(load_result.loaded_model, version_desc)
-
-                        # Update registry state to READY
-                        registry.update_state(
-                            model_id,
-                            version,
-                            LoadState.READY
-                        )
-
-                        # Update registry health to HEALTHY
-                        registry.update_health(
-                            model_id,
-                            version,
-                            HealthStatus.HEALTHY
-                        )
-
-                        # Update metrics
-                        if config.metrics_enabled:
-                            set_model_load_status(model_id, version, loaded=True)
-                            set_model_health_status(model_id, version, "healthy")
-
-                        logger.info("Model loaded successfully", extra={
-                            "model_id": model_id,
-                            "version": version,
-                            "load_time_ms": load_result.load_time_ms
-                        })
-                    else:
-                        error_msg = load_result.error.message if load_result.error else "Unknown error"
-
-                        # Update metrics
-                        if config.metrics_enabled:
-                            set_model_load_status(model_id, version, loaded=False)
-
-                        logger.error("Model load failed", extra={
-                            "model_id": model_id,
-                            "version": version,
-                            "error": error_msg
-                        })
-                except Exception as e:
-                    if config.metrics_enabled:
-                        set_model_load_status(model_id, version, loaded=False)
-
-                    logger.error("Model load exception", extra={
-                        "model_id": model_id,
-                        "version": version,
-                        "error": str(e)
-                    }, exc_info=True)
-
-        # Report final state
-        all_versions = registry.get_all_versions()
-        ready_count = sum(1 for v in all_versions if v.state.is_available())
-
-        logger.info(
-            f"✅ Runtime ready: {ready_count}/{len(all_versions)} models available for inference"
+        startup_loader = ParallelModelLoader(
+            loader=loader,
+            registry=registry,
+            sandbox_manager=sandbox_manager,
+            max_workers=config.model_load_concurrency,
+            on_loaded=on_model_loaded,
+            on_failed=on_model_failed,
         )
+        app.state.startup_loader = startup_loader
 
-        if ready_count == 0:
+        if discovery_result.versions_valid > 0:
+            logger.info("Loading valid models...", extra={
+                "valid_count": discovery_result.versions_valid,
+                "startup_count": len(startup_versions),
+                "concurrency": config.model_load_concurrency,
+            })
+            startup_loader.start(startup_versions)
+
+            if config.model_load_blocking:
+                await asyncio.to_thread(startup_loader.wait)
+                all_versions = registry.get_all_versions()
+                ready_count = sum(1 for v in all_versions if v.state.is_available())
+                logger.info(
+                    f"✅ Runtime ready: {ready_count}/{len(all_versions)} models available for inference"
+                )
+                if ready_count == 0:
+                    logger.warning("⚠️  No models ready for inference!")
+        else:
             logger.warning("⚠️  No models ready for inference!")
 
+        # Watch for model drops: only changed version directories are
+        # revalidated, new ones are registered. In eager mode, new versions
+        # and changed ones re-registered as DISCOVERED (e.g. a FAILED model
+        # whose weights were fixed) are loaded.
+        if config.model_watch_enabled:
+            def load_watched_version(version_desc) -> None:
+                if version_desc.state != LoadState.DISCOVERED or residency_manager is not None:
+                    return
+                ParallelModelLoader(
+                    loader=loader,
+                    registry=registry,
+                    sandbox_manager=sandbox_manager,
+                    max_workers=1,
+                    on_loaded=on_model_loaded,
+                    on_failed=on_model_failed,
+                ).start([version_desc])
+
+            watcher = DirectoryWatcher(
+                scanner=scanner,
+                registry=registry,
+                poll_interval_seconds=config.model_watch_poll_interval_seconds,
+                on_added=load_watched_version,
+                on_changed=load_watched_version,
+            )
+            watcher.start()
+            app.state.model_watcher = watcher
+
     except Exception as e:
         logger.error(f"Error during model discovery/loading: {e}", exc_info=True)
 
     # ==========================================================================
-    # Start Capability Publisher (after models loaded)
+    # Start Capability Publisher (publishes again as each model becomes READY)
     # ==========================================================================
 
     if capability_publisher is not None:
@@ -311,6 +389,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     shutdown_start = asyncio.get_event_loop().time()
 
+    # Step 0: Stop watching the models directory and scheduling model loads
+    model_watcher = getattr(app.state, "model_watcher", None)
+    if model_watcher is not None:
+        await asyncio.to_thread(model_watcher.stop)
+
+    startup_loader = getattr(app.state, "startup_loader", None)
+    if startup_loader is not None and startup_loader.is_running:
+        logger.info("Cancelling pending model loads...")
+        startup_loader.cancel()
+        await asyncio.to_thread(
+            startup_loader.wait, config.graceful_shutdown_timeout_seconds
+        )
+
     # Step 1: Stop capability publisher and deregister from backend
     try:
         if capability_publisher is not None:
@@ -371,6 +462,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if gpu_manager:
             gpu_manager.release_all()
             logger.info("GPU resources released")
+        gpu_telemetry.stop()
     except Exception as e:
         logger.error(f"Error releasing GPU resources: {e}")
 
@@ -402,7 +494,7 @@ app.add_middleware(
 # Request ID middleware
 @app.middleware("http")
 async def request_id_middleware(request: Request, call_next):
-    """Add request ID to context and response headers."""
+    """Add request ID and the capacity signal to context and response headers."""
     config = get_config()
 
     # Get request ID from header or generate new one
@@ -414,6 +506,9 @@ async def request_id_middleware(request: Request, call_next):
     try:
         response = await call_next(request)
         response.headers[config.request_id_header] = request_id
+        capacity_tracker = dependencies.get_capacity_tracker()
+        if capacity_tracker is not None:
+            response.headers[CAPACITY_HEADER] = capacity_tracker.get_signal().to_header()
         return response
     finally:
         # Clear request ID from context
@@ -425,6 +520,8 @@ app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(capabilities.router, prefix="/capabilities", tags=["capabilities"])
 app.include_router(inference.router, prefix="/inference", tags=["inference"])
 app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+app.include_router(internal.router, prefix="/internal", tags=["internal"])
+app.include_router(debug.router, prefix="/debug", tags=["debug"])
 
 
 @app.exception_handler(RequestValidationError)
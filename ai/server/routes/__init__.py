@@ -4,6 +4,6 @@ Ruth AI Unified Runtime - API Routes
 This package contains all FastAPI route handlers.
 """
 
-from . import health, capabilities, inference
+from . import health, capabilities, inference, internal, debug
 
-__all__ = ["health", "capabilities", "inference"]
+__all__ = ["health", "capabilities", "inference", "internal", "debug"]
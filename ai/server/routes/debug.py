@@ -0,0 +1,84 @@
+"""
+Ruth AI Unified Runtime - Debug Endpoints
+
+On-demand profiling for latency investigations. Disabled unless
+INTERNAL_API_KEY is set; every request must carry X-Internal-API-Key.
+Nothing runs between requests.
+
+Endpoints:
+- GET /debug/profile    - Sample stacks (collapsed, flamegraph-ready) or cProfile the loop
+- GET /debug/tasks      - Pending asyncio tasks with their suspended stacks
+- GET /debug/executors  - Default executor and per-model sandbox executor queues
+"""
+
+import asyncio
+from typing import Any, Dict, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from ai.observability.profiling import (
+    ProfilerBusyError,
+    default_executor_state,
+    dump_asyncio_tasks,
+    format_collapsed,
+    profile_event_loop,
+    sample_stacks,
+)
+from ai.server.dependencies import get_sandbox_manager, require_internal_api_key
+
+router = APIRouter(dependencies=[Depends(require_internal_api_key)])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(default=10.0, gt=0, le=60, description="Profile duration"),
+    mode: Literal["sample", "cprofile"] = Query(default="sample"),
+    interval_ms: float = Query(default=10.0, ge=1, le=1000, description="Sampling interval"),
+    limit: int = Query(default=50, ge=1, le=500, description="cProfile rows"),
+) -> PlainTextResponse:
+    """
+    Profile the runtime for `seconds`.
+
+    mode=sample returns collapsed stacks across all threads (pipe into
+    flamegraph.pl or load into speedscope). mode=cprofile returns a pstats
+    report for the event loop thread, sorted by cumulative time.
+
+    Raises:
+        409: Another profile is already running
+    """
+    try:
+        if mode == "cprofile":
+            return PlainTextResponse(await profile_event_loop(seconds, limit=limit))
+        result = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return PlainTextResponse(
+        format_collapsed(result["stacks"]),
+        headers={
+            "X-Profile-Samples": str(result["samples"]),
+            "X-Profile-Duration": str(result["duration_s"]),
+        },
+    )
+
+
+@router.get("/tasks")
+async def tasks(
+    max_frames: int = Query(default=10, ge=1, le=100),
+) -> Dict[str, Any]:
+    """Return every pending asyncio task and where it is suspended."""
+    task_list = dump_asyncio_tasks(max_frames=max_frames)
+    return {"count": len(task_list), "tasks": task_list}
+
+
+@router.get("/executors")
+async def executors() -> Dict[str, Any]:
+    """Return queue depth of the default executor and each model sandbox executor."""
+    sandbox_manager = get_sandbox_manager()
+    return {
+        "default": default_executor_state(),
+        "sandboxes": (
+            sandbox_manager.get_all_executor_stats() if sandbox_manager else {}
+        ),
+    }
@@ -18,7 +18,12 @@ from fastapi import APIRouter, Query, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
-from ai.server.dependencies import get_registry, get_capability_publisher, get_sandbox_manager
+from ai.server.dependencies import (
+    get_registry,
+    get_capability_publisher,
+    get_residency_manager,
+    get_sandbox_manager,
+)
 from ai.server.config import get_config
 from ai.runtime.models import HealthStatus, LoadState
 
@@ -63,6 +68,10 @@ class HealthResponse(BaseModel):
     gpu_available: Optional[bool] = None
     gpu_device_count: Optional[int] = None
     gpu_devices: Optional[List[GPUDeviceHealth]] = None
+    gpu_telemetry: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Latest NVML sample and 60s min/avg/max per device",
+    )
     models: Optional[List[ModelHealth]] = None
 
     class Config:
@@ -147,7 +156,6 @@ async def health_check(
         # GPU information
         gpu_manager = getattr(request.app.state, "gpu_manager", None)
         if gpu_manager:
-            gpu_manager.update_device_stats()
             gpu_stats = gpu_manager.get_stats()
 
             response.gpu_available = gpu_stats["status"] == "available"
@@ -168,6 +176,9 @@ async def health_check(
                     for d in gpu_stats["devices"]
                 ]
 
+            if gpu_manager.telemetry is not None:
+                response.gpu_telemetry = gpu_manager.telemetry.get_status()
+
         # Per-model health
         response.models = [
             ModelHealth(
@@ -271,14 +282,35 @@ async def readiness_probe(request: Request) -> ReadinessResponse:
     all_versions = registry.get_all_versions()
     models_ready = sum(1 for v in all_versions if v.state == LoadState.READY)
 
+    # Lazy residency: versions that load on first request count as servable
+    if models_ready == 0 and get_residency_manager() is not None:
+        models_on_demand = sum(
+            1 for v in all_versions
+            if v.state in (LoadState.DISCOVERED, LoadState.UNLOADED)
+        )
+        if models_on_demand:
+            return ReadinessResponse(
+                ready=True,
+                status="ready",
+                models_ready=0,
+                reason=f"{models_on_demand} models load on demand"
+            )
+
     if models_ready == 0:
+        models_loading = sum(
+            1 for v in all_versions
+            if v.state in (LoadState.DISCOVERED, LoadState.LOADING)
+        )
+        reason = "No models ready for inference"
+        if models_loading:
+            reason += f" ({models_loading} still loading)"
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=ReadinessResponse(
                 ready=False,
                 status="not_ready",
                 models_ready=0,
-                reason="No models ready for inference"
+                reason=reason
             ).model_dump()
         )
 
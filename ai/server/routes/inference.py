@@ -5,13 +5,16 @@ Accepts base64-encoded frames and routes to appropriate models for inference.
 Includes input validation for security hardening.
 """
 
+import asyncio
 import base64
+import binascii
 import io
 import re
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import cv2
 import numpy as np
@@ -19,12 +22,23 @@ from fastapi import APIRouter, HTTPException, status
 from PIL import Image
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from ai.server.dependencies import get_pipeline, get_registry, get_sandbox_manager
+from ai.server.dependencies import (
+    get_capacity_tracker,
+    get_pipeline,
+    get_registry,
+    get_residency_manager,
+    get_sandbox_manager,
+    get_traffic_router,
+)
 from ai.runtime.errors import ModelError, PipelineError, ExecutionError
-from ai.observability.logging import get_logger
+from ai.runtime.hotswap import TrafficRouter
+from ai.runtime.models import LoadState
+from ai.runtime.residency import ON_DEMAND_STATES
+from ai.observability.logging import get_logger, get_request_id
 from ai.observability.metrics import (
     record_inference,
     record_inference_latency,
+    record_inference_stages,
     record_frame_decode_latency,
     record_frame_size,
 )
@@ -61,6 +75,9 @@ VERSION_PATTERN = re.compile(r'^[0-9]+\.[0-9]+\.[0-9]+(-[a-zA-Z0-9]+)?$')
 # Timestamp limits
 MAX_TIMESTAMP_DRIFT_SECONDS = 86400  # 24 hours max drift
 
+# States served through the residency manager in lazy loading mode
+RESIDENCY_STATES = (LoadState.READY, LoadState.LOADING) + ON_DEMAND_STATES
+
 
 # =============================================================================
 # VALIDATION FUNCTIONS
@@ -287,6 +304,13 @@ class InferenceResponse(BaseModel):
     inference_time_ms: float = Field(description="Inference duration in milliseconds")
     result: Optional[Dict[str, Any]] = Field(None, description="Inference results")
     error: Optional[str] = Field(None, description="Error message if failed")
+    decode_scale: int = Field(
+        1, description="JPEG decode scale denominator; result coordinates are in 1/N frame pixels"
+    )
+    timing: Optional[Dict[str, float]] = Field(
+        None, description="Per-stage durations in milliseconds (decode, preprocess, inference, ...)"
+    )
+    trace_id: Optional[str] = Field(None, description="Trace ID from the X-Request-ID header")
 
     class Config:
         json_schema_extra = {
@@ -302,6 +326,15 @@ class InferenceResponse(BaseModel):
                     "bounding_boxes": [],
                 },
                 "error": None,
+                "decode_scale": 1,
+                "timing": {
+                    "decode_ms": 4.2,
+                    "preprocess_ms": 3.0,
+                    "inference_ms": 83.0,
+                    "postprocess_ms": 2.0,
+                    "total_ms": 150.5,
+                },
+                "trace_id": "3f2b9c1e-8a41-4d7e-9b0c-2e5f7a6d1c90",
             }
         }
 
@@ -331,9 +364,12 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
             detail="Runtime not initialized"
         )
 
-    # Generate request ID
+    # Generate request ID; the caller's X-Request-ID (set by middleware)
+    # is echoed back as the trace ID so both sides can join their timings
     request_id = uuid.uuid4()
+    trace_id = get_request_id()
     start_time = time.time()
+    timing: Dict[str, float] = {}
 
     # Record frame size
     frame_size = len(request.frame_base64)
@@ -347,42 +383,100 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
         "stream_id": request.stream_id
     })
 
-    try:
-        # Phase 2: Decode base64 to numpy array
-        decode_start = time.time()
-        frame = _decode_base64_frame(request.frame_base64, request.frame_format)
-        decode_duration = time.time() - decode_start
-
-        # Record decode latency
-        record_frame_decode_latency(decode_duration)
+    # Counted in flight for the X-Runtime-Capacity signal
+    capacity_tracker = get_capacity_tracker()
+    if capacity_tracker is not None:
+        capacity_tracker.request_started()
 
+    try:
         # Get model from registry
         model_key = f"{request.model_id}:{request.model_version or 'latest'}"
-        model_version = None
+        fallback_version = None
 
         # Find matching model version
         for version in registry.get_all_versions():
             if version.model_id == request.model_id:
                 if request.model_version and version.version != request.model_version:
                     continue
-                model_version = version
+                fallback_version = version.version
                 break
 
-        if not model_version or not model_version.state.is_available():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Model not found or not ready: {model_key}"
+        # Requests without an explicit version follow the blue/green routing
+        # pointer and are counted in flight so a hot-swap can drain them.
+        traffic_router = get_traffic_router()
+        with _route(traffic_router, request.model_id, request.model_version, fallback_version) as routed_version:
+            model_version = (
+                registry.get_version(request.model_id, routed_version)
+                if routed_version else None
             )
 
-        # Execute inference through sandbox manager
-        # This provides proper isolation and error handling
-        execution_result = sandbox_manager.execute(
-            model_id=request.model_id,
-            version=model_version.version,
-            frame=frame,
-            request_id=str(request_id),
-            config=request.config,
-        )
+            if not model_version:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Model not found or not ready: {model_key}"
+                )
+
+            # Lazy residency: load the model on demand and hold it resident
+            # (not evictable) for the duration of this request.
+            residency_manager = get_residency_manager()
+            acquired = False
+            if residency_manager is not None and model_version.state in RESIDENCY_STATES:
+                load_wait_start = time.time()
+                acquired = await asyncio.to_thread(
+                    residency_manager.acquire, request.model_id, model_version.version
+                )
+                timing["load_wait_ms"] = (time.time() - load_wait_start) * 1000
+                if not acquired:
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=f"Model could not be loaded: {model_key}"
+                    )
+            elif not model_version.state.is_available():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Model not found or not ready: {model_key}"
+                )
+
+            # Decode base64 to numpy array, at reduced scale if the
+            # model contract allows it
+            try:
+                decode_start = time.time()
+                frame, decode_scale = _decode_frame(
+                    request.frame_base64,
+                    request.frame_format,
+                    model_version.input_spec.decode_max_side,
+                )
+                decode_duration = time.time() - decode_start
+                record_frame_decode_latency(decode_duration)
+                timing["decode_ms"] = decode_duration * 1000
+
+                # Execute inference through sandbox manager
+                # This provides proper isolation and error handling
+                execution_result = sandbox_manager.execute(
+                    model_id=request.model_id,
+                    version=model_version.version,
+                    frame=frame,
+                    request_id=str(request_id),
+                    config=request.config,
+                )
+            finally:
+                if acquired:
+                    residency_manager.release(request.model_id, model_version.version)
+
+        # Mirror a share of traffic to a candidate version (result discarded)
+        if traffic_router is not None:
+            shadow_version = traffic_router.pick_shadow(request.model_id, model_version.version)
+            if shadow_version:
+                asyncio.get_running_loop().run_in_executor(
+                    None,
+                    _execute_shadow,
+                    traffic_router,
+                    sandbox_manager,
+                    request.model_id,
+                    shadow_version,
+                    frame.copy(),
+                    request.config,
+                )
 
         if not execution_result.success:
             raise Exception(execution_result.error or "Inference failed")
@@ -393,9 +487,24 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
         inference_time_ms = (time.time() - start_time) * 1000
         inference_time_seconds = inference_time_ms / 1000.0
 
+        timing.update(
+            preprocess_ms=float(execution_result.preprocess_ms),
+            inference_ms=float(execution_result.inference_ms),
+            postprocess_ms=float(execution_result.postprocess_ms),
+            total_ms=inference_time_ms,
+        )
+
         # Record metrics
         record_inference(model_id=request.model_id, status="success")
         record_inference_latency(model_id=request.model_id, duration_seconds=inference_time_seconds)
+        record_inference_stages(model_id=request.model_id, timing_ms=timing)
+
+        # Service time excludes waiting for a lazy model load, so the
+        # backend paces on what one request costs once the model is resident
+        if capacity_tracker is not None:
+            capacity_tracker.record_service_time(
+                request.model_id, inference_time_ms - timing.get("load_wait_ms", 0.0)
+            )
 
         # Log success
         logger.info("Inference completed successfully", extra={
@@ -403,6 +512,8 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
             "model_id": request.model_id,
             "model_version": model_version.version,
             "inference_time_ms": inference_time_ms,
+            "timing": timing,
+            "trace_id": trace_id,
             "detection_count": result.get("detection_count", 0) if result else 0,
             "violation_detected": result.get("violation_detected", False) if result else False
         })
@@ -415,6 +526,9 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
             inference_time_ms=inference_time_ms,
             result=result,
             error=None,
+            decode_scale=decode_scale,
+            timing=timing,
+            trace_id=trace_id,
         )
 
     except HTTPException as e:
@@ -451,24 +565,148 @@ async def submit_inference(request: InferenceRequest) -> InferenceResponse:
             inference_time_ms=inference_time_ms,
             result=None,
             error=str(e),
+            trace_id=trace_id,
         )
 
+    finally:
+        if capacity_tracker is not None:
+            capacity_tracker.request_finished()
+
+
+@contextmanager
+def _route(
+    router: Optional[TrafficRouter],
+    model_id: str,
+    requested_version: Optional[str],
+    fallback_version: Optional[str],
+) -> Iterator[Optional[str]]:
+    """Route through the traffic router when one is configured."""
+    if router is None:
+        yield requested_version or fallback_version
+        return
+    with router.route(model_id, requested_version, fallback_version) as version:
+        yield version
+
+
+def _execute_shadow(
+    router: TrafficRouter,
+    sandbox_manager: Any,
+    model_id: str,
+    version: str,
+    frame: np.ndarray,
+    config: Optional[Dict[str, Any]],
+) -> None:
+    """Run a mirrored request on a shadow version and record the outcome."""
+    start = time.perf_counter()
+    try:
+        with router.track(model_id, version):
+            result = sandbox_manager.execute(
+                model_id=model_id,
+                version=version,
+                frame=frame,
+                request_id=f"shadow-{uuid.uuid4()}",
+                config=config,
+            )
+        success = result.success
+    except Exception:
+        success = False
+    router.record_shadow(model_id, success, (time.perf_counter() - start) * 1000)
+
 
-def _decode_base64_frame(base64_data: str, format: str = "jpeg") -> np.ndarray:
+# JPEG start-of-frame markers (baseline, extended, progressive, lossless, ...)
+_JPEG_SOF_MARKERS = frozenset(
+    (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+)
+
+# libjpeg DCT-domain scaling: decode at 1/N without materialising full resolution
+_REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def _jpeg_dimensions(data: bytes) -> Optional[tuple[int, int]]:
     """
-    Decode base64 string to numpy array (BGR format for OpenCV).
+    Read (width, height) from the JPEG SOF marker without decoding.
 
-    Includes security validation:
-    - Decoded size limits
-    - Image dimension limits
-    - Memory protection via PIL limits
+    Returns None if the data is not a JPEG or no SOF marker is found.
+    """
+    if len(data) < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+
+    offset = 2
+    length = len(data)
+    while offset + 4 <= length:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte
+            offset += 1
+            continue
+        if marker in (0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7):
+            # Standalone markers carry no length
+            offset += 2
+            continue
+        segment_length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > length:
+                return None
+            height = int.from_bytes(data[offset + 5:offset + 7], "big")
+            width = int.from_bytes(data[offset + 7:offset + 9], "big")
+            return width, height
+        if marker == 0xDA or segment_length < 2:
+            # Start of scan before any SOF - malformed
+            return None
+        offset += 2 + segment_length
+
+    return None
+
+
+def _header_dimensions(image_bytes: bytes) -> tuple[int, int]:
+    """Read non-JPEG frame dimensions from the image header with PIL."""
+    # Set PIL limits to prevent decompression bombs
+    Image.MAX_IMAGE_PIXELS = MAX_FRAME_WIDTH * MAX_FRAME_HEIGHT
+
+    # Image.open only parses the header; pixel data is not decoded
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return image.size
+
+
+def _reduced_decode_factor(width: int, height: int, max_side: Optional[int]) -> int:
+    """
+    Pick the largest JPEG scale denominator (2, 4, 8) that keeps the
+    longest side at or above max_side. Returns 1 for a full decode.
+    """
+    if not max_side:
+        return 1
+    longest = max(width, height)
+    for factor, _ in _REDUCED_DECODE_FLAGS:
+        if longest // factor >= max_side:
+            return factor
+    return 1
+
+
+def _decode_frame(
+    base64_data: str,
+    format: str = "jpeg",
+    max_side: Optional[int] = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Decode a base64 frame straight to BGR with cv2.imdecode.
+
+    Dimensions are validated from the image header before any pixel data
+    is decoded. When max_side is set and the frame is a JPEG at least twice
+    that size, libjpeg decodes at 1/2, 1/4 or 1/8 scale in the DCT domain.
 
     Args:
         base64_data: Base64-encoded image data
         format: Image format (jpeg, png)
+        max_side: Longest side the model needs (None = full resolution)
 
     Returns:
-        Numpy array in BGR format (H, W, 3)
+        Tuple of (BGR array (H, W, 3), scale denominator applied)
 
     Raises:
         ValueError: If decoding fails or validation fails
@@ -484,14 +722,9 @@ def _decode_base64_frame(base64_data: str, format: str = "jpeg") -> np.ndarray:
                 f"(max: {MAX_FRAME_DECODED_SIZE} bytes)"
             )
 
-        # Set PIL limits to prevent decompression bombs
-        Image.MAX_IMAGE_PIXELS = MAX_FRAME_WIDTH * MAX_FRAME_HEIGHT
-
-        # Convert to PIL Image
-        image = Image.open(io.BytesIO(image_bytes))
-
-        # Validate dimensions
-        width, height = image.size
+        # Validate dimensions from the header (JPEG SOF, else PIL)
+        jpeg_dimensions = _jpeg_dimensions(image_bytes)
+        width, height = jpeg_dimensions or _header_dimensions(image_bytes)
         if width > MAX_FRAME_WIDTH or height > MAX_FRAME_HEIGHT:
             raise ValueError(
                 f"Frame dimensions too large: {width}x{height} "
@@ -503,30 +736,51 @@ def _decode_base64_frame(base64_data: str, format: str = "jpeg") -> np.ndarray:
                 f"(min: {MIN_FRAME_WIDTH}x{MIN_FRAME_HEIGHT})"
             )
 
-        # Convert to RGB numpy array
-        frame_rgb = np.array(image)
-
-        # Validate array size
-        if frame_rgb.nbytes > MAX_FRAME_DECODED_SIZE:
+        # Validate the size of the array we are about to allocate
+        if width * height * 3 > MAX_FRAME_DECODED_SIZE:
             raise ValueError(
-                f"Decoded frame array too large: {frame_rgb.nbytes} bytes"
+                f"Decoded frame array too large: {width * height * 3} bytes"
             )
 
-        # Convert RGB to BGR for OpenCV
-        if len(frame_rgb.shape) == 3 and frame_rgb.shape[2] == 3:
-            frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-        elif len(frame_rgb.shape) == 3 and frame_rgb.shape[2] == 4:
-            # RGBA to BGR
-            frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGBA2BGR)
-        elif len(frame_rgb.shape) == 2:
-            # Grayscale to BGR
-            frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_GRAY2BGR)
-        else:
-            frame_bgr = frame_rgb
+        # Reduced decode only applies to JPEG (libjpeg scaling)
+        factor = 1
+        if jpeg_dimensions is not None:
+            factor = _reduced_decode_factor(width, height, max_side)
+        # Ignore EXIF orientation: the decoded frame keeps the stored
+        # width/height validated above, as camera frames always have
+        flag = dict(_REDUCED_DECODE_FLAGS).get(factor, cv2.IMREAD_COLOR)
+        flag |= cv2.IMREAD_IGNORE_ORIENTATION
+
+        # imdecode yields BGR directly (gray/alpha converted to 3 channels)
+        frame_bgr = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), flag)
+        if frame_bgr is None:
+            raise ValueError(
+                f"Failed to decode base64 frame: not a valid {format} image"
+            )
 
-        return frame_bgr
+        return frame_bgr, factor
 
+    except binascii.Error as e:
+        raise ValueError(f"Failed to decode base64 frame: {e}")
     except ValueError:
         raise
     except Exception as e:
         raise ValueError(f"Failed to decode base64 frame: {e}")
+
+
+def _decode_base64_frame(base64_data: str, format: str = "jpeg") -> np.ndarray:
+    """
+    Decode base64 string to a full-resolution numpy array (BGR format for OpenCV).
+
+    Args:
+        base64_data: Base64-encoded image data
+        format: Image format (jpeg, png)
+
+    Returns:
+        Numpy array in BGR format (H, W, 3)
+
+    Raises:
+        ValueError: If decoding fails or validation fails
+    """
+    frame, _ = _decode_frame(base64_data, format)
+    return frame
@@ -0,0 +1,95 @@
+"""
+Ruth AI Unified Runtime - Internal Endpoints
+
+Operator endpoints that change runtime behaviour. Disabled unless
+INTERNAL_API_KEY is set; every request must carry X-Internal-API-Key.
+
+Endpoints:
+- GET    /internal/models/routing                  - Routing pointers, shadows, in-flight
+- POST   /internal/models/{model_id}/swap          - Blue/green swap to a version
+- POST   /internal/models/{model_id}/shadow        - Mirror traffic to a candidate version
+- DELETE /internal/models/{model_id}/shadow        - Stop mirroring
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+
+from ai.server.dependencies import (
+    get_hot_swap_manager,
+    get_traffic_router,
+    require_internal_api_key,
+)
+
+router = APIRouter(dependencies=[Depends(require_internal_api_key)])
+
+
+class SwapRequest(BaseModel):
+    """Blue/green swap request."""
+
+    version: str = Field(description="Version to route traffic to")
+
+
+class ShadowRequest(BaseModel):
+    """Shadow traffic request."""
+
+    version: str = Field(description="Candidate version receiving mirrored traffic")
+    percent: float = Field(ge=0, le=100, description="Share of requests mirrored (0-100)")
+
+
+def _swapper():
+    swapper = get_hot_swap_manager()
+    if swapper is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Runtime not initialized"
+        )
+    return swapper
+
+
+@router.get("/models/routing")
+async def get_routing() -> Dict[str, Any]:
+    """Return routing pointers, active shadows and in-flight counts."""
+    traffic_router = get_traffic_router()
+    if traffic_router is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Runtime not initialized"
+        )
+    return traffic_router.get_status()
+
+
+@router.post("/models/{model_id}/swap")
+async def swap_model(model_id: str, request: SwapRequest) -> Dict[str, Any]:
+    """
+    Load the version next to the serving one, flip traffic, drain and unload the old one.
+
+    Raises:
+        409: The new version could not be loaded (old version keeps serving)
+    """
+    result = await asyncio.to_thread(_swapper().swap, model_id, request.version)
+    if not result.success:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result.to_dict())
+    return result.to_dict()
+
+
+@router.post("/models/{model_id}/shadow")
+async def start_shadow(model_id: str, request: ShadowRequest) -> Dict[str, Any]:
+    """Load a candidate version and mirror a share of traffic to it."""
+    error: Optional[str] = await asyncio.to_thread(
+        _swapper().start_shadow, model_id, request.version, request.percent
+    )
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error)
+    return {"model_id": model_id, "version": request.version, "percent": request.percent}
+
+
+@router.delete("/models/{model_id}/shadow")
+async def stop_shadow(model_id: str) -> Dict[str, Any]:
+    """Stop mirroring traffic and return the shadow statistics."""
+    shadow = _swapper().stop_shadow(model_id)
+    if shadow is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No shadow active")
+    return shadow.to_dict()
@@ -0,0 +1,151 @@
+"""
+Tests for the runtime capacity signal
+
+Covers:
+1. Compact X-Runtime-Capacity header serialization
+2. In-flight counting, queue depth and per-model service time EWMA
+3. Utilization read from the GPU telemetry sampler
+4. Capability reports carry the same signal
+5. The header is attached to every response
+"""
+
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.concurrency import ConcurrencyManager
+from ai.runtime.reporting import (
+    CAPACITY_HEADER,
+    CapacitySignal,
+    RuntimeCapacityTracker,
+)
+from ai.server import dependencies
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def _tracker(max_concurrent=2, utilization=None):
+    return RuntimeCapacityTracker(
+        max_concurrent=max_concurrent,
+        utilization_source=(lambda: utilization) if utilization is not None else None,
+    )
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestCapacitySignal:
+    """Tests for header serialization."""
+
+    def test_header_format(self):
+        signal = CapacitySignal(
+            free_slots=2,
+            queue_depth=0,
+            utilization=0.634,
+            service_time_ms={"fall_detection": 83.12, "ppe_detection": 295.0},
+        )
+
+        assert signal.to_header() == (
+            "free=2;queue=0;util=0.63;svc=fall_detection:83.1,ppe_detection:295.0"
+        )
+
+    def test_unknown_fields_are_omitted(self):
+        assert CapacitySignal(free_slots=1, queue_depth=3).to_header() == "free=1;queue=3"
+
+
+class TestCapacityTracker:
+    """Tests for the tracker feeding the signal."""
+
+    def test_in_flight_requests_use_slots_then_queue(self):
+        tracker = _tracker(max_concurrent=2)
+        for _ in range(3):
+            tracker.request_started()
+
+        signal = tracker.get_signal()
+        assert signal.free_slots == 0
+        assert signal.queue_depth == 1
+
+        for _ in range(3):
+            tracker.request_finished()
+        assert tracker.get_signal().free_slots == 2
+
+    def test_service_time_ewma(self):
+        tracker = _tracker()
+        tracker.record_service_time("fall_detection", 100.0)
+        tracker.record_service_time("fall_detection", 200.0)
+
+        assert tracker.get_signal().service_time_ms == {"fall_detection": 120.0}
+
+    def test_utilization_source_failure_is_unknown(self):
+        def broken():
+            raise RuntimeError("nvml gone")
+
+        tracker = RuntimeCapacityTracker(utilization_source=broken)
+
+        assert tracker.get_signal().utilization is None
+
+    def test_concurrency_manager_slots_count_as_busy(self):
+        manager = ConcurrencyManager(global_limit=2)
+        manager.register_model("fall_detection", "1.0.0", max_concurrent=2)
+        slot = manager.try_acquire("fall_detection", "1.0.0", request_id="r1")
+        tracker = RuntimeCapacityTracker(concurrency_manager=manager)
+
+        assert tracker.get_signal().free_slots == 1
+        slot.release()
+
+    def test_report_carries_signal(self):
+        tracker = _tracker(utilization=0.5)
+        tracker.record_service_time("fall_detection", 83.0)
+
+        report = tracker.get_report().to_dict()
+
+        assert report["utilization"] == 0.5
+        assert report["service_time_ms"] == {"fall_detection": 83.0}
+        assert report["backpressure"]["level"] == "none"
+
+    def test_gpu_telemetry_utilization(self):
+        from ai.tests.test_gpu_telemetry import FakeNVML, _sampler
+
+        sampler = _sampler(FakeNVML(device_count=2, utilization=(40, 80)))
+        sampler._init_nvml()
+        sampler.sample_once()
+
+        tracker = RuntimeCapacityTracker(utilization_source=sampler.mean_utilization)
+
+        assert tracker.get_signal().utilization == 0.6
+
+
+class TestCapacityHeader:
+    """Tests for the header on HTTP responses."""
+
+    def test_header_on_every_response(self):
+        from ai.server.main import request_id_middleware
+
+        tracker = _tracker(max_concurrent=4, utilization=0.25)
+        tracker.record_service_time("fall_detection", 90.0)
+        dependencies.set_capacity_tracker(tracker)
+
+        app = FastAPI()
+        app.middleware("http")(request_id_middleware)
+
+        @app.get("/ping")
+        def ping():
+            return {}
+
+        try:
+            response = TestClient(app).get("/ping")
+        finally:
+            dependencies.clear_all()
+
+        assert response.headers[CAPACITY_HEADER] == (
+            "free=4;queue=0;util=0.25;svc=fall_detection:90.0"
+        )
@@ -0,0 +1,200 @@
+"""
+Tests for incremental model directory watching
+
+Covers:
+1. Only new or changed version directories are revalidated
+2. New versions are registered without a full rescan
+3. Loaded versions are not replaced when their files change; failed ones
+   are re-registered for loading
+4. Hot model drops are detected within a second
+"""
+
+import shutil
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.discovery import (
+    DirectoryWatcher,
+    DiscoveryScanner,
+    fingerprint_version_dir,
+)
+from ai.runtime.models import LoadState
+from ai.runtime.registry import ModelRegistry
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def _write_version(models_root: Path, model_id: str, version: str, display_name: str = None) -> Path:
+    version_dir = models_root / model_id / version
+    (version_dir / "weights").mkdir(parents=True, exist_ok=True)
+    (version_dir / "inference.py").write_text("def infer(frame, **kwargs):\n    return {}\n")
+    contract = {
+        "contract_schema_version": "1.0.0",
+        "model_id": model_id,
+        "version": version,
+        "display_name": display_name or model_id,
+        "input": {"type": "frame", "format": "raw_bgr", "min_width": 32, "min_height": 32, "channels": 3},
+        "output": {"schema_version": "1.0", "schema": {}},
+        "hardware": {"supports_cpu": True, "supports_gpu": False, "supports_jetson": False},
+        "performance": {"inference_time_hint_ms": 10, "recommended_fps": 5},
+    }
+    (version_dir / "model.yaml").write_text(yaml.safe_dump(contract))
+    return version_dir
+
+
+@pytest.fixture
+def models_root(tmp_path):
+    root = tmp_path / "models"
+    _write_version(root, "model_a", "1.0.0")
+    _write_version(root, "model_b", "1.0.0")
+    return root
+
+
+@pytest.fixture
+def scanner(models_root):
+    return DiscoveryScanner(models_root)
+
+
+@pytest.fixture
+def registry(scanner):
+    registry = ModelRegistry()
+    for descriptor in scanner.scan().discovered_versions:
+        registry.register_version(descriptor)
+    return registry
+
+
+def _watcher(scanner, registry, **kwargs):
+    watcher = DirectoryWatcher(scanner, registry, use_native_events=False, **kwargs)
+    watcher._manifest = watcher._build_manifest()
+    return watcher
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestFingerprint:
+    """Tests for stat-only version fingerprints."""
+
+    def test_fingerprint_changes_when_file_changes(self, models_root):
+        version_dir = models_root / "model_a" / "1.0.0"
+        before = fingerprint_version_dir(version_dir)
+
+        (version_dir / "weights" / "model.pt").write_bytes(b"new weights")
+
+        assert fingerprint_version_dir(version_dir) != before
+
+    def test_pycache_is_ignored(self, models_root):
+        version_dir = models_root / "model_a" / "1.0.0"
+        before = fingerprint_version_dir(version_dir)
+
+        (version_dir / "__pycache__").mkdir()
+        (version_dir / "__pycache__" / "inference.cpython-311.pyc").write_bytes(b"x")
+
+        assert fingerprint_version_dir(version_dir) == before
+
+
+class TestIncrementalChanges:
+    """Tests for incremental registry updates."""
+
+    def test_no_changes_validates_nothing(self, scanner, registry):
+        watcher = _watcher(scanner, registry)
+
+        with patch.object(scanner.validator, "validate") as validate:
+            watcher._check_for_changes()
+
+        validate.assert_not_called()
+
+    def test_new_version_is_validated_and_registered(self, models_root, scanner, registry):
+        added = []
+        watcher = _watcher(scanner, registry, on_added=added.append)
+        _write_version(models_root, "model_c", "1.0.0")
+
+        validated = []
+        original = scanner.validator.validate
+        with patch.object(
+            scanner.validator,
+            "validate",
+            side_effect=lambda **kw: validated.append(kw["expected_model_id"]) or original(**kw),
+        ):
+            watcher._check_for_changes()
+
+        assert validated == ["model_c"]
+        assert registry.get_version("model_c", "1.0.0").state == LoadState.DISCOVERED
+        assert [d.model_id for d in added] == ["model_c"]
+
+    def test_changed_unloaded_version_is_revalidated(self, models_root, scanner, registry):
+        watcher = _watcher(scanner, registry)
+        _write_version(models_root, "model_a", "1.0.0", display_name="Model A v2")
+
+        watcher.notify_path(models_root / "model_a" / "1.0.0" / "model.yaml")
+        watcher._check_dirty()
+
+        assert registry.get_version("model_a", "1.0.0").display_name == "Model A v2"
+
+    def test_changed_failed_version_is_reported_as_discovered(self, models_root, scanner, registry):
+        changed = []
+        registry.update_state("model_a", "1.0.0", LoadState.FAILED)
+        watcher = _watcher(scanner, registry, on_changed=changed.append)
+        _write_version(models_root, "model_a", "1.0.0", display_name="Model A v2")
+
+        watcher._check_for_changes()
+
+        # The startup loader picks DISCOVERED versions up again in eager mode
+        assert [d.state for d in changed] == [LoadState.DISCOVERED]
+        assert registry.get_version("model_a", "1.0.0").state == LoadState.DISCOVERED
+
+    def test_changed_loaded_version_is_not_replaced(self, models_root, scanner, registry):
+        changed = []
+        registry.update_state("model_a", "1.0.0", LoadState.READY)
+        watcher = _watcher(scanner, registry, on_changed=changed.append)
+        _write_version(models_root, "model_a", "1.0.0", display_name="Model A v2")
+
+        watcher._check_for_changes()
+
+        descriptor = registry.get_version("model_a", "1.0.0")
+        assert descriptor.state == LoadState.READY
+        assert descriptor.display_name == "model_a"
+        assert changed == [descriptor]
+
+    def test_removed_version_is_reported_not_unregistered(self, models_root, scanner, registry):
+        removed = []
+        watcher = _watcher(scanner, registry, on_removed=lambda m, v: removed.append(m))
+
+        shutil.rmtree(models_root / "model_b")
+        watcher.notify_path(models_root / "model_b")
+        watcher._check_dirty()
+
+        assert removed == ["model_b"]
+        assert registry.get_version("model_b", "1.0.0") is not None
+
+
+class TestWatchLoop:
+    """Tests for the running watcher."""
+
+    def test_hot_drop_detected_within_a_second(self, models_root, scanner, registry):
+        watcher = DirectoryWatcher(
+            scanner, registry, poll_interval_seconds=0.2, use_native_events=False
+        )
+        watcher.start()
+        try:
+            _write_version(models_root, "model_c", "1.0.0")
+
+            deadline = time.monotonic() + 1.0
+            while registry.get_version("model_c", "1.0.0") is None and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert registry.get_version("model_c", "1.0.0") is not None
+        finally:
+            watcher.stop()
@@ -12,7 +12,11 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from ai.server.routes.inference import _decode_base64_frame
+from ai.server.routes.inference import (
+    _decode_base64_frame,
+    _decode_frame,
+    _jpeg_dimensions,
+)
 
 
 def create_test_image(width=640, height=480, color=(255, 0, 0)):
@@ -96,5 +100,70 @@ def test_decode_empty_string():
         _decode_base64_frame("", format="jpeg")
 
 
+def test_jpeg_dimensions_from_sof_marker():
+    """Test that JPEG dimensions are read from the header without decoding."""
+    img = create_test_image(width=1280, height=720)
+    jpeg_bytes = base64.b64decode(encode_image_to_base64(img, format="jpeg"))
+    png_bytes = base64.b64decode(encode_image_to_base64(img, format="png"))
+
+    assert _jpeg_dimensions(jpeg_bytes) == (1280, 720)
+    assert _jpeg_dimensions(png_bytes) is None
+
+
+def test_reduced_decode_for_small_model_input():
+    """Test that large JPEG frames decode at reduced scale when the model allows it."""
+    img = create_test_image(width=1920, height=1080, color=(0, 0, 255))
+    base64_str = encode_image_to_base64(img, format="jpeg")
+
+    decoded, scale = _decode_frame(base64_str, "jpeg", max_side=480)
+
+    assert scale == 4
+    assert decoded.shape == (270, 480, 3)
+    assert decoded[100, 100, 2] > 200  # Still BGR
+    assert decoded[100, 100, 0] < 50
+
+
+def test_reduced_decode_never_goes_below_max_side():
+    """Test that the scale keeps the longest side at or above max_side."""
+    img = create_test_image(width=1920, height=1080)
+    base64_str = encode_image_to_base64(img, format="jpeg")
+
+    decoded, scale = _decode_frame(base64_str, "jpeg", max_side=1280)
+    assert scale == 1
+    assert decoded.shape == (1080, 1920, 3)
+
+    decoded, scale = _decode_frame(base64_str, "jpeg", max_side=960)
+    assert scale == 2
+    assert decoded.shape == (540, 960, 3)
+
+
+def test_png_is_always_decoded_at_full_scale():
+    """Test that reduced decoding only applies to JPEG."""
+    img = create_test_image(width=1280, height=720)
+    base64_str = encode_image_to_base64(img, format="png")
+
+    decoded, scale = _decode_frame(base64_str, "png", max_side=320)
+
+    assert scale == 1
+    assert decoded.shape == (720, 1280, 3)
+
+
+def test_exif_orientation_is_ignored():
+    """Test that EXIF rotation does not change the validated frame shape."""
+    img = create_test_image(width=1280, height=720)
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90 CW
+    buffer = io.BytesIO()
+    Image.fromarray(img[:, :, ::-1]).save(buffer, format="JPEG", exif=exif)
+    base64_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+    decoded, _ = _decode_frame(base64_str, "jpeg")
+    assert decoded.shape == (720, 1280, 3)
+
+    decoded, scale = _decode_frame(base64_str, "jpeg", max_side=640)
+    assert scale == 2
+    assert decoded.shape == (360, 640, 3)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
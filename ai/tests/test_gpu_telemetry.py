@@ -0,0 +1,207 @@
+"""
+Tests for the GPU telemetry sampler
+
+Covers:
+1. Samples are read from NVML into a bounded ring buffer
+2. Window statistics (min/avg/max) per device
+3. Clean degradation without pynvml, without devices, and on read errors
+4. The GPU manager reads utilization from the sampler instead of NVML
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.gpu_telemetry import GPUTelemetrySampler
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class FakeNVML:
+    """Stand-in for pynvml that serves scripted utilization readings."""
+
+    NVML_TEMPERATURE_GPU = 0
+
+    def __init__(self, device_count=1, utilization=(10, 50, 90), fail_power=False):
+        self.device_count = device_count
+        self.utilization = list(utilization)
+        self.fail_power = fail_power
+        self.reads = 0
+        self.shutdown = False
+
+    def nvmlInit(self):
+        pass
+
+    def nvmlShutdown(self):
+        self.shutdown = True
+
+    def nvmlDeviceGetCount(self):
+        return self.device_count
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        return b"Fake GPU"
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        value = self.utilization[self.reads % len(self.utilization)]
+        self.reads += 1
+        return SimpleNamespace(gpu=value)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        return SimpleNamespace(used=2048 * 1024 * 1024, total=8192 * 1024 * 1024)
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        return 60
+
+    def nvmlDeviceGetPowerUsage(self, handle):
+        if self.fail_power:
+            raise RuntimeError("not supported")
+        return 150_000
+
+
+def _sampler(nvml, **kwargs):
+    options = dict(interval_seconds=1.0, history_seconds=120.0, nvml=nvml)
+    options.update(kwargs)
+    return GPUTelemetrySampler(**options)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestSampling:
+    """Tests for NVML sampling into the ring buffer."""
+
+    def test_start_takes_first_sample(self):
+        sampler = _sampler(FakeNVML())
+        try:
+            assert sampler.start()
+            sample = sampler.latest()[0]
+        finally:
+            sampler.stop()
+
+        assert sample.utilization_percent == 10
+        assert sample.memory_used_mb == 2048
+        assert sample.memory_total_mb == 8192
+        assert sample.power_w == 150.0
+        assert sampler.device_name(0) == "Fake GPU"
+
+    def test_ring_buffer_is_bounded(self):
+        sampler = _sampler(FakeNVML(), interval_seconds=1.0, history_seconds=3.0)
+        sampler._init_nvml()
+        for _ in range(10):
+            sampler.sample_once()
+
+        assert len(sampler.samples(0)) == 3
+
+    def test_background_thread_samples(self):
+        nvml = FakeNVML()
+        sampler = _sampler(nvml, interval_seconds=0.01)
+        sampler.start()
+        time.sleep(0.1)
+        sampler.stop()
+
+        assert nvml.reads > 2
+        assert nvml.shutdown
+
+    def test_on_sample_callback(self):
+        seen = []
+        sampler = _sampler(FakeNVML(device_count=2), on_sample=seen.append)
+        sampler._init_nvml()
+        sampler.sample_once()
+
+        assert [s.device_id for s in seen] == [0, 1]
+
+
+class TestWindowStats:
+    """Tests for min/avg/max over a window."""
+
+    def test_min_avg_max(self):
+        sampler = _sampler(FakeNVML(utilization=(10, 50, 90)))
+        sampler._init_nvml()
+        for _ in range(3):
+            sampler.sample_once()
+
+        stats = sampler.window_stats(60)[0]
+
+        assert stats["samples"] == 3
+        assert stats["utilization_percent"] == {"min": 10, "avg": 50, "max": 90}
+        assert stats["power_w"]["avg"] == 150.0
+
+    def test_old_samples_fall_out_of_window(self):
+        sampler = _sampler(FakeNVML())
+        sampler._init_nvml()
+        sampler.sample_once()
+        sampler.samples(0)[0].timestamp -= 120
+        sampler.sample_once()
+
+        assert sampler.window_stats(60)[0]["samples"] == 1
+
+    def test_unreported_fields_are_omitted(self):
+        sampler = _sampler(FakeNVML(fail_power=True))
+        sampler._init_nvml()
+        sampler.sample_once()
+
+        assert "power_w" not in sampler.window_stats(60)[0]
+
+
+class TestDegradation:
+    """Tests for running without a usable GPU."""
+
+    def test_no_devices(self):
+        sampler = _sampler(FakeNVML(device_count=0))
+
+        assert not sampler.start()
+        assert not sampler.available
+        assert sampler.latest() == {}
+        assert sampler.window_stats() == {}
+
+    def test_nvml_init_failure(self):
+        nvml = FakeNVML()
+        nvml.nvmlInit = lambda: (_ for _ in ()).throw(RuntimeError("driver"))
+        sampler = _sampler(nvml)
+
+        assert not sampler.start()
+        assert sampler.get_status()["available"] is False
+
+    def test_read_errors_are_counted_not_raised(self):
+        nvml = FakeNVML()
+        nvml.nvmlDeviceGetMemoryInfo = lambda handle: (_ for _ in ()).throw(RuntimeError("gone"))
+        sampler = _sampler(nvml)
+        sampler._init_nvml()
+        sampler.sample_once()
+
+        assert sampler.latest() == {}
+        assert sampler.get_status()["read_errors"] == 1
+
+
+class TestGPUManagerIntegration:
+    """Tests for the GPU manager reading from the sampler."""
+
+    def test_utilization_comes_from_sampler(self, monkeypatch):
+        from ai.runtime.gpu_manager import GPUDevice, GPUManager, GPUStatus
+
+        sampler = _sampler(FakeNVML(utilization=(77,)))
+        sampler._init_nvml()
+        sampler.sample_once()
+
+        manager = GPUManager(enable_gpu=False)
+        manager._devices = {0: GPUDevice(device_id=0, name="Fake GPU", total_memory_mb=8192)}
+        manager._status = GPUStatus.AVAILABLE
+        manager._torch_available = True
+        manager.attach_telemetry(sampler)
+
+        fake_torch = SimpleNamespace(cuda=SimpleNamespace(memory_allocated=lambda d: 0))
+        monkeypatch.setitem(sys.modules, "torch", fake_torch)
+        manager.update_device_stats()
+
+        assert manager.get_device(0).utilization_percent == 77
@@ -0,0 +1,202 @@
+"""
+Tests for blue/green model version hot-swap
+
+Covers:
+1. The new version is loaded alongside the old one before traffic flips
+2. In-flight requests on the old version drain before it is unloaded
+3. A failed load leaves the old version serving
+4. Shadow traffic mirrors a share of requests to the candidate
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.errors import ErrorCode, load_error
+from ai.runtime.hotswap import HotSwapManager, TrafficRouter
+from ai.runtime.loader import LoadedModel, LoadResult, ModelLoader
+from ai.runtime.models import HealthStatus, LoadState, ModelVersionDescriptor
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.sandbox import SandboxManager
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class StubLoader(ModelLoader):
+    """Loader stub whose models return their own version."""
+
+    def __init__(self, fail: set[str] = frozenset()):
+        super().__init__(warmup_enabled=False)
+        self.fail = fail
+        self.unloaded: list[str] = []
+
+    def load(self, descriptor: ModelVersionDescriptor) -> LoadResult:
+        if descriptor.version in self.fail:
+            return LoadResult.fail(
+                load_error(
+                    code=ErrorCode.LOAD_WEIGHTS_FAILED,
+                    message="weights missing",
+                    model_id=descriptor.model_id,
+                    version=descriptor.version,
+                )
+            )
+        loaded = LoadedModel(
+            model_id=descriptor.model_id,
+            version=descriptor.version,
+            infer=lambda frame, **kwargs: {"version": descriptor.version},
+        )
+        return LoadResult.ok(loaded, 1)
+
+    def unload(self, model_id: str, version: str) -> bool:
+        self.unloaded.append(version)
+        return True
+
+
+@pytest.fixture
+def registry():
+    registry = ModelRegistry()
+    for version in ("1.0.0", "1.1.0"):
+        registry.register_version(
+            ModelVersionDescriptor(model_id="detector", version=version, display_name="Detector")
+        )
+    return registry
+
+
+@pytest.fixture
+def sandbox_manager():
+    manager = SandboxManager()
+    yield manager
+    manager.shutdown_all()
+
+
+@pytest.fixture
+def router():
+    return TrafficRouter()
+
+
+def _serve_blue(registry, sandbox_manager, loader):
+    """Bring 1.0.0 up as the serving (blue) version."""
+    descriptor = registry.get_version("detector", "1.0.0")
+    sandbox_manager.create_sandbox(loader.load(descriptor).loaded_model, descriptor)
+    registry.update_state("detector", "1.0.0", LoadState.READY)
+    registry.update_health("detector", "1.0.0", HealthStatus.HEALTHY)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestTrafficRouter:
+    """Tests for routing pointer and in-flight accounting."""
+
+    def test_route_prefers_requested_then_pointer_then_fallback(self, router):
+        with router.route("detector", None, "1.0.0") as version:
+            assert version == "1.0.0"
+
+        router.set_active("detector", "1.1.0")
+        with router.route("detector", None, "1.0.0") as version:
+            assert version == "1.1.0"
+            assert router.in_flight("detector", "1.1.0") == 1
+        with router.route("detector", "1.0.0", None) as version:
+            assert version == "1.0.0"
+
+        assert router.in_flight("detector", "1.1.0") == 0
+
+    def test_wait_drained_blocks_until_requests_finish(self, router):
+        entered = threading.Event()
+
+        def request():
+            with router.track("detector", "1.0.0"):
+                entered.set()
+                time.sleep(0.1)
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        entered.wait()
+
+        assert not router.wait_drained("detector", "1.0.0", timeout=0.01)
+        assert router.wait_drained("detector", "1.0.0", timeout=1.0)
+        thread.join()
+
+
+class TestHotSwap:
+    """Tests for HotSwapManager."""
+
+    def test_swap_flips_traffic_and_unloads_old_version(self, registry, sandbox_manager, router):
+        loader = StubLoader()
+        _serve_blue(registry, sandbox_manager, loader)
+        swapper = HotSwapManager(loader, registry, sandbox_manager, router)
+
+        result = swapper.swap("detector", "1.1.0")
+
+        assert result.success and result.from_version == "1.0.0"
+        assert router.get_active("detector") == "1.1.0"
+        assert registry.get_version("detector", "1.1.0").state == LoadState.READY
+        assert registry.get_version("detector", "1.0.0").state == LoadState.UNLOADED
+        assert sandbox_manager.get_sandbox("detector", "1.0.0") is None
+        assert loader.unloaded == ["1.0.0"]
+
+        output = sandbox_manager.execute("detector", "1.1.0", frame=None).output
+        assert output == {"version": "1.1.0"}
+
+    def test_in_flight_request_completes_before_unload(self, registry, sandbox_manager, router):
+        loader = StubLoader()
+        _serve_blue(registry, sandbox_manager, loader)
+        swapper = HotSwapManager(loader, registry, sandbox_manager, router)
+        observed = {}
+        entered = threading.Event()
+
+        def slow_request():
+            with router.route("detector", None, "1.0.0") as version:
+                entered.set()
+                time.sleep(0.2)
+                observed["sandbox"] = sandbox_manager.get_sandbox("detector", version)
+
+        thread = threading.Thread(target=slow_request)
+        thread.start()
+        entered.wait()
+
+        result = swapper.swap("detector", "1.1.0")
+        thread.join()
+
+        assert result.drained and result.drain_time_ms >= 100
+        assert observed["sandbox"] is not None  # old sandbox still there mid-request
+
+    def test_failed_load_keeps_old_version_serving(self, registry, sandbox_manager, router):
+        loader = StubLoader(fail={"1.1.0"})
+        _serve_blue(registry, sandbox_manager, loader)
+        swapper = HotSwapManager(loader, registry, sandbox_manager, router)
+
+        result = swapper.swap("detector", "1.1.0")
+
+        assert not result.success
+        assert result.error == "weights missing"
+        assert router.get_active("detector") is None
+        assert registry.get_version("detector", "1.0.0").state == LoadState.READY
+        assert loader.unloaded == []
+
+    def test_shadow_traffic_is_recorded(self, registry, sandbox_manager, router):
+        loader = StubLoader()
+        _serve_blue(registry, sandbox_manager, loader)
+        swapper = HotSwapManager(loader, registry, sandbox_manager, router)
+
+        assert swapper.start_shadow("detector", "1.1.0", percent=100) is None
+        assert router.pick_shadow("detector", "1.0.0") == "1.1.0"
+        assert router.pick_shadow("detector", "1.1.0") is None
+
+        router.record_shadow("detector", success=True, duration_ms=12.0)
+        router.record_shadow("detector", success=False, duration_ms=0.0)
+        stats = swapper.stop_shadow("detector").to_dict()
+
+        assert stats["mirrored"] == 2 and stats["failures"] == 1
+        assert stats["avg_time_ms"] == 12.0
+        assert router.pick_shadow("detector", "1.0.0") is None
@@ -0,0 +1,189 @@
+"""
+Tests for the offline model benchmark harness
+
+Covers:
+1. Plugins are loaded in-process and measured per stage
+2. Batch sizes are only run for models that declare batch input
+3. Synthetic frames are deterministic
+4. Regressions against a stored baseline are detected
+5. Stub-mode answers are flagged and runs are CPU-only by default
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.benchmark import ModelBenchmark, compare_to_baseline, main, synthetic_frame
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+INFERENCE_PY = """
+def infer(frame, **kwargs):
+    return {"mean": float(frame.mean())}
+"""
+
+
+@pytest.fixture
+def models_root(tmp_path):
+    version_dir = tmp_path / "models" / "bench_model" / "1.0.0"
+    (version_dir / "weights").mkdir(parents=True)
+    (version_dir / "inference.py").write_text(INFERENCE_PY)
+    contract = {
+        "contract_schema_version": "1.0.0",
+        "model_id": "bench_model",
+        "version": "1.0.0",
+        "display_name": "Bench Model",
+        "input": {"type": "frame", "format": "jpeg", "min_width": 32, "min_height": 32, "channels": 3},
+        "output": {"schema_version": "1.0", "schema": {}},
+        "hardware": {"supports_cpu": True, "supports_gpu": False, "supports_jetson": False},
+        "performance": {"inference_time_hint_ms": 10, "recommended_fps": 5},
+    }
+    (version_dir / "model.yaml").write_text(yaml.safe_dump(contract))
+    return tmp_path / "models"
+
+
+def _bench(models_root, **kwargs):
+    options = dict(resolutions=[(320, 240)], concurrency=[1, 2], warmup=1, requests=4)
+    options.update(kwargs)
+    return ModelBenchmark(models_root, **options)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestModelBenchmark:
+    """Tests for the in-process benchmark run."""
+
+    def test_report_has_stage_percentiles_per_scenario(self, models_root):
+        report = _bench(models_root).run()
+
+        model = report["models"]["bench_model:1.0.0"]
+        assert [s["key"] for s in model["scenarios"]] == ["320x240/c1/b1", "320x240/c2/b1"]
+
+        scenario = model["scenarios"][0]
+        assert scenario["errors"] == 0
+        assert scenario["throughput_fps"] > 0
+        assert set(scenario["stages_ms"]) == {
+            "decode", "preprocess", "inference", "postprocess", "end_to_end"
+        }
+        assert scenario["stages_ms"]["end_to_end"]["p99"] >= scenario["stages_ms"]["decode"]["p50"]
+
+    def test_batch_sizes_skipped_for_frame_models(self, models_root):
+        report = _bench(models_root, concurrency=[1], batch_sizes=[1, 4]).run()
+
+        model = report["models"]["bench_model:1.0.0"]
+        assert [s["batch_size"] for s in model["scenarios"]] == [1]
+        assert model["skipped"] == ["320x240/b4: model does not accept batch input"]
+
+    def test_model_filter(self, models_root):
+        report = _bench(models_root).run(model_ids=["other_model"])
+
+        assert report["models"] == {}
+
+    def test_stub_mode_is_flagged(self, models_root):
+        (models_root / "bench_model" / "1.0.0" / "inference.py").write_text(
+            'def infer(frame, **kwargs):\n    return {"metadata": {"mode": "stub"}}\n'
+        )
+
+        report = _bench(models_root, concurrency=[1]).run()
+
+        model = report["models"]["bench_model:1.0.0"]
+        assert model["stub_mode"]
+        assert model["scenarios"][0]["stub_responses"] == 4
+        assert report["stub_models"] == ["bench_model:1.0.0"]
+
+    def test_real_inference_is_not_flagged(self, models_root):
+        report = _bench(models_root, concurrency=[1]).run()
+
+        assert not report["models"]["bench_model:1.0.0"]["stub_mode"]
+        assert report["stub_models"] == []
+
+    def test_synthetic_frames_are_deterministic(self):
+        assert np.array_equal(synthetic_frame(64, 48, seed=1), synthetic_frame(64, 48, seed=1))
+        assert not np.array_equal(synthetic_frame(64, 48, seed=1), synthetic_frame(64, 48, seed=2))
+
+
+class TestBaselineComparison:
+    """Tests for regression detection against a baseline report."""
+
+    @pytest.fixture
+    def report(self, models_root):
+        return _bench(models_root, concurrency=[1]).run()
+
+    def test_identical_report_has_no_regressions(self, report):
+        assert compare_to_baseline(report, report) == []
+
+    def test_slower_latency_and_lower_throughput_are_regressions(self, report):
+        baseline = copy.deepcopy(report)
+        scenario = baseline["models"]["bench_model:1.0.0"]["scenarios"][0]
+        scenario["stages_ms"]["end_to_end"]["p50"] = 0.001
+        scenario["throughput_fps"] *= 10
+
+        metrics = {r.metric for r in compare_to_baseline(report, baseline, tolerance=0.1)}
+
+        assert metrics == {"end_to_end.p50_ms", "throughput_fps"}
+
+    def test_cli_exits_non_zero_on_regression(self, models_root, report, tmp_path, monkeypatch):
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+        baseline = copy.deepcopy(report)
+        baseline["models"]["bench_model:1.0.0"]["scenarios"][0]["throughput_fps"] = 1e9
+        baseline_path = tmp_path / "baseline.json"
+        baseline_path.write_text(json.dumps(baseline))
+
+        exit_code = main([
+            "--models-root", str(models_root),
+            "--resolutions", "320x240",
+            "--concurrency", "1",
+            "--requests", "2",
+            "--warmup", "0",
+            "--output", str(tmp_path / "report.json"),
+            "--baseline", str(baseline_path),
+        ])
+
+        assert exit_code == 1
+        assert "regressions" in (tmp_path / "report.json").read_text()
+
+
+class TestDeviceSelection:
+    """Tests for keeping benchmark runs on CPU unless asked otherwise."""
+
+    def _run(self, models_root, tmp_path, *extra):
+        main([
+            "--models-root", str(models_root),
+            "--resolutions", "320x240",
+            "--concurrency", "1",
+            "--requests", "1",
+            "--warmup", "0",
+            "--output", str(tmp_path / "report.json"),
+            *extra,
+        ])
+        return json.loads((tmp_path / "report.json").read_text())
+
+    def test_gpus_hidden_by_default(self, models_root, tmp_path, monkeypatch):
+        monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
+
+        report = self._run(models_root, tmp_path)
+
+        assert report["config"]["device"] == "cpu"
+        assert report["environment"]["cuda_visible_devices"] == ""
+
+    def test_explicit_device_keeps_gpus_visible(self, models_root, tmp_path, monkeypatch):
+        monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
+
+        report = self._run(models_root, tmp_path, "--device", "cuda")
+
+        assert report["config"]["device"] == "cuda"
+        assert report["environment"]["cuda_visible_devices"] == "0"
@@ -0,0 +1,326 @@
+"""
+Tests for load-time model optimization (model.yaml ``optimize:`` section)
+
+Covers:
+1. Contract parsing of the optimize section
+2. Compiled-artifact caching keyed by weights hash
+3. Fallback to the eager model when optimizations cannot be applied
+4. ModelLoader integration
+5. The shipped fall_detection plugin loading through the optimizer
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.loader import ModelLoader
+from ai.runtime.models import ModelVersionDescriptor, OptimizationSpec, PerformanceHints
+from ai.runtime.optimizer import ModelOptimizer
+from ai.runtime.validator import ContractValidator
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class FakeYOLO:
+    """Minimal stand-in for an Ultralytics model (export + predict API)."""
+
+    export_calls = 0
+
+    def __init__(self, path: str, task: str = "detect"):
+        self.path = path
+        self.task = task
+
+    def predict(self, *args, **kwargs):
+        return []
+
+    def export(self, format: str, **kwargs) -> str:
+        FakeYOLO.export_calls += 1
+        out = Path(self.path).with_suffix(f".{format}")
+        out.write_bytes(b"compiled")
+        return str(out)
+
+
+def _contract(optimize=None) -> dict:
+    data = {
+        "contract_schema_version": "1.0.0",
+        "model_id": "opt_model",
+        "version": "1.0.0",
+        "display_name": "Optimizable Model",
+        "input": {
+            "type": "frame",
+            "format": "raw_bgr",
+            "min_width": 32,
+            "min_height": 32,
+            "channels": 3,
+        },
+        "output": {"schema_version": "1.0", "schema": {}},
+        "hardware": {"supports_cpu": True, "supports_gpu": False, "supports_jetson": False},
+        "performance": {
+            "inference_time_hint_ms": 10,
+            "recommended_fps": 5,
+            "warmup_iterations": 0,
+        },
+        "entry_points": {"inference": "inference.py", "loader": "loader.py"},
+    }
+    if optimize is not None:
+        data["optimize"] = optimize
+    return data
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """Create a model version directory with a loader returning a FakeYOLO."""
+    version_dir = tmp_path / "opt_model" / "1.0.0"
+    weights = version_dir / "weights"
+    weights.mkdir(parents=True)
+    (weights / "model.pt").write_bytes(b"weights-v1")
+    (version_dir / "inference.py").write_text(
+        "def infer(frame, **kwargs):\n    return {'event_type': 'not_detected'}\n"
+    )
+    (version_dir / "loader.py").write_text(
+        "from test_model_optimizer import FakeYOLO\n"
+        "def load(weights_path):\n"
+        "    return FakeYOLO(str(weights_path / 'model.pt'))\n"
+    )
+    return version_dir
+
+
+def _write_contract(version_dir: Path, optimize=None) -> None:
+    (version_dir / "model.yaml").write_text(yaml.safe_dump(_contract(optimize)))
+
+
+def _descriptor(version_dir: Path, spec: OptimizationSpec) -> ModelVersionDescriptor:
+    return ModelVersionDescriptor(
+        model_id="opt_model",
+        version="1.0.0",
+        display_name="Optimizable Model",
+        directory_path=version_dir,
+        performance=PerformanceHints(warmup_iterations=0),
+        optimize=spec,
+    )
+
+
+# =============================================================================
+# CONTRACT PARSING
+# =============================================================================
+
+
+class TestOptimizeContract:
+    """Tests for parsing the optimize section of model.yaml."""
+
+    def test_optimize_defaults_to_disabled(self, model_dir):
+        _write_contract(model_dir)
+        result = ContractValidator().validate(model_dir, "opt_model", "1.0.0")
+
+        assert result.is_valid
+        assert result.descriptor.optimize == OptimizationSpec()
+        assert not result.descriptor.optimize.enabled
+
+    def test_optimize_section_parsed(self, model_dir):
+        _write_contract(model_dir, {"onnx": True, "fp16": True, "input_size": 512})
+        result = ContractValidator().validate(model_dir, "opt_model", "1.0.0")
+
+        spec = result.descriptor.optimize
+        assert spec.onnx and spec.fp16
+        assert spec.input_size == (512, 512)
+        assert spec.enabled
+
+    def test_torchscript_and_onnx_are_exclusive(self, model_dir):
+        _write_contract(model_dir, {"onnx": True, "torchscript": True})
+        result = ContractValidator().validate(model_dir, "opt_model", "1.0.0")
+
+        assert not result.is_valid
+
+
+# =============================================================================
+# OPTIMIZER
+# =============================================================================
+
+
+class TestModelOptimizer:
+    """Tests for ModelOptimizer caching and fallback."""
+
+    def test_disabled_spec_returns_model_unchanged(self, model_dir, tmp_path):
+        model = object()
+        result = ModelOptimizer(cache_dir=tmp_path / "cache").optimize(
+            model, _descriptor(model_dir, OptimizationSpec())
+        )
+
+        assert result.model is model
+        assert result.is_eager
+
+    def test_ultralytics_export_is_cached_by_weights_hash(self, model_dir, tmp_path):
+        FakeYOLO.export_calls = 0
+        optimizer = ModelOptimizer(cache_dir=tmp_path / "cache")
+        descriptor = _descriptor(model_dir, OptimizationSpec(onnx=True))
+        model = FakeYOLO(str(model_dir / "weights" / "model.pt"))
+
+        first = optimizer.optimize(model, descriptor)
+        second = optimizer.optimize(model, descriptor)
+
+        assert FakeYOLO.export_calls == 1
+        assert first.applied == ["onnx"] and not first.cache_hit
+        assert second.cache_hit
+        assert Path(second.model.path).parent == tmp_path / "cache"
+
+        # New weights produce a new cache key and a fresh export
+        (model_dir / "weights" / "model.pt").write_bytes(b"weights-v2-longer")
+        optimizer.optimize(model, descriptor)
+        assert FakeYOLO.export_calls == 2
+
+    def test_fp16_skipped_on_cpu(self, model_dir, tmp_path):
+        result = ModelOptimizer(cache_dir=tmp_path / "cache").optimize(
+            FakeYOLO(str(model_dir / "weights" / "model.pt")),
+            _descriptor(model_dir, OptimizationSpec(fp16=True, onnx=True)),
+            device="cpu",
+        )
+
+        assert "fp16" in result.skipped
+        assert result.applied == ["onnx"]
+
+    def test_export_failure_falls_back_to_eager(self, model_dir, tmp_path):
+        model = FakeYOLO(str(model_dir / "weights" / "model.pt"))
+        descriptor = _descriptor(model_dir, OptimizationSpec(torchscript=True))
+
+        with patch.object(FakeYOLO, "export", side_effect=RuntimeError("boom")):
+            result = ModelOptimizer(cache_dir=tmp_path / "cache").optimize(model, descriptor)
+
+        assert result.model is model
+        assert result.skipped["torchscript"] == "boom"
+
+    def test_missing_torch_falls_back_to_eager(self, model_dir, tmp_path):
+        model = object()
+        descriptor = _descriptor(model_dir, OptimizationSpec(channels_last=True))
+
+        with patch.dict(sys.modules, {"torch": None}):
+            result = ModelOptimizer(cache_dir=tmp_path / "cache").optimize(model, descriptor)
+
+        assert result.model is model
+        assert result.skipped == {"channels_last": "torch not installed"}
+
+
+# =============================================================================
+# LOADER INTEGRATION
+# =============================================================================
+
+
+class TestLoaderOptimization:
+    """Tests for ModelLoader applying optimizations."""
+
+    def test_loader_applies_optimizations(self, model_dir, tmp_path):
+        _write_contract(model_dir, {"onnx": True})
+        descriptor = ContractValidator().validate(model_dir, "opt_model", "1.0.0").descriptor
+
+        loader = ModelLoader(optimizer=ModelOptimizer(cache_dir=tmp_path / "cache"))
+        sys.path.insert(0, str(Path(__file__).parent))
+        try:
+            result = loader.load(descriptor)
+        finally:
+            sys.path.remove(str(Path(__file__).parent))
+
+        assert result.success
+        assert result.loaded_model.optimizations == ("onnx",)
+        assert result.loaded_model.model_instance.path.endswith(".onnx")
+
+
+# =============================================================================
+# SHIPPED PLUGIN
+# =============================================================================
+
+
+FALL_DETECTION_DIR = Path(__file__).parent.parent / "models" / "fall_detection" / "1.0.0"
+FALL_DETECTION_WEIGHTS = FALL_DETECTION_DIR / "weights" / "yolov7-w6-pose.pt"
+
+
+def _load_fall_detection(tmp_path, optimize: dict):
+    """Load the shipped fall_detection plugin with the given optimize section."""
+    contract = yaml.safe_load((FALL_DETECTION_DIR / "model.yaml").read_text())
+    descriptor = ContractValidator().validate(
+        FALL_DETECTION_DIR, "fall_detection", "1.0.0"
+    ).descriptor
+    descriptor.optimize = OptimizationSpec(
+        **{**contract["optimize"], **optimize, "input_size": (640, 640)}
+    )
+    loader = ModelLoader(
+        warmup_enabled=False,
+        optimizer=ModelOptimizer(cache_dir=tmp_path / "cache"),
+    )
+    result = loader.load(descriptor)
+    assert result.success, result.error
+    return result.loaded_model
+
+
+class TestFallDetectionPlugin:
+    """The shipped fall_detection plugin goes through the optimizer."""
+
+    def test_contract_declares_loader_and_optimize(self):
+        descriptor = ContractValidator().validate(
+            FALL_DETECTION_DIR, "fall_detection", "1.0.0"
+        ).descriptor
+
+        assert descriptor.entry_points.loader == "loader.py"
+        assert descriptor.optimize.enabled
+        assert descriptor.optimize.onnx and descriptor.optimize.fp16
+
+    @pytest.mark.skipif(
+        FALL_DETECTION_WEIGHTS.exists(), reason="weights deployed; stub mode unused"
+    )
+    def test_missing_weights_leave_stub_mode(self, tmp_path):
+        loaded = _load_fall_detection(tmp_path, {})
+
+        assert loaded.model_instance is None
+        assert loaded.optimizations == ()
+
+    def test_onnx_variant_matches_eager_detections(self, tmp_path, test_data_dir):
+        pytest.importorskip("torch")
+        pytest.importorskip("onnxruntime")
+        if not FALL_DETECTION_WEIGHTS.exists():
+            pytest.skip(f"weights not deployed at {FALL_DETECTION_WEIGHTS}")
+        image_path = test_data_dir / "person.jpg"
+        if not image_path.exists():
+            pytest.skip(f"needs a photo of a person at {image_path}")
+        import cv2
+
+        frame = cv2.imread(str(image_path))
+        optimized = _load_fall_detection(tmp_path, {"fp16": False, "onnx": True})
+        eager = _load_fall_detection(tmp_path, {"fp16": False, "onnx": False})
+
+        assert optimized.optimizations == ("onnx",)
+        result = optimized.infer(frame, model=optimized.model_instance)
+        reference = eager.infer(frame, model=eager.model_instance)
+
+        assert result["metadata"]["mode"] == "inference"
+        assert result["detection_count"] > 0
+        assert result["detection_count"] == reference["detection_count"]
+        for got, want in zip(result["detections"], reference["detections"]):
+            assert got["bbox"] == pytest.approx(want["bbox"], abs=2.0)
+
+
+class TestScratchArtifacts:
+    """Uncached ONNX exports do not leave files behind."""
+
+    def test_uncached_onnx_export_removes_scratch_dir(
+        self, model_dir, tmp_path, monkeypatch
+    ):
+        torch = pytest.importorskip("torch")
+        pytest.importorskip("onnxruntime")
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        model = torch.nn.Sequential(torch.nn.Conv2d(3, 4, 3)).eval()
+        descriptor = _descriptor(
+            model_dir,
+            OptimizationSpec(onnx=True, input_size=(32, 32), cache_artifacts=False),
+        )
+
+        result = ModelOptimizer(cache_dir=tmp_path / "cache").optimize(model, descriptor)
+
+        assert result.applied == ["onnx"]
+        assert result.model(torch.zeros(1, 3, 32, 32)).shape == (1, 4, 30, 30)
+        assert not list(tmp_path.glob("ruth_onnx_*"))
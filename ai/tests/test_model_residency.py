@@ -0,0 +1,261 @@
+"""
+Tests for lazy model loading with LRU eviction
+
+Covers:
+1. Models load on first use and are shared by concurrent requests
+2. Least-recently-used idle models are evicted when a budget is exceeded
+3. Pinned models and models with requests in flight are never evicted
+4. On-demand versions are still advertised to the backend
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.loader import LoadedModel, LoadResult, ModelLoader
+from ai.runtime.models import (
+    HardwareCompatibility,
+    LoadState,
+    ModelVersionDescriptor,
+)
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.reporting import HealthAggregator
+from ai.runtime.residency import ModelResidencyManager
+from ai.runtime.sandbox import SandboxManager
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class CountingLoader(ModelLoader):
+    """Loader stub that records load/unload calls instead of importing code."""
+
+    def __init__(self, delay: float = 0.0, fail: set[str] = frozenset()):
+        super().__init__(warmup_enabled=False)
+        self.delay = delay
+        self.fail = fail
+        self.loads: list[str] = []
+        self.unloads: list[str] = []
+
+    def load(self, descriptor: ModelVersionDescriptor) -> LoadResult:
+        time.sleep(self.delay)
+        self.loads.append(descriptor.model_id)
+        if descriptor.model_id in self.fail:
+            raise RuntimeError("weights missing")
+        loaded = LoadedModel(
+            model_id=descriptor.model_id,
+            version=descriptor.version,
+            infer=lambda frame, **kwargs: {},
+        )
+        return LoadResult.ok(loaded, 1)
+
+    def unload(self, model_id: str, version: str) -> bool:
+        self.unloads.append(model_id)
+        return True
+
+
+def _descriptor(model_id: str, ram_mb: int = 0) -> ModelVersionDescriptor:
+    return ModelVersionDescriptor(
+        model_id=model_id,
+        version="1.0.0",
+        display_name=model_id,
+        hardware=HardwareCompatibility(min_ram_mb=ram_mb or None),
+    )
+
+
+@pytest.fixture
+def registry():
+    registry = ModelRegistry()
+    for model_id in ("model_a", "model_b", "model_c"):
+        registry.register_version(_descriptor(model_id, ram_mb=1000))
+    return registry
+
+
+@pytest.fixture
+def sandbox_manager():
+    manager = SandboxManager()
+    yield manager
+    manager.shutdown_all()
+
+
+def _state(registry, model_id):
+    return registry.get_version(model_id, "1.0.0").state
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestOnDemandLoading:
+    """Tests for loading models on first use."""
+
+    def test_model_loads_on_first_acquire(self, registry, sandbox_manager):
+        loader = CountingLoader()
+        residency = ModelResidencyManager(loader, registry, sandbox_manager)
+
+        assert _state(registry, "model_a") == LoadState.DISCOVERED
+        assert residency.acquire("model_a", "1.0.0")
+        residency.release("model_a", "1.0.0")
+
+        assert _state(registry, "model_a") == LoadState.READY
+        assert sandbox_manager.get_sandbox("model_a", "1.0.0") is not None
+        assert loader.loads == ["model_a"]
+
+        # Second request hits the resident model
+        assert residency.acquire("model_a", "1.0.0")
+        assert loader.loads == ["model_a"]
+
+    def test_concurrent_requests_share_one_load(self, registry, sandbox_manager):
+        loader = CountingLoader(delay=0.1)
+        residency = ModelResidencyManager(loader, registry, sandbox_manager)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(residency.ensure_resident("model_a", "1.0.0")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == [True] * 5
+        assert loader.loads == ["model_a"]
+
+    def test_failed_load_is_not_retried(self, registry, sandbox_manager):
+        loader = CountingLoader(fail={"model_a"})
+        residency = ModelResidencyManager(loader, registry, sandbox_manager)
+
+        assert not residency.acquire("model_a", "1.0.0")
+        assert not residency.acquire("model_a", "1.0.0")
+
+        assert _state(registry, "model_a") == LoadState.FAILED
+        assert loader.loads == ["model_a"]
+
+    def test_unknown_model_is_rejected(self, registry, sandbox_manager):
+        residency = ModelResidencyManager(CountingLoader(), registry, sandbox_manager)
+
+        assert not residency.acquire("missing", "1.0.0")
+
+
+class TestEviction:
+    """Tests for LRU eviction under memory pressure."""
+
+    def test_least_recently_used_is_evicted(self, registry, sandbox_manager):
+        loader = CountingLoader()
+        residency = ModelResidencyManager(
+            loader, registry, sandbox_manager, max_resident_models=2
+        )
+
+        residency.ensure_resident("model_a", "1.0.0")
+        residency.ensure_resident("model_b", "1.0.0")
+        # Touch model_a so model_b becomes least recently used
+        residency.acquire("model_a", "1.0.0")
+        residency.release("model_a", "1.0.0")
+
+        residency.ensure_resident("model_c", "1.0.0")
+
+        assert loader.unloads == ["model_b"]
+        assert _state(registry, "model_b") == LoadState.UNLOADED
+        assert sandbox_manager.get_sandbox("model_b", "1.0.0") is None
+        assert residency.is_resident("model_a", "1.0.0")
+        assert residency.is_resident("model_c", "1.0.0")
+
+        # An evicted model reloads on its next request
+        assert residency.acquire("model_b", "1.0.0")
+        assert loader.loads.count("model_b") == 2
+
+    def test_ram_budget_triggers_eviction(self, registry, sandbox_manager):
+        loader = CountingLoader()
+        residency = ModelResidencyManager(
+            loader, registry, sandbox_manager, ram_budget_mb=2500
+        )
+
+        for model_id in ("model_a", "model_b", "model_c"):
+            residency.ensure_resident(model_id, "1.0.0")
+
+        assert loader.unloads == ["model_a"]
+        assert residency.get_status()["ram_used_mb"] == 2000
+
+    def test_pinned_and_in_flight_models_are_not_evicted(self, registry, sandbox_manager):
+        loader = CountingLoader()
+        residency = ModelResidencyManager(
+            loader, registry, sandbox_manager,
+            pinned=["model_a"],
+            max_resident_models=2,
+        )
+
+        residency.ensure_resident("model_a", "1.0.0")
+        assert residency.acquire("model_b", "1.0.0")  # in flight
+
+        # Nothing evictable: the load proceeds over budget
+        residency.ensure_resident("model_c", "1.0.0")
+        assert loader.unloads == []
+
+        # Idle unpinned models can be evicted; pinned ones cannot
+        residency.release("model_b", "1.0.0")
+        assert residency.evict("model_c", "1.0.0")
+        assert not residency.evict("model_a", "1.0.0")
+
+    def test_concurrent_cold_loads_respect_budget(self, registry, sandbox_manager):
+        loader = CountingLoader(delay=0.1)
+        residency = ModelResidencyManager(
+            loader, registry, sandbox_manager, max_resident_models=2
+        )
+        residency.ensure_resident("model_a", "1.0.0")
+
+        threads = [
+            threading.Thread(target=residency.ensure_resident, args=(model_id, "1.0.0"))
+            for model_id in ("model_b", "model_c")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # The second load counts the first one's reservation and evicts model_a
+        assert loader.unloads == ["model_a"]
+        assert len(residency.get_status()["resident"]) == 2
+
+    def test_failed_load_releases_reservation(self, registry, sandbox_manager):
+        loader = CountingLoader(fail={"model_a"})
+        residency = ModelResidencyManager(
+            loader, registry, sandbox_manager, max_resident_models=2
+        )
+
+        assert not residency.ensure_resident("model_a", "1.0.0")
+        residency.ensure_resident("model_b", "1.0.0")
+        residency.ensure_resident("model_c", "1.0.0")
+
+        assert loader.unloads == []
+
+    def test_pinned_by_qualified_id(self, registry, sandbox_manager):
+        residency = ModelResidencyManager(
+            CountingLoader(), registry, sandbox_manager, pinned=["model_b:1.0.0"]
+        )
+
+        assert residency.is_pinned("model_b", "1.0.0")
+        assert not residency.is_pinned("model_b", "2.0.0")
+        assert not residency.is_pinned("model_a", "1.0.0")
+
+
+class TestOnDemandAdvertising:
+    """Tests for advertising versions that load on demand."""
+
+    def test_on_demand_versions_are_advertised(self, registry):
+        eager = HealthAggregator(registry)
+        lazy = HealthAggregator(registry, advertise_on_demand=True)
+
+        assert eager.get_all_advertisable_versions() == []
+        assert len(lazy.get_all_advertisable_versions()) == 3
+
+        registry.update_state("model_a", "1.0.0", LoadState.FAILED, "boom")
+        assert len(lazy.get_all_advertisable_versions()) == 2
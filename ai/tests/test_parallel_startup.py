@@ -0,0 +1,244 @@
+"""
+Tests for parallel model loading at runtime startup
+
+Covers:
+1. Loads run concurrently and each model becomes READY independently
+2. GPU memory budget bounds how many loads run at once
+3. One model's failure does not affect the others
+4. Plugin imports from parallel loads do not see each other's model dirs
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.runtime.errors import ErrorCode, load_error
+from ai.runtime.gpu_manager import GPUManager
+from ai.runtime.loader import LoadedModel, LoadResult, ModelLoader
+from ai.runtime.models import LoadState, ModelVersionDescriptor, ResourceLimits
+from ai.runtime.registry import ModelRegistry
+from ai.runtime.sandbox import SandboxManager
+from ai.runtime.startup import ParallelModelLoader
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class SlowLoader(ModelLoader):
+    """Loader stub that sleeps instead of importing model code."""
+
+    def __init__(self, delays: dict[str, float], fail: set[str] = frozenset(), **kwargs):
+        super().__init__(warmup_enabled=False, **kwargs)
+        self.delays = delays
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+        self._active_lock = threading.Lock()
+
+    def load(self, descriptor: ModelVersionDescriptor) -> LoadResult:
+        with self._active_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(descriptor.model_id, 0.0))
+            if descriptor.model_id in self.fail:
+                return LoadResult.fail(
+                    load_error(
+                        code=ErrorCode.LOAD_WEIGHTS_FAILED,
+                        message="weights missing",
+                        model_id=descriptor.model_id,
+                        version=descriptor.version,
+                    )
+                )
+            loaded = LoadedModel(
+                model_id=descriptor.model_id,
+                version=descriptor.version,
+                infer=lambda frame, **kwargs: {},
+            )
+            return LoadResult.ok(loaded, 1)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+
+
+def _descriptor(model_id: str, memory_mb: int = 1024) -> ModelVersionDescriptor:
+    return ModelVersionDescriptor(
+        model_id=model_id,
+        version="1.0.0",
+        display_name=model_id,
+        limits=ResourceLimits(max_memory_mb=memory_mb),
+    )
+
+
+@pytest.fixture
+def registry():
+    return ModelRegistry()
+
+
+@pytest.fixture
+def sandbox_manager():
+    manager = SandboxManager()
+    yield manager
+    manager.shutdown_all()
+
+
+def _register(registry, descriptors):
+    for descriptor in descriptors:
+        registry.register_version(descriptor)
+    return descriptors
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestParallelModelLoader:
+    """Tests for ParallelModelLoader."""
+
+    def test_loads_run_concurrently(self, registry, sandbox_manager):
+        descriptors = _register(registry, [_descriptor(f"model_{i}") for i in range(4)])
+        loader = SlowLoader({d.model_id: 0.2 for d in descriptors})
+
+        startup = ParallelModelLoader(loader, registry, sandbox_manager, max_workers=4)
+        start = time.monotonic()
+        report = startup.load_all(descriptors)
+        elapsed = time.monotonic() - start
+
+        assert report.loaded_count == 4
+        assert loader.max_active == 4
+        assert elapsed < 0.6  # sequential would take 0.8s
+        assert all(d.state == LoadState.READY for d in registry.get_all_versions())
+
+    def test_worker_limit_is_respected(self, registry, sandbox_manager):
+        descriptors = _register(registry, [_descriptor(f"model_{i}") for i in range(5)])
+        loader = SlowLoader({d.model_id: 0.05 for d in descriptors})
+
+        ParallelModelLoader(loader, registry, sandbox_manager, max_workers=2).load_all(descriptors)
+
+        assert loader.max_active == 2
+
+    def test_model_ready_before_slow_model_finishes(self, registry, sandbox_manager):
+        fast, slow = _register(registry, [_descriptor("fast_model"), _descriptor("slow_model")])
+        loader = SlowLoader({"fast_model": 0.0, "slow_model": 0.5})
+
+        startup = ParallelModelLoader(loader, registry, sandbox_manager, max_workers=2)
+        startup.start([fast, slow])
+
+        deadline = time.monotonic() + 0.4
+        while fast.state != LoadState.READY and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert fast.state == LoadState.READY
+        assert slow.state == LoadState.LOADING
+        assert sandbox_manager.get_sandbox("fast_model", "1.0.0") is not None
+        assert startup.is_running
+
+        assert startup.wait(timeout=2.0)
+        assert slow.state == LoadState.READY
+
+    def test_failure_is_isolated(self, registry, sandbox_manager):
+        descriptors = _register(registry, [_descriptor("good_model"), _descriptor("bad_model")])
+        loader = SlowLoader({}, fail={"bad_model"})
+        failed = []
+
+        report = ParallelModelLoader(
+            loader, registry, sandbox_manager,
+            on_failed=lambda desc, msg: failed.append(desc.model_id),
+        ).load_all(descriptors)
+
+        assert report.loaded_count == 1 and report.failed_count == 1
+        assert registry.get_version("bad_model", "1.0.0").state == LoadState.FAILED
+        assert registry.get_version("good_model", "1.0.0").state == LoadState.READY
+        assert failed == ["bad_model"]
+
+    def test_invalid_versions_are_skipped(self, registry, sandbox_manager):
+        invalid = _descriptor("broken_model")
+        invalid.state = LoadState.INVALID
+        _register(registry, [invalid])
+        loader = SlowLoader({})
+
+        report = ParallelModelLoader(loader, registry, sandbox_manager).load_all([invalid])
+
+        assert report.outcomes == []
+        assert invalid.state == LoadState.INVALID
+
+    def test_gpu_budget_serializes_loads_that_do_not_fit(self, registry, sandbox_manager):
+        descriptors = _register(
+            registry, [_descriptor("big_a", 3000), _descriptor("big_b", 3000)]
+        )
+
+        # 4 GB of budget: one 3 GB model fits, two do not
+        gpu_manager = MagicMock(spec=GPUManager)
+        gpu_manager.is_available = True
+        gpu_manager.get_allocation.return_value = None
+        gpu_manager.can_allocate.side_effect = lambda model_id, required_mb: required_mb <= 4000
+
+        loader = SlowLoader({"big_a": 0.05, "big_b": 0.05})
+        loader.gpu_manager = gpu_manager
+
+        report = ParallelModelLoader(
+            loader, registry, sandbox_manager, max_workers=4
+        ).load_all(descriptors)
+
+        assert report.loaded_count == 2
+        assert loader.max_active == 1
+
+    def test_cancel_skips_pending_loads(self, registry, sandbox_manager):
+        descriptors = _register(registry, [_descriptor(f"model_{i}") for i in range(3)])
+        loader = SlowLoader({d.model_id: 0.1 for d in descriptors})
+
+        startup = ParallelModelLoader(loader, registry, sandbox_manager, max_workers=1)
+        startup.start(descriptors)
+        time.sleep(0.02)
+        startup.cancel()
+
+        assert startup.wait(timeout=2.0)
+        assert startup.report.loaded_count == 1
+        assert len(startup.report.skipped) == 2
+
+
+class TestParallelImports:
+    """Tests for plugin imports from concurrent loads."""
+
+    def test_each_import_sees_its_own_model_dir(self, tmp_path):
+        loader = ModelLoader(warmup_enabled=False)
+        descriptors = []
+        for model_id in ("model_a", "model_b", "model_c"):
+            model_dir = tmp_path / model_id
+            model_dir.mkdir()
+            # Sleep mid-import so the imports overlap if they are not serialized
+            (model_dir / "inference.py").write_text(
+                "import sys, time\ntime.sleep(0.05)\nSEARCH_DIR = sys.path[0]\n"
+            )
+            descriptor = _descriptor(model_id)
+            descriptor.directory_path = model_dir
+            descriptors.append(descriptor)
+
+        modules = {}
+        threads = [
+            threading.Thread(
+                target=lambda d=d: modules.__setitem__(
+                    d.model_id,
+                    loader._import_module(d, d.directory_path / "inference.py", "inference"),
+                )
+            )
+            for d in descriptors
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for d in descriptors:
+            assert modules[d.model_id].SEARCH_DIR == str(d.directory_path)
+            assert loader.unload(d.model_id, d.version)
+        assert str(tmp_path / "model_a") not in sys.path
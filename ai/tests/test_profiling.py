@@ -0,0 +1,139 @@
+"""
+Tests for on-demand profiling and the /debug endpoints
+
+Covers:
+1. Stack sampling sees work on other threads, in collapsed-stack format
+2. Only one profile runs at a time
+3. cProfile capture of the event loop
+4. Endpoints are guarded by the internal API key
+5. Task and executor dumps
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ai.observability import profiling
+from ai.observability.profiling import ProfilerBusyError, format_collapsed, sample_stacks
+from ai.server.config import reload_config
+from ai.server.routes import debug
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+API_KEY = "test-internal-key"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("INTERNAL_API_KEY", API_KEY)
+    reload_config()
+    app = FastAPI()
+    app.include_router(debug.router, prefix="/debug")
+    yield TestClient(app, headers={"X-Internal-API-Key": API_KEY})
+    monkeypatch.delenv("INTERNAL_API_KEY")
+    reload_config()
+
+
+def _busy_worker(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=_busy_worker, args=(stop,), name="busy")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestStackSampling:
+    """Tests for the in-process stack sampler."""
+
+    def test_samples_other_threads(self, busy_thread):
+        result = sample_stacks(0.2, interval_s=0.005)
+
+        assert result["samples"] > 0
+        busy = [s for s in result["stacks"] if s.startswith("busy;")]
+        assert busy
+        assert any("_busy_worker (tests/test_profiling.py:" in s for s in busy)
+
+    def test_collapsed_format_is_heaviest_first(self):
+        text = format_collapsed({"main;a": 2, "main;a;b": 5})
+
+        assert text == "main;a;b 5\nmain;a 2\n"
+
+    def test_second_profile_is_rejected(self):
+        assert profiling._profile_lock.acquire(blocking=False)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                sample_stacks(0.01)
+        finally:
+            profiling._profile_lock.release()
+
+
+class TestDebugEndpoints:
+    """Tests for the /debug routes."""
+
+    def test_disabled_without_internal_key(self):
+        reload_config()
+        app = FastAPI()
+        app.include_router(debug.router, prefix="/debug")
+
+        response = TestClient(app).get("/debug/tasks")
+
+        assert response.status_code == 404
+
+    def test_wrong_key_is_forbidden(self, client):
+        response = client.get("/debug/tasks", headers={"X-Internal-API-Key": "nope"})
+
+        assert response.status_code == 403
+
+    def test_sample_profile_returns_collapsed_stacks(self, client, busy_thread):
+        response = client.get("/debug/profile", params={"seconds": 0.2, "interval_ms": 5})
+
+        assert response.status_code == 200
+        assert int(response.headers["X-Profile-Samples"]) > 0
+        line = response.text.splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+    def test_cprofile_returns_pstats_report(self, client):
+        response = client.get("/debug/profile", params={"seconds": 0.05, "mode": "cprofile"})
+
+        assert response.status_code == 200
+        assert "function calls" in response.text
+
+    def test_concurrent_profile_conflicts(self, client):
+        assert profiling._profile_lock.acquire(blocking=False)
+        try:
+            response = client.get("/debug/profile", params={"seconds": 0.05})
+        finally:
+            profiling._profile_lock.release()
+
+        assert response.status_code == 409
+
+    def test_tasks_and_executors(self, client):
+        tasks = client.get("/debug/tasks").json()
+        executors = client.get("/debug/executors").json()
+
+        assert tasks["count"] == len(tasks["tasks"]) >= 1
+        assert {"name", "coro", "done", "stack"} <= set(tasks["tasks"][0])
+        assert set(executors) == {"default", "sandboxes"}
@@ -359,6 +359,9 @@ export interface ViolationsListResponse {
 
   /** Items per page - MAY be absent */
   limit?: number;
+
+  /** Keyset cursor for the next page (pass back as `cursor`); null on the last page */
+  next_cursor?: string | null;
 }
 
 // ============================================================================
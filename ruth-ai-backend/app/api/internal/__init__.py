@@ -6,4 +6,5 @@ They are used for internal service communication.
 Includes:
 - events: AI inference event ingestion
 - ai_runtime: AI Runtime registration and health
+- debug: On-demand profiling, task and executor dumps (internal key)
 """
@@ -98,6 +98,8 @@ class CapacityReport(BaseModel):
     concurrency: CapacityConcurrency
     per_model_limits: Dict[str, int] = Field(default_factory=dict)
     backpressure: CapacityBackpressure
+    utilization: Optional[float] = None  # GPU busy fraction, None when unknown
+    service_time_ms: Dict[str, float] = Field(default_factory=dict)
 
 
 class VersionHardware(BaseModel):
@@ -0,0 +1,92 @@
+"""Debug endpoints for latency investigations.
+
+GET /debug/profile - Sample stacks (collapsed, flamegraph-ready) or cProfile the loop
+GET /debug/tasks - Pending asyncio tasks with their suspended stacks
+GET /debug/executors - Default executor queue and DB connection pool
+
+Disabled unless INTERNAL_API_KEY is set; every request must carry
+X-Internal-API-Key. Nothing runs between requests.
+"""
+
+import asyncio
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.database import get_engine
+from app.core.profiling import (
+    ProfilerBusyError,
+    default_executor_state,
+    dump_asyncio_tasks,
+    format_collapsed,
+    profile_event_loop,
+    sample_stacks,
+)
+from app.deps.internal import require_internal_api_key
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["Debug"],
+    dependencies=[Depends(require_internal_api_key)],
+)
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(default=10.0, gt=0, le=60, description="Duration"),
+    mode: Literal["sample", "cprofile"] = Query(default="sample"),
+    interval_ms: float = Query(default=10.0, ge=1, le=1000),
+    limit: int = Query(default=50, ge=1, le=500, description="cProfile rows"),
+) -> PlainTextResponse:
+    """Profile the backend for `seconds`.
+
+    mode=sample returns collapsed stacks across all threads (pipe into
+    flamegraph.pl or load into speedscope). mode=cprofile returns a pstats
+    report for the event loop thread, sorted by cumulative time.
+
+    Raises:
+        HTTPException 409: Another profile is already running
+    """
+    try:
+        if mode == "cprofile":
+            return PlainTextResponse(await profile_event_loop(seconds, limit=limit))
+        result = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return PlainTextResponse(
+        format_collapsed(result["stacks"]),
+        headers={
+            "X-Profile-Samples": str(result["samples"]),
+            "X-Profile-Duration": str(result["duration_s"]),
+        },
+    )
+
+
+@router.get("/tasks")
+async def tasks(max_frames: int = Query(default=10, ge=1, le=100)) -> dict[str, Any]:
+    """Return every pending asyncio task and where it is suspended."""
+    task_list = dump_asyncio_tasks(max_frames=max_frames)
+    return {"count": len(task_list), "tasks": task_list}
+
+
+@router.get("/executors")
+async def executors() -> dict[str, Any]:
+    """Return default executor queue depth and DB connection pool usage."""
+    return {
+        "default": default_executor_state(),
+        "db_pool": _db_pool_state(),
+    }
+
+
+def _db_pool_state() -> dict[str, Any] | None:
+    engine = get_engine()
+    if engine is None:
+        return None
+    pool = engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
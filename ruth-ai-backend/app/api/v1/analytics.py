@@ -5,6 +5,9 @@ From API Contract - Analytics APIs:
 - GET    /analytics/violations/trends (Time series trends)
 - GET    /analytics/devices/status (Per-device analytics)
 - POST   /analytics/export (CSV/XLSX/PDF exports)
+- POST   /analytics/export/jobs (Background export: submit)
+- GET    /analytics/export/jobs/{job_id} (Background export: status)
+- GET    /analytics/export/jobs/{job_id}/download (Background export: result)
 
 Aligned with analytics-design.md Section 8.
 """
@@ -12,12 +15,14 @@ Aligned with analytics-design.md Section 8.
 from datetime import datetime, timedelta, timezone
 from typing import Literal
 
-from fastapi import APIRouter, Query, status
-from sqlalchemy import and_, case, func, select
+from fastapi import APIRouter, Header, Query, status
+from sqlalchemy import Subquery, and_, case, func, select
 
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
+from app.core.errors import ServiceUnavailableAPIError, ValidationAPIError
 from app.core.logging import get_logger
+from app.core.ranges import iter_file_range, parse_range
 from app.deps import DBSession
 from app.models import Device, StreamSession, StreamState, Violation, ViolationStatus
 from app.schemas import (
@@ -30,6 +35,7 @@ from app.schemas import (
     DeviceStatusResponse,
     DeviceStatusSummary,
     ErrorResponse,
+    ExportJobResponse,
     ExportRequest,
     StatusBreakdown,
     TimeRange,
@@ -38,11 +44,21 @@ from app.schemas import (
     ViolationTrendBucket,
     ViolationTrendsResponse,
 )
+from app.services.export_jobs import (
+    ExportJob,
+    ExportJobManager,
+    ExportJobState,
+    get_export_job_manager,
+)
 from app.services.export_service import ExportService
+from app.services.violation_rollups import violation_counts
 
 router = APIRouter(tags=["Analytics"])
 logger = get_logger(__name__)
 
+# Longest time range a single export may cover
+MAX_EXPORT_RANGE_DAYS = 90
+
 
 @router.get(
     "/analytics/summary",
@@ -92,27 +108,19 @@ async def get_analytics_summary(
         granularity=granularity,
     )
 
-    # Base filter for time range
-    time_filter = and_(
-        Violation.timestamp >= from_time,
-        Violation.timestamp < to_time,
+    # Counts come from the rollup tables (plus raw rows for the sub-hour
+    # edges), so none of these queries scale with violation history
+    counts = violation_counts(
+        from_time, to_time, finest="hour" if granularity == "hour" else "day"
     )
 
-    # Count total violations in range
-    total_stmt = select(func.count()).select_from(Violation).where(time_filter)
-    result = await db.execute(total_stmt)
-    violations_total = result.scalar() or 0
-
-    # Count violations by status
-    status_counts = {}
-    for status_val in ViolationStatus:
-        stmt = (
-            select(func.count())
-            .select_from(Violation)
-            .where(and_(time_filter, Violation.status == status_val))
-        )
-        result = await db.execute(stmt)
-        status_counts[status_val.value] = result.scalar() or 0
+    # Totals by status in one grouped query
+    status_stmt = select(counts.c.status, func.sum(counts.c.count).label("count")).group_by(
+        counts.c.status
+    )
+    result = await db.execute(status_stmt)
+    status_counts = {row.status.value: int(row.count or 0) for row in result.all()}
+    violations_total = sum(status_counts.values())
 
     # Count active cameras (with LIVE streams)
     active_cameras_stmt = (
@@ -143,16 +151,16 @@ async def get_analytics_summary(
     comparison = await _compute_comparison(db, from_time, to_time, violations_total)
 
     # Per-camera breakdown
-    by_camera = await _get_camera_breakdown(db, time_filter)
+    by_camera = await _get_camera_breakdown(db, counts)
 
     # Per-type breakdown
-    by_type = await _get_type_breakdown(db, time_filter, violations_total)
+    by_type = await _get_type_breakdown(db, counts, violations_total)
 
     # Per-status breakdown
-    by_status = await _get_status_breakdown(db, time_filter, violations_total)
+    by_status = _get_status_breakdown(status_counts, violations_total)
 
     # Time series
-    time_series = await _get_time_series(db, from_time, to_time, granularity)
+    time_series = await _get_time_series(db, counts, granularity)
 
     return AnalyticsSummaryResponse(
         time_range=TimeRange(from_=from_time, to=to_time),
@@ -177,16 +185,8 @@ async def _compute_comparison(
     prev_from = from_time - period_duration
     prev_to = from_time
 
-    prev_stmt = (
-        select(func.count())
-        .select_from(Violation)
-        .where(
-            and_(
-                Violation.timestamp >= prev_from,
-                Violation.timestamp < prev_to,
-            )
-        )
-    )
+    prev_counts = violation_counts(prev_from, prev_to, finest="day")
+    prev_stmt = select(func.coalesce(func.sum(prev_counts.c.count), 0))
     result = await db.execute(prev_stmt)
     prev_total = result.scalar() or 0
 
@@ -204,32 +204,29 @@ async def _compute_comparison(
 
 async def _get_camera_breakdown(
     db: DBSession,
-    time_filter,
+    counts: Subquery,
 ) -> list[CameraBreakdown]:
     """Get per-camera violation breakdown."""
+    total = func.sum(counts.c.count)
+
+    def by_status(status_val: ViolationStatus):
+        return func.sum(case((counts.c.status == status_val, counts.c.count), else_=0))
+
     stmt = (
         select(
             Device.id,
             Device.name,
-            func.count(Violation.id).label("total"),
-            func.sum(
-                case((Violation.status == ViolationStatus.OPEN, 1), else_=0)
-            ).label("open"),
-            func.sum(
-                case((Violation.status == ViolationStatus.REVIEWED, 1), else_=0)
-            ).label("reviewed"),
-            func.sum(
-                case((Violation.status == ViolationStatus.DISMISSED, 1), else_=0)
-            ).label("dismissed"),
-            func.sum(
-                case((Violation.status == ViolationStatus.RESOLVED, 1), else_=0)
-            ).label("resolved"),
+            total.label("total"),
+            by_status(ViolationStatus.OPEN).label("open"),
+            by_status(ViolationStatus.REVIEWED).label("reviewed"),
+            by_status(ViolationStatus.DISMISSED).label("dismissed"),
+            by_status(ViolationStatus.RESOLVED).label("resolved"),
         )
-        .select_from(Violation)
-        .join(Device, Violation.device_id == Device.id)
-        .where(time_filter)
+        .select_from(counts)
+        .join(Device, counts.c.device_id == Device.id)
         .group_by(Device.id, Device.name)
-        .order_by(func.count(Violation.id).desc())
+        .having(total > 0)
+        .order_by(total.desc())
     )
 
     result = await db.execute(stmt)
@@ -239,11 +236,11 @@ async def _get_camera_breakdown(
         CameraBreakdown(
             camera_id=str(row.id),
             camera_name=row.name,
-            violations_total=row.total or 0,
-            violations_open=row.open or 0,
-            violations_reviewed=row.reviewed or 0,
-            violations_dismissed=row.dismissed or 0,
-            violations_resolved=row.resolved or 0,
+            violations_total=int(row.total or 0),
+            violations_open=int(row.open or 0),
+            violations_reviewed=int(row.reviewed or 0),
+            violations_dismissed=int(row.dismissed or 0),
+            violations_resolved=int(row.resolved or 0),
         )
         for row in rows
     ]
@@ -251,19 +248,16 @@ async def _get_camera_breakdown(
 
 async def _get_type_breakdown(
     db: DBSession,
-    time_filter,
+    counts: Subquery,
     total: int,
 ) -> list[TypeBreakdown]:
     """Get violation type breakdown."""
+    count = func.sum(counts.c.count)
     stmt = (
-        select(
-            Violation.type,
-            func.count(Violation.id).label("count"),
-        )
-        .select_from(Violation)
-        .where(time_filter)
-        .group_by(Violation.type)
-        .order_by(func.count(Violation.id).desc())
+        select(counts.c.type, count.label("count"))
+        .group_by(counts.c.type)
+        .having(count > 0)
+        .order_by(count.desc())
     )
 
     result = await db.execute(stmt)
@@ -273,68 +267,46 @@ async def _get_type_breakdown(
         TypeBreakdown(
             type=row.type.value,
             type_display=row.type.value.replace("_", " ").title(),
-            count=row.count,
+            count=int(row.count),
             percentage=round((row.count / total * 100) if total > 0 else 0, 1),
         )
         for row in rows
     ]
 
 
-async def _get_status_breakdown(
-    db: DBSession,
-    time_filter,
+def _get_status_breakdown(
+    status_counts: dict[str, int],
     total: int,
 ) -> list[StatusBreakdown]:
-    """Get violation status breakdown."""
-    stmt = (
-        select(
-            Violation.status,
-            func.count(Violation.id).label("count"),
-        )
-        .select_from(Violation)
-        .where(time_filter)
-        .group_by(Violation.status)
-        .order_by(func.count(Violation.id).desc())
-    )
-
-    result = await db.execute(stmt)
-    rows = result.all()
-
+    """Get violation status breakdown from the per-status totals."""
     return [
         StatusBreakdown(
-            status=row.status.value,
-            count=row.count,
-            percentage=round((row.count / total * 100) if total > 0 else 0, 1),
+            status=status_key,
+            count=count,
+            percentage=round((count / total * 100) if total > 0 else 0, 1),
         )
-        for row in rows
+        for status_key, count in sorted(
+            status_counts.items(), key=lambda item: item[1], reverse=True
+        )
+        if count > 0
     ]
 
 
 async def _get_time_series(
     db: DBSession,
-    from_time: datetime,
-    to_time: datetime,
+    counts: Subquery,
     granularity: Literal["hour", "day"],
 ) -> list[TimeSeriesBucket]:
     """Get time series data with specified granularity."""
-    # Use PostgreSQL date_trunc for time bucketing
-    trunc_format = granularity  # 'hour' or 'day'
+    # Rollup buckets are UTC hours/days; truncate to the requested size
+    bucket = func.date_trunc(granularity, counts.c.bucket, "UTC")
+    count = func.sum(counts.c.count)
 
     stmt = (
-        select(
-            func.date_trunc(trunc_format, Violation.timestamp).label("bucket"),
-            func.count(Violation.id).label("total"),
-            Violation.type,
-        )
-        .select_from(Violation)
-        .where(
-            and_(
-                Violation.timestamp >= from_time,
-                Violation.timestamp < to_time,
-            )
-        )
-        .group_by("bucket", Violation.type)
-        .order_by("bucket")
+        select(bucket.label("bucket"), count.label("total"), counts.c.type)
+        .group_by(bucket, counts.c.type)
+        .having(count > 0)
+        .order_by(bucket)
     )
 
     result = await db.execute(stmt)
@@ -346,7 +318,7 @@ async def _get_time_series(
         bucket_time = row.bucket
         if bucket_time not in buckets:
             buckets[bucket_time] = {}
-        buckets[bucket_time][row.type.value] = row.total
+        buckets[bucket_time][row.type.value] = int(row.total)
 
     # Convert to response format
     return [
@@ -412,31 +384,46 @@ async def get_violations_trends(
         violation_type=violation_type,
     )
 
-    # Build filters
-    filters = [
-        Violation.timestamp >= from_time,
-        Violation.timestamp < to_time,
-    ]
-
-    if camera_id:
-        filters.append(Violation.device_id == camera_id)
-
-    if violation_type:
-        filters.append(Violation.type == violation_type)
-
-    # Query for time series with type and status breakdowns
-    stmt = (
-        select(
-            func.date_trunc(granularity, Violation.timestamp).label("bucket"),
-            Violation.type,
-            Violation.status,
-            func.count(Violation.id).label("count"),
+    if granularity == "minute":
+        # Finer than any rollup: group the raw rows
+        filters = [
+            Violation.timestamp >= from_time,
+            Violation.timestamp < to_time,
+        ]
+        if camera_id:
+            filters.append(Violation.device_id == camera_id)
+        if violation_type:
+            filters.append(Violation.type == violation_type)
+
+        bucket = func.date_trunc(granularity, Violation.timestamp)
+        stmt = (
+            select(
+                bucket.label("bucket"),
+                Violation.type,
+                Violation.status,
+                func.count(Violation.id).label("count"),
+            )
+            .select_from(Violation)
+            .where(and_(*filters))
+            .group_by(bucket, Violation.type, Violation.status)
+            .order_by(bucket)
+        )
+    else:
+        counts = violation_counts(
+            from_time,
+            to_time,
+            finest=granularity,
+            device_id=camera_id,
+            violation_type=violation_type,
+        )
+        bucket = func.date_trunc(granularity, counts.c.bucket, "UTC")
+        count = func.sum(counts.c.count)
+        stmt = (
+            select(bucket.label("bucket"), counts.c.type, counts.c.status, count.label("count"))
+            .group_by(bucket, counts.c.type, counts.c.status)
+            .having(count > 0)
+            .order_by(bucket)
         )
-        .select_from(Violation)
-        .where(and_(*filters))
-        .group_by("bucket", Violation.type, Violation.status)
-        .order_by("bucket")
-    )
 
     result = await db.execute(stmt)
     rows = result.all()
@@ -455,13 +442,14 @@ async def get_violations_trends(
         type_key = row.type.value
         status_key = row.status.value
 
+        row_count = int(row.count)
         buckets[bucket_time]["by_type"][type_key] = (
-            buckets[bucket_time]["by_type"].get(type_key, 0) + row.count
+            buckets[bucket_time]["by_type"].get(type_key, 0) + row_count
         )
         buckets[bucket_time]["by_status"][status_key] = (
-            buckets[bucket_time]["by_status"].get(status_key, 0) + row.count
+            buckets[bucket_time]["by_status"].get(status_key, 0) + row_count
         )
-        buckets[bucket_time]["total"] += row.count
+        buckets[bucket_time]["total"] += row_count
 
     # Convert to response format
     data = [
@@ -524,85 +512,27 @@ async def get_devices_status(
         to_time=to_time.isoformat(),
     )
 
-    # Query per-device statistics
-    # For each device, get: violation counts by status, by type, avg confidence, last violation time
-    devices_data = []
-
-    # Get all devices
-    devices_stmt = select(Device).where(Device.is_active == True)
-    devices_result = await db.execute(devices_stmt)
-    all_devices = devices_result.scalars().all()
-
-    total_violations = 0
-
-    for device in all_devices:
-        # Count violations for this device in time range
-        violations_stmt = (
-            select(Violation)
-            .where(
-                and_(
-                    Violation.device_id == device.id,
-                    Violation.timestamp >= from_time,
-                    Violation.timestamp < to_time,
-                )
-            )
-        )
-        violations_result = await db.execute(violations_stmt)
-        violations = violations_result.scalars().all()
-
-        if not violations:
-            # Skip devices with no violations in range
-            continue
-
-        violations_total = len(violations)
-        total_violations += violations_total
-
-        # Build status breakdown
-        violations_by_status = {}
-        for v in violations:
-            status_key = v.status.value
-            violations_by_status[status_key] = violations_by_status.get(status_key, 0) + 1
-
-        # Build type breakdown
-        violations_by_type = {}
-        for v in violations:
-            type_key = v.type.value
-            violations_by_type[type_key] = violations_by_type.get(type_key, 0) + 1
-
-        # Calculate average confidence
-        avg_confidence = sum(v.confidence for v in violations) / len(violations)
-
-        # Get last violation timestamp
-        last_violation_at = max(v.timestamp for v in violations)
-
-        devices_data.append(
-            DeviceAnalytics(
-                camera_id=str(device.id),
-                camera_name=device.name,
-                violations_total=violations_total,
-                violations_by_status=violations_by_status,
-                violations_by_type=violations_by_type,
-                avg_confidence=round(avg_confidence, 2),
-                last_violation_at=last_violation_at,
-            )
-        )
-
-    # Sort by violation count (descending)
-    devices_data.sort(key=lambda d: d.violations_total, reverse=True)
+    devices_data = await _get_device_analytics(db, from_time, to_time)
+    total_violations = sum(d.violations_total for d in devices_data)
 
-    # Count active cameras
-    active_cameras_stmt = (
+    # Camera counts in one round trip
+    counts_stmt = select(
+        select(func.count())
+        .select_from(Device)
+        .where(Device.is_active == True)
+        .scalar_subquery()
+        .label("total_cameras"),
         select(func.count(func.distinct(StreamSession.device_id)))
-        .select_from(StreamSession)
         .where(StreamSession.state == StreamState.LIVE)
+        .scalar_subquery()
+        .label("active_cameras"),
     )
-    active_result = await db.execute(active_cameras_stmt)
-    active_cameras = active_result.scalar() or 0
+    counts = (await db.execute(counts_stmt)).one()
 
     summary = DeviceStatusSummary(
         total_violations=total_violations,
-        total_cameras=len(all_devices),
-        active_cameras=active_cameras,
+        total_cameras=counts.total_cameras or 0,
+        active_cameras=counts.active_cameras or 0,
     )
 
     return DeviceStatusResponse(
@@ -613,6 +543,80 @@ async def get_devices_status(
     )
 
 
+async def _get_device_analytics(
+    db: DBSession,
+    from_time: datetime,
+    to_time: datetime,
+) -> list[DeviceAnalytics]:
+    """Get per-device violation analytics from one grouped query.
+
+    Postgres aggregates per (device, status, type); only those few rows come
+    back and are folded into one DeviceAnalytics per device, so the query
+    count is constant in the number of devices and no violation rows (or
+    their JSONB payloads) are loaded.
+    """
+    stmt = (
+        select(
+            Device.id,
+            Device.name,
+            Violation.status,
+            Violation.type,
+            func.count(Violation.id).label("count"),
+            func.sum(Violation.confidence).label("confidence_sum"),
+            func.max(Violation.timestamp).label("last_at"),
+        )
+        .select_from(Violation)
+        .join(Device, Violation.device_id == Device.id)
+        .where(
+            and_(
+                Device.is_active == True,
+                Violation.timestamp >= from_time,
+                Violation.timestamp < to_time,
+            )
+        )
+        .group_by(Device.id, Device.name, Violation.status, Violation.type)
+    )
+
+    result = await db.execute(stmt)
+
+    devices: dict = {}
+    for row in result.all():
+        device = devices.get(row.id)
+        if device is None:
+            device = devices[row.id] = {
+                "name": row.name,
+                "total": 0,
+                "by_status": {},
+                "by_type": {},
+                "confidence_sum": 0.0,
+                "last_at": row.last_at,
+            }
+        device["total"] += row.count
+        by_status = device["by_status"]
+        by_status[row.status.value] = by_status.get(row.status.value, 0) + row.count
+        by_type = device["by_type"]
+        by_type[row.type.value] = by_type.get(row.type.value, 0) + row.count
+        device["confidence_sum"] += row.confidence_sum or 0.0
+        device["last_at"] = max(device["last_at"], row.last_at)
+
+    devices_data = [
+        DeviceAnalytics(
+            camera_id=str(device_id),
+            camera_name=device["name"],
+            violations_total=device["total"],
+            violations_by_status=device["by_status"],
+            violations_by_type=device["by_type"],
+            avg_confidence=round(device["confidence_sum"] / device["total"], 2),
+            last_violation_at=device["last_at"],
+        )
+        for device_id, device in devices.items()
+    ]
+
+    # Sort by violation count (descending)
+    devices_data.sort(key=lambda d: d.violations_total, reverse=True)
+    return devices_data
+
+
 @router.post(
     "/analytics/export",
     status_code=status.HTTP_200_OK,
@@ -631,26 +635,26 @@ async def export_analytics(
     """Export analytics data.
 
     Generates a downloadable file in the requested format (CSV, XLSX, or PDF)
-    containing violations data matching the specified filters.
+    containing violations data matching the specified filters. The body is
+    streamed, so memory use does not depend on the number of rows.
 
     Args:
         db: Database session
         request: Export configuration
 
     Returns:
-        Binary file download with appropriate Content-Type and Content-Disposition
+        Streamed file download with appropriate Content-Type and Content-Disposition
     """
     from_time = request.time_range.from_
     to_time = request.time_range.to
 
     # Validate time range
-    max_range_days = 90
-    if (to_time - from_time).days > max_range_days:
+    if (to_time - from_time).days > MAX_EXPORT_RANGE_DAYS:
         logger.warning(
             "Export time range exceeds maximum",
             from_time=from_time.isoformat(),
             to_time=to_time.isoformat(),
-            max_days=max_range_days,
+            max_days=MAX_EXPORT_RANGE_DAYS,
         )
         return Response(
             content='{"error":"INVALID_EXPORT_CONFIG","error_description":"Time range exceeds maximum allowed (90 days)","status_code":400}',
@@ -667,42 +671,27 @@ async def export_analytics(
     )
 
     try:
-        # Initialize export service
-        export_service = ExportService(db)
-
-        # Prepare filters
-        camera_ids = None if request.scope.all else request.scope.camera_ids or None
-        violation_types = None if request.scope.all else request.scope.violation_types or None
-        statuses = None if request.scope.all else request.scope.statuses or None
-
         # Generate export
-        file_bytes, content_type, filename = await export_service.export_violations(
-            format=request.format,
-            from_time=from_time,
-            to_time=to_time,
-            camera_ids=camera_ids,
-            violation_types=violation_types,
-            statuses=statuses,
-            include_headers=request.options.include_headers,
-            include_timestamps=request.options.include_timestamps,
-            include_raw_confidence=request.options.include_raw_confidence,
-            include_evidence_urls=request.options.include_evidence_urls,
-            include_bounding_boxes=request.options.include_bounding_boxes,
-        )
-
-        logger.info(
-            "Export generated",
-            format=request.format,
-            filename=filename,
-            size_bytes=len(file_bytes),
-        )
-
-        # Return file as download
-        return Response(
-            content=file_bytes,
-            media_type=content_type,
+        export = await ExportService(db).export_request(request)
+
+        # Produce the first chunk here so a failing query still gets a 503;
+        # once streaming starts the status line has already been sent
+        first_chunk = await anext(export.chunks, b"")
+
+        async def body():
+            try:
+                yield first_chunk
+                async for chunk in export.chunks:
+                    yield chunk
+            finally:
+                await export.chunks.aclose()
+
+        # Stream file as download
+        return StreamingResponse(
+            body(),
+            media_type=export.content_type,
             headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Disposition": f'attachment; filename="{export.filename}"',
             },
         )
 
@@ -717,3 +706,140 @@ async def export_analytics(
             status_code=503,
             media_type="application/json",
         )
+
+
+def _export_jobs() -> ExportJobManager:
+    manager = get_export_job_manager()
+    if manager is None:
+        raise ServiceUnavailableAPIError("Export jobs are not available")
+    return manager
+
+
+def _export_job_response(job: ExportJob) -> ExportJobResponse:
+    return ExportJobResponse(
+        job_id=job.id,
+        status=job.state.value,
+        format=job.request.format,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        expires_at=job.expires_at,
+        filename=job.filename,
+        size_bytes=job.size_bytes,
+        error=job.error,
+        download_url=(
+            f"/api/v1/analytics/export/jobs/{job.id}/download"
+            if job.state == ExportJobState.COMPLETED
+            else None
+        ),
+    )
+
+
+@router.post(
+    "/analytics/export/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a background export",
+    description=(
+        "Queue an export and return immediately. Poll the job, then download "
+        "the result. Identical requests share one job while it is queued, "
+        "running or downloadable."
+    ),
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid export configuration"},
+        503: {"model": ErrorResponse, "description": "Export queue is full"},
+    },
+)
+async def submit_export_job(request: ExportRequest) -> ExportJobResponse:
+    """Submit an export job.
+
+    Args:
+        request: Export configuration (same body as POST /analytics/export)
+
+    Returns:
+        The queued job, or the existing job for an identical request
+    """
+    from_time = request.time_range.from_
+    to_time = request.time_range.to
+    if (to_time - from_time).days > MAX_EXPORT_RANGE_DAYS:
+        raise ValidationAPIError(
+            f"Time range exceeds maximum allowed ({MAX_EXPORT_RANGE_DAYS} days)",
+            details={"max_days": MAX_EXPORT_RANGE_DAYS},
+        )
+
+    job = _export_jobs().submit(request)
+    return _export_job_response(job)
+
+
+@router.get(
+    "/analytics/export/jobs/{job_id}",
+    response_model=ExportJobResponse,
+    summary="Get background export status",
+    responses={
+        404: {"model": ErrorResponse, "description": "Job not found or expired"},
+    },
+)
+async def get_export_job(job_id: str) -> ExportJobResponse:
+    """Get an export job's status.
+
+    Args:
+        job_id: Export job ID
+
+    Returns:
+        Current job status, with download_url once completed
+    """
+    return _export_job_response(_export_jobs().get(job_id))
+
+
+@router.get(
+    "/analytics/export/jobs/{job_id}/download",
+    summary="Download a background export",
+    description=(
+        "Serve a completed export. Honors single byte-range Range headers "
+        "(206 Partial Content) so interrupted downloads can be resumed."
+    ),
+    responses={
+        200: {"description": "Export file download"},
+        206: {"description": "Requested byte range of the export file"},
+        404: {"model": ErrorResponse, "description": "Job not found or expired"},
+        409: {"model": ErrorResponse, "description": "Job has not completed"},
+    },
+)
+async def download_export_job(
+    job_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+) -> StreamingResponse:
+    """Download an export job's result.
+
+    Args:
+        job_id: Export job ID
+        range_header: Optional ``bytes=start-end`` range
+
+    Returns:
+        Streamed file, whole (200) or the requested range (206)
+    """
+    job = _export_jobs().get_result(job_id)
+
+    total = job.size_bytes or 0
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{job.filename}"',
+    }
+    rng = parse_range(range_header, total)
+    if rng is None:
+        return StreamingResponse(
+            iter_file_range(job.path, 0, total - 1),
+            media_type=job.content_type,
+            headers={**headers, "Content-Length": str(total)},
+        )
+    start, end = rng
+    return StreamingResponse(
+        iter_file_range(job.path, start, end),
+        media_type=job.content_type,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        headers={
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{total}",
+            "Content-Length": str(end - start + 1),
+        },
+    )
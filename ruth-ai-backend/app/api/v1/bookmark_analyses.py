@@ -6,19 +6,20 @@ GET    /api/v1/bookmark-analyses/{id}                     get one
 GET    /api/v1/bookmarks/{vas_bookmark_id}/analyses       list for bookmark
 GET    /api/v1/bookmarks/{vas_bookmark_id}/preview-frame  thumbnail proxy
 
-Phase D.1 wires the submit/poll/list loop end-to-end with a
-placeholder worker. The worker runs via FastAPI BackgroundTasks —
-no external job queue.
+Submitted analyses are rows in bookmark_analyses, which doubles as a
+durable job queue drained by BookmarkAnalysisQueue workers — see
+app/services/bookmark_analysis_queue.py.
 """
 
 from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
 from fastapi.responses import Response
 
 from app.core.logging import get_logger
+from app.core.ranges import parse_range
 from app.deps import DBSession
 from app.deps.services import get_vas_client_optional
 from app.integrations.unified_runtime.client import UnifiedRuntimeError
@@ -30,10 +31,8 @@ from app.schemas.bookmark_analysis import (
     BookmarkAnalysisResponse,
     BookmarkAnalysisSubmitRequest,
 )
-from app.services.bookmark_analysis_service import (
-    BookmarkAnalysisService,
-    run_analysis,
-)
+from app.services.bookmark_analysis_queue import get_bookmark_analysis_queue
+from app.services.bookmark_analysis_service import BookmarkAnalysisService
 from app.services.model_availability import (
     ModelNotAvailableError,
     assert_model_available,
@@ -56,9 +55,14 @@ bookmark_subresource_router = APIRouter(prefix="/bookmarks", tags=["Bookmark Ana
         "Create a new async analysis job against a VAS bookmark. Returns the "
         "new record immediately in state=pending. The worker runs in the "
         "background; poll GET /api/v1/bookmark-analyses/{id} to observe state "
-        "transitions."
+        "transitions and progress. Submitting a request identical to one that "
+        "is still pending or running returns that analysis with status 200."
     ),
     responses={
+        200: {
+            "model": BookmarkAnalysisResponse,
+            "description": "Identical analysis already queued or running",
+        },
         400: {"model": ErrorResponse, "description": "Invalid request payload or unknown model"},
         503: {"model": ErrorResponse, "description": "AI runtime is unreachable; retry"},
     },
@@ -66,7 +70,7 @@ bookmark_subresource_router = APIRouter(prefix="/bookmarks", tags=["Bookmark Ana
 async def submit_analysis(
     request: BookmarkAnalysisSubmitRequest,
     db: DBSession,
-    background_tasks: BackgroundTasks,
+    response: Response,
 ) -> BookmarkAnalysisResponse:
     # Fail fast on unknown model_id before we persist anything. The
     # check is cached for ~30s so a burst of concurrent submits doesn't
@@ -95,11 +99,16 @@ async def submit_analysis(
         ) from e
 
     service = BookmarkAnalysisService(db=db)
-    analysis = await service.submit(request)
-    # Schedule the worker only after the row commits. BackgroundTasks
-    # fires after the response is sent, so the caller's poll for state
-    # always finds the row at minimum in PENDING.
-    background_tasks.add_task(run_analysis, analysis.id)
+    analysis, created = await service.submit(request)
+    if not created:
+        response.status_code = status.HTTP_200_OK
+        return BookmarkAnalysisResponse.model_validate(analysis)
+
+    # The row is committed, so a worker can claim it now; without a queue
+    # in this process it waits for the next poll of any worker.
+    queue = get_bookmark_analysis_queue()
+    if queue is not None:
+        queue.notify()
     return BookmarkAnalysisResponse.model_validate(analysis)
 
 
@@ -204,50 +213,6 @@ async def get_bookmark_preview_frame(vas_bookmark_id: str) -> Response:
     )
 
 
-def _parse_range(
-    range_header: str | None, total: int
-) -> tuple[int, int] | None:
-    """Parse a single ``bytes=start-end`` Range header.
-
-    Returns ``(start, end_inclusive)`` clamped to ``[0, total-1]``, or
-    ``None`` for malformed/unsupported requests (multipart, suffix
-    forms, non-byte units). Callers should fall back to a full 200.
-    """
-    if not range_header:
-        return None
-    if not range_header.startswith("bytes="):
-        return None
-    spec = range_header[len("bytes=") :]
-    # Multi-range (``a-b,c-d``) is allowed by RFC but rarely used by
-    # browsers for <video>. Fall back to a full response.
-    if "," in spec:
-        return None
-    if "-" not in spec:
-        return None
-    start_str, end_str = spec.split("-", 1)
-    try:
-        if start_str == "":
-            # Suffix form ``bytes=-N`` — last N bytes.
-            if end_str == "":
-                return None
-            length = int(end_str)
-            if length <= 0:
-                return None
-            start = max(0, total - length)
-            end = total - 1
-        else:
-            start = int(start_str)
-            end = int(end_str) if end_str else total - 1
-    except ValueError:
-        return None
-    if start < 0 or start >= total:
-        return None
-    end = min(end, total - 1)
-    if end < start:
-        return None
-    return start, end
-
-
 @bookmark_subresource_router.get(
     "/{vas_bookmark_id}/video",
     summary="Bookmark video (proxy with Range support)",
@@ -292,7 +257,7 @@ async def get_bookmark_video(
         ) from e
 
     total = len(video_bytes)
-    rng = _parse_range(range_header, total)
+    rng = parse_range(range_header, total)
     common_headers = {
         "Accept-Ranges": "bytes",
         # Bookmark videos are immutable per id — short browser cache is safe.
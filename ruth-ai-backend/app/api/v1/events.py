@@ -12,9 +12,10 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from app.core.logging import get_logger
+from app.core.pagination import cached_count, keyset_page, resolve_cursor, split_page
 from app.deps import DBSession, EventIngestionServiceDep
 from app.models import Event
 from app.schemas import (
@@ -43,23 +44,44 @@ async def list_events(
     event_type: str | None = Query(None, description="Filter by event type"),
     since: datetime | None = Query(None, description="Events after this timestamp"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page (keyset pagination)"
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Deprecated OFFSET pagination; slow on deep pages. Use cursor.",
+    ),
+    include_total: bool = Query(
+        True, description="Include the (cached, up to 30s stale) total count"
+    ),
 ) -> EventListResponse:
     """List events with optional filtering.
 
+    Pages are keyed on (timestamp, id); pass `next_cursor` back as
+    `cursor` for the next page.
+
     Args:
         db: Database session
         device_id: Filter by device UUID
         event_type: Filter by event type string
         since: Only events after this timestamp
         limit: Maximum results to return
-        offset: Pagination offset
+        cursor: Opaque cursor from the previous page's next_cursor
+        offset: Deprecated pagination offset
+        include_total: Whether to count matching events
 
     Returns:
-        List of events with total count
+        List of events with total count and next page cursor
+
+    Raises:
+        ValidationAPIError: 400 if the cursor is invalid or combined with offset
     """
+    page_cursor = resolve_cursor(cursor, offset)
+
     # Build query
-    stmt = select(Event).order_by(Event.timestamp.desc())
+    stmt = select(Event)
 
     # Apply filters
     if device_id is not None:
@@ -71,16 +93,21 @@ async def list_events(
     if since is not None:
         stmt = stmt.where(Event.timestamp >= since)
 
-    # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar() or 0
+    # Count total (cached per filter combination across pages)
+    total = None
+    if include_total:
+        total = await cached_count(
+            db,
+            stmt,
+            "events",
+            {"device_id": device_id, "event_type": event_type, "since": since},
+        )
 
     # Apply pagination
-    stmt = stmt.offset(offset).limit(limit)
+    stmt = keyset_page(stmt, Event.timestamp, Event.id, page_cursor, limit).offset(offset)
 
     result = await db.execute(stmt)
-    events = list(result.scalars().all())
+    events, next_cursor = split_page(result.scalars().all(), limit)
 
     logger.info(
         "Listing events",
@@ -109,6 +136,7 @@ async def list_events(
             for e in events
         ],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
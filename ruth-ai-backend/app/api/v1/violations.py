@@ -15,10 +15,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.core.logging import get_logger
+from app.core.pagination import cached_count, keyset_page, resolve_cursor, split_page
 from app.deps import DBSession, EvidenceServiceDep, VASClientDep, ViolationServiceDep
 from app.models import Evidence, EvidenceType, Violation
 from app.schemas import (
@@ -104,7 +105,18 @@ async def list_violations(
     since: datetime | None = Query(None, description="Violations after this timestamp"),
     until: datetime | None = Query(None, description="Violations before this timestamp"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page (keyset pagination)"
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Deprecated OFFSET pagination; slow on deep pages. Use cursor.",
+    ),
+    include_total: bool = Query(
+        True, description="Include the (cached, up to 30s stale) total count"
+    ),
 ) -> ViolationListResponse:
     """List all violations with optional filtering.
 
@@ -114,6 +126,10 @@ async def list_violations(
     back. `device_id` stays accepted as a deprecated alias so existing
     callers keep working; `camera_id` wins when both are supplied.
 
+    Pages are keyed on (timestamp, id): pass `next_cursor` back as
+    `cursor` to get the next page at constant cost. `offset` still works
+    for existing callers but cannot be combined with `cursor`.
+
     Args:
         db: Database session
         violation_status: Filter by status
@@ -122,18 +138,19 @@ async def list_violations(
         since: Only violations after this timestamp
         until: Only violations before this timestamp
         limit: Maximum results to return
-        offset: Pagination offset
+        cursor: Opaque cursor from the previous page's next_cursor
+        offset: Deprecated pagination offset
+        include_total: Whether to count matching violations
 
     Returns:
-        List of violations with total count
+        List of violations with total count and next page cursor
+
+    Raises:
+        ValidationAPIError: 400 if the cursor is invalid or combined with offset
     """
+    page_cursor = resolve_cursor(cursor, offset)
     camera_filter = camera_id if camera_id is not None else device_id
-    # Build query with eager loading of evidence
-    stmt = (
-        select(Violation)
-        .options(selectinload(Violation.evidence))
-        .order_by(Violation.timestamp.desc())
-    )
+    stmt = select(Violation)
 
     # Apply filters
     if violation_status is not None:
@@ -148,16 +165,27 @@ async def list_violations(
     if until is not None:
         stmt = stmt.where(Violation.timestamp <= until)
 
-    # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar() or 0
+    # Count total (cached per filter combination across pages)
+    total = None
+    if include_total:
+        total = await cached_count(
+            db,
+            stmt,
+            "violations",
+            {
+                "status": violation_status,
+                "camera_id": camera_filter,
+                "since": since,
+                "until": until,
+            },
+        )
 
-    # Apply pagination
-    stmt = stmt.offset(offset).limit(limit)
+    # Apply pagination, with eager loading of evidence for the page only
+    stmt = keyset_page(stmt, Violation.timestamp, Violation.id, page_cursor, limit)
+    stmt = stmt.options(selectinload(Violation.evidence)).offset(offset)
 
     result = await db.execute(stmt)
-    violations = list(result.scalars().all())
+    violations, next_cursor = split_page(result.scalars().all(), limit)
 
     logger.info(
         "Listing violations",
@@ -190,6 +218,7 @@ async def list_violations(
             for v in violations
         ],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -123,6 +123,125 @@ class Settings(BaseSettings):
         description="Access token expiry in minutes",
     )
 
+    # Internal API
+    internal_api_key: str | None = Field(
+        default=None,
+        description="Shared secret for /debug endpoints (disabled when unset)",
+    )
+
+    # Event Loop Monitoring
+    loop_monitor_enabled: bool = Field(
+        default=True,
+        description="Run the event loop lag heartbeat (event_loop_lag_seconds)",
+    )
+    loop_monitor_interval_seconds: float = Field(
+        default=0.5,
+        ge=0.05,
+        le=10.0,
+        description="Loop lag heartbeat period in seconds",
+    )
+    loop_lag_warn_ms: float = Field(
+        default=250.0,
+        ge=1.0,
+        description="Log a warning when one heartbeat wakes this late",
+    )
+    slow_callback_threshold_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "Log the coroutine and stack holding the loop when it stalls "
+            "longer than this. 0 disables the watchdog thread."
+        ),
+    )
+
+    # Event partitioning and retention
+    event_partition_months_ahead: int = Field(
+        default=3,
+        ge=1,
+        le=24,
+        description="Monthly events partitions to create ahead of the current month",
+    )
+    event_partition_maintenance_interval_seconds: float = Field(
+        default=3600.0,
+        ge=60.0,
+        description="How often to create upcoming and retire expired event partitions",
+    )
+    event_retention_months: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Complete months of events to keep before the current one. "
+            "0 keeps events indefinitely."
+        ),
+    )
+    event_retention_mode: Literal["detach", "drop"] = Field(
+        default="detach",
+        description=(
+            "What to do with expired event partitions: detach them into "
+            "standalone tables for archival, or drop them"
+        ),
+    )
+
+    # Background export jobs
+    export_job_workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Export jobs generated concurrently",
+    )
+    export_job_queue_size: int = Field(
+        default=50,
+        ge=1,
+        description="Export jobs that may wait for a worker before submit returns 503",
+    )
+    export_job_dir: str = Field(
+        default="/tmp/ruth-ai-exports",
+        description="Directory for export results (local or a mounted object store)",
+    )
+    export_job_ttl_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="How long a finished export stays downloadable before cleanup",
+    )
+
+    # Bookmark analyses
+    bookmark_inference_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description=(
+            "Most frames of one bookmark analysis in flight at the runtime; "
+            "the window shrinks below this while live inference is queueing"
+        ),
+    )
+    bookmark_analysis_workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=32,
+        description=(
+            "Analyses processed concurrently by this process; each decodes "
+            "video on its own thread. Defaults to half the CPU cores"
+        ),
+    )
+    bookmark_analysis_poll_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="How often idle workers look for analyses queued elsewhere",
+    )
+    bookmark_analysis_lease_seconds: int = Field(
+        default=60,
+        ge=10,
+        description=(
+            "Heartbeat timeout after which a running analysis is presumed "
+            "abandoned and claimed again"
+        ),
+    )
+    bookmark_analysis_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Claims after which an analysis that never finishes is failed",
+    )
+
     # Health Check Timeouts (in seconds)
     health_check_db_timeout: float = Field(
         default=5.0,
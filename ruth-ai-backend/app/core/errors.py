@@ -57,6 +57,10 @@ from app.services.exceptions import (
     EventError,
     EventIngestionError,
     EventSessionMissingError,
+    ExportError,
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+    ExportQueueFullError,
     InferenceFailedError,
     NoActiveStreamError,
     ServiceError,
@@ -370,6 +374,27 @@ def map_domain_exception(exc: ServiceError) -> RuthAPIError:
             details=exc.details,
         )
 
+    # -------------------------------------------------------------------------
+    # Export Exceptions
+    # -------------------------------------------------------------------------
+    if isinstance(exc, ExportJobNotFoundError):
+        return NotFoundAPIError(
+            message=exc.message,
+            details=exc.details,
+        )
+
+    if isinstance(exc, ExportJobNotReadyError):
+        return ConflictAPIError(
+            message=exc.message,
+            details=exc.details,
+        )
+
+    if isinstance(exc, ExportQueueFullError):
+        return ServiceUnavailableAPIError(
+            message=exc.message,
+            details=exc.details,
+        )
+
     # -------------------------------------------------------------------------
     # Generic Service Errors
     # -------------------------------------------------------------------------
@@ -403,6 +428,12 @@ def map_domain_exception(exc: ServiceError) -> RuthAPIError:
             details=exc.details,
         )
 
+    if isinstance(exc, ExportError):
+        return InternalServerAPIError(
+            message="Export operation failed",
+            details=exc.details,
+        )
+
     # Base ServiceError
     return InternalServerAPIError(
         message="Service error",
@@ -5,6 +5,7 @@ Provides:
 - Startup hooks (database init, Redis init, VAS client init, NLP Chat client init)
 - Shutdown hooks (cleanup for all clients)
 - Startup time tracking for uptime calculation
+- Event loop lag monitoring
 """
 
 import asyncio
@@ -15,8 +16,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.core.config import get_settings
-from app.core.database import close_database, init_database, get_db_session
+from app.core.database import close_database, get_db_session, get_engine, init_database
 from app.core.logging import configure_logging, get_logger
+from app.core.loop_monitor import LoopMonitor
 from app.core.redis import close_redis, init_redis
 from app.deps.services import set_nlp_chat_client, set_redis_client, set_vas_client
 from app.integrations.nlp_chat import NLPChatClient
@@ -28,6 +30,12 @@ from app.integrations.vas import (
 )
 from app.integrations.unified_runtime.router import RuntimeRouter
 from app.integrations.unified_runtime.client import UnifiedRuntimeClient
+from app.services.bookmark_analysis_queue import (
+    BookmarkAnalysisQueue,
+    set_bookmark_analysis_queue,
+)
+from app.services.event_partitions import EventPartitionMaintainer
+from app.services.export_jobs import ExportJobManager, set_export_job_manager
 from app.services.inference_loop import InferenceLoopService, set_inference_loop
 
 logger = get_logger(__name__)
@@ -36,6 +44,10 @@ logger = get_logger(__name__)
 _vas_client: VASClient | None = None
 _nlp_chat_client: NLPChatClient | None = None
 _inference_loop: InferenceLoopService | None = None
+_loop_monitor: LoopMonitor | None = None
+_partition_maintainer: EventPartitionMaintainer | None = None
+_export_jobs: ExportJobManager | None = None
+_bookmark_queue: BookmarkAnalysisQueue | None = None
 
 # Startup timestamp for uptime calculation
 _startup_time: float | None = None
@@ -69,8 +81,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Startup:
         1. Record startup time
-        2. Configure logging
-        3. Initialize database connection pool
+        2. Configure logging and start the event loop monitor
+        3. Initialize database connection pool, event partition maintenance,
+           background export workers and bookmark analysis queue workers
         4. Initialize Redis connection pool
         5. Initialize VAS client
         6. Initialize NLP Chat client (connects to separate microservice)
@@ -81,12 +94,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         2. Close NLP Chat client
         3. Close VAS client
         4. Close Redis connections
-        5. Close database connections
+        5. Stop bookmark analysis and export workers and event partition
+           maintenance, then close database connections
+        6. Stop the event loop monitor
 
     Args:
         app: FastAPI application instance
     """
-    global _vas_client, _nlp_chat_client, _inference_loop, _startup_time
+    global _vas_client, _nlp_chat_client, _inference_loop, _loop_monitor
+    global _partition_maintainer, _export_jobs, _bookmark_queue
+    global _startup_time
 
     # Record startup time
     _startup_time = time.time()
@@ -104,6 +121,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         port=settings.port,
     )
 
+    # Event loop lag heartbeat; the stall watchdog is opt-in
+    if settings.loop_monitor_enabled:
+        _loop_monitor = LoopMonitor(
+            interval=settings.loop_monitor_interval_seconds,
+            warn_threshold=settings.loop_lag_warn_ms / 1000,
+            stall_threshold=(
+                settings.slow_callback_threshold_ms / 1000
+                if settings.slow_callback_threshold_ms > 0
+                else None
+            ),
+        )
+        _loop_monitor.start()
+
     # Initialize database
     try:
         await init_database()
@@ -111,6 +141,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error("Failed to initialize database", error=str(e))
         raise
 
+    # Keep monthly events partitions created ahead and apply retention
+    _partition_maintainer = EventPartitionMaintainer(get_engine)
+    asyncio.create_task(
+        _partition_maintainer.start(), name="event-partition-maintainer"
+    )
+
+    # Background export jobs (queue, workers and result cleanup)
+    _export_jobs = ExportJobManager()
+    try:
+        await _export_jobs.start()
+        set_export_job_manager(_export_jobs)
+    except Exception as e:
+        logger.error("Failed to start export job manager", error=str(e))
+        _export_jobs = None
+
+    # Bookmark analysis workers; analyses queued or interrupted before a
+    # restart are picked up from the table
+    _bookmark_queue = BookmarkAnalysisQueue()
+    try:
+        await _bookmark_queue.start()
+        set_bookmark_analysis_queue(_bookmark_queue)
+    except Exception as e:
+        logger.error("Failed to start bookmark analysis queue", error=str(e))
+        _bookmark_queue = None
+
     # Initialize Redis
     try:
         redis_client = await init_redis()
@@ -346,10 +401,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("Error during Redis shutdown", error=str(e))
 
+    # Release running analyses (checkpointed for resume) while the
+    # database is still up
+    if _bookmark_queue:
+        set_bookmark_analysis_queue(None)
+        await _bookmark_queue.stop()
+        _bookmark_queue = None
+
+    # Stop export workers before their sessions' engine goes away
+    if _export_jobs:
+        set_export_job_manager(None)
+        await _export_jobs.stop()
+        _export_jobs = None
+
+    # Stop partition maintenance before its engine goes away
+    if _partition_maintainer:
+        await _partition_maintainer.stop()
+        _partition_maintainer = None
+
     # Close database connections
     try:
         await close_database()
     except Exception as e:
         logger.error("Error during database shutdown", error=str(e))
 
+    # Stop event loop monitor
+    if _loop_monitor:
+        await _loop_monitor.stop()
+        _loop_monitor = None
+
     logger.info("Ruth AI Backend shutdown complete")
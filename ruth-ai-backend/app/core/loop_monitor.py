@@ -0,0 +1,155 @@
+"""Event loop lag monitor and stall detector.
+
+Provides:
+- Heartbeat task measuring how late the loop wakes it (event_loop_lag_seconds)
+- Optional watchdog thread that, when the loop stops ticking for longer
+  than a threshold, logs the coroutine and stack responsible
+
+Design Principles:
+- A heartbeat sleep that wakes late means something ran synchronously on
+  the loop thread (PIL decode, XLSX generation, blocking psutil calls)
+- The watchdog reads the loop thread's frames from outside, so it names
+  the culprit while it is still running and works with uvloop, where
+  asyncio's own slow_callback_duration hook does not exist
+- Failures here NEVER affect the application
+
+Usage:
+    monitor = LoopMonitor(interval=0.5, warn_threshold=0.25, stall_threshold=0.2)
+    monitor.start()
+    ...
+    await monitor.stop()
+"""
+
+import asyncio
+import contextlib
+import sys
+import threading
+import time
+
+from app.core.logging import get_logger
+from app.core.metrics import record_loop_lag, record_loop_stall
+
+logger = get_logger(__name__)
+
+# Frames of the stalled stack included in the warning (innermost last)
+STALL_STACK_DEPTH = 12
+
+
+class LoopMonitor:
+    """Heartbeat-based loop lag monitor with an optional stall watchdog."""
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        warn_threshold: float = 0.25,
+        stall_threshold: float | None = None,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval: Heartbeat period in seconds
+            warn_threshold: Log a warning when one heartbeat is this late
+            stall_threshold: Start the watchdog; report the running coroutine
+                when the loop has not ticked for interval + this many seconds.
+                None disables the watchdog.
+        """
+        self._interval = interval
+        self._warn_threshold = warn_threshold
+        self._stall_threshold = stall_threshold
+
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_tick = time.monotonic()
+        self._watchdog: threading.Thread | None = None
+        self._stop_watchdog = threading.Event()
+
+    def start(self) -> None:
+        """Start the heartbeat (and watchdog) on the running loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-monitor")
+
+        if self._stall_threshold is not None:
+            self._stop_watchdog.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+        logger.info(
+            "Loop monitor started",
+            interval_sec=self._interval,
+            stall_threshold_sec=self._stall_threshold,
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and watchdog."""
+        self._stop_watchdog.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - scheduled)
+            self._last_tick = time.monotonic()
+
+            record_loop_lag(lag)
+            if lag >= self._warn_threshold:
+                logger.warning("Event loop lag", lag_ms=round(lag * 1000, 1))
+
+    # -------------------------------------------------------------------------
+    # Watchdog (runs on its own thread)
+    # -------------------------------------------------------------------------
+
+    def _watch(self) -> None:
+        limit = self._interval + self._stall_threshold
+        poll = max(0.01, self._stall_threshold / 2)
+        reported_tick = None
+
+        while not self._stop_watchdog.wait(poll):
+            tick = self._last_tick
+            if tick == reported_tick or time.monotonic() - tick < limit:
+                continue
+            reported_tick = tick
+            try:
+                self._report_stall(time.monotonic() - tick - self._interval)
+            except Exception as e:
+                logger.warning("Loop stall report failed", error=str(e))
+
+    def _report_stall(self, stalled: float) -> None:
+        coro = "unknown"
+        task_name = None
+        task = asyncio.current_task(self._loop)
+        if task is not None:
+            task_name = task.get_name()
+            coro = getattr(task.get_coro(), "__qualname__", coro)
+
+        stack = []
+        frame = sys._current_frames().get(self._loop_thread_id)
+        while frame is not None and len(stack) < STALL_STACK_DEPTH:
+            code = frame.f_code
+            stack.append(f"{code.co_filename}:{frame.f_lineno} {code.co_name}")
+            frame = frame.f_back
+
+        record_loop_stall(coro)
+        logger.warning(
+            "Event loop stalled",
+            stalled_ms=round(stalled * 1000, 1),
+            coro=coro,
+            task=task_name,
+            stack=list(reversed(stack)),
+        )
@@ -12,6 +12,7 @@ Design Principles:
 - Instrumentation is optional, never mandatory
 - Failures in metrics NEVER affect core behavior
 - Prefer explicit instrumentation over magic decorators
+- Updates touch one series under its own lock; text is built at scrape time
 
 Usage:
     from app.core.metrics import (
@@ -31,11 +32,13 @@ Usage:
     text = get_metrics_text()
 """
 
+import re
 import threading
 import time
 import uuid
-from collections import defaultdict
+from bisect import bisect_left
 from contextlib import contextmanager
+from itertools import accumulate
 from typing import Any, Generator
 
 from app.core.logging import get_logger, get_request_id, set_request_id
@@ -52,7 +55,8 @@ class MetricsRegistry:
     """Thread-safe registry for Prometheus-style metrics.
 
     Manages counters, gauges, and histograms with label support.
-    All operations are thread-safe via internal locking.
+    The registry lock guards registration and scrape only; metric
+    updates lock the individual series they touch.
     """
 
     def __init__(self) -> None:
@@ -124,11 +128,19 @@ metrics_registry = MetricsRegistry()
 # =============================================================================
 # Metric Types
 # =============================================================================
+#
+# Each metric keeps one child per label combination. The child owns the
+# series state and a lock of its own, so an update costs a dict lookup (for
+# .labels()) plus an uncontended lock - no registry-wide lock, no label
+# sorting, no string formatting. Hot paths can bind a child once and call
+# it directly. Text exposition happens only in to_prometheus() at scrape.
 
 
 class LabeledMetric:
     """Base class for labeled metrics."""
 
+    child_class: type = object
+
     def __init__(
         self,
         name: str,
@@ -137,8 +149,10 @@ class LabeledMetric:
     ) -> None:
         self.name = name
         self.description = description
-        self.label_names = label_names
-        self._lock = threading.RLock()
+        self.label_names = tuple(label_names)
+        # Guards child creation only; updates lock the child
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], Any] = {}
 
     def _validate_labels(self, labels: dict[str, str]) -> None:
         """Validate that provided labels match expected label names."""
@@ -147,9 +161,34 @@ class LabeledMetric:
                 f"Labels {set(labels.keys())} do not match expected {set(self.label_names)}"
             )
 
-    def _labels_key(self, labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
-        """Create a hashable key from labels."""
-        return tuple(sorted(labels.items()))
+    def labels(self, **kwargs: str) -> Any:
+        """Get the child for a label combination, creating it on first use."""
+        try:
+            key = tuple([kwargs[n] for n in self.label_names])
+        except KeyError:
+            key = ()
+        if len(kwargs) != len(key) or len(key) != len(self.label_names):
+            self._validate_labels(kwargs)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(key)
+                    self._children[key] = child
+        return child
+
+    def _new_child(self, key: tuple[str, ...]) -> Any:
+        labels = dict(zip(self.label_names, key, strict=True))
+        return self.child_class(self._format_labels(labels))
+
+    def _child_for(self, labels: dict[str, str] | None) -> Any:
+        """Child for the legacy labels= argument; None if labels are missing."""
+        if not labels:
+            if self.label_names:
+                return None  # Silently ignore if labels required but not provided
+            labels = {}
+        return self.labels(**labels)
 
     def _format_labels(self, labels: dict[str, str]) -> str:
         """Format labels for Prometheus output."""
@@ -158,146 +197,163 @@ class LabeledMetric:
         parts = [f'{k}="{v}"' for k, v in sorted(labels.items())]
         return "{" + ",".join(parts) + "}"
 
+    def _header(self, kind: str) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {kind}",
+        ]
+
+
+class CounterChild:
+    """A counter series with pre-bound labels."""
+
+    __slots__ = ("label_str", "_value", "_lock")
+
+    def __init__(self, label_str: str) -> None:
+        self.label_str = label_str
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1.0) -> None:
+        """Increment counter value."""
+        with self._lock:
+            self._value += value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
 
 class Counter(LabeledMetric):
     """Prometheus-style counter (monotonically increasing)."""
 
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        label_names: list[str],
-    ) -> None:
-        super().__init__(name, description, label_names)
-        self._values: dict[tuple[tuple[str, str], ...], float] = defaultdict(float)
-
-    def labels(self, **kwargs: str) -> "CounterChild":
-        """Get a counter child with specific label values."""
-        return CounterChild(self, kwargs)
+    child_class = CounterChild
 
     def inc(self, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
         """Increment counter value."""
-        labels = labels or {}
-        if self.label_names and not labels:
-            return  # Silently ignore if labels required but not provided
-        if labels:
-            self._validate_labels(labels)
-        with self._lock:
-            self._values[self._labels_key(labels)] += value
+        child = self._child_for(labels)
+        if child is not None:
+            child.inc(value)
 
     def to_prometheus(self) -> list[str]:
         """Convert to Prometheus text format."""
-        lines = [
-            f"# HELP {self.name} {self.description}",
-            f"# TYPE {self.name} counter",
-        ]
-        with self._lock:
-            for labels_key, value in self._values.items():
-                labels_dict = dict(labels_key)
-                labels_str = self._format_labels(labels_dict)
-                lines.append(f"{self.name}{labels_str} {value}")
+        lines = self._header("counter")
+        for child in list(self._children.values()):
+            lines.append(f"{self.name}{child.label_str} {child.value}")
         return lines
 
 
-class CounterChild:
-    """A counter instance with pre-bound labels."""
+class GaugeChild:
+    """A gauge series with pre-bound labels."""
+
+    __slots__ = ("label_str", "_value", "_lock")
 
-    def __init__(self, parent: Counter, labels: dict[str, str]) -> None:
-        self._parent = parent
-        self._labels = labels
+    def __init__(self, label_str: str) -> None:
+        self.label_str = label_str
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set gauge value."""
+        self._value = value
 
     def inc(self, value: float = 1.0) -> None:
-        """Increment counter value."""
-        self._parent.inc(value, self._labels)
+        """Increment gauge value."""
+        with self._lock:
+            self._value += value
+
+    def dec(self, value: float = 1.0) -> None:
+        """Decrement gauge value."""
+        with self._lock:
+            self._value -= value
+
+    @property
+    def value(self) -> float:
+        return self._value
 
 
 class Gauge(LabeledMetric):
     """Prometheus-style gauge (can go up and down)."""
 
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        label_names: list[str],
-    ) -> None:
-        super().__init__(name, description, label_names)
-        self._values: dict[tuple[tuple[str, str], ...], float] = defaultdict(float)
-
-    def labels(self, **kwargs: str) -> "GaugeChild":
-        """Get a gauge child with specific label values."""
-        return GaugeChild(self, kwargs)
+    child_class = GaugeChild
 
     def set(self, value: float, labels: dict[str, str] | None = None) -> None:
         """Set gauge value."""
-        labels = labels or {}
-        if self.label_names and not labels:
-            return
-        if labels:
-            self._validate_labels(labels)
-        with self._lock:
-            self._values[self._labels_key(labels)] = value
+        child = self._child_for(labels)
+        if child is not None:
+            child.set(value)
 
     def inc(self, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
         """Increment gauge value."""
-        labels = labels or {}
-        if self.label_names and not labels:
-            return
-        if labels:
-            self._validate_labels(labels)
-        with self._lock:
-            self._values[self._labels_key(labels)] += value
+        child = self._child_for(labels)
+        if child is not None:
+            child.inc(value)
 
     def dec(self, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
         """Decrement gauge value."""
-        labels = labels or {}
-        if self.label_names and not labels:
-            return
-        if labels:
-            self._validate_labels(labels)
-        with self._lock:
-            self._values[self._labels_key(labels)] -= value
+        child = self._child_for(labels)
+        if child is not None:
+            child.dec(value)
 
     def to_prometheus(self) -> list[str]:
         """Convert to Prometheus text format."""
-        lines = [
-            f"# HELP {self.name} {self.description}",
-            f"# TYPE {self.name} gauge",
-        ]
-        with self._lock:
-            for labels_key, value in self._values.items():
-                labels_dict = dict(labels_key)
-                labels_str = self._format_labels(labels_dict)
-                lines.append(f"{self.name}{labels_str} {value}")
+        lines = self._header("gauge")
+        for child in list(self._children.values()):
+            lines.append(f"{self.name}{child.label_str} {child.value}")
         return lines
 
 
-class GaugeChild:
-    """A gauge instance with pre-bound labels."""
+# Default histogram buckets (in seconds)
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
 
-    def __init__(self, parent: Gauge, labels: dict[str, str]) -> None:
-        self._parent = parent
-        self._labels = labels
 
-    def set(self, value: float) -> None:
-        """Set gauge value."""
-        self._parent.set(value, self._labels)
+class HistogramChild:
+    """A histogram series with pre-bound labels.
 
-    def inc(self, value: float = 1.0) -> None:
-        """Increment gauge value."""
-        self._parent.inc(value, self._labels)
+    Bucket counts are stored per bucket (not cumulative) in a flat list
+    with a trailing +Inf slot; observe() bisects once and bumps one slot.
+    """
 
-    def dec(self, value: float = 1.0) -> None:
-        """Decrement gauge value."""
-        self._parent.dec(value, self._labels)
+    __slots__ = ("label_str", "_upper", "_counts", "_sum", "_lock")
 
+    def __init__(self, label_str: str, upper: list[float]) -> None:
+        self.label_str = label_str
+        self._upper = upper
+        self._counts = [0] * (len(upper) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
 
-# Default histogram buckets (in seconds)
-DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+    def observe(self, value: float) -> None:
+        """Observe a value."""
+        index = bisect_left(self._upper, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Generator[None, None, None]:
+        """Context manager to measure and observe duration."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.observe(duration)
+
+    def snapshot(self) -> tuple[list[int], float, int]:
+        """Cumulative bucket counts (last is +Inf), sum, and count."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = list(accumulate(counts))
+        return cumulative, total, cumulative[-1]
 
 
 class Histogram(LabeledMetric):
     """Prometheus-style histogram with configurable buckets."""
 
+    child_class = HistogramChild
+
     def __init__(
         self,
         name: str,
@@ -307,99 +363,32 @@ class Histogram(LabeledMetric):
     ) -> None:
         super().__init__(name, description, label_names)
         self.buckets = sorted(buckets or DEFAULT_BUCKETS)
-        # Per-label data: {labels_key: {"buckets": {...}, "sum": float, "count": int}}
-        self._data: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
-
-    def _get_data(
-        self, labels_key: tuple[tuple[str, str], ...]
-    ) -> dict[str, Any]:
-        """Get or create data for a label combination."""
-        if labels_key not in self._data:
-            self._data[labels_key] = {
-                "buckets": {b: 0 for b in self.buckets},
-                "sum": 0.0,
-                "count": 0,
-            }
-        return self._data[labels_key]
-
-    def labels(self, **kwargs: str) -> "HistogramChild":
-        """Get a histogram child with specific label values."""
-        return HistogramChild(self, kwargs)
+
+    def _new_child(self, key: tuple[str, ...]) -> HistogramChild:
+        label_str = self._format_labels(dict(zip(self.label_names, key, strict=True)))
+        return HistogramChild(label_str, self.buckets)
 
     def observe(self, value: float, labels: dict[str, str] | None = None) -> None:
         """Observe a value."""
-        labels = labels or {}
-        if self.label_names and not labels:
-            return
-        if labels:
-            self._validate_labels(labels)
-        labels_key = self._labels_key(labels)
-        with self._lock:
-            data = self._get_data(labels_key)
-            data["sum"] += value
-            data["count"] += 1
-            for bucket in self.buckets:
-                if value <= bucket:
-                    data["buckets"][bucket] += 1
+        child = self._child_for(labels)
+        if child is not None:
+            child.observe(value)
 
     def to_prometheus(self) -> list[str]:
         """Convert to Prometheus text format."""
-        lines = [
-            f"# HELP {self.name} {self.description}",
-            f"# TYPE {self.name} histogram",
-        ]
-        with self._lock:
-            for labels_key, data in self._data.items():
-                labels_dict = dict(labels_key)
-                base_labels = self._format_labels(labels_dict)
-
-                # Cumulative bucket counts
-                cumulative = 0
-                for bucket in self.buckets:
-                    cumulative += data["buckets"][bucket]
-                    if labels_dict:
-                        bucket_labels = {**labels_dict, "le": str(bucket)}
-                    else:
-                        bucket_labels = {"le": str(bucket)}
-                    labels_str = self._format_labels(bucket_labels)
-                    lines.append(f"{self.name}_bucket{labels_str} {cumulative}")
-
-                # +Inf bucket
-                if labels_dict:
-                    inf_labels = {**labels_dict, "le": "+Inf"}
-                else:
-                    inf_labels = {"le": "+Inf"}
-                labels_str = self._format_labels(inf_labels)
-                lines.append(f"{self.name}_bucket{labels_str} {data['count']}")
-
-                # Sum and count
-                lines.append(f"{self.name}_sum{base_labels} {data['sum']}")
-                lines.append(f"{self.name}_count{base_labels} {data['count']}")
+        lines = self._header("histogram")
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        for child in list(self._children.values()):
+            cumulative, total, count = child.snapshot()
+            # label_str is "{a=\"x\"}" or ""; splice le into it
+            prefix = child.label_str[:-1] + "," if child.label_str else "{"
+            for bound, value in zip(bounds, cumulative, strict=True):
+                lines.append(f'{self.name}_bucket{prefix}le="{bound}"}} {value}')
+            lines.append(f"{self.name}_sum{child.label_str} {total}")
+            lines.append(f"{self.name}_count{child.label_str} {count}")
         return lines
 
 
-class HistogramChild:
-    """A histogram instance with pre-bound labels."""
-
-    def __init__(self, parent: Histogram, labels: dict[str, str]) -> None:
-        self._parent = parent
-        self._labels = labels
-
-    def observe(self, value: float) -> None:
-        """Observe a value."""
-        self._parent.observe(value, self._labels)
-
-    @contextmanager
-    def time(self) -> Generator[None, None, None]:
-        """Context manager to measure and observe duration."""
-        start = time.perf_counter()
-        try:
-            yield
-        finally:
-            duration = time.perf_counter() - start
-            self.observe(duration)
-
-
 # =============================================================================
 # Pre-registered Metrics
 # =============================================================================
@@ -462,6 +451,30 @@ ai_runtime_latency_seconds = metrics_registry.register_histogram(
     ["operation"],
 )
 
+# Per-stage breakdown of one inference, backend and runtime stages together
+# (fetch, encode, transport, decode, preprocess, inference, postprocess, persist)
+inference_stage_latency_seconds = metrics_registry.register_histogram(
+    "inference_stage_latency_seconds",
+    "Inference pipeline stage latency in seconds",
+    ["model_id", "stage"],
+)
+
+# --- Event loop health ---
+# How late the loop wakes a heartbeat sleep: time spent unable to schedule
+# anything because something ran synchronously on the loop thread
+event_loop_lag_seconds = metrics_registry.register_histogram(
+    "event_loop_lag_seconds",
+    "Event loop scheduling delay in seconds",
+    [],
+    [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+event_loop_stalls_total = metrics_registry.register_counter(
+    "event_loop_stalls_total",
+    "Event loop stalls over the slow-callback threshold",
+    ["coro"],
+)
+
 # --- Active connections/sessions ---
 active_stream_sessions = metrics_registry.register_gauge(
     "active_stream_sessions",
@@ -548,6 +561,52 @@ def record_ai_runtime_request(
         logger.warning("Failed to record AI Runtime metrics", error=str(e))
 
 
+def record_inference_stages(model_id: str, timing_ms: dict[str, float]) -> None:
+    """Record per-stage inference latencies.
+
+    Args:
+        model_id: Model identifier
+        timing_ms: Stage durations in milliseconds keyed "<stage>_ms"
+            (e.g. {"fetch_ms": 12.0, "inference_ms": 83.0}). "total_ms" and
+            "round_trip_ms" are skipped; the round trip is recorded by
+            record_ai_runtime_request.
+    """
+    try:
+        for key, value in timing_ms.items():
+            if key in ("total_ms", "round_trip_ms") or value is None:
+                continue
+            stage = key.removesuffix("_ms")
+            inference_stage_latency_seconds.labels(
+                model_id=model_id, stage=stage
+            ).observe(value / 1000)
+    except Exception as e:
+        logger.warning("Failed to record inference stage metrics", error=str(e))
+
+
+def record_loop_lag(lag_seconds: float) -> None:
+    """Record one event loop lag sample.
+
+    Args:
+        lag_seconds: How much later than scheduled the heartbeat woke
+    """
+    try:
+        event_loop_lag_seconds.observe(lag_seconds)
+    except Exception as e:
+        logger.warning("Failed to record loop lag metric", error=str(e))
+
+
+def record_loop_stall(coro: str) -> None:
+    """Record an event loop stall.
+
+    Args:
+        coro: Qualified name of the coroutine running when the loop stalled
+    """
+    try:
+        event_loop_stalls_total.labels(coro=coro).inc()
+    except Exception as e:
+        logger.warning("Failed to record loop stall metric", error=str(e))
+
+
 def record_event_ingested(event_type: str) -> None:
     """Record an event ingestion.
 
@@ -596,20 +655,21 @@ def _normalize_path(path: str) -> str:
     Returns:
         Normalized path
     """
-    import re
-
     # Replace UUIDs
-    path = re.sub(
-        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-        "{id}",
-        path,
-        flags=re.IGNORECASE,
-    )
+    path = _UUID_PATTERN.sub("{id}", path)
     # Replace numeric IDs
-    path = re.sub(r"/\d+(/|$)", "/{id}\\1", path)
+    path = _NUMERIC_ID_PATTERN.sub("/{id}\\1", path)
     return path
 
 
+# Compiled once; _normalize_path runs on every HTTP request
+_UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+_NUMERIC_ID_PATTERN = re.compile(r"/\d+(/|$)")
+
+
 def get_metrics_text() -> str:
     """Get all metrics in Prometheus text exposition format.
 
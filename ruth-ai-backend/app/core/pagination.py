@@ -0,0 +1,160 @@
+"""Keyset (cursor) pagination for time-ordered listings.
+
+OFFSET pagination makes Postgres walk and discard every row before the
+page, so page N costs O(N * limit) and deep pages of a multi-million-row
+table take seconds. Keyset pagination instead remembers the sort key of
+the last row returned and asks for rows strictly after it:
+
+    WHERE (timestamp, id) < (:last_timestamp, :last_id)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit + 1
+
+which an index ending in (timestamp, id) answers by seeking straight to
+the cursor — every page costs the same however deep it is. `id` breaks
+ties between rows sharing a timestamp so no row is skipped or repeated.
+
+The cursor is opaque to clients (URL-safe base64 of the sort key); they
+pass `next_cursor` from one response as `cursor` on the next request.
+
+Totals are the other linear cost: a filtered COUNT(*) scans every
+matching row. `cached_count` keeps the count per filter combination in
+the Redis TTL cache, so paging through a result set counts it once.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from datetime import datetime
+from typing import Any, NamedTuple, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.cache import cache_get_json, cache_set_json
+from app.core.errors import ValidationAPIError
+
+#: How long a listing's total is reused across pages.
+LIST_COUNT_CACHE_TTL_SECONDS = 30
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Cursor(NamedTuple):
+    """Sort key of the last row on a page."""
+
+    timestamp: datetime
+    id: UUID
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Encode a row's sort key as an opaque cursor token."""
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a cursor token produced by encode_cursor.
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        timestamp, row_id = raw.split("|")
+        return Cursor(datetime.fromisoformat(timestamp), UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {token!r}") from e
+
+
+def resolve_cursor(cursor: str | None, offset: int = 0) -> Cursor | None:
+    """Decode a listing's `cursor` query parameter.
+
+    Raises:
+        ValidationAPIError: If the cursor is malformed or combined with offset
+    """
+    if cursor is None:
+        return None
+    if offset:
+        raise ValidationAPIError(
+            "cursor and offset cannot be combined",
+            details={"offset": offset},
+        )
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorError as e:
+        raise ValidationAPIError(str(e), details={"cursor": cursor}) from e
+
+
+def keyset_page(
+    stmt: Select,
+    timestamp_col: InstrumentedAttribute,
+    id_col: InstrumentedAttribute,
+    cursor: Cursor | None,
+    limit: int,
+) -> Select:
+    """Order a statement newest-first and restrict it to the page after cursor.
+
+    Selects limit + 1 rows; pass the result to `split_page` to learn
+    whether another page follows.
+    """
+    if cursor is not None:
+        # The plain bound is implied by the row comparison, but only it lets
+        # Postgres prune partitions newer than the cursor
+        stmt = stmt.where(
+            timestamp_col <= cursor.timestamp,
+            tuple_(timestamp_col, id_col) < (cursor.timestamp, cursor.id),
+        )
+    return stmt.order_by(timestamp_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int) -> tuple[list[Any], str | None]:
+    """Trim the look-ahead row and build the cursor for the next page.
+
+    Rows must expose `timestamp` and `id`.
+
+    Returns:
+        Tuple of (page rows, next cursor or None on the last page)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.timestamp, last.id)
+
+
+async def cached_count(
+    db: AsyncSession,
+    stmt: Select,
+    namespace: str,
+    filters: dict[str, Any],
+) -> int:
+    """COUNT(*) of a filtered statement, cached per filter combination.
+
+    Args:
+        db: Database session
+        stmt: Filtered statement, without ordering or pagination
+        namespace: Listing name, part of the cache key
+        filters: The values the statement was filtered by
+
+    Returns:
+        Row count, at most LIST_COUNT_CACHE_TTL_SECONDS stale
+    """
+    digest = hashlib.sha1(
+        repr(sorted((k, str(v)) for k, v in filters.items())).encode()
+    ).hexdigest()
+    key = f"ruth:{namespace}:count:{digest}"
+
+    cached = await cache_get_json(key)
+    if isinstance(cached, int):
+        return cached
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    total = result.scalar() or 0
+    await cache_set_json(key, total, LIST_COUNT_CACHE_TTL_SECONDS)
+    return total
@@ -0,0 +1,71 @@
+"""HTTP byte-range helpers.
+
+Shared by endpoints that serve files which clients fetch with Range
+requests: browser <video> seeking and resumed downloads.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+# Read size when streaming a file range
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def parse_range(
+    range_header: str | None, total: int
+) -> tuple[int, int] | None:
+    """Parse a single ``bytes=start-end`` Range header.
+
+    Returns ``(start, end_inclusive)`` clamped to ``[0, total-1]``, or
+    ``None`` for malformed/unsupported requests (multipart, suffix
+    forms, non-byte units). Callers should fall back to a full 200.
+    """
+    if not range_header:
+        return None
+    if not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes=") :]
+    # Multi-range (``a-b,c-d``) is allowed by RFC but rarely used by
+    # browsers for <video>. Fall back to a full response.
+    if "," in spec:
+        return None
+    if "-" not in spec:
+        return None
+    start_str, end_str = spec.split("-", 1)
+    try:
+        if start_str == "":
+            # Suffix form ``bytes=-N`` — last N bytes.
+            if end_str == "":
+                return None
+            length = int(end_str)
+            if length <= 0:
+                return None
+            start = max(0, total - length)
+            end = total - 1
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str else total - 1
+    except ValueError:
+        return None
+    if start < 0 or start >= total:
+        return None
+    end = min(end, total - 1)
+    if end < start:
+        return None
+    return start, end
+
+
+async def iter_file_range(
+    path: Path, start: int, end: int, chunk_size: int = FILE_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield bytes ``start..end`` (inclusive) of a file, reading off the loop."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(f.read, min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
@@ -1,6 +1,7 @@
 """Dependency injection modules for Ruth AI Backend."""
 
 from app.deps.db import DBSession, get_db
+from app.deps.internal import require_internal_api_key
 from app.deps.services import (
     DeviceServiceDep,
     EvidenceServiceDep,
@@ -25,6 +26,8 @@ __all__ = [
     # Database
     "DBSession",
     "get_db",
+    # Internal API key
+    "require_internal_api_key",
     # VAS Client
     "get_vas_client",
     "set_vas_client",
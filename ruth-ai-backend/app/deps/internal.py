@@ -0,0 +1,31 @@
+"""Internal API key guard for operator-only routes.
+
+Provides:
+- Dependency that hides a route unless INTERNAL_API_KEY is configured
+- Constant-time comparison against the X-Internal-API-Key header
+"""
+
+import hmac
+
+from fastapi import Header, HTTPException, status
+
+from app.core.config import get_settings
+
+
+def require_internal_api_key(
+    x_internal_api_key: str | None = Header(default=None),
+) -> None:
+    """FastAPI dependency guarding internal/operator endpoints.
+
+    Routes are disabled (404) unless INTERNAL_API_KEY is configured, and
+    require a matching X-Internal-API-Key header (403 otherwise).
+    """
+    expected = get_settings().internal_api_key
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if not x_internal_api_key or not hmac.compare_digest(
+        x_internal_api_key, expected
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal API key"
+        )
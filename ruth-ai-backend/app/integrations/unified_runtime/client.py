@@ -4,6 +4,8 @@ Unified Runtime HTTP Client
 Async client for communicating with the Unified AI Runtime.
 """
 
+import time
+import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
@@ -11,12 +13,19 @@ from uuid import UUID
 import httpx
 from pydantic import ValidationError
 
-from app.core.logging import get_logger
-from .schemas import UnifiedInferenceRequest, UnifiedInferenceResponse
+from app.core.logging import get_logger, get_request_id
+from app.core.metrics import record_ai_runtime_request
+from .schemas import RuntimeCapacity, UnifiedInferenceRequest, UnifiedInferenceResponse
 from .config import get_unified_runtime_config
 
 logger = get_logger(__name__)
 
+# Header the runtime reads its request ID from and echoes back as trace_id
+TRACE_HEADER = "X-Request-ID"
+
+# Header carrying the runtime's capacity signal (free slots, queue, utilization)
+CAPACITY_HEADER = "X-Runtime-Capacity"
+
 
 class UnifiedRuntimeError(Exception):
     """Base exception for unified runtime errors."""
@@ -162,6 +171,7 @@ class UnifiedRuntimeClient:
         priority: int = 0,
         metadata: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
+        trace_id: Optional[str] = None,
     ) -> UnifiedInferenceResponse:
         """
         Submit inference request to unified runtime.
@@ -179,6 +189,8 @@ class UnifiedRuntimeClient:
             priority: Request priority (0-10)
             metadata: Additional metadata
             config: Model-specific configuration (e.g., tank corners, ROI)
+            trace_id: Trace ID sent as X-Request-ID (defaults to the current
+                request ID, or a new UUID)
 
         Returns:
             Inference response
@@ -206,17 +218,23 @@ class UnifiedRuntimeClient:
             config=config,
         )
 
+        trace_id = trace_id or get_request_id() or str(uuid.uuid4())
+
         logger.debug(
             "Submitting inference request",
             model_id=model_id,
             stream_id=str(stream_id),
             frame_size_kb=len(frame_base64) / 1024,
+            trace_id=trace_id,
         )
 
+        started = time.perf_counter()
+        status = "error"
         try:
             response = await self._client.post(
                 "/inference",
                 json=request.model_dump(mode="json"),
+                headers={TRACE_HEADER: trace_id},
             )
 
             if response.status_code == 404:
@@ -231,6 +249,9 @@ class UnifiedRuntimeClient:
 
             # Parse response
             result = UnifiedInferenceResponse.model_validate(response.json())
+            result.capacity = RuntimeCapacity.from_header(
+                response.headers.get(CAPACITY_HEADER)
+            )
 
             logger.info(
                 "Inference completed",
@@ -238,8 +259,10 @@ class UnifiedRuntimeClient:
                 model_version=result.model_version,
                 status=result.status,
                 inference_time_ms=result.inference_time_ms,
+                trace_id=trace_id,
             )
 
+            status = "success" if result.status == "success" else "error"
             return result
 
         except httpx.ConnectError as e:
@@ -250,3 +273,7 @@ class UnifiedRuntimeClient:
             raise UnifiedRuntimeInferenceError(f"Invalid response: {e}")
         except httpx.HTTPStatusError as e:
             raise UnifiedRuntimeInferenceError(f"Inference failed: {e}")
+        finally:
+            record_ai_runtime_request(
+                "inference", status, time.perf_counter() - started
+            )
@@ -6,6 +6,12 @@ Handles:
 2. Converting to base64 for unified runtime
 3. Extracting image metadata (format, dimensions)
 
+Metadata comes from the image header alone (JPEG SOF marker / PNG IHDR
+chunk, a few bytes), falling back to the dimensions VAS reports in its
+response headers. Frames are never decoded on the event loop; a sampled
+share can be fully decoded in a worker thread to verify the cheap path
+(RUTH_FRAME_VERIFY_SAMPLE_RATE, default 0).
+
 The frame comes off the decode VAS already performs to feed mediasoup, so
 fetching it costs no RTSP connection and no extra decode. This replaced a
 create-snapshot / poll-until-ready / download sequence that opened a fresh
@@ -15,6 +21,8 @@ RTSP connection per frame and failed roughly a third of the time under load.
 import asyncio
 import base64
 import os
+import random
+import time
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
@@ -35,6 +43,73 @@ logger = get_logger(__name__)
 # reporting detections against a frame from minutes ago.
 DEFAULT_MAX_FRAME_AGE_MS = int(os.getenv("RUTH_MAX_FRAME_AGE_MS", "5000"))
 
+# Share of frames (0.0-1.0) fully decoded in a worker thread to check the
+# header-only metadata path. Off by default; a full decode per frame was the
+# single largest CPU cost on the backend event loop.
+DEFAULT_VERIFY_SAMPLE_RATE = float(os.getenv("RUTH_FRAME_VERIFY_SAMPLE_RATE", "0"))
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers (baseline, extended, progressive, lossless, ...)
+_JPEG_SOF_MARKERS = frozenset(
+    (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+)
+
+
+def _jpeg_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """Read (width, height) from the JPEG SOF marker, or None."""
+    if len(data) < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+
+    offset = 2
+    length = len(data)
+    while offset + 4 <= length:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Standalone markers carry no length
+            offset += 2
+            continue
+        segment_length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > length:
+                return None
+            height = int.from_bytes(data[offset + 5:offset + 7], "big")
+            width = int.from_bytes(data[offset + 7:offset + 9], "big")
+            return width, height
+        if marker == 0xDA or segment_length < 2:
+            # Start of scan before any SOF - malformed
+            return None
+        offset += 2 + segment_length
+
+    return None
+
+
+def read_image_header(data: bytes) -> Optional[tuple[str, int, int]]:
+    """
+    Read (format, width, height) from the image header without decoding.
+
+    Supports JPEG (SOF marker) and PNG (IHDR chunk).
+
+    Returns:
+        (format, width, height), or None if the header is not recognised
+    """
+    dimensions = _jpeg_dimensions(data)
+    if dimensions is not None:
+        return ("jpeg", *dimensions)
+
+    if len(data) >= 24 and data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR":
+        width = int.from_bytes(data[16:20], "big")
+        height = int.from_bytes(data[20:24], "big")
+        return ("png", width, height)
+
+    return None
+
 
 @dataclass
 class FrameData:
@@ -45,6 +120,8 @@ class FrameData:
     width: int
     height: int
     size_bytes: int
+    fetch_ms: float = 0.0  # VAS frame tap round trip
+    encode_ms: float = 0.0  # Header parse + base64 encode
 
     @property
     def size_kb(self) -> float:
@@ -73,14 +150,21 @@ class FrameFetcher:
         )
     """
 
-    def __init__(self, vas_client: VASClient):
+    def __init__(
+        self,
+        vas_client: VASClient,
+        verify_sample_rate: float = DEFAULT_VERIFY_SAMPLE_RATE,
+    ):
         """
         Initialize frame fetcher.
 
         Args:
             vas_client: Connected VAS client instance
+            verify_sample_rate: Share of frames (0.0-1.0) fully decoded
+                off the event loop to verify header metadata
         """
         self.vas_client = vas_client
+        self.verify_sample_rate = verify_sample_rate
 
     async def fetch_and_encode(
         self,
@@ -113,20 +197,26 @@ class FrameFetcher:
             )
 
         try:
+            fetch_started = time.perf_counter()
             image_bytes, header_width, header_height = (
                 await self.vas_client.get_latest_frame(
                     stream_id=str(stream_id),
                     max_age_ms=max_age_ms,
                 )
             )
+            encode_started = time.perf_counter()
 
-            # Encode to base64 and extract metadata
-            frame_data = self._encode_and_extract_metadata(image_bytes)
+            # Encode to base64 and extract metadata from the image header
+            frame_data = self._encode_and_extract_metadata(
+                image_bytes, header_width, header_height
+            )
+            frame_data.fetch_ms = (encode_started - fetch_started) * 1000
+            frame_data.encode_ms = (time.perf_counter() - encode_started) * 1000
 
             # VAS reports the tapped frame's geometry in response headers. It
-            # should agree with what we decode here; if it ever doesn't, the
-            # decoded values win, because inference coordinates are only
-            # meaningful relative to the bytes actually handed to the model.
+            # should agree with the image header; if it ever doesn't, the
+            # image wins, because inference coordinates are only meaningful
+            # relative to the bytes actually handed to the model.
             if (
                 header_width
                 and header_height
@@ -140,6 +230,9 @@ class FrameFetcher:
                     decoded_dimensions=f"{frame_data.width}x{frame_data.height}",
                 )
 
+            if self._should_verify():
+                frame_data = await self._verify_frame(image_bytes, frame_data)
+
             logger.debug(
                 "Frame fetched and encoded",
                 stream_id=str(stream_id),
@@ -158,27 +251,45 @@ class FrameFetcher:
             )
             raise
 
-    def _encode_and_extract_metadata(self, image_bytes: bytes) -> FrameData:
+    def _encode_and_extract_metadata(
+        self,
+        image_bytes: bytes,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> FrameData:
         """
-        Encode image to base64 and extract metadata.
+        Encode image to base64 and extract metadata without decoding pixels.
+
+        Dimensions come from the JPEG SOF marker / PNG IHDR chunk. For other
+        formats the caller-supplied dimensions (VAS response headers) are
+        trusted; only when neither is available is the header parsed by PIL.
 
         Args:
             image_bytes: Raw image bytes
+            width: Frame width reported by VAS, if any
+            height: Frame height reported by VAS, if any
 
         Returns:
             FrameData with base64 encoding and metadata
 
         Raises:
-            ValueError: If image cannot be decoded
+            ValueError: If image metadata cannot be determined
         """
-        # Open image to extract metadata
-        try:
-            image = Image.open(io.BytesIO(image_bytes))
-            width, height = image.size
-            image_format = (image.format or "JPEG").lower()
-        except Exception as e:
-            logger.error("Failed to decode image", error=str(e))
-            raise ValueError(f"Invalid image data: {e}")
+        header = read_image_header(image_bytes)
+        if header is not None:
+            image_format, width, height = header
+        elif width and height:
+            image_format = "jpeg"
+        else:
+            # Unrecognised format and no VAS dimensions. Image.open reads
+            # only the header; pixel data is not decoded.
+            try:
+                with Image.open(io.BytesIO(image_bytes)) as image:
+                    width, height = image.size
+                    image_format = (image.format or "JPEG").lower()
+            except Exception as e:
+                logger.error("Failed to read image header", error=str(e))
+                raise ValueError(f"Invalid image data: {e}")
 
         # Encode to base64
         base64_data = base64.b64encode(image_bytes).decode("utf-8")
@@ -191,6 +302,45 @@ class FrameFetcher:
             size_bytes=len(image_bytes),
         )
 
+    def _should_verify(self) -> bool:
+        """Whether this frame is sampled for full-decode verification."""
+        return self.verify_sample_rate > 0 and random.random() < self.verify_sample_rate
+
+    async def _verify_frame(self, image_bytes: bytes, frame_data: FrameData) -> FrameData:
+        """
+        Fully decode a sampled frame in a worker thread and check its metadata.
+
+        Decoded values win on a mismatch. Raises ValueError if the frame does
+        not decode, which the header-only path cannot detect.
+        """
+
+        def _decode() -> tuple[str, int, int]:
+            with Image.open(io.BytesIO(image_bytes)) as image:
+                image.load()
+                return (image.format or "JPEG").lower(), image.width, image.height
+
+        try:
+            image_format, width, height = await asyncio.to_thread(_decode)
+        except Exception as e:
+            logger.error("Sampled frame failed full decode", error=str(e))
+            raise ValueError(f"Invalid image data: {e}")
+
+        if (image_format, width, height) != (
+            frame_data.format,
+            frame_data.width,
+            frame_data.height,
+        ):
+            logger.warning(
+                "Frame header metadata disagrees with full decode",
+                header_metadata=f"{frame_data.format} {frame_data.width}x{frame_data.height}",
+                decoded_metadata=f"{image_format} {width}x{height}",
+            )
+            frame_data.format = image_format
+            frame_data.width = width
+            frame_data.height = height
+
+        return frame_data
+
     async def fetch_and_encode_from_reference(
         self,
         frame_reference: str,
@@ -6,6 +6,9 @@ Decides whether to use:
 - Existing Containers (demo models: fall_detection_container, ppe_detection_container)
 """
 
+import math
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -13,6 +16,7 @@ from typing import Any, Dict, Optional
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.core.metrics import record_inference_stages
 from app.integrations.vas import VASClient
 
 from .config import should_use_unified_runtime
@@ -179,8 +183,13 @@ class RuntimeRouter:
             metadata: Additional metadata
 
         Returns:
-            Inference results dictionary
+            Inference results dictionary, including a per-stage "timing"
+            breakdown (backend and runtime stages), the "trace_id" the
+            runtime logged the request under, and the runtime's "capacity"
+            signal (None if it did not send one)
         """
+        trace_id = str(uuid.uuid4())
+
         # Step 1: Fetch frame from VAS and encode
         logger.debug("Fetching frame from VAS", device_id=str(device_id) if device_id else None)
 
@@ -197,6 +206,7 @@ class RuntimeRouter:
         )
 
         # Step 2: Submit to unified runtime
+        submitted = time.perf_counter()
         response = await self.unified_runtime_client.submit_inference(
             model_id=model_id,
             frame_base64=frame_data.base64_data,
@@ -210,7 +220,30 @@ class RuntimeRouter:
             priority=priority,
             metadata=metadata,
             config=config,
+            trace_id=trace_id,
         )
+        round_trip_ms = (time.perf_counter() - submitted) * 1000
+
+        # Stage breakdown: what the backend measured, plus what the runtime
+        # reports. transport is the round trip minus the runtime's own total
+        # (serialization, network and runtime queueing outside the handler).
+        timing: Dict[str, float] = {
+            "fetch_ms": frame_data.fetch_ms,
+            "encode_ms": frame_data.encode_ms,
+        }
+        if response.timing:
+            timing.update(response.timing)
+            timing["transport_ms"] = max(
+                0.0, round_trip_ms - response.timing.get("total_ms", response.inference_time_ms)
+            )
+        timing["round_trip_ms"] = round_trip_ms
+        record_inference_stages(model_id, timing)
+
+        # With reduced-scale decode the model saw a 1/N frame; box
+        # coordinates are relative to that (libjpeg rounds up).
+        scale = response.decode_scale or 1
+        frame_width = math.ceil(frame_data.width / scale)
+        frame_height = math.ceil(frame_data.height / scale)
 
         # Step 3: Convert response to dict and return
         #
@@ -226,6 +259,9 @@ class RuntimeRouter:
             "inference_time_ms": response.inference_time_ms,
             "result": response.result,
             "error": response.error,
-            "frame_width": frame_data.width,
-            "frame_height": frame_data.height,
+            "frame_width": frame_width,
+            "frame_height": frame_height,
+            "timing": timing,
+            "trace_id": response.trace_id or trace_id,
+            "capacity": response.capacity,
         }
@@ -46,6 +46,45 @@ class UnifiedInferenceRequest(BaseModel):
         }
 
 
+class RuntimeCapacity(BaseModel):
+    """Capacity signal the runtime attaches to every response.
+
+    Parsed from the X-Runtime-Capacity header, e.g.
+    ``free=2;queue=0;util=0.63;svc=fall_detection:83.1,ppe_detection:295.0``.
+    """
+
+    free_slots: int = Field(description="Inference slots free on the runtime")
+    queue_depth: int = Field(description="Requests waiting for a slot")
+    utilization: Optional[float] = Field(
+        None, description="GPU busy fraction (0.0-1.0), None when unknown"
+    )
+    service_time_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-model service time measured by the runtime (EWMA)",
+    )
+
+    @classmethod
+    def from_header(cls, value: Optional[str]) -> Optional["RuntimeCapacity"]:
+        """Parse the header value; returns None if absent or malformed."""
+        if not value:
+            return None
+        try:
+            fields = dict(part.split("=", 1) for part in value.split(";") if part)
+            service_time_ms = {}
+            if fields.get("svc"):
+                for entry in fields["svc"].split(","):
+                    model_id, ms = entry.rsplit(":", 1)
+                    service_time_ms[model_id] = float(ms)
+            return cls(
+                free_slots=int(fields["free"]),
+                queue_depth=int(fields["queue"]),
+                utilization=float(fields["util"]) if "util" in fields else None,
+                service_time_ms=service_time_ms,
+            )
+        except (KeyError, ValueError):
+            return None
+
+
 class UnifiedInferenceResponse(BaseModel):
     """Response schema from unified runtime inference endpoint."""
 
@@ -56,6 +95,16 @@ class UnifiedInferenceResponse(BaseModel):
     inference_time_ms: float = Field(description="Inference duration in milliseconds")
     result: Optional[Dict[str, Any]] = Field(None, description="Inference results")
     error: Optional[str] = Field(None, description="Error message if failed")
+    decode_scale: int = Field(
+        default=1, description="JPEG decode scale denominator applied by the runtime"
+    )
+    timing: Optional[Dict[str, float]] = Field(
+        None, description="Runtime per-stage durations in milliseconds"
+    )
+    trace_id: Optional[str] = Field(None, description="Trace ID echoed by the runtime")
+    capacity: Optional[RuntimeCapacity] = Field(
+        None, description="Capacity signal from the X-Runtime-Capacity header"
+    )
 
     class Config:
         json_schema_extra = {
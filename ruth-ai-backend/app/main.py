@@ -17,6 +17,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import __version__
 from app.api.internal import events as internal_events
 from app.api.internal import ai_runtime as internal_ai_runtime
+from app.api.internal import debug as internal_debug
 from app.api.v1 import (
     ai,
     analytics,
@@ -90,6 +91,9 @@ def create_application() -> FastAPI:
     app.include_router(internal_events.router, prefix="/internal")
     app.include_router(internal_ai_runtime.router, prefix="/internal")
 
+    # Debug endpoints (guarded by INTERNAL_API_KEY, 404 when unset)
+    app.include_router(internal_debug.router)
+
     # Observability endpoint
     app.include_router(create_metrics_router())
 
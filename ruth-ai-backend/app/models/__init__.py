@@ -21,6 +21,7 @@ from app.models.event import Event
 from app.models.evidence import Evidence
 from app.models.stream_session import StreamSession
 from app.models.violation import Violation
+from app.models.violation_rollup import ViolationRollup
 
 __all__ = [
     # Base
@@ -42,5 +43,6 @@ __all__ = [
     "StreamSession",
     "Event",
     "Violation",
+    "ViolationRollup",
     "Evidence",
 ]
@@ -1,9 +1,10 @@
 """BookmarkAnalysis model — async AI analysis jobs against VAS bookmarks.
 
 A row represents one submitted analysis of a recorded bookmark. The job
-lifecycle is async: API submits, worker picks it up, summary is written
-when complete. Independent of the live InferenceLoop — bookmarks are
-recorded video, not live streams.
+lifecycle is async: API submits, a queue worker claims it, summary is
+written when complete; the table is the queue (see
+``app.services.bookmark_analysis_queue``). Independent of the live
+InferenceLoop — bookmarks are recorded video, not live streams.
 
 vas_bookmark_id is a foreign reference to VAS, not Ruth. We never own
 the bookmark; we annotate it.
@@ -12,7 +13,7 @@ the bookmark; we annotate it.
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Float, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,13 +31,26 @@ class BookmarkAnalysis(Base):
 
     No relationships to other Ruth tables: bookmarks live in VAS.
 
+    Identical submissions (same bookmark, model, version and parameters)
+    share a ``request_key``; at most one pending or running row may hold
+    a given key, so a duplicate submit returns the live row instead.
+
     Indexes:
     - vas_bookmark_id  (list analyses for a specific bookmark)
     - state            (find pending/running jobs)
     - created_at DESC  (chronological listing of recent runs)
+    - request_key      (unique among pending/running rows; dedup)
     """
 
     __tablename__ = "bookmark_analyses"
+    __table_args__ = (
+        Index(
+            "uq_bookmark_analyses_active_request_key",
+            "request_key",
+            unique=True,
+            postgresql_where=text("state IN ('pending', 'running')"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -95,6 +109,25 @@ class BookmarkAnalysis(Base):
         nullable=True,
     )
 
+    # Queue bookkeeping. heartbeat_at is refreshed while a worker holds
+    # the job; a running row whose heartbeat has lapsed is reclaimed.
+    request_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    attempts: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Progress while running. checkpoint holds the per-frame results up to
+    # processed_until_seconds so a reclaimed job resumes from there.
+    progress_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
+    processed_until_seconds: Mapped[float | None] = mapped_column(
+        Float, nullable=True
+    )
+    checkpoint: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+
     # Future hook for user tracking (auth not wired yet — nullable).
     submitted_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
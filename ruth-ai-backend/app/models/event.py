@@ -6,7 +6,8 @@ Multiple events may be aggregated into a single Violation.
 
 From API Contract Section 3.1 - Event Schema:
 - Events are created for every AI inference that produces a detection
-- Events are retained indefinitely (per confirmed design decision)
+- Events are retained indefinitely (per confirmed design decision);
+  optional retention is applied per monthly partition, see below
 - Events link to violations for traceability
 """
 
@@ -14,7 +15,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DDL, DateTime, Float, ForeignKey, Index, Integer, String, event
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -51,12 +52,52 @@ class Event(Base, TimestampMixin):
     - Index on stream_session_id for session analysis
     - Index on violation_id for linking events to violations
     - Index on event_type for filtering by detection type
-    - Index on timestamp for time-range queries
-    - Composite index on (device_id, timestamp) for dashboard queries
-    - Composite index on (device_id, event_type, timestamp) for analytics
+    - BRIN index on timestamp for time-range scans (events are append-only,
+      so physical order follows timestamp and BRIN stays a few pages in size)
+    - Composite indexes ending in (timestamp, id) for keyset pagination and
+      dashboards, one per filter: (timestamp, id), (event_type, timestamp, id),
+      (device_id, timestamp, id), (device_id, event_type, timestamp, id).
+      The (device_id, timestamp, id) one INCLUDEs event_type and confidence
+      so actionable-event lookups filter without visiting the heap.
+
+    The composite indexes are created by migrations and declared in
+    __table_args__ so metadata-created (test) databases match.
+
+    Partitioning:
+    - Range-partitioned by month on timestamp (events_pYYYY_MM plus an
+      events_default catch-all); partitions are created ahead and retired
+      by app.services.event_partitions
+    - The primary key is (id, timestamp), since Postgres requires unique
+      constraints on a partitioned table to include the partition key.
+      Filter on timestamp wherever possible so only matching months are read
     """
 
     __tablename__ = "events"
+    __table_args__ = (
+        Index(
+            "ix_events_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_events_timestamp_id", "timestamp", "id"),
+        Index("ix_events_type_timestamp_id", "event_type", "timestamp", "id"),
+        Index(
+            "ix_events_device_timestamp_covering",
+            "device_id",
+            "timestamp",
+            "id",
+            postgresql_include=["event_type", "confidence"],
+        ),
+        Index(
+            "ix_events_device_type_timestamp_id",
+            "device_id",
+            "event_type",
+            "timestamp",
+            "id",
+        ),
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
 
     # Primary key
     id: Mapped[uuid.UUID] = mapped_column(
@@ -106,10 +147,10 @@ class Event(Base, TimestampMixin):
     )
 
     # Timestamp when the event occurred (frame capture time)
+    # Part of the primary key because it is the partition key
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
 
     # AI model information
@@ -162,3 +203,14 @@ class Event(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, type={self.event_type}, confidence={self.confidence})>"
+
+
+# Metadata-created (test) databases get the catch-all partition so inserts
+# work without the maintenance task; monthly partitions come from migrations
+# and app.services.event_partitions.
+event.listen(
+    Event.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS events_default PARTITION OF events DEFAULT")
+    .execute_if(dialect="postgresql"),
+)
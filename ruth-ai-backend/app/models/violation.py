@@ -14,7 +14,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -53,12 +53,34 @@ class Violation(Base, TimestampMixin):
     - Index on stream_session_id for session analysis
     - Index on status for filtering by lifecycle state
     - Index on type for filtering by violation type
-    - Index on timestamp for time-range queries
-    - Composite index on (status, timestamp) for dashboard (open violations)
-    - Composite index on (device_id, status, timestamp) for per-camera dashboards
+    - Covering index on (timestamp, id) INCLUDE (device_id, type, status,
+      confidence): time-range aggregates run as index-only scans
+    - Composite indexes ending in (timestamp, id) for keyset pagination of
+      the listing, one per filter: (timestamp, id), (status, timestamp, id),
+      (device_id, timestamp, id), (device_id, status, timestamp, id)
+
+    The composite indexes are created by migrations and declared in
+    __table_args__ so metadata-created (test) databases match.
     """
 
     __tablename__ = "violations"
+    __table_args__ = (
+        Index(
+            "ix_violations_timestamp_covering",
+            "timestamp",
+            "id",
+            postgresql_include=["device_id", "type", "status", "confidence"],
+        ),
+        Index("ix_violations_status_timestamp_id", "status", "timestamp", "id"),
+        Index("ix_violations_device_timestamp_id", "device_id", "timestamp", "id"),
+        Index(
+            "ix_violations_device_status_timestamp_id",
+            "device_id",
+            "status",
+            "timestamp",
+            "id",
+        ),
+    )
 
     # Primary key
     id: Mapped[uuid.UUID] = mapped_column(
@@ -127,7 +149,6 @@ class Violation(Base, TimestampMixin):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
 
     # Denormalized camera name for display (from device at creation time)
@@ -0,0 +1,163 @@
+"""ViolationRollup model — pre-aggregated violation counts for analytics.
+
+One row per (granularity, bucket, device, type, status) holding how many
+violations fall in it. Dashboards sum a bounded number of these rows
+instead of scanning and date_trunc-grouping the raw `violations` table,
+so their latency no longer grows with history.
+
+Maintained by Postgres triggers on `violations`, not by application code:
+violations are written from three places (the inference loop, the event
+ingestion API and ViolationService) and status changes can come from any
+session, so a trigger is the only point that sees every insert, status
+transition and delete — including the cascade when a device is removed.
+
+Buckets are UTC-aligned (`date_trunc(..., 'UTC')`), hourly and daily.
+Reads that need a range not aligned to buckets take the ragged edges from
+the raw table; see app.services.violation_rollups.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, ForeignKey, Integer, String, event
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.enums import ViolationStatus, ViolationType
+
+#: Bucket sizes maintained by the trigger.
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+
+class ViolationRollup(Base):
+    """Violation count for one device, type and status in one time bucket.
+
+    Written only by the `violations_rollup_*` triggers; never insert or
+    update these rows from the application.
+
+    Indexes:
+    - Primary key (granularity, bucket_start, device_id, type, status),
+      which also serves range scans by bucket
+    """
+
+    __tablename__ = "violation_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+
+    device_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    type: Mapped[ViolationType] = mapped_column(
+        ENUM(
+            ViolationType,
+            name="violation_type",
+            create_type=False,
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        primary_key=True,
+    )
+
+    status: Mapped[ViolationStatus] = mapped_column(
+        ENUM(
+            ViolationStatus,
+            name="violation_status",
+            create_type=False,
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        primary_key=True,
+    )
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ViolationRollup({self.granularity} {self.bucket_start}, "
+            f"device={self.device_id}, {self.type}/{self.status}: {self.count})>"
+        )
+
+
+# Trigger DDL, one statement per entry (asyncpg will not run several in one
+# execute). Kept in sync with the add_violation_rollups migration; this copy
+# makes Base.metadata.create_all() (test databases) install it too.
+ROLLUP_CREATE_STATEMENTS = (
+    """
+    CREATE OR REPLACE FUNCTION violation_rollups_apply(
+        v_timestamp timestamptz,
+        v_device_id uuid,
+        v_type violation_type,
+        v_status violation_status,
+        v_delta integer
+    ) RETURNS void AS $$
+    BEGIN
+        INSERT INTO violation_rollups (granularity, bucket_start, device_id, type, status, count)
+        VALUES
+            ('hour', date_trunc('hour', v_timestamp, 'UTC'), v_device_id, v_type, v_status, v_delta),
+            ('day', date_trunc('day', v_timestamp, 'UTC'), v_device_id, v_type, v_status, v_delta)
+        ON CONFLICT (granularity, bucket_start, device_id, type, status)
+        DO UPDATE SET count = violation_rollups.count + EXCLUDED.count;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION violations_rollup_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM violation_rollups_apply(OLD.timestamp, OLD.device_id, OLD.type, OLD.status, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM violation_rollups_apply(NEW.timestamp, NEW.device_id, NEW.type, NEW.status, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER violations_rollup_insert_delete
+        AFTER INSERT OR DELETE ON violations
+        FOR EACH ROW EXECUTE FUNCTION violations_rollup_trigger()
+    """,
+    # Only changes that move a violation to another rollup row
+    """
+    CREATE TRIGGER violations_rollup_update
+        AFTER UPDATE OF timestamp, device_id, type, status ON violations
+        FOR EACH ROW
+        WHEN (
+            OLD.timestamp IS DISTINCT FROM NEW.timestamp
+            OR OLD.device_id IS DISTINCT FROM NEW.device_id
+            OR OLD.type IS DISTINCT FROM NEW.type
+            OR OLD.status IS DISTINCT FROM NEW.status
+        )
+        EXECUTE FUNCTION violations_rollup_trigger()
+    """,
+)
+
+ROLLUP_DROP_STATEMENTS = (
+    "DROP TRIGGER IF EXISTS violations_rollup_update ON violations",
+    "DROP TRIGGER IF EXISTS violations_rollup_insert_delete ON violations",
+    "DROP FUNCTION IF EXISTS violations_rollup_trigger()",
+    "DROP FUNCTION IF EXISTS violation_rollups_apply("
+    "timestamptz, uuid, violation_type, violation_status, integer)",
+)
+
+# After the whole metadata is created, since the triggers sit on `violations`
+for _statement in ROLLUP_CREATE_STATEMENTS:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+for _statement in ROLLUP_DROP_STATEMENTS:
+    event.listen(
+        Base.metadata,
+        "before_drop",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
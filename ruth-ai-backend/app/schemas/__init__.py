@@ -21,6 +21,7 @@ from app.schemas.analytics import (
     DeviceAnalytics,
     DeviceStatusResponse,
     DeviceStatusSummary,
+    ExportJobResponse,
     ExportOptions,
     ExportRequest,
     ExportScope,
@@ -121,6 +122,7 @@ __all__ = [
     "DeviceAnalytics",
     "DeviceStatusResponse",
     "DeviceStatusSummary",
+    "ExportJobResponse",
     "ExportOptions",
     "ExportRequest",
     "ExportScope",
@@ -232,3 +232,29 @@ class ExportRequest(BaseModel):
     options: ExportOptions = Field(
         default_factory=ExportOptions, description="Format-specific options"
     )
+
+
+class ExportJobResponse(BaseModel):
+    """Response for the /api/v1/analytics/export/jobs endpoints."""
+
+    job_id: str = Field(..., description="Export job ID")
+    status: Literal["pending", "running", "completed", "failed"] = Field(
+        ..., description="Job status"
+    )
+    format: Literal["csv", "xlsx", "pdf"] = Field(..., description="Export format")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    started_at: datetime | None = Field(
+        default=None, description="When generation started"
+    )
+    completed_at: datetime | None = Field(
+        default=None, description="When generation finished or failed"
+    )
+    expires_at: datetime | None = Field(
+        default=None, description="When the result is deleted"
+    )
+    filename: str | None = Field(default=None, description="Download filename")
+    size_bytes: int | None = Field(default=None, description="Result size in bytes")
+    error: str | None = Field(default=None, description="Failure reason")
+    download_url: str | None = Field(
+        default=None, description="Where to fetch the result once completed"
+    )
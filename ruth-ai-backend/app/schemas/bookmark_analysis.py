@@ -117,6 +117,18 @@ class BookmarkAnalysisResponse(BaseModel):
     state: BookmarkAnalysisStateName
     summary: dict[str, Any] | None
     error_message: str | None
+    progress_percent: float | None = Field(
+        default=None,
+        description="Share of the clip processed so far (0-100), once known.",
+    )
+    processed_until_seconds: float | None = Field(
+        default=None,
+        description="Clip timestamp up to which every sampled frame is done.",
+    )
+    attempts: int = Field(
+        default=0,
+        description="Times a worker has claimed this analysis.",
+    )
     created_at: datetime
     started_at: datetime | None
     completed_at: datetime | None
@@ -137,6 +149,7 @@ class BookmarkAnalysisListItem(BaseModel):
     model_id: str
     model_version: str | None
     state: BookmarkAnalysisStateName
+    progress_percent: float | None = None
     created_at: datetime
     completed_at: datetime | None
 
@@ -131,7 +131,12 @@ class EventListResponse(BaseModel):
     """Response schema for GET /api/v1/events."""
 
     events: list[EventResponse] = Field(..., description="List of events")
-    total: int = Field(..., description="Total count of events")
+    total: int | None = Field(
+        None, description="Total count of events (omitted when include_total=false)"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
 
 
 class EventQueryParams(BaseModel):
@@ -141,4 +146,5 @@ class EventQueryParams(BaseModel):
     event_type: str | None = Field(None, description="Filter by event type")
     since: datetime | None = Field(None, description="Filter by timestamp (after)")
     limit: int = Field(default=100, ge=1, le=1000, description="Maximum results")
-    offset: int = Field(default=0, ge=0, description="Pagination offset")
+    cursor: str | None = Field(None, description="Keyset pagination cursor")
+    offset: int = Field(default=0, ge=0, description="Deprecated pagination offset")
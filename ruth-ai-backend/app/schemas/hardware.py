@@ -24,6 +24,13 @@ class GPUMetrics(BaseModel):
     vram_percent: int | None = Field(None, description="VRAM usage percentage")
     utilization_percent: int | None = Field(None, description="GPU compute utilization percentage")
     temperature_c: int | None = Field(None, description="GPU temperature in Celsius")
+    power_w: float | None = Field(None, description="GPU power draw in watts")
+    utilization_avg_percent: float | None = Field(
+        None, description="Average GPU utilization over the last minute"
+    )
+    utilization_max_percent: float | None = Field(
+        None, description="Peak GPU utilization over the last minute"
+    )
 
 
 class CPUMetrics(BaseModel):
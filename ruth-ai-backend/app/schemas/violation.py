@@ -88,7 +88,12 @@ class ViolationListResponse(BaseModel):
     """
 
     items: list[ViolationResponse] = Field(..., description="List of violations")
-    total: int = Field(..., description="Total count of violations")
+    total: int | None = Field(
+        None, description="Total count of violations (omitted when include_total=false)"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
 
 
 class ViolationQueryParams(BaseModel):
@@ -98,7 +103,8 @@ class ViolationQueryParams(BaseModel):
     camera_id: uuid.UUID | None = Field(None, description="Filter by camera ID")
     since: datetime | None = Field(None, description="Filter by timestamp (after)")
     limit: int = Field(default=100, ge=1, le=1000, description="Maximum results")
-    offset: int = Field(default=0, ge=0, description="Pagination offset")
+    cursor: str | None = Field(None, description="Keyset pagination cursor")
+    offset: int = Field(default=0, ge=0, description="Deprecated pagination offset")
 
 
 class ViolationStatusUpdateRequest(BaseModel):
@@ -67,15 +67,19 @@ Exception Hierarchy:
     │   ├── ViolationTerminalStateError
     │   ├── ViolationCreationError
     │   └── DuplicateViolationError
-    └── EvidenceError
-        ├── EvidenceNotFoundError
-        ├── EvidenceStateError
-        ├── EvidenceTerminalStateError
-        ├── EvidenceCreationError
-        ├── EvidenceAlreadyExistsError
-        ├── EvidencePollingTimeoutError
-        ├── EvidenceVASError
-        └── NoActiveStreamError
+    ├── EvidenceError
+    │   ├── EvidenceNotFoundError
+    │   ├── EvidenceStateError
+    │   ├── EvidenceTerminalStateError
+    │   ├── EvidenceCreationError
+    │   ├── EvidenceAlreadyExistsError
+    │   ├── EvidencePollingTimeoutError
+    │   ├── EvidenceVASError
+    │   └── NoActiveStreamError
+    └── ExportError
+        ├── ExportJobNotFoundError
+        ├── ExportJobNotReadyError
+        └── ExportQueueFullError
 
 Design Principles:
     - Services receive dependencies via constructor (DI)
@@ -107,6 +111,10 @@ from .exceptions import (
     EventError,
     EventIngestionError,
     EventSessionMissingError,
+    ExportError,
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+    ExportQueueFullError,
     InferenceFailedError,
     NoActiveStreamError,
     ServiceError,
@@ -174,4 +182,9 @@ __all__ = [
     "EvidencePollingTimeoutError",
     "EvidenceVASError",
     "NoActiveStreamError",
+    # Export Exceptions
+    "ExportError",
+    "ExportJobNotFoundError",
+    "ExportJobNotReadyError",
+    "ExportQueueFullError",
 ]
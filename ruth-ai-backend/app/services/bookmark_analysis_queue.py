@@ -0,0 +1,330 @@
+"""Durable queue for bookmark analyses.
+
+The bookmark_analyses table is the queue: a submitted row waits in
+PENDING until a worker claims it. Nothing lives only in memory, so a
+restart loses no work and several backend processes can share the table.
+
+- Claim: the oldest PENDING row, or a RUNNING row whose heartbeat has
+  lapsed (its worker died), is taken with SELECT ... FOR UPDATE SKIP
+  LOCKED, so concurrent workers never claim the same row and never wait
+  on each other.
+- Worker pool: `bookmark_analysis_workers` tasks per process, by default
+  half the CPU cores. Each analysis decodes video on its own thread, so
+  this is what bounds concurrent decodes.
+- Heartbeat: while a job runs, its heartbeat_at, progress_percent,
+  processed_until_seconds and checkpoint are written every third of
+  `bookmark_analysis_lease_seconds`. Every write is guarded by the
+  attempt number the worker claimed; once a heartbeat matches no row the
+  lease has been lost to another worker and this run is stopped.
+- Resumption: a reclaimed row continues from its checkpoint. On shutdown
+  running jobs are put back to PENDING with their checkpoint, without
+  counting the interrupted attempt.
+- Retries: a row claimed `bookmark_analysis_max_attempts` times without
+  finishing is failed.
+
+Idle workers poll every `bookmark_analysis_poll_seconds`; notify() wakes
+them at once after a submit in this process.
+
+Usage:
+    queue = BookmarkAnalysisQueue()
+    await queue.start()
+    set_bookmark_analysis_queue(queue)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import Select, and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.database import get_session_factory
+from app.core.logging import get_logger
+from app.models import BookmarkAnalysis, BookmarkAnalysisState
+from app.services.bookmark_analysis_worker import (
+    AnalysisJob,
+    AnalysisProgress,
+    run_analysis,
+)
+
+logger = get_logger(__name__)
+
+
+def default_worker_count() -> int:
+    """Half the CPU cores, leaving the rest to the API and live inference."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def claim_statement(now: datetime, lease: timedelta) -> Select:
+    """Lock the next claimable row, skipping rows other workers hold."""
+    return (
+        select(BookmarkAnalysis)
+        .where(
+            or_(
+                BookmarkAnalysis.state == BookmarkAnalysisState.PENDING,
+                and_(
+                    BookmarkAnalysis.state == BookmarkAnalysisState.RUNNING,
+                    or_(
+                        BookmarkAnalysis.heartbeat_at.is_(None),
+                        BookmarkAnalysis.heartbeat_at < now - lease,
+                    ),
+                ),
+            )
+        )
+        .order_by(BookmarkAnalysis.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+class BookmarkAnalysisQueue:
+    """Worker pool draining the bookmark_analyses table."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        poll_seconds: float | None = None,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+        session_factory: Callable[[], async_sessionmaker[AsyncSession] | None] = (
+            get_session_factory
+        ),
+    ) -> None:
+        settings = get_settings()
+        self._workers = (
+            workers or settings.bookmark_analysis_workers or default_worker_count()
+        )
+        self._poll_seconds = poll_seconds or settings.bookmark_analysis_poll_seconds
+        self._lease = timedelta(
+            seconds=lease_seconds or settings.bookmark_analysis_lease_seconds
+        )
+        self._max_attempts = max_attempts or settings.bookmark_analysis_max_attempts
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    async def start(self) -> None:
+        """Start the worker pool."""
+        if self._running:
+            return
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"bookmark-analysis-worker-{i}")
+            for i in range(self._workers)
+        ]
+        logger.info(
+            "Bookmark analysis queue started",
+            workers=self._workers,
+            lease_seconds=int(self._lease.total_seconds()),
+        )
+
+    async def stop(self) -> None:
+        """Cancel workers; their running jobs are released for a later resume."""
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Bookmark analysis queue stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers, e.g. right after a submit."""
+        self._wakeup.set()
+
+    async def _worker(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.claim()
+            except Exception as e:
+                logger.error("Bookmark analysis claim failed", error=str(e))
+                claimed = None
+
+            if claimed is None:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self._poll_seconds)
+                continue
+
+            try:
+                await self._run(*claimed)
+            except Exception as e:
+                job, _ = claimed
+                logger.error(
+                    "Bookmark analysis run failed",
+                    analysis_id=str(job.id),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def claim(self) -> tuple[AnalysisJob, AnalysisProgress] | None:
+        """Claim the next analysis, or None if there is nothing to do."""
+        factory = self._session_factory()
+        if factory is None:
+            return None
+
+        async with factory() as db:
+            while True:
+                now = datetime.now(timezone.utc)
+                result = await db.execute(claim_statement(now, self._lease))
+                analysis = result.scalar_one_or_none()
+                if analysis is None:
+                    return None
+
+                if analysis.attempts >= self._max_attempts:
+                    analysis.state = BookmarkAnalysisState.FAILED
+                    analysis.completed_at = now
+                    analysis.checkpoint = None
+                    analysis.error_message = (
+                        f"Abandoned after {analysis.attempts} attempts "
+                        "without finishing"
+                    )
+                    await db.commit()
+                    logger.warning(
+                        "Bookmark analysis abandoned",
+                        analysis_id=str(analysis.id),
+                        attempts=analysis.attempts,
+                    )
+                    continue
+
+                reclaimed = analysis.state == BookmarkAnalysisState.RUNNING
+                analysis.state = BookmarkAnalysisState.RUNNING
+                analysis.attempts += 1
+                analysis.heartbeat_at = now
+                analysis.started_at = analysis.started_at or now
+                job = AnalysisJob(
+                    id=analysis.id,
+                    vas_bookmark_id=analysis.vas_bookmark_id,
+                    model_id=analysis.model_id,
+                    model_version=analysis.model_version,
+                    parameters=dict(analysis.parameters or {}),
+                    attempt=analysis.attempts,
+                )
+                progress = AnalysisProgress.from_checkpoint(analysis.checkpoint)
+                await db.commit()
+
+                if reclaimed:
+                    logger.warning(
+                        "Reclaimed bookmark analysis with lapsed heartbeat",
+                        analysis_id=str(job.id),
+                        attempt=job.attempt,
+                    )
+                return job, progress
+
+    async def _run(self, job: AnalysisJob, progress: AnalysisProgress) -> None:
+        analysis = asyncio.create_task(run_analysis(job, progress))
+        heartbeat = asyncio.create_task(self._heartbeat(job, progress))
+        try:
+            await asyncio.wait(
+                {analysis, heartbeat}, return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            analysis.cancel()
+            await asyncio.gather(analysis, return_exceptions=True)
+            # If this fails the lapsed heartbeat gets the row reclaimed anyway
+            try:
+                released = await self._save_progress(job, progress, release=True)
+            except Exception as e:
+                logger.warning(
+                    "Failed to release bookmark analysis",
+                    analysis_id=str(job.id),
+                    error=str(e),
+                )
+            else:
+                if released:
+                    logger.info(
+                        "Bookmark analysis released for resume",
+                        analysis_id=str(job.id),
+                        processed_until_seconds=progress.processed_until_seconds,
+                    )
+            raise
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        if not analysis.done():
+            # The heartbeat ended: another worker holds the row now
+            logger.warning(
+                "Bookmark analysis lease lost, stopping this attempt",
+                analysis_id=str(job.id),
+                attempt=job.attempt,
+            )
+            analysis.cancel()
+            await asyncio.gather(analysis, return_exceptions=True)
+            return
+        await analysis
+
+    async def _heartbeat(self, job: AnalysisJob, progress: AnalysisProgress) -> None:
+        """Renew the lease until an update finds the row no longer ours."""
+        interval = self._lease.total_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self._save_progress(job, progress):
+                    return
+            except Exception as e:
+                logger.warning(
+                    "Bookmark analysis heartbeat failed",
+                    analysis_id=str(job.id),
+                    error=str(e),
+                )
+
+    async def _save_progress(
+        self,
+        job: AnalysisJob,
+        progress: AnalysisProgress,
+        release: bool = False,
+    ) -> bool:
+        """Record progress on a running row; with ``release``, requeue it.
+
+        Returns False if the row is no longer RUNNING under this attempt.
+        """
+        factory = self._session_factory()
+        if factory is None:
+            return True
+
+        values = {
+            "heartbeat_at": datetime.now(timezone.utc),
+            "progress_percent": progress.percent,
+            "processed_until_seconds": progress.processed_until_seconds,
+            "checkpoint": progress.to_checkpoint(),
+        }
+        if release:
+            values.update(
+                state=BookmarkAnalysisState.PENDING,
+                heartbeat_at=None,
+                attempts=BookmarkAnalysis.attempts - 1,
+            )
+        stmt = (
+            update(BookmarkAnalysis)
+            .where(
+                BookmarkAnalysis.id == job.id,
+                BookmarkAnalysis.state == BookmarkAnalysisState.RUNNING,
+                BookmarkAnalysis.attempts == job.attempt,
+            )
+            .values(**values)
+        )
+        async with factory() as db:
+            result = await db.execute(stmt)
+            await db.commit()
+        return result.rowcount > 0
+
+
+# Global instance (initialized on startup)
+_bookmark_analysis_queue: BookmarkAnalysisQueue | None = None
+
+
+def get_bookmark_analysis_queue() -> BookmarkAnalysisQueue | None:
+    """Get the global bookmark analysis queue instance."""
+    return _bookmark_analysis_queue
+
+
+def set_bookmark_analysis_queue(queue: BookmarkAnalysisQueue | None) -> None:
+    """Set the global bookmark analysis queue instance."""
+    global _bookmark_analysis_queue
+    _bookmark_analysis_queue = queue
@@ -1,40 +1,49 @@
 """Bookmark analysis service.
 
 Owns the lifecycle of bookmark_analyses rows: submit (pending) →
-worker picks it up (running) → terminal (completed / failed).
+queue worker claims it (running) → terminal (completed / failed).
 
 The request-scoped service class (this module) handles CRUD-shaped
-operations. The async worker — download bookmark video from VAS,
-extract frames, dispatch inference, aggregate — lives in
-``bookmark_analysis_worker`` so this module stays small and the
-worker's heavy imports (cv2) are only loaded when needed.
-
-The worker entry point is re-exported as ``run_analysis`` for
-backwards compatibility with the API layer.
+operations. Scheduling lives in ``bookmark_analysis_queue`` and the
+pipeline — download bookmark video from VAS, extract frames, dispatch
+inference, aggregate — in ``bookmark_analysis_worker``, so this module
+stays small and the worker's heavy imports (cv2) are only loaded when
+needed.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models import BookmarkAnalysis, BookmarkAnalysisState
 from app.schemas.bookmark_analysis import BookmarkAnalysisSubmitRequest
-from app.services.bookmark_analysis_worker import run_analysis
 
-__all__ = ["BookmarkAnalysisService", "run_analysis"]
+__all__ = ["BookmarkAnalysisService", "analysis_request_key"]
 
 logger = get_logger(__name__)
 
+_ACTIVE_STATES = (BookmarkAnalysisState.PENDING, BookmarkAnalysisState.RUNNING)
+
+
+def analysis_request_key(request: BookmarkAnalysisSubmitRequest) -> str:
+    """Dedup key: equal for submissions that would run the same analysis."""
+    data = request.model_dump(mode="json")
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
 
 class BookmarkAnalysisService:
     """CRUD-shaped operations against bookmark_analyses.
 
-    Construct per request with the request's DB session. The worker
-    opens its own session — see ``bookmark_analysis_worker.run_analysis``.
+    Construct per request with the request's DB session. Queue workers
+    open their own sessions — see ``bookmark_analysis_queue``.
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -43,23 +52,38 @@ class BookmarkAnalysisService:
     async def submit(
         self,
         request: BookmarkAnalysisSubmitRequest,
-    ) -> BookmarkAnalysis:
+    ) -> tuple[BookmarkAnalysis, bool]:
         """Persist a new analysis row in state=PENDING.
 
-        Returns the created row with all server-generated columns
-        populated. The caller is responsible for scheduling
-        ``run_analysis(analysis.id)`` via FastAPI BackgroundTasks
-        after this returns.
+        If an identical request is still pending or running, that row
+        is returned instead. Returns ``(analysis, created)``. The row
+        is picked up by a queue worker; callers may ``notify()`` the
+        queue to start it without waiting for the next poll.
         """
+        key = analysis_request_key(request)
+        existing = await self._active_for_key(key)
+        if existing is not None:
+            return self._deduplicated(existing), False
+
         analysis = BookmarkAnalysis(
             vas_bookmark_id=request.vas_bookmark_id,
             model_id=request.model_id,
             model_version=request.model_version,
             parameters=request.parameters,
             state=BookmarkAnalysisState.PENDING,
+            request_key=key,
         )
         self._db.add(analysis)
-        await self._db.commit()
+        try:
+            await self._db.commit()
+        except IntegrityError:
+            # A concurrent identical submit won the partial unique index
+            await self._db.rollback()
+            existing = await self._active_for_key(key)
+            if existing is None:
+                raise
+            return self._deduplicated(existing), False
+
         await self._db.refresh(analysis)
         logger.info(
             "Bookmark analysis submitted",
@@ -67,6 +91,22 @@ class BookmarkAnalysisService:
             vas_bookmark_id=analysis.vas_bookmark_id,
             model_id=analysis.model_id,
         )
+        return analysis, True
+
+    async def _active_for_key(self, key: str) -> BookmarkAnalysis | None:
+        stmt = select(BookmarkAnalysis).where(
+            BookmarkAnalysis.request_key == key,
+            BookmarkAnalysis.state.in_(_ACTIVE_STATES),
+        )
+        result = await self._db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def _deduplicated(self, analysis: BookmarkAnalysis) -> BookmarkAnalysis:
+        logger.info(
+            "Bookmark analysis deduplicated",
+            analysis_id=str(analysis.id),
+            state=analysis.state.value,
+        )
         return analysis
 
     async def get(self, analysis_id: UUID) -> BookmarkAnalysis | None:
@@ -7,11 +7,19 @@ without restructuring.
 
 Pipeline:
 
-  1. Load row, transition PENDING -> RUNNING.
+  1. A BookmarkAnalysisQueue worker claims the row (PENDING -> RUNNING)
+     and hands over an AnalysisJob plus its AnalysisProgress.
   2. Stream the bookmark video from VAS to /tmp.
-  3. Walk the file with OpenCV, sample frames at the requested fps,
-     JPEG-encode each sample.
-  4. For each sample, call the unified runtime's /inference.
+  3. Walk the file with OpenCV in a worker thread, sample frames at the
+     requested fps, JPEG-encode each sample.
+  4. For each sample, call the unified runtime's /inference. Samples
+     flow from the decode thread through a bounded queue, so inference
+     starts on the first sample while decoding continues, and peak
+     memory is FRAME_QUEUE_SIZE frames regardless of clip length.
+     Several samples are in flight at once (see _InferenceWindow);
+     AnalysisProgress puts results back in timestamp order and tracks
+     the prefix that is done, which the queue checkpoints. A resumed
+     job skips samples up to its checkpoint.
   5. Aggregate per-frame results into a summary (timeline +
      threshold-crossing events + stats).
   6. Transition COMPLETED with the summary, or FAILED with
@@ -28,15 +36,21 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import threading
 import time
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
 
 import cv2  # opencv-python-headless
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.config import get_settings
 from app.core.database import get_session_factory
 from app.core.logging import get_logger
 from app.deps.services import get_vas_client_optional
@@ -44,15 +58,30 @@ from app.integrations.unified_runtime.client import (
     UnifiedRuntimeClient,
     UnifiedRuntimeError,
 )
+from app.integrations.unified_runtime.schemas import RuntimeCapacity
 from app.integrations.vas.exceptions import VASError
 from app.models import BookmarkAnalysis, BookmarkAnalysisState
 from app.schemas.bookmark_analysis import SAMPLING_FPS_DEFAULT
+from app.services.inference_loop import TARGET_GPU_UTILIZATION
 
 logger = get_logger(__name__)
 
 TEMP_DIR = Path("/tmp/ruth-bookmark-analyses")
 TANK_THRESHOLDS = [80, 90]
 
+# Decoded samples buffered between the decode thread and inference. The
+# decoder blocks when the queue is full, so this bounds memory.
+FRAME_QUEUE_SIZE = 16
+
+# Writing the terminal state is retried this many times, FINALIZE_RETRY_SECONDS
+# apart, so a DB blip at the end does not leave the row RUNNING until its
+# lease lapses and the whole clip is re-run.
+FINALIZE_ATTEMPTS = 3
+FINALIZE_RETRY_SECONDS = 1.0
+
+# Live camera sessions submit at priority 5; bookmark frames go below them.
+BOOKMARK_INFERENCE_PRIORITY = 1
+
 # Stable UUID5 namespace for synthesizing stream_ids from analysis_ids.
 # UnifiedRuntimeClient.submit_inference requires a stream_id UUID; for
 # bookmark analyses we don't have a real stream so we deterministically
@@ -62,18 +91,95 @@ _ANALYSIS_STREAM_NAMESPACE = uuid.UUID("00000000-0000-0000-0000-000000000d02")
 
 
 # ---------------------------------------------------------------------------
-# Public entry point — called from BackgroundTasks.
+# Public entry point — called from BookmarkAnalysisQueue workers.
 # ---------------------------------------------------------------------------
 
 
-async def run_analysis(analysis_id: uuid.UUID) -> None:
-    """BackgroundTasks worker entry point.
+@dataclass(frozen=True)
+class AnalysisJob:
+    """Immutable fields of a claimed bookmark_analyses row.
+
+    Captured when the queue claims the row so the pipeline never holds
+    a DB session or a stale ORM object across the long-running work.
+    """
+
+    id: uuid.UUID
+    vas_bookmark_id: str
+    model_id: str
+    model_version: str | None
+    parameters: dict[str, Any]
+    attempt: int = 1
+
+
+class AnalysisProgress:
+    """Per-frame results of one analysis, kept as a resumable prefix.
+
+    Frames finish out of order under the inference window. Only the
+    prefix whose frames have all finished counts as processed, so a job
+    resumed from ``processed_until_seconds`` never skips a frame that
+    was still in flight. Each result is ``(timestamp_seconds, fill)``,
+    where a fill of None marks a skipped frame.
+    """
+
+    def __init__(
+        self,
+        results: list[tuple[float, float | None]] | None = None,
+        duration_seconds: float | None = None,
+    ) -> None:
+        self.results = list(results or [])
+        self.duration_seconds = duration_seconds
+        self._submitted: deque[float] = deque()
+        self._finished: dict[float, Any] = {}
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict[str, Any] | None) -> "AnalysisProgress":
+        checkpoint = checkpoint or {}
+        return cls(
+            results=[(ts, fill) for ts, fill in checkpoint.get("results", [])],
+            duration_seconds=checkpoint.get("duration_seconds"),
+        )
+
+    def to_checkpoint(self) -> dict[str, Any]:
+        return {
+            "results": [[ts, fill] for ts, fill in self.results],
+            "duration_seconds": self.duration_seconds,
+        }
+
+    @property
+    def processed_until_seconds(self) -> float | None:
+        return self.results[-1][0] if self.results else None
+
+    @property
+    def percent(self) -> float | None:
+        if not self.duration_seconds or self.processed_until_seconds is None:
+            return None
+        return min(
+            100.0, 100.0 * self.processed_until_seconds / self.duration_seconds
+        )
+
+    def submitted(self, ts_seconds: float) -> None:
+        self._submitted.append(ts_seconds)
+
+    def finished(self, ts_seconds: float, value: Any) -> None:
+        self._finished[ts_seconds] = value
+        while self._submitted and self._submitted[0] in self._finished:
+            ts = self._submitted.popleft()
+            self.results.append((ts, self._finished.pop(ts)))
+
 
-    Opens its own DB session (request session has closed by now),
-    runs the pipeline, and persists the terminal state. Never crashes
-    the BackgroundTasks runner — any uncaught error is logged and
-    persisted as FAILED.
+async def run_analysis(job: AnalysisJob, progress: AnalysisProgress) -> None:
+    """Run a claimed analysis and persist its terminal state.
+
+    Opens its own DB sessions. Pipeline errors are logged and persisted
+    as FAILED rather than raised, so they never take down the queue
+    worker. Cancellation (shutdown, or a lost lease) propagates with the
+    row still RUNNING; the queue releases it for a later resume.
+
+    The terminal state is only written while the row is still held by
+    this attempt: if the lease lapsed and another worker reclaimed it,
+    that worker's result wins.
     """
+    analysis_id = job.id
     factory = get_session_factory()
     if factory is None:
         logger.error(
@@ -82,51 +188,28 @@ async def run_analysis(analysis_id: uuid.UUID) -> None:
         )
         return
 
-    # 1. Load + transition to RUNNING in its own short-lived session.
-    async with factory() as db:
-        analysis = await _load(db, analysis_id)
-        if analysis is None:
-            logger.warning(
-                "Bookmark analysis row missing when worker started",
-                analysis_id=str(analysis_id),
-            )
-            return
-        if analysis.state != BookmarkAnalysisState.PENDING:
-            logger.info(
-                "Skipping bookmark analysis worker — row not in pending state",
-                analysis_id=str(analysis_id),
-                state=analysis.state.value,
-            )
-            return
-        analysis.state = BookmarkAnalysisState.RUNNING
-        analysis.started_at = datetime.now(timezone.utc)
-        await db.commit()
-
-        # Capture immutable fields for the pipeline. Avoids any stale-row
-        # issue if a future revision adds row mutation between sessions.
-        vas_bookmark_id = analysis.vas_bookmark_id
-        model_id = analysis.model_id
-        model_version = analysis.model_version
-        parameters = dict(analysis.parameters or {})
-
     logger.info(
         "Bookmark analysis running",
         analysis_id=str(analysis_id),
-        model_id=model_id,
-        vas_bookmark_id=vas_bookmark_id,
+        model_id=job.model_id,
+        vas_bookmark_id=job.vas_bookmark_id,
+        attempt=job.attempt,
+        resume_from_seconds=progress.processed_until_seconds,
     )
 
-    # 2. Run the pipeline outside any DB session (long-running work).
-    TEMP_DIR.mkdir(parents=True, exist_ok=True)
-    temp_video = TEMP_DIR / f"{analysis_id}.mp4"
+    # Run the pipeline outside any DB session (long-running work).
+    # Per attempt: a reclaimed row may briefly run on two workers at once
+    temp_video = TEMP_DIR / f"{analysis_id}-{job.attempt}.mp4"
     try:
+        TEMP_DIR.mkdir(parents=True, exist_ok=True)
         summary = await _run_pipeline(
             analysis_id=analysis_id,
-            vas_bookmark_id=vas_bookmark_id,
-            model_id=model_id,
-            model_version=model_version,
-            parameters=parameters,
+            vas_bookmark_id=job.vas_bookmark_id,
+            model_id=job.model_id,
+            model_version=job.model_version,
+            parameters=job.parameters,
             temp_video=temp_video,
+            progress=progress,
         )
     except Exception as exc:
         logger.warning(
@@ -135,17 +218,15 @@ async def run_analysis(analysis_id: uuid.UUID) -> None:
             error=str(exc),
             error_type=type(exc).__name__,
         )
-        async with factory() as db:
-            await _finalize_failed(db, analysis_id, str(exc))
+        await _finalize(factory, job, _finalize_failed, str(exc))
     else:
-        async with factory() as db:
-            await _finalize_completed(db, analysis_id, summary)
-        logger.info(
-            "Bookmark analysis completed",
-            analysis_id=str(analysis_id),
-            frames_analyzed=summary["stats"]["frames_analyzed"],
-            frames_skipped=summary["stats"]["frames_skipped"],
-        )
+        if await _finalize(factory, job, _finalize_completed, summary):
+            logger.info(
+                "Bookmark analysis completed",
+                analysis_id=str(analysis_id),
+                frames_analyzed=summary["stats"]["frames_analyzed"],
+                frames_skipped=summary["stats"]["frames_skipped"],
+            )
     finally:
         try:
             if temp_video.exists():
@@ -171,8 +252,13 @@ async def _run_pipeline(
     model_version: str | None,
     parameters: dict[str, Any],
     temp_video: Path,
+    progress: AnalysisProgress,
 ) -> dict[str, Any]:
-    """Returns the summary blob on success; raises on fatal failure."""
+    """Returns the summary blob on success; raises on fatal failure.
+
+    Results accumulate in ``progress``; frames it already holds (a
+    resumed job) are not decoded or inferred again.
+    """
 
     # Step 1: download bookmark video from VAS to local file.
     vas = get_vas_client_optional()
@@ -195,29 +281,31 @@ async def _run_pipeline(
     )
     if size_bytes == 0:
         raise RuntimeError("Downloaded bookmark video is empty (0 bytes)")
+    if progress.duration_seconds is None:
+        progress.duration_seconds = await asyncio.to_thread(
+            _video_duration, temp_video
+        )
 
-    # Step 2: extract frames at the requested fps. cv2.VideoCapture is
-    # synchronous and CPU-bound; run it in a worker thread so we don't
-    # block the event loop for the duration of the decode.
+    # Step 2: decode frames at the requested fps. cv2.VideoCapture is
+    # synchronous and CPU-bound, so it runs in a worker thread feeding a
+    # bounded queue; inference below consumes samples as they arrive.
+    # (MP4s are not decodable until fully downloaded — the index can sit
+    # at the end of the file — so decoding starts after step 1.)
     sampling_fps = float(parameters.get("sampling_fps", SAMPLING_FPS_DEFAULT))
-    frames = await asyncio.to_thread(_extract_frames_list, temp_video, sampling_fps)
-    if not frames:
-        raise RuntimeError("No frames extracted from bookmark video")
-    logger.info(
-        "Extracted frames from bookmark",
-        analysis_id=str(analysis_id),
-        frame_count=len(frames),
-        sampling_fps=sampling_fps,
-    )
 
-    # Step 3: per-frame inference via the unified runtime.
+    # Step 3: per-frame inference via the unified runtime, several frames
+    # in flight at once. The runtime takes one frame per /inference call,
+    # so concurrency rather than batching is what hides the round trips.
     stream_id = uuid.uuid5(_ANALYSIS_STREAM_NAMESPACE, str(analysis_id))
-    timeline: list[dict[str, float]] = []
-    frames_skipped = 0
+    window = _InferenceWindow(get_settings().bookmark_inference_concurrency)
+    resumed_frames = len(progress.results)
     started_at = time.monotonic()
 
-    async with UnifiedRuntimeClient() as runtime:
-        for ts_seconds, jpeg_bytes in frames:
+    async with UnifiedRuntimeClient() as runtime, _stream_frames(
+        temp_video, sampling_fps, after_seconds=progress.processed_until_seconds
+    ) as frames:
+
+        async def infer(jpeg_bytes: bytes) -> float | None:
             try:
                 response = await runtime.submit_inference(
                     model_id=model_id,
@@ -225,6 +313,7 @@ async def _run_pipeline(
                     stream_id=stream_id,
                     model_version=model_version,
                     frame_format="jpeg",
+                    priority=BOOKMARK_INFERENCE_PRIORITY,
                     config=parameters,
                     metadata={
                         "source": "bookmark_analysis",
@@ -237,38 +326,46 @@ async def _run_pipeline(
                 # whole analysis — no point continuing if it can't reach
                 # the model server at all.
                 raise RuntimeError(f"AI runtime unreachable: {e}") from e
+            window.record(response.capacity)
 
             if response.status != "success" or response.result is None:
-                frames_skipped += 1
                 logger.debug(
                     "Frame inference returned non-success; skipping",
                     analysis_id=str(analysis_id),
-                    ts_seconds=ts_seconds,
                     status=response.status,
                     error=response.error,
                 )
-                continue
-
-            fill = _extract_fill_percentage(model_id, response.result)
-            if fill is None:
-                frames_skipped += 1
-                continue
-            timeline.append(
-                {"timestamp_seconds": ts_seconds, "fill_percentage": fill}
-            )
+                return None
+            return _extract_fill_percentage(model_id, response.result)
+
+        await _infer_in_window(frames, infer, window, progress)
+
+    frame_count = len(progress.results)
+    timeline = [
+        {"timestamp_seconds": ts_seconds, "fill_percentage": fill}
+        for ts_seconds, fill in progress.results
+        if fill is not None
+    ]
+    frames_skipped = frame_count - len(timeline)
 
+    if frame_count == 0:
+        raise RuntimeError("No frames extracted from bookmark video")
     if not timeline:
         raise RuntimeError(
-            f"All {len(frames)} frames failed inference — no fill data to summarize"
+            f"All {frame_count} frames failed inference — no fill data to summarize"
         )
 
     inference_elapsed = time.monotonic() - started_at
     logger.info(
         "Bookmark analysis inference loop done",
         analysis_id=str(analysis_id),
+        frame_count=frame_count,
+        resumed_frames=resumed_frames,
+        sampling_fps=sampling_fps,
         frames_analyzed=len(timeline),
         frames_skipped=frames_skipped,
         inference_elapsed_seconds=round(inference_elapsed, 2),
+        inference_window=window.size,
     )
 
     # Step 4: aggregate.
@@ -320,19 +417,19 @@ def _extract_fill_percentage(model_id: str, result: dict[str, Any]) -> float | N
 # ---------------------------------------------------------------------------
 
 
-def _extract_frames_list(
-    video_path: Path, fps: float
-) -> list[tuple[float, bytes]]:
-    """Materialize all sampled frames as (timestamp_seconds, jpeg_bytes).
+def _extract_frames(
+    video_path: Path,
+    fps: float,
+    after_seconds: float | None = None,
+) -> Iterator[tuple[float, bytes]]:
+    """Yield ``(timestamp_seconds, jpeg_bytes)`` at approximately ``fps``.
 
-    Intentionally NOT a generator: we run this inside ``asyncio.to_thread``
-    and need to return a complete result to the event loop.
+    Every frame is ``grab()``bed to advance the stream, but only sampled
+    frames are ``retrieve()``d — skipped frames never pay for the
+    conversion to a BGR array or the JPEG encode. Samples at or before
+    ``after_seconds`` (already processed by an earlier attempt) are
+    skipped the same way, keeping the sampling grid unchanged.
     """
-    return list(_extract_frames(video_path, fps))
-
-
-def _extract_frames(video_path: Path, fps: float) -> Iterator[tuple[float, bytes]]:
-    """Yield ``(timestamp_seconds, jpeg_bytes)`` at approximately ``fps``."""
     cap = cv2.VideoCapture(str(video_path))
     try:
         if not cap.isOpened():
@@ -349,21 +446,168 @@ def _extract_frames(video_path: Path, fps: float) -> Iterator[tuple[float, bytes
         frame_interval = source_fps / fps  # source frames per sample
         next_sample_at = 0.0
         frame_idx = 0
-        while True:
-            ok, frame = cap.read()
-            if not ok:
-                break
+        while cap.grab():
             if frame_idx >= next_sample_at:
                 ts = frame_idx / source_fps
-                encoded_ok, buf = cv2.imencode(".jpg", frame)
-                if encoded_ok:
-                    yield ts, bytes(buf)
+                done = after_seconds is not None and ts <= after_seconds
+                ok, frame = (False, None) if done else cap.retrieve()
+                if ok:
+                    encoded_ok, buf = cv2.imencode(".jpg", frame)
+                    if encoded_ok:
+                        yield ts, buf.tobytes()
                 next_sample_at += frame_interval
             frame_idx += 1
     finally:
         cap.release()
 
 
+def _video_duration(video_path: Path) -> float | None:
+    """Clip length from the container header, or None if not reported."""
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        source_fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        frames = cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0.0
+        if source_fps <= 0 or frames <= 0:
+            return None
+        return frames / source_fps
+    finally:
+        cap.release()
+
+
+_END = object()
+
+
+@asynccontextmanager
+async def _stream_frames(
+    video_path: Path,
+    fps: float,
+    maxsize: int = FRAME_QUEUE_SIZE,
+    after_seconds: float | None = None,
+) -> AsyncIterator[AsyncIterator[tuple[float, bytes]]]:
+    """Run ``_extract_frames`` in a thread, handing samples over a bounded queue.
+
+    The decoder blocks while ``maxsize`` samples are waiting, so decode
+    never runs more than a queue's length ahead of inference. Leaving
+    the context early stops and joins the decode thread; a decode error
+    is raised from the iterator.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    slots = threading.Semaphore(maxsize)
+    stop = threading.Event()
+
+    def put(item: Any) -> None:
+        # Blocks the decode thread while ``maxsize`` samples are queued;
+        # gives up once the consumer has gone away.
+        while not stop.is_set():
+            if slots.acquire(timeout=0.5):
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+                return
+
+    def produce() -> None:
+        try:
+            for sample in _extract_frames(video_path, fps, after_seconds):
+                if stop.is_set():
+                    return
+                put(sample)
+        except Exception as e:
+            put(e)
+        else:
+            put(_END)
+
+    async def consume() -> AsyncIterator[tuple[float, bytes]]:
+        while True:
+            item = await queue.get()
+            slots.release()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    producer = asyncio.create_task(asyncio.to_thread(produce))
+    try:
+        yield consume()
+    finally:
+        stop.set()
+        await producer
+
+
+# ---------------------------------------------------------------------------
+# Concurrent inference.
+# ---------------------------------------------------------------------------
+
+
+class _InferenceWindow:
+    """How many frames of one analysis may be in flight at the runtime.
+
+    Additive increase, multiplicative decrease on the runtime's capacity
+    signal: grow by one per response while nothing is queued on the
+    runtime and the GPU is under TARGET_GPU_UTILIZATION, halve whenever
+    requests are queueing. Live cameras only trim their pacing gain a
+    step per signal, so under contention bookmark work gives way first.
+    Runtimes that send no signal get the full ``limit``.
+    """
+
+    def __init__(self, limit: int, initial: int = 1) -> None:
+        self.limit = limit
+        self.size = min(initial, limit)
+
+    def record(self, capacity: RuntimeCapacity | None) -> None:
+        if capacity is not None and capacity.queue_depth > 0:
+            self.size = max(1, self.size // 2)
+        elif (
+            capacity is None
+            or capacity.utilization is None
+            or capacity.utilization < TARGET_GPU_UTILIZATION
+        ):
+            self.size = min(self.limit, self.size + 1)
+
+
+_T = TypeVar("_T")
+
+
+async def _infer_in_window(
+    frames: AsyncIterator[tuple[float, bytes]],
+    infer: Callable[[bytes], Awaitable[_T]],
+    window: _InferenceWindow,
+    progress: AnalysisProgress | None = None,
+) -> list[tuple[float, _T]]:
+    """Run ``infer`` on each frame with up to ``window.size`` in flight.
+
+    Results arrive in completion order and are recorded in ``progress``,
+    which keeps them in timestamp order; its results are returned. The
+    first error cancels the frames still in flight and is raised.
+    """
+    progress = progress if progress is not None else AnalysisProgress()
+    in_flight: set[asyncio.Task] = set()
+
+    async def run(ts_seconds: float, jpeg_bytes: bytes) -> None:
+        progress.finished(ts_seconds, await infer(jpeg_bytes))
+
+    async def wait_for_slot(limit: int) -> None:
+        nonlocal in_flight
+        while len(in_flight) > limit:
+            done, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+
+    try:
+        async for ts_seconds, jpeg_bytes in frames:
+            await wait_for_slot(window.size - 1)
+            progress.submitted(ts_seconds)
+            in_flight.add(asyncio.create_task(run(ts_seconds, jpeg_bytes)))
+        await wait_for_slot(0)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+    return progress.results
+
+
 # ---------------------------------------------------------------------------
 # Aggregation helpers.
 # ---------------------------------------------------------------------------
@@ -429,33 +673,88 @@ def _compute_stats(
 # ---------------------------------------------------------------------------
 
 
-async def _load(db: AsyncSession, analysis_id: uuid.UUID) -> BookmarkAnalysis | None:
-    return await db.get(BookmarkAnalysis, analysis_id)
+async def _load_owned(
+    db: AsyncSession, job: AnalysisJob
+) -> BookmarkAnalysis | None:
+    """Lock the row if it is still RUNNING under this job's attempt."""
+    result = await db.execute(
+        select(BookmarkAnalysis)
+        .where(
+            BookmarkAnalysis.id == job.id,
+            BookmarkAnalysis.state == BookmarkAnalysisState.RUNNING,
+            BookmarkAnalysis.attempts == job.attempt,
+        )
+        .with_for_update()
+    )
+    analysis = result.scalar_one_or_none()
+    if analysis is None:
+        logger.warning(
+            "Bookmark analysis no longer held by this attempt; result dropped",
+            analysis_id=str(job.id),
+            attempt=job.attempt,
+        )
+    return analysis
+
+
+async def _finalize(
+    factory: async_sessionmaker[AsyncSession],
+    job: AnalysisJob,
+    write: Callable[[AsyncSession, AnalysisJob, Any], Awaitable[None]],
+    value: Any,
+) -> bool:
+    """Persist the terminal state, retrying DB errors; never raises them.
+
+    Returns False if every attempt failed. The row then stays RUNNING and
+    is reclaimed from its checkpoint once the lease lapses.
+    """
+    for attempt in range(1, FINALIZE_ATTEMPTS + 1):
+        try:
+            async with factory() as db:
+                await write(db, job, value)
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to record bookmark analysis result",
+                analysis_id=str(job.id),
+                attempt=attempt,
+                error=str(e),
+            )
+            if attempt < FINALIZE_ATTEMPTS:
+                await asyncio.sleep(FINALIZE_RETRY_SECONDS * attempt)
+    logger.error(
+        "Bookmark analysis result not recorded; row left for reclaim",
+        analysis_id=str(job.id),
+    )
+    return False
 
 
 async def _finalize_completed(
     db: AsyncSession,
-    analysis_id: uuid.UUID,
+    job: AnalysisJob,
     summary: dict[str, Any],
 ) -> None:
-    analysis = await _load(db, analysis_id)
+    analysis = await _load_owned(db, job)
     if analysis is None:
         return
     analysis.state = BookmarkAnalysisState.COMPLETED
     analysis.completed_at = datetime.now(timezone.utc)
     analysis.summary = summary
+    analysis.progress_percent = 100.0
+    analysis.processed_until_seconds = summary["stats"]["duration_seconds"]
+    analysis.checkpoint = None
     await db.commit()
 
 
 async def _finalize_failed(
     db: AsyncSession,
-    analysis_id: uuid.UUID,
+    job: AnalysisJob,
     error_message: str,
 ) -> None:
-    analysis = await _load(db, analysis_id)
+    analysis = await _load_owned(db, job)
     if analysis is None:
         return
     analysis.state = BookmarkAnalysisState.FAILED
     analysis.completed_at = datetime.now(timezone.utc)
     analysis.error_message = error_message[:2000]
+    analysis.checkpoint = None
     await db.commit()
@@ -0,0 +1,277 @@
+"""Monthly partition maintenance for the `events` table.
+
+`events` is range-partitioned by month on `timestamp` (migration
+partition_events_by_month). Each month lives in its own table named
+`events_pYYYY_MM`, and a DEFAULT partition catches anything outside the
+created range. This module keeps the partition set current:
+
+- Creates partitions for the current month and `months_ahead` months
+  after it, so inserts never land in the DEFAULT partition. A populated
+  DEFAULT partition blocks creating the matching month later.
+- Retires partitions that end before the retention cutoff, either by
+  DETACH, which keeps the rows as a standalone table for archival (the
+  default), or by DROP.
+- Prunes rows older than the cutoff from the DEFAULT partition (late or
+  out-of-range events), at most DEFAULT_PRUNE_BATCH rows per pass. The
+  DEFAULT partition has no month to detach, so this happens in either
+  retention mode.
+
+Retention is off unless configured: events are retained indefinitely by
+default, per the Event model's design decision.
+
+Dropping a month this way is metadata-only. DELETE ... WHERE timestamp <
+cutoff would rewrite, WAL-log and later vacuum every row, which is why it
+is only used, in bounded batches, on the DEFAULT partition.
+
+Usage:
+    maintainer = EventPartitionMaintainer(get_engine)
+    asyncio.create_task(maintainer.start())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import datetime, timezone
+from typing import Callable, Literal, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+RetentionMode = Literal["detach", "drop"]
+
+PARENT_TABLE = "events"
+DEFAULT_PARTITION = "events_default"
+# Rows deleted from the DEFAULT partition per maintenance pass
+DEFAULT_PRUNE_BATCH = 10_000
+_PARTITION_RE = re.compile(r"^events_p(\d{4})_(\d{2})$")
+
+
+class Partition(NamedTuple):
+    """One monthly partition: [start, end) in UTC."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(ts: datetime) -> datetime:
+    """First instant of ts's UTC month."""
+    ts = ts.astimezone(timezone.utc) if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+    return ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months (may be negative)."""
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_for(start: datetime) -> Partition:
+    """The partition covering the month that begins at start."""
+    start = month_start(start)
+    return Partition(
+        f"events_p{start.year:04d}_{start.month:02d}", start, add_months(start, 1)
+    )
+
+
+def parse_partition(name: str) -> Partition | None:
+    """Partition for a child table name, or None if it is not a monthly one."""
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        return None
+    year, month = int(match.group(1)), int(match.group(2))
+    if not 1 <= month <= 12:
+        return None
+    return partition_for(datetime(year, month, 1, tzinfo=timezone.utc))
+
+
+def partitions_to_create(now: datetime, months_ahead: int) -> list[Partition]:
+    """Partitions for the current month and the next months_ahead."""
+    current = month_start(now)
+    return [partition_for(add_months(current, i)) for i in range(months_ahead + 1)]
+
+
+def retention_cutoff(now: datetime, retention_months: int) -> datetime | None:
+    """Start of the oldest retained month, or None if retention is off."""
+    if retention_months <= 0:
+        return None
+    return add_months(month_start(now), -retention_months)
+
+
+def partitions_to_retire(
+    existing: list[str],
+    now: datetime,
+    retention_months: int,
+) -> list[Partition]:
+    """Monthly partitions whose whole range is older than the retention window.
+
+    Args:
+        existing: Names of the current child tables of `events`
+        now: Current time
+        retention_months: Complete months to keep before the current one;
+            0 disables retention
+
+    Returns:
+        Partitions to retire, oldest first
+    """
+    cutoff = retention_cutoff(now, retention_months)
+    if cutoff is None:
+        return []
+    expired = [
+        p for p in map(parse_partition, existing) if p is not None and p.end <= cutoff
+    ]
+    return sorted(expired, key=lambda p: p.start)
+
+
+def create_partition_sql(partition: Partition) -> str:
+    """DDL creating a monthly partition if it does not exist yet."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+        f"TO ('{partition.end.isoformat()}')"
+    )
+
+
+def retire_partition_sql(partition: Partition, mode: RetentionMode) -> str:
+    """DDL detaching or dropping a monthly partition."""
+    if mode == "drop":
+        return f"DROP TABLE IF EXISTS {partition.name}"
+    return f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"
+
+
+def prune_default_sql() -> str:
+    """DELETE of at most :batch DEFAULT-partition rows older than :cutoff."""
+    return (
+        f"DELETE FROM {DEFAULT_PARTITION} WHERE ctid = ANY(ARRAY("
+        f"SELECT ctid FROM {DEFAULT_PARTITION} "
+        'WHERE "timestamp" < :cutoff LIMIT :batch))'
+    )
+
+
+async def list_partitions(conn: AsyncConnection) -> list[str]:
+    """Names of the current child tables of `events`."""
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def maintain_partitions(
+    conn: AsyncConnection,
+    now: datetime | None = None,
+    months_ahead: int = 3,
+    retention_months: int = 0,
+    retention_mode: RetentionMode = "detach",
+    prune_batch: int = DEFAULT_PRUNE_BATCH,
+) -> tuple[list[str], list[str], int]:
+    """Create upcoming partitions, retire expired ones and prune DEFAULT.
+
+    Args:
+        conn: Connection inside a transaction
+        now: Current time (default: now)
+        months_ahead: Months after the current one to create in advance
+        retention_months: Complete months to keep; 0 keeps everything
+        retention_mode: "detach" keeps retired months as standalone tables,
+            "drop" deletes them
+        prune_batch: Most expired rows deleted from the DEFAULT partition
+
+    Returns:
+        Tuple of (partitions created, partitions retired, DEFAULT rows pruned)
+    """
+    now = now or datetime.now(timezone.utc)
+    existing = await list_partitions(conn)
+
+    created = []
+    for partition in partitions_to_create(now, months_ahead):
+        if partition.name not in existing:
+            await conn.execute(text(create_partition_sql(partition)))
+            created.append(partition.name)
+
+    retired = []
+    for partition in partitions_to_retire(existing, now, retention_months):
+        await conn.execute(text(retire_partition_sql(partition, retention_mode)))
+        retired.append(partition.name)
+
+    pruned = 0
+    cutoff = retention_cutoff(now, retention_months)
+    if cutoff is not None and DEFAULT_PARTITION in existing:
+        result = await conn.execute(
+            text(prune_default_sql()), {"cutoff": cutoff, "batch": prune_batch}
+        )
+        pruned = result.rowcount
+
+    return created, retired, pruned
+
+
+class EventPartitionMaintainer:
+    """Background task running maintain_partitions at startup and periodically."""
+
+    def __init__(self, engine_provider: Callable[[], AsyncEngine | None]) -> None:
+        self._engine_provider = engine_provider
+        self._settings = get_settings()
+        self._running = False
+        self._wake = asyncio.Event()
+
+    async def start(self) -> None:
+        """Run maintenance until stopped. Safe to launch as a fire-and-forget task."""
+        if self._running:
+            return
+        self._running = True
+        interval = self._settings.event_partition_maintenance_interval_seconds
+
+        while self._running:
+            await self.run_once()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                break
+
+        logger.info("Event partition maintainer stopped")
+
+    async def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+
+    async def run_once(self) -> None:
+        """One maintenance pass; errors are logged, never raised."""
+        engine = self._engine_provider()
+        if engine is None:
+            return
+        try:
+            async with engine.begin() as conn:
+                created, retired, pruned = await maintain_partitions(
+                    conn,
+                    months_ahead=self._settings.event_partition_months_ahead,
+                    retention_months=self._settings.event_retention_months,
+                    retention_mode=self._settings.event_retention_mode,
+                )
+        except Exception as e:
+            logger.error(
+                "Event partition maintenance failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return
+
+        if created or retired or pruned:
+            logger.info(
+                "Event partitions maintained",
+                created=created,
+                retired=retired,
+                default_rows_pruned=pruned,
+                retention_mode=self._settings.event_retention_mode,
+            )
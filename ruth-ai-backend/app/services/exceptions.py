@@ -564,3 +564,48 @@ class NoActiveStreamError(EvidenceError):
         )
         self.violation_id = violation_id
         self.device_id = device_id
+
+
+# -----------------------------------------------------------------------------
+# Export Job Exceptions
+# -----------------------------------------------------------------------------
+
+
+class ExportError(ServiceError):
+    """Base exception for export-related errors."""
+
+    pass
+
+
+class ExportJobNotFoundError(ExportError):
+    """Export job does not exist or has expired."""
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(
+            f"Export job not found: {job_id}",
+            details={"job_id": job_id},
+        )
+        self.job_id = job_id
+
+
+class ExportJobNotReadyError(ExportError):
+    """Export job has no downloadable result (yet)."""
+
+    def __init__(self, job_id: str, state: str) -> None:
+        super().__init__(
+            f"Export job {job_id} is not ready (status: {state})",
+            details={"job_id": job_id, "status": state},
+        )
+        self.job_id = job_id
+        self.state = state
+
+
+class ExportQueueFullError(ExportError):
+    """Too many export jobs are already waiting."""
+
+    def __init__(self, queued: int) -> None:
+        super().__init__(
+            "Export queue is full, try again later",
+            details={"queued": queued},
+        )
+        self.queued = queued
@@ -0,0 +1,335 @@
+"""Background export jobs.
+
+Large reports (PDF rendering in particular) can outlast the proxy timeout
+when generated inside POST /analytics/export. Export jobs move that work
+off the request:
+
+    POST /analytics/export/jobs                  submit, returns a job id
+    GET  /analytics/export/jobs/{id}             poll status
+    GET  /analytics/export/jobs/{id}/download    fetch the file (Range-aware)
+
+- A fixed pool of `export_job_workers` tasks drains a bounded queue, so
+  at most that many exports are generated at once. Submissions beyond
+  `export_job_queue_size` waiting jobs are refused with 503.
+- Results are written to `export_job_dir` and kept for
+  `export_job_ttl_seconds` after completion, then removed by a sweeper.
+- Identical requests (same format, time range, scope and options) map to
+  one key. Submitting one while a matching job is queued, running or
+  still downloadable returns that job instead of generating it again.
+
+Job state lives in this process; result files left by a previous process
+are unreachable and are removed at startup.
+
+Usage:
+    manager = ExportJobManager()
+    set_export_job_manager(manager)
+    asyncio.create_task(manager.start())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.database import get_session_factory
+from app.core.logging import get_logger
+from app.schemas.analytics import ExportRequest
+from app.services.exceptions import (
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+    ExportQueueFullError,
+)
+from app.services.export_service import ExportService
+
+logger = get_logger(__name__)
+
+# Longest pause between expiry sweeps
+CLEANUP_INTERVAL_SECONDS = 60.0
+
+_RESULT_PREFIX = "export-"
+
+
+class ExportJobState(str, Enum):
+    """Lifecycle of an export job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ExportJob:
+    """One submitted export and, once finished, where its result is."""
+
+    id: str
+    key: str
+    request: ExportRequest
+    state: ExportJobState = ExportJobState.PENDING
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    expires_at: datetime | None = None
+    filename: str | None = None
+    content_type: str | None = None
+    size_bytes: int | None = None
+    error: str | None = None
+    path: Path | None = None
+
+
+def export_job_key(request: ExportRequest) -> str:
+    """Dedup key: equal for requests that produce the same export.
+
+    Filter lists are order-insensitive, and ignored entirely when the
+    scope is "all", matching how ExportService applies them.
+    """
+    data = request.model_dump(mode="json", by_alias=True)
+    data["time_range"] = {
+        "from": request.time_range.from_.astimezone(timezone.utc).isoformat(),
+        "to": request.time_range.to.astimezone(timezone.utc).isoformat(),
+    }
+    scope = data["scope"]
+    for name in ("camera_ids", "violation_types", "statuses"):
+        scope[name] = [] if scope["all"] else sorted(set(scope[name]))
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ExportJobManager:
+    """Queue, worker pool and result store for export jobs."""
+
+    def __init__(
+        self,
+        storage_dir: str | Path | None = None,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        ttl_seconds: int | None = None,
+        session_factory: Callable[[], async_sessionmaker[AsyncSession] | None] = (
+            get_session_factory
+        ),
+    ) -> None:
+        settings = get_settings()
+        self._dir = Path(storage_dir or settings.export_job_dir)
+        self._workers = workers or settings.export_job_workers
+        self._ttl = timedelta(seconds=ttl_seconds or settings.export_job_ttl_seconds)
+        self._queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=queue_size or settings.export_job_queue_size
+        )
+        self._session_factory = session_factory
+        self._jobs: dict[str, ExportJob] = {}
+        self._by_key: dict[str, str] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    async def start(self) -> None:
+        """Start the workers and the expiry sweeper."""
+        if self._running:
+            return
+        self._running = True
+        self._dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(self._remove_stale_results)
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"export-job-worker-{i}")
+            for i in range(self._workers)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._cleanup_loop(), name="export-job-cleanup")
+        )
+        logger.info(
+            "Export job manager started",
+            workers=self._workers,
+            storage_dir=str(self._dir),
+            ttl_seconds=int(self._ttl.total_seconds()),
+        )
+
+    async def stop(self) -> None:
+        """Cancel workers; running jobs are abandoned and their files removed."""
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Export job manager stopped")
+
+    def submit(self, request: ExportRequest) -> ExportJob:
+        """Queue an export, or return the live job for an identical request.
+
+        Raises:
+            ExportQueueFullError: If export_job_queue_size jobs are waiting
+        """
+        key = export_job_key(request)
+        existing = self._jobs.get(self._by_key.get(key, ""))
+        if existing is not None and existing.state != ExportJobState.FAILED:
+            logger.info(
+                "Export job deduplicated",
+                job_id=existing.id,
+                status=existing.state.value,
+            )
+            return existing
+
+        job = ExportJob(id=uuid.uuid4().hex, key=key, request=request)
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            raise ExportQueueFullError(self._queue.qsize()) from None
+
+        self._jobs[job.id] = job
+        self._by_key[key] = job.id
+        logger.info(
+            "Export job queued",
+            job_id=job.id,
+            format=request.format,
+            queued=self._queue.qsize(),
+        )
+        return job
+
+    def get(self, job_id: str) -> ExportJob:
+        """Look up a job.
+
+        Raises:
+            ExportJobNotFoundError: If unknown or already cleaned up
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ExportJobNotFoundError(job_id)
+        return job
+
+    def get_result(self, job_id: str) -> ExportJob:
+        """Look up a job whose file can be downloaded.
+
+        Raises:
+            ExportJobNotFoundError: If unknown or already cleaned up
+            ExportJobNotReadyError: If the job has not completed successfully
+        """
+        job = self.get(job_id)
+        if job.state != ExportJobState.COMPLETED or job.path is None:
+            raise ExportJobNotReadyError(job_id, job.state.value)
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ExportJob) -> None:
+        """Generate one export into the storage directory."""
+        job.state = ExportJobState.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        partial = self._dir / f"{_RESULT_PREFIX}{job.id}.part"
+
+        try:
+            factory = self._session_factory()
+            if factory is None:
+                raise RuntimeError("Database not initialized")
+
+            async with factory() as session:
+                export = await ExportService(session).export_request(job.request)
+                size_bytes = 0
+                with open(partial, "wb") as f:
+                    async with aclosing(export.chunks) as chunks:
+                        async for chunk in chunks:
+                            await asyncio.to_thread(f.write, chunk)
+                            size_bytes += len(chunk)
+
+            suffix = Path(export.filename).suffix
+            path = self._dir / f"{_RESULT_PREFIX}{job.id}{suffix}"
+            os.replace(partial, path)
+        except asyncio.CancelledError:
+            partial.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            partial.unlink(missing_ok=True)
+            job.state = ExportJobState.FAILED
+            job.error = str(e)
+            job.completed_at = datetime.now(timezone.utc)
+            job.expires_at = job.completed_at + self._ttl
+            logger.error(
+                "Export job failed",
+                job_id=job.id,
+                format=job.request.format,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return
+
+        job.state = ExportJobState.COMPLETED
+        job.path = path
+        job.filename = export.filename
+        job.content_type = export.content_type
+        job.size_bytes = size_bytes
+        job.completed_at = datetime.now(timezone.utc)
+        job.expires_at = job.completed_at + self._ttl
+        logger.info(
+            "Export job completed",
+            job_id=job.id,
+            format=job.request.format,
+            size_bytes=size_bytes,
+            duration_ms=int(
+                (job.completed_at - job.started_at).total_seconds() * 1000
+            ),
+        )
+
+    async def _cleanup_loop(self) -> None:
+        interval = min(CLEANUP_INTERVAL_SECONDS, self._ttl.total_seconds())
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.remove_expired()
+            except Exception as e:
+                logger.error("Export job cleanup failed", error=str(e))
+
+    async def remove_expired(self, now: datetime | None = None) -> list[str]:
+        """Forget expired jobs and delete their files. Returns their ids."""
+        now = now or datetime.now(timezone.utc)
+        expired = [
+            job
+            for job in self._jobs.values()
+            if job.expires_at is not None and job.expires_at <= now
+        ]
+        for job in expired:
+            if job.path is not None:
+                await asyncio.to_thread(job.path.unlink, missing_ok=True)
+            del self._jobs[job.id]
+            if self._by_key.get(job.key) == job.id:
+                del self._by_key[job.key]
+
+        if expired:
+            logger.info("Expired export jobs removed", count=len(expired))
+        return [job.id for job in expired]
+
+    def _remove_stale_results(self) -> None:
+        for path in self._dir.glob(f"{_RESULT_PREFIX}*"):
+            path.unlink(missing_ok=True)
+
+
+# Global instance (initialized on startup)
+_export_job_manager: ExportJobManager | None = None
+
+
+def get_export_job_manager() -> ExportJobManager | None:
+    """Get the global export job manager instance."""
+    return _export_job_manager
+
+
+def set_export_job_manager(manager: ExportJobManager | None) -> None:
+    """Set the global export job manager instance."""
+    global _export_job_manager
+    _export_job_manager = manager
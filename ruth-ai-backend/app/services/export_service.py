@@ -2,18 +2,42 @@
 
 Provides CSV, XLSX, and PDF export functionality for violations data.
 Per analytics-design.md Section 7 (Export Data Flow).
+
+Exports are streamed so memory stays flat however many rows match:
+
+- Rows come off a server-side cursor in batches of EXPORT_BATCH_SIZE as
+  plain column tuples, never as a full list of ORM objects.
+- CSV is formatted batch by batch in a worker thread and sent as it is
+  produced.
+- XLSX is written with openpyxl's write-only mode, which spools rows to
+  temporary files, then the finished workbook is streamed from disk.
+  (An XLSX file is a zip archive, so nothing can be sent before the
+  workbook is complete.)
+- PDF only tabulates the first PDF_ROW_LIMIT rows, so it reads just
+  those plus the aggregate counts.
+
+Summary counts (XLSX and PDF) come from the violation rollups rather
+than from counting the streamed rows.
 """
 
+import asyncio
 import csv
+import json
+import os
+import tempfile
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import aclosing
 from datetime import datetime
 from io import BytesIO, StringIO
-from typing import Any
+from typing import Any, NamedTuple
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, letter
+from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (
@@ -24,300 +48,237 @@ from reportlab.platypus import (
     Table,
     TableStyle,
 )
-from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.database import get_session_factory
 from app.core.logging import get_logger
-from app.models import Device, Violation
+from app.models import Violation
+from app.schemas.analytics import ExportRequest
+from app.services.violation_rollups import violation_counts
 
 logger = get_logger(__name__)
 
+# Rows fetched from the server-side cursor and formatted per step
+EXPORT_BATCH_SIZE = 1000
+
+# Read size when streaming a finished file from disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Rows tabulated in the PDF report
+PDF_ROW_LIMIT = 100
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Only the columns exports render; rows are read as tuples, not entities
+EXPORT_COLUMNS = (
+    Violation.id,
+    Violation.type,
+    Violation.camera_name,
+    Violation.status,
+    Violation.confidence,
+    Violation.timestamp,
+    Violation.created_at,
+    Violation.reviewed_by,
+    Violation.reviewed_at,
+    Violation.bounding_boxes,
+    Violation.model_id,
+    Violation.model_version,
+)
 
-class ExportService:
-    """Service for exporting analytics data in various formats."""
-
-    def __init__(self, db: AsyncSession):
-        """Initialize export service.
-
-        Args:
-            db: Database session
-        """
-        self.db = db
-
-    async def export_violations(
-        self,
-        format: str,
-        from_time: datetime,
-        to_time: datetime,
-        camera_ids: list[str] | None = None,
-        violation_types: list[str] | None = None,
-        statuses: list[str] | None = None,
-        include_headers: bool = True,
-        include_timestamps: bool = True,
-        include_raw_confidence: bool = False,
-        include_evidence_urls: bool = False,
-        include_bounding_boxes: bool = False,
-    ) -> tuple[bytes, str, str]:
-        """Export violations data.
-
-        Args:
-            format: Export format (csv, xlsx, pdf)
-            from_time: Start of time range
-            to_time: End of time range
-            camera_ids: Optional camera filter
-            violation_types: Optional violation type filter
-            statuses: Optional status filter
-            include_headers: Include column headers
-            include_timestamps: Include ISO 8601 timestamps
-            include_raw_confidence: Include raw confidence scores
-            include_evidence_urls: Include evidence URLs
-            include_bounding_boxes: Include bounding box coordinates
-
-        Returns:
-            Tuple of (file_bytes, content_type, filename)
-        """
-        # Fetch violations data
-        violations = await self._fetch_violations(
-            from_time,
-            to_time,
-            camera_ids,
-            violation_types,
-            statuses,
-        )
-
-        logger.info(
-            "Exporting violations",
-            format=format,
-            count=len(violations),
-            from_time=from_time.isoformat(),
-            to_time=to_time.isoformat(),
-        )
+XLSX_HEADERS = [
+    "ID",
+    "Type",
+    "Camera",
+    "Status",
+    "Confidence",
+    "Timestamp",
+    "Reviewed By",
+    "Reviewed At",
+]
 
-        # Generate export based on format
-        if format == "csv":
-            return await self._export_csv(
-                violations,
-                from_time,
-                to_time,
-                include_headers,
-                include_timestamps,
-                include_raw_confidence,
-                include_evidence_urls,
-                include_bounding_boxes,
-            )
-        elif format == "xlsx":
-            return await self._export_xlsx(
-                violations,
-                from_time,
-                to_time,
-                include_raw_confidence,
-            )
-        elif format == "pdf":
-            return await self._export_pdf(
-                violations,
-                from_time,
-                to_time,
-            )
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+# Write-only sheets cannot be auto-sized after the fact
+XLSX_COLUMN_WIDTHS = [13, 18, 30, 12, 12, 21, 30, 21]
 
-    async def _fetch_violations(
-        self,
-        from_time: datetime,
-        to_time: datetime,
-        camera_ids: list[str] | None = None,
-        violation_types: list[str] | None = None,
-        statuses: list[str] | None = None,
-    ) -> list[Violation]:
-        """Fetch violations matching filters."""
-        filters = [
-            Violation.timestamp >= from_time,
-            Violation.timestamp < to_time,
-        ]
 
-        if camera_ids:
-            filters.append(Violation.device_id.in_(camera_ids))
+class ExportFile(NamedTuple):
+    """A generated export: body chunks plus download metadata."""
 
-        if violation_types:
-            filters.append(Violation.type.in_(violation_types))
+    chunks: AsyncIterator[bytes]
+    content_type: str
+    filename: str
 
-        if statuses:
-            filters.append(Violation.status.in_(statuses))
 
-        stmt = (
-            select(Violation)
-            .where(and_(*filters))
-            .order_by(Violation.timestamp.desc())
-        )
+class CsvOptions(NamedTuple):
+    """Column selection for CSV exports."""
 
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+    include_timestamps: bool = True
+    include_raw_confidence: bool = False
+    include_evidence_urls: bool = False
+    include_bounding_boxes: bool = False
 
-    async def _export_csv(
-        self,
-        violations: list[Violation],
-        from_time: datetime,
-        to_time: datetime,
-        include_headers: bool,
-        include_timestamps: bool,
-        include_raw_confidence: bool,
-        include_evidence_urls: bool,
-        include_bounding_boxes: bool,
-    ) -> tuple[bytes, str, str]:
-        """Export violations as CSV."""
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Define columns
+    @property
+    def columns(self) -> list[str]:
         columns = ["id", "type", "camera_name", "status"]
 
-        if include_raw_confidence:
+        if self.include_raw_confidence:
             columns.append("confidence_raw")
         else:
             columns.append("confidence_category")
 
-        if include_timestamps:
+        if self.include_timestamps:
             columns.extend(["timestamp", "created_at"])
 
         columns.extend(["reviewed_by", "reviewed_at"])
 
-        if include_evidence_urls:
+        if self.include_evidence_urls:
             columns.extend(["snapshot_url", "bookmark_url"])
 
-        if include_bounding_boxes:
+        if self.include_bounding_boxes:
             columns.append("bounding_boxes")
 
         columns.extend(["model_id", "model_version"])
+        return columns
 
-        # Write header
-        if include_headers:
-            writer.writerow(columns)
 
-        # Write data
-        for v in violations:
-            row = [
-                str(v.id),
-                v.type.value,
-                v.camera_name,
-                v.status.value,
-            ]
+def confidence_category(confidence: float) -> str:
+    """High/Medium/Low label shown instead of the raw score."""
+    if confidence >= 0.8:
+        return "High"
+    if confidence >= 0.6:
+        return "Medium"
+    return "Low"
 
-            # Confidence
-            if include_raw_confidence:
-                row.append(f"{v.confidence:.3f}")
-            else:
-                if v.confidence >= 0.8:
-                    row.append("High")
-                elif v.confidence >= 0.6:
-                    row.append("Medium")
-                else:
-                    row.append("Low")
-
-            # Timestamps
-            if include_timestamps:
-                row.extend([
-                    v.timestamp.isoformat(),
-                    v.created_at.isoformat(),
-                ])
-
-            # Review info
+
+def export_filename(extension: str) -> str:
+    """Download filename for an export generated now."""
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return f"ruth-ai-analytics-{timestamp}.{extension}"
+
+
+def format_csv_rows(rows: Sequence[Any], options: CsvOptions) -> bytes:
+    """Encode a batch of violation rows as CSV lines."""
+    output = StringIO()
+    writer = csv.writer(output)
+
+    for v in rows:
+        row = [
+            str(v.id),
+            v.type.value,
+            v.camera_name,
+            v.status.value,
+        ]
+
+        # Confidence
+        if options.include_raw_confidence:
+            row.append(f"{v.confidence:.3f}")
+        else:
+            row.append(confidence_category(v.confidence))
+
+        # Timestamps
+        if options.include_timestamps:
             row.extend([
-                v.reviewed_by or "",
-                v.reviewed_at.isoformat() if v.reviewed_at else "",
+                v.timestamp.isoformat(),
+                v.created_at.isoformat(),
             ])
 
-            # Evidence URLs (placeholder - would need to construct from evidence table)
-            if include_evidence_urls:
-                row.extend(["", ""])  # TODO: Fetch from evidence table if needed
-
-            # Bounding boxes
-            if include_bounding_boxes:
-                import json
-                row.append(json.dumps(v.bounding_boxes) if v.bounding_boxes else "")
+        # Review info
+        row.extend([
+            v.reviewed_by or "",
+            v.reviewed_at.isoformat() if v.reviewed_at else "",
+        ])
 
-            # Model info
-            row.extend([v.model_id, v.model_version])
+        # Evidence URLs (placeholder - would need to construct from evidence table)
+        if options.include_evidence_urls:
+            row.extend(["", ""])  # TODO: Fetch from evidence table if needed
 
-            writer.writerow(row)
+        # Bounding boxes
+        if options.include_bounding_boxes:
+            row.append(json.dumps(v.bounding_boxes) if v.bounding_boxes else "")
 
-        # Convert to bytes
-        csv_bytes = output.getvalue().encode("utf-8")
+        # Model info
+        row.extend([v.model_id, v.model_version])
 
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        filename = f"ruth-ai-analytics-{timestamp}.csv"
+        writer.writerow(row)
 
-        return csv_bytes, "text/csv", filename
+    return output.getvalue().encode("utf-8")
 
-    async def _export_xlsx(
-        self,
-        violations: list[Violation],
-        from_time: datetime,
-        to_time: datetime,
-        include_raw_confidence: bool,
-    ) -> tuple[bytes, str, str]:
-        """Export violations as XLSX with formatting."""
-        wb = Workbook()
 
-        # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
+def format_csv_header(options: CsvOptions) -> bytes:
+    """Encode the CSV header line."""
+    output = StringIO()
+    csv.writer(output).writerow(options.columns)
+    return output.getvalue().encode("utf-8")
 
-        # Add summary information
-        ws_summary["A1"] = "Analytics Report"
-        ws_summary["A1"].font = Font(size=16, bold=True)
 
-        ws_summary["A3"] = "Time Range:"
-        ws_summary["B3"] = f"{from_time.strftime('%Y-%m-%d %H:%M')} to {to_time.strftime('%Y-%m-%d %H:%M')}"
+class XlsxWriter:
+    """Write-only workbook filled one batch at a time.
 
-        ws_summary["A4"] = "Total Violations:"
-        ws_summary["B4"] = len(violations)
+    Every method is blocking; call them via asyncio.to_thread. openpyxl
+    spools appended rows to temporary files, so memory does not grow
+    with the row count.
+    """
 
-        ws_summary["A5"] = "Generated:"
-        ws_summary["B5"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def __init__(
+        self,
+        from_time: datetime,
+        to_time: datetime,
+        status_counts: Counter[str],
+        include_raw_confidence: bool,
+    ) -> None:
+        self._include_raw_confidence = include_raw_confidence
+        self._workbook = Workbook(write_only=True)
+
+        # Summary Sheet (write-only sheets are filled row by row)
+        ws_summary = self._workbook.create_sheet("Summary")
+        title = WriteOnlyCell(ws_summary, value="Analytics Report")
+        title.font = Font(size=16, bold=True)
+        ws_summary.append([title])
+        ws_summary.append([])
+        ws_summary.append([
+            "Time Range:",
+            f"{from_time.strftime('%Y-%m-%d %H:%M')} to {to_time.strftime('%Y-%m-%d %H:%M')}",
+        ])
+        ws_summary.append(["Total Violations:", sum(status_counts.values())])
+        ws_summary.append(["Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+        ws_summary.append([])
 
         # Status breakdown
-        from collections import Counter
-        status_counts = Counter(v.status.value for v in violations)
-
-        row = 7
-        ws_summary["A7"] = "Status Breakdown:"
-        ws_summary["A7"].font = Font(bold=True)
+        heading = WriteOnlyCell(ws_summary, value="Status Breakdown:")
+        heading.font = Font(bold=True)
+        ws_summary.append([heading])
         for status, count in status_counts.items():
-            row += 1
-            ws_summary[f"A{row}"] = status.title()
-            ws_summary[f"B{row}"] = count
+            ws_summary.append([status.title(), count])
 
         # Violations List Sheet
-        ws_violations = wb.create_sheet("Violations")
+        self._sheet = self._workbook.create_sheet("Violations")
+        for col_num, width in enumerate(XLSX_COLUMN_WIDTHS, 1):
+            self._sheet.column_dimensions[get_column_letter(col_num)].width = width
 
-        # Headers
-        headers = ["ID", "Type", "Camera", "Status", "Confidence", "Timestamp", "Reviewed By", "Reviewed At"]
-        ws_violations.append(headers)
+        # Freeze header row
+        self._sheet.freeze_panes = "A2"
 
-        # Style headers
+        # Styled headers
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_font = Font(color="FFFFFF", bold=True)
-
-        for col_num, header in enumerate(headers, 1):
-            cell = ws_violations.cell(row=1, column=col_num)
+        header_cells = []
+        for header in XLSX_HEADERS:
+            cell = WriteOnlyCell(self._sheet, value=header)
             cell.fill = header_fill
             cell.font = header_font
             cell.alignment = Alignment(horizontal="center", vertical="center")
+            header_cells.append(cell)
+        self._sheet.append(header_cells)
 
-        # Data rows
-        for v in violations:
-            if include_raw_confidence:
+    def append(self, rows: Sequence[Any]) -> None:
+        """Append a batch of violation rows to the Violations sheet."""
+        for v in rows:
+            if self._include_raw_confidence:
                 confidence_display = f"{v.confidence:.3f}"
             else:
-                if v.confidence >= 0.8:
-                    confidence_display = "High"
-                elif v.confidence >= 0.6:
-                    confidence_display = "Medium"
-                else:
-                    confidence_display = "Low"
-
-            ws_violations.append([
+                confidence_display = confidence_category(v.confidence)
+
+            self._sheet.append([
                 str(v.id)[:8] + "...",  # Truncated UUID
                 v.type.value.replace("_", " ").title(),
                 v.camera_name,
@@ -328,150 +289,364 @@ class ExportService:
                 v.reviewed_at.strftime("%Y-%m-%d %H:%M:%S") if v.reviewed_at else "",
             ])
 
-        # Auto-size columns
-        for column in ws_violations.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws_violations.column_dimensions[column_letter].width = adjusted_width
+    def save(self, path: str) -> None:
+        """Write the finished workbook to path. The writer is unusable afterwards."""
+        self._workbook.save(path)
+
+
+def build_pdf(
+    rows: Sequence[Any],
+    from_time: datetime,
+    to_time: datetime,
+    status_counts: Counter[str],
+    type_counts: Counter[str],
+) -> bytes:
+    """Render the PDF report. Blocking; call via asyncio.to_thread."""
+    output = BytesIO()
+    total = sum(status_counts.values())
+
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        output,
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+    )
+
+    # Container for elements
+    elements = []
+    styles = getSampleStyleSheet()
+
+    # Title
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#366092'),
+        spaceAfter=30,
+        alignment=1,  # Center
+    )
+    elements.append(Paragraph("Analytics Report", title_style))
+    elements.append(Spacer(1, 12))
+
+    # Metadata
+    meta_style = styles["Normal"]
+    elements.append(Paragraph(f"<b>Time Range:</b> {from_time.strftime('%Y-%m-%d %H:%M')} to {to_time.strftime('%Y-%m-%d %H:%M')}", meta_style))
+    elements.append(Paragraph(f"<b>Total Violations:</b> {total}", meta_style))
+    elements.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", meta_style))
+    elements.append(Spacer(1, 20))
+
+    # Summary section
+    elements.append(Paragraph("<b>Executive Summary</b>", styles['Heading2']))
+    elements.append(Spacer(1, 12))
+
+    # Status breakdown
+    elements.append(Paragraph("<b>By Status:</b>", styles['Heading3']))
+    for status, count in status_counts.most_common():
+        pct = (count / total * 100) if total else 0
+        elements.append(Paragraph(f"• {status.title()}: {count} ({pct:.1f}%)", meta_style))
+    elements.append(Spacer(1, 12))
+
+    # Type breakdown
+    elements.append(Paragraph("<b>By Type:</b>", styles['Heading3']))
+    for vtype, count in type_counts.most_common():
+        pct = (count / total * 100) if total else 0
+        elements.append(Paragraph(f"• {vtype.replace('_', ' ').title()}: {count} ({pct:.1f}%)", meta_style))
+
+    elements.append(PageBreak())
+
+    # Violations list
+    elements.append(Paragraph("<b>Detailed Violations List</b>", styles['Heading2']))
+    elements.append(Spacer(1, 12))
+
+    # Create table
+    table_data = [
+        ["Type", "Camera", "Status", "Confidence", "Timestamp"]
+    ]
+
+    for v in rows[:PDF_ROW_LIMIT]:
+        table_data.append([
+            v.type.value.replace("_", " ").title(),
+            v.camera_name[:20],  # Truncate long names
+            v.status.value.title(),
+            confidence_category(v.confidence),
+            v.timestamp.strftime("%Y-%m-%d %H:%M"),
+        ])
+
+    # Create table with styling
+    table = Table(table_data, colWidths=[1.5*inch, 1.5*inch, 1*inch, 1*inch, 1.5*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#366092')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ]))
+
+    elements.append(table)
+
+    if total > PDF_ROW_LIMIT:
+        elements.append(Spacer(1, 12))
+        elements.append(Paragraph(f"<i>Note: Showing first {PDF_ROW_LIMIT} of {total} violations</i>", meta_style))
 
-        # Freeze header row
-        ws_violations.freeze_panes = "A2"
+    # Build PDF
+    doc.build(elements)
+    return output.getvalue()
 
-        # Save to BytesIO
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
 
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        filename = f"ruth-ai-analytics-{timestamp}.xlsx"
+class ExportService:
+    """Service for exporting analytics data in various formats."""
 
-        return output.read(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", filename
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_factory: Callable[[], async_sessionmaker[AsyncSession] | None] = (
+            get_session_factory
+        ),
+    ):
+        """Initialize export service.
 
-    async def _export_pdf(
+        Args:
+            db: Database session for the up-front queries
+            session_factory: Provider of the session factory the row stream
+                opens its own session from. The request's session is closed
+                once the endpoint returns, before a streamed body is sent.
+        """
+        self.db = db
+        self._session_factory = session_factory
+
+    async def export_request(self, request: ExportRequest) -> ExportFile:
+        """Export for a POST /analytics/export body, applying its scope and options."""
+        scope = request.scope
+        return await self.export_violations(
+            format=request.format,
+            from_time=request.time_range.from_,
+            to_time=request.time_range.to,
+            camera_ids=None if scope.all else scope.camera_ids or None,
+            violation_types=None if scope.all else scope.violation_types or None,
+            statuses=None if scope.all else scope.statuses or None,
+            include_headers=request.options.include_headers,
+            include_timestamps=request.options.include_timestamps,
+            include_raw_confidence=request.options.include_raw_confidence,
+            include_evidence_urls=request.options.include_evidence_urls,
+            include_bounding_boxes=request.options.include_bounding_boxes,
+        )
+
+    async def export_violations(
         self,
-        violations: list[Violation],
+        format: str,
         from_time: datetime,
         to_time: datetime,
-    ) -> tuple[bytes, str, str]:
-        """Export violations as PDF report."""
-        output = BytesIO()
-
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            output,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18,
+        camera_ids: list[str] | None = None,
+        violation_types: list[str] | None = None,
+        statuses: list[str] | None = None,
+        include_headers: bool = True,
+        include_timestamps: bool = True,
+        include_raw_confidence: bool = False,
+        include_evidence_urls: bool = False,
+        include_bounding_boxes: bool = False,
+    ) -> ExportFile:
+        """Export violations data.
+
+        Nothing is buffered beyond one batch of rows: the returned chunks
+        are produced as the caller consumes them.
+
+        Args:
+            format: Export format (csv, xlsx, pdf)
+            from_time: Start of time range
+            to_time: End of time range
+            camera_ids: Optional camera filter
+            violation_types: Optional violation type filter
+            statuses: Optional status filter
+            include_headers: Include column headers
+            include_timestamps: Include ISO 8601 timestamps
+            include_raw_confidence: Include raw confidence scores
+            include_evidence_urls: Include evidence URLs
+            include_bounding_boxes: Include bounding box coordinates
+
+        Returns:
+            ExportFile with the body chunks, content type and filename
+        """
+        filters = [
+            Violation.timestamp >= from_time,
+            Violation.timestamp < to_time,
+        ]
+
+        if camera_ids:
+            filters.append(Violation.device_id.in_(camera_ids))
+
+        if violation_types:
+            filters.append(Violation.type.in_(violation_types))
+
+        if statuses:
+            filters.append(Violation.status.in_(statuses))
+
+        logger.info(
+            "Exporting violations",
+            format=format,
+            from_time=from_time.isoformat(),
+            to_time=to_time.isoformat(),
         )
 
-        # Container for elements
-        elements = []
-        styles = getSampleStyleSheet()
-
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#366092'),
-            spaceAfter=30,
-            alignment=1,  # Center
+        # Generate export based on format
+        if format == "csv":
+            options = CsvOptions(
+                include_timestamps=include_timestamps,
+                include_raw_confidence=include_raw_confidence,
+                include_evidence_urls=include_evidence_urls,
+                include_bounding_boxes=include_bounding_boxes,
+            )
+            chunks = self._stream_csv(filters, options, include_headers)
+            return ExportFile(
+                self._logged(chunks, format), "text/csv", export_filename("csv")
+            )
+
+        status_counts, type_counts = await self._count_violations(
+            from_time, to_time, camera_ids, violation_types, statuses
         )
-        elements.append(Paragraph("Analytics Report", title_style))
-        elements.append(Spacer(1, 12))
 
-        # Metadata
-        meta_style = styles["Normal"]
-        elements.append(Paragraph(f"<b>Time Range:</b> {from_time.strftime('%Y-%m-%d %H:%M')} to {to_time.strftime('%Y-%m-%d %H:%M')}", meta_style))
-        elements.append(Paragraph(f"<b>Total Violations:</b> {len(violations)}", meta_style))
-        elements.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", meta_style))
-        elements.append(Spacer(1, 20))
+        if format == "xlsx":
+            writer = await asyncio.to_thread(
+                XlsxWriter, from_time, to_time, status_counts, include_raw_confidence
+            )
+            chunks = self._stream_xlsx(filters, writer)
+            return ExportFile(
+                self._logged(chunks, format), XLSX_CONTENT_TYPE, export_filename("xlsx")
+            )
+        elif format == "pdf":
+            rows = await self._fetch_rows(filters, limit=PDF_ROW_LIMIT)
+            pdf_bytes = await asyncio.to_thread(
+                build_pdf, rows, from_time, to_time, status_counts, type_counts
+            )
+            chunks = self._single_chunk(pdf_bytes)
+            return ExportFile(
+                self._logged(chunks, format), "application/pdf", export_filename("pdf")
+            )
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
 
-        # Summary section
-        from collections import Counter
-        status_counts = Counter(v.status.value for v in violations)
-        type_counts = Counter(v.type.value for v in violations)
+    def _rows_stmt(self, filters: list[Any]):
+        return (
+            select(*EXPORT_COLUMNS)
+            .where(and_(*filters))
+            .order_by(Violation.timestamp.desc(), Violation.id.desc())
+        )
 
-        elements.append(Paragraph("<b>Executive Summary</b>", styles['Heading2']))
-        elements.append(Spacer(1, 12))
+    async def _fetch_rows(self, filters: list[Any], limit: int) -> Sequence[Any]:
+        """First rows matching filters, read in one round trip."""
+        result = await self.db.execute(self._rows_stmt(filters).limit(limit))
+        return result.all()
 
-        # Status breakdown
-        elements.append(Paragraph("<b>By Status:</b>", styles['Heading3']))
-        for status, count in status_counts.most_common():
-            pct = (count / len(violations) * 100) if violations else 0
-            elements.append(Paragraph(f"• {status.title()}: {count} ({pct:.1f}%)", meta_style))
-        elements.append(Spacer(1, 12))
+    async def _iter_batches(self, filters: list[Any]) -> AsyncIterator[Sequence[Any]]:
+        """Rows matching filters, EXPORT_BATCH_SIZE at a time, off a server-side cursor.
 
-        # Type breakdown
-        elements.append(Paragraph("<b>By Type:</b>", styles['Heading3']))
-        for vtype, count in type_counts.most_common():
-            pct = (count / len(violations) * 100) if violations else 0
-            elements.append(Paragraph(f"• {vtype.replace('_', ' ').title()}: {count} ({pct:.1f}%)", meta_style))
+        Uses its own session: the request's session is already closed by the
+        time a streamed response body is produced.
+        """
+        factory = self._session_factory()
+        if factory is None:
+            raise RuntimeError("Database not initialized. Call init_database() first.")
 
-        elements.append(PageBreak())
+        stmt = self._rows_stmt(filters).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        async with factory() as session:
+            result = await session.stream(stmt)
+            async for batch in result.partitions():
+                yield batch
 
-        # Violations list
-        elements.append(Paragraph("<b>Detailed Violations List</b>", styles['Heading2']))
-        elements.append(Spacer(1, 12))
+    async def _count_violations(
+        self,
+        from_time: datetime,
+        to_time: datetime,
+        camera_ids: list[str] | None,
+        violation_types: list[str] | None,
+        statuses: list[str] | None,
+    ) -> tuple[Counter[str], Counter[str]]:
+        """Violation counts by status and by type, from the rollups."""
+        # Grouped by status and type only, so daily rollups give the same totals
+        counts = violation_counts(from_time, to_time, finest="day")
+        stmt = select(
+            counts.c.status, counts.c.type, func.sum(counts.c.count)
+        ).group_by(counts.c.status, counts.c.type)
 
-        # Create table
-        table_data = [
-            ["Type", "Camera", "Status", "Confidence", "Timestamp"]
-        ]
+        if camera_ids:
+            stmt = stmt.where(counts.c.device_id.in_(camera_ids))
+        if violation_types:
+            stmt = stmt.where(counts.c.type.in_(violation_types))
+        if statuses:
+            stmt = stmt.where(counts.c.status.in_(statuses))
 
-        for v in violations[:100]:  # Limit to first 100 for PDF
-            if v.confidence >= 0.8:
-                confidence_display = "High"
-            elif v.confidence >= 0.6:
-                confidence_display = "Medium"
-            else:
-                confidence_display = "Low"
+        result = await self.db.execute(stmt)
 
-            table_data.append([
-                v.type.value.replace("_", " ").title(),
-                v.camera_name[:20],  # Truncate long names
-                v.status.value.title(),
-                confidence_display,
-                v.timestamp.strftime("%Y-%m-%d %H:%M"),
-            ])
+        status_counts: Counter[str] = Counter()
+        type_counts: Counter[str] = Counter()
+        for status, vtype, count in result.all():
+            status_counts[status.value] += int(count)
+            type_counts[vtype.value] += int(count)
+        return status_counts, type_counts
 
-        # Create table with styling
-        table = Table(table_data, colWidths=[1.5*inch, 1.5*inch, 1*inch, 1*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#366092')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-
-        elements.append(table)
-
-        if len(violations) > 100:
-            elements.append(Spacer(1, 12))
-            elements.append(Paragraph(f"<i>Note: Showing first 100 of {len(violations)} violations</i>", meta_style))
-
-        # Build PDF
-        doc.build(elements)
-
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        filename = f"ruth-ai-analytics-{timestamp}.pdf"
-
-        return output.getvalue(), "application/pdf", filename
+    async def _stream_csv(
+        self,
+        filters: list[Any],
+        options: CsvOptions,
+        include_headers: bool,
+    ) -> AsyncIterator[bytes]:
+        # Sent with the first batch, so the first chunk proves the query ran
+        header = format_csv_header(options) if include_headers else b""
+        async with aclosing(self._iter_batches(filters)) as batches:
+            async for batch in batches:
+                yield header + await asyncio.to_thread(format_csv_rows, batch, options)
+                header = b""
+        if header:
+            yield header
+
+    async def _stream_xlsx(
+        self,
+        filters: list[Any],
+        writer: XlsxWriter,
+    ) -> AsyncIterator[bytes]:
+        fd, path = tempfile.mkstemp(prefix="ruth-ai-export-", suffix=".xlsx")
+        os.close(fd)
+        try:
+            async with aclosing(self._iter_batches(filters)) as batches:
+                async for batch in batches:
+                    await asyncio.to_thread(writer.append, batch)
+            await asyncio.to_thread(writer.save, path)
+
+            with open(path, "rb") as f:
+                while chunk := await asyncio.to_thread(f.read, STREAM_CHUNK_SIZE):
+                    yield chunk
+        finally:
+            os.unlink(path)
+
+    async def _single_chunk(self, data: bytes) -> AsyncIterator[bytes]:
+        yield data
+
+    async def _logged(
+        self, chunks: AsyncIterator[bytes], format: str
+    ) -> AsyncIterator[bytes]:
+        """Pass chunks through, logging the outcome once the stream ends."""
+        size_bytes = 0
+        try:
+            async for chunk in chunks:
+                size_bytes += len(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(
+                "Export stream failed",
+                format=format,
+                size_bytes=size_bytes,
+                error=str(e),
+            )
+            raise
+        finally:
+            # Releases the cursor session and temp files if the client disconnects
+            await chunks.aclose()
+        logger.info("Export generated", format=format, size_bytes=size_bytes)
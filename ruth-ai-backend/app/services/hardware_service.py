@@ -144,6 +144,15 @@ class HardwareService:
                 )
 
             device = gpu_devices[0]
+
+            # The runtime's NVML sampler keeps recent history in memory;
+            # JSON object keys arrive as strings.
+            telemetry = data.get("gpu_telemetry") or {}
+            device_key = str(device.get("device_id", 0))
+            latest = (telemetry.get("latest") or {}).get(device_key) or {}
+            window = (telemetry.get("window") or {}).get(device_key) or {}
+            utilization_window = window.get("utilization_percent") or {}
+
             total_mb = device.get("total_memory_mb", 0)
             used_mb = device.get("used_memory_mb", 0)
             vram_total_gb = round(total_mb / 1024, 1) if total_mb else None
@@ -158,6 +167,9 @@ class HardwareService:
                 vram_percent=vram_percent,
                 utilization_percent=device.get("utilization_percent"),
                 temperature_c=device.get("temperature_c"),
+                power_w=latest.get("power_w"),
+                utilization_avg_percent=utilization_window.get("avg"),
+                utilization_max_percent=utilization_window.get("max"),
             )
 
         except asyncio.TimeoutError:
@@ -30,6 +30,7 @@ Usage:
 import asyncio
 import base64
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Callable, Dict, Optional
@@ -39,9 +40,11 @@ from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
+from app.core.metrics import record_inference_stages
 from app.models import Device, StreamSession, StreamState, Violation, ViolationStatus
 from app.models.enums import is_known_violation_type, resolve_violation_type
 from app.integrations.unified_runtime.router import RuntimeRouter
+from app.integrations.unified_runtime.schemas import RuntimeCapacity
 from app.integrations.vas import VASClient
 
 logger = get_logger(__name__)
@@ -143,8 +146,9 @@ INFERENCE_CONCURRENCY = int(os.getenv("RUTH_INFERENCE_CONCURRENCY", "2"))
 # back down on the next iteration.
 #
 # This is the quick knob, not the correct fix. The correct fix is to time only
-# the runtime call so this number means what its name says; then this drops
-# back to ~0.85. Tracked as a follow-up.
+# the runtime call so this number means what its name says — which is what the
+# capacity signal below does. This value now only applies to runtimes that
+# don't send it.
 MAX_GPU_UTILIZATION = float(os.getenv("RUTH_INFERENCE_MAX_GPU_UTIL", "2.3"))
 
 # Until a model has been measured, assume the slower of the two known models
@@ -152,21 +156,49 @@ MAX_GPU_UTILIZATION = float(os.getenv("RUTH_INFERENCE_MAX_GPU_UTIL", "2.3"))
 DEFAULT_LATENCY_S = 0.3
 LATENCY_EWMA_ALPHA = 0.3
 
+# Runtime capacity signal (X-Runtime-Capacity header).
+#
+# The runtime reports the service time it measured for each model, how many
+# requests are queued on it, and GPU utilization from its telemetry sampler.
+# With that, the budget divides by real service time against a real ceiling,
+# then nudges a feedback gain toward TARGET_GPU_UTILIZATION: up while the GPU
+# has headroom, down while it is over target or requests are queueing. The
+# same settings then hold on a 3090 and on a CPU-only site, instead of
+# MAX_GPU_UTILIZATION being re-measured per deployment.
+TARGET_GPU_UTILIZATION = float(os.getenv("RUTH_INFERENCE_TARGET_GPU_UTIL", "0.85"))
+# Ignore a signal this old (runtime restarted, or stopped sending it)
+CAPACITY_SIGNAL_TTL_S = 10.0
+# Gain change per signal, per unit of utilization error. Signals arrive once
+# per inference, so this is small: ~10 signals/sec moves the gain at most
+# ~0.1/sec when utilization is 0.2 off target.
+CAPACITY_GAIN_STEP = 0.05
+CAPACITY_GAIN_MIN = 0.25
+CAPACITY_GAIN_MAX = 2.0
+# Utilization error assumed while requests are queued on the runtime
+QUEUE_BACKOFF_ERROR = -0.2
+
 
 class InferenceBudget:
     """Shares finite GPU capacity across the active inference sessions.
 
     Tracks how long each model actually takes and hands out a per-iteration
-    sleep interval that keeps aggregate GPU demand under MAX_GPU_UTILIZATION.
+    sleep interval that keeps aggregate GPU demand under the ceiling.
     Degradation is graceful and automatic: with few cameras everyone gets
     TARGET_FPS, and as cameras are added each one's rate falls until it reaches
     MIN_FPS — a floor, so a saturated system still makes progress on every
     camera rather than starving some completely.
+
+    When the runtime publishes a capacity signal, pacing uses its measured
+    service time and a gain fed back from its utilization and queue depth;
+    otherwise it falls back to round-trip latency against MAX_GPU_UTILIZATION.
     """
 
     def __init__(self) -> None:
         self._active: set = set()
         self._latency_s: Dict[str, float] = {}
+        self._service_s: Dict[str, float] = {}
+        self._gain = 1.0
+        self._capacity_at: Optional[float] = None
 
     def register(self, session_id: UUID) -> None:
         self._active.add(session_id)
@@ -178,6 +210,11 @@ class InferenceBudget:
     def active_count(self) -> int:
         return len(self._active)
 
+    @property
+    def gain(self) -> float:
+        """Feedback correction applied to capacity-signal pacing."""
+        return self._gain
+
     def record_latency(self, model_id: str, seconds: float) -> None:
         """Fold one observed inference duration into the model's EWMA."""
         previous = self._latency_s.get(model_id)
@@ -189,12 +226,48 @@ class InferenceBudget:
                 + (1 - LATENCY_EWMA_ALPHA) * previous
             )
 
+    def record_capacity(
+        self, capacity: RuntimeCapacity, now: Optional[float] = None
+    ) -> None:
+        """Take the runtime's service times and adjust the feedback gain."""
+        for model_id, ms in capacity.service_time_ms.items():
+            if ms > 0:
+                self._service_s[model_id] = ms / 1000.0
+
+        if capacity.queue_depth > 0:
+            error = QUEUE_BACKOFF_ERROR
+        elif capacity.utilization is not None:
+            error = TARGET_GPU_UTILIZATION - capacity.utilization
+        else:
+            # No utilization reading: relax back to the uncorrected estimate
+            error = 1.0 - self._gain
+        self._gain = max(
+            CAPACITY_GAIN_MIN,
+            min(CAPACITY_GAIN_MAX, self._gain + CAPACITY_GAIN_STEP * error),
+        )
+        self._capacity_at = time.monotonic() if now is None else now
+
+    def _service_time_for(self, model_id: str) -> Optional[float]:
+        """Runtime-measured service time, if the signal is fresh."""
+        if self._capacity_at is None:
+            return None
+        if time.monotonic() - self._capacity_at > CAPACITY_SIGNAL_TTL_S:
+            return None
+        return self._service_s.get(model_id)
+
     def latency_for(self, model_id: str) -> float:
         return self._latency_s.get(model_id, DEFAULT_LATENCY_S)
 
     def fps_for(self, model_id: str) -> float:
         """Per-camera fps this model can sustain given current contention."""
         n = max(1, self.active_count)
+
+        service = self._service_time_for(model_id)
+        if service is not None:
+            # Runtime-measured: each inference occupies it for `service`
+            fair_share_fps = self._gain * TARGET_GPU_UTILIZATION / (n * service)
+            return max(MIN_FPS, min(TARGET_FPS, fair_share_fps))
+
         latency = self.latency_for(model_id)
         if latency <= 0:
             return TARGET_FPS
@@ -309,8 +382,9 @@ class InferenceLoopService:
         """Stop the inference loop gracefully."""
         self._running = False
 
-        # Cancel all session tasks
-        for session_id, task in self._session_tasks.items():
+        # Cancel all session tasks. Iterate over a copy: a cancelled task
+        # breaks out of its loop and pops its own entry on the way out.
+        for session_id, task in list(self._session_tasks.items()):
             task.cancel()
             try:
                 await task
@@ -472,7 +546,8 @@ class InferenceLoopService:
                 # Submit inference via runtime router. The semaphore caps how
                 # many inferences are in flight across all sessions; the timing
                 # around it feeds the budget so pacing tracks what the GPU is
-                # actually delivering rather than a number we guessed.
+                # actually delivering rather than a number we guessed, and the
+                # runtime's own capacity signal (when sent) refines it.
                 async with self._gpu_slots:
                     inference_started = asyncio.get_event_loop().time()
                     result = await self._runtime_router.submit_inference(
@@ -489,6 +564,8 @@ class InferenceLoopService:
                         model_id,
                         asyncio.get_event_loop().time() - inference_started,
                     )
+                    if result.get("capacity") is not None:
+                        self._budget.record_capacity(result["capacity"])
 
                 # Check for violations with debouncing
                 if result.get("status") == "success" and result.get("result"):
@@ -556,6 +633,7 @@ class InferenceLoopService:
                                 pass
 
                         if should_create:
+                            persist_started = asyncio.get_event_loop().time()
                             await self._create_violation(
                                 session_id=session_id,
                                 device_id=device_id,
@@ -566,6 +644,15 @@ class InferenceLoopService:
                                 frame_width=result.get("frame_width"),
                                 frame_height=result.get("frame_height"),
                             )
+                            record_inference_stages(model_id, {
+                                "persist_ms": (asyncio.get_event_loop().time() - persist_started) * 1000,
+                            })
+                            logger.debug(
+                                "Violation inference timing",
+                                session_id=str(session_id),
+                                trace_id=result.get("trace_id"),
+                                timing=result.get("timing"),
+                            )
                             state["last_violation_time"] = now
 
                         # Update state
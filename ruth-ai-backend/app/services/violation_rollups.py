@@ -0,0 +1,168 @@
+"""Violation counts for analytics, read from the rollup tables.
+
+Builds one selectable of violation counts per (bucket, device, type,
+status) for an arbitrary [from, to) window, stitched together from:
+
+- daily rollups for whole UTC days inside the window,
+- hourly rollups for whole UTC hours outside those days,
+- the raw `violations` table for the sub-hour edges at each end.
+
+Every part is bounded by the window's shape rather than by history, so
+the analytics endpoints aggregate at most a few hundred rollup rows per
+device plus under two hours of raw rows, however many years of
+violations exist. Callers GROUP BY / SUM over the result exactly as they
+would over `violations`, reading `count` instead of counting rows.
+
+Usage:
+    counts = violation_counts(from_time, to_time, finest="day")
+    stmt = select(counts.c.status, func.sum(counts.c.count)).group_by(counts.c.status)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Literal, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, Integer, Subquery, and_, cast, func, literal, select, union_all
+
+from app.models import Violation, ViolationRollup, ViolationType
+
+Granularity = Literal["hour", "day"]
+
+_STEP = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+
+class Segment(NamedTuple):
+    """A half-open [start, end) slice of the window and where it is read from."""
+
+    source: Literal["raw", "hour", "day"]
+    start: datetime
+    end: datetime
+
+
+def _utc(ts: datetime) -> datetime:
+    # Naive query parameters are taken as UTC
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def floor_bucket(ts: datetime, granularity: Granularity) -> datetime:
+    """Start of the UTC bucket containing ts."""
+    ts = _utc(ts).replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if granularity == "day" else ts
+
+
+def ceil_bucket(ts: datetime, granularity: Granularity) -> datetime:
+    """Start of the first UTC bucket at or after ts."""
+    floor = floor_bucket(ts, granularity)
+    return floor if floor == _utc(ts) else floor + _STEP[granularity]
+
+
+def plan_segments(
+    from_time: datetime,
+    to_time: datetime,
+    finest: Granularity = "hour",
+) -> list[Segment]:
+    """Split [from_time, to_time) into raw, hourly and daily segments.
+
+    Args:
+        from_time: Window start (inclusive)
+        to_time: Window end (exclusive)
+        finest: Smallest bucket the caller groups by. "hour" never uses
+            daily rollups, since those can't be split back into hours.
+
+    Returns:
+        Non-empty, non-overlapping segments covering the window in order
+    """
+    start, end = _utc(from_time), _utc(to_time)
+    if start >= end:
+        return []
+
+    hour_start = min(ceil_bucket(start, "hour"), end)
+    hour_end = max(floor_bucket(end, "hour"), hour_start)
+
+    middle: list[Segment] = []
+    if finest == "day":
+        day_start = ceil_bucket(hour_start, "day")
+        day_end = floor_bucket(hour_end, "day")
+        if day_start < day_end:
+            middle = [
+                Segment("hour", hour_start, day_start),
+                Segment("day", day_start, day_end),
+                Segment("hour", day_end, hour_end),
+            ]
+    if not middle:
+        middle = [Segment("hour", hour_start, hour_end)]
+
+    segments = [Segment("raw", start, hour_start), *middle, Segment("raw", hour_end, end)]
+    return [s for s in segments if s.start < s.end]
+
+
+def violation_counts(
+    from_time: datetime,
+    to_time: datetime,
+    finest: Granularity = "hour",
+    device_id: UUID | str | None = None,
+    violation_type: ViolationType | str | None = None,
+) -> Subquery:
+    """Violation counts for a window as a subquery.
+
+    Columns: bucket (UTC hour or day start), device_id, type, status, count.
+    Raw edge rows are bucketed by hour; group by
+    ``date_trunc(granularity, bucket, 'UTC')`` for coarser series.
+
+    Args:
+        from_time: Window start (inclusive)
+        to_time: Window end (exclusive)
+        finest: Smallest bucket the caller groups by
+        device_id: Only this camera
+        violation_type: Only this violation type
+    """
+    parts = []
+    for segment in plan_segments(from_time, to_time, finest) or [
+        Segment("raw", _utc(from_time), _utc(to_time))
+    ]:
+        if segment.source == "raw":
+            bucket = func.date_trunc(
+                "hour", Violation.timestamp, "UTC", type_=DateTime(timezone=True)
+            )
+            filters = [
+                Violation.timestamp >= segment.start,
+                Violation.timestamp < segment.end,
+            ]
+            if device_id is not None:
+                filters.append(Violation.device_id == device_id)
+            if violation_type is not None:
+                filters.append(Violation.type == violation_type)
+            parts.append(
+                select(
+                    bucket.label("bucket"),
+                    Violation.device_id,
+                    Violation.type,
+                    Violation.status,
+                    cast(func.count(Violation.id), Integer).label("count"),
+                )
+                .where(and_(*filters))
+                .group_by(bucket, Violation.device_id, Violation.type, Violation.status)
+            )
+        else:
+            filters = [
+                ViolationRollup.granularity == literal(segment.source),
+                ViolationRollup.bucket_start >= segment.start,
+                ViolationRollup.bucket_start < segment.end,
+            ]
+            if device_id is not None:
+                filters.append(ViolationRollup.device_id == device_id)
+            if violation_type is not None:
+                filters.append(ViolationRollup.type == violation_type)
+            parts.append(
+                select(
+                    ViolationRollup.bucket_start.label("bucket"),
+                    ViolationRollup.device_id,
+                    ViolationRollup.type,
+                    ViolationRollup.status,
+                    ViolationRollup.count,
+                ).where(and_(*filters))
+            )
+
+    return union_all(*parts).subquery("violation_counts")
@@ -0,0 +1 @@
+"""Offline benchmarks and simulators for Ruth AI Backend (not shipped in the wheel)."""
@@ -0,0 +1,207 @@
+"""Device analytics query-count benchmark.
+
+Runs GET /analytics/devices/status against a recording session that
+answers each statement from an in-memory fleet, and compares it with the
+previous implementation (one SELECT of full violation rows per device),
+reproduced here. Reports statements issued and rows returned as the fleet
+grows: the grouped query stays at a constant statement count and returns
+at most devices x statuses x types rows, whatever the violation volume.
+
+Usage:
+    python -m benchmarks.analytics_queries
+    python -m benchmarks.analytics_queries --devices 10 100 500 --violations 200
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from sqlalchemy import and_, func, select
+
+from app.api.v1.analytics import get_devices_status
+from app.models import (
+    Device,
+    StreamSession,
+    StreamState,
+    Violation,
+    ViolationStatus,
+    ViolationType,
+)
+
+
+class RecordingResult:
+    """Minimal AsyncSession result over canned rows."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self) -> "RecordingResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def one(self) -> Any:
+        return self._rows[0]
+
+    def scalar(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+
+class RecordingSession:
+    """Answers the analytics statements from an in-memory fleet and counts them."""
+
+    def __init__(self, devices: list[Any], violations: list[Any]) -> None:
+        self.devices = devices
+        self.violations = violations
+        self.statements = 0
+        self.rows = 0
+
+    async def execute(self, stmt: Any) -> RecordingResult:
+        self.statements += 1
+        rows = self._answer(stmt)
+        self.rows += len(rows)
+        return RecordingResult(rows)
+
+    def _answer(self, stmt: Any) -> list[Any]:
+        names = [c["name"] for c in stmt.column_descriptions]
+        entity = stmt.column_descriptions[0].get("entity")
+        params = stmt.compile().params
+        start, end = params.get("timestamp_1"), params.get("timestamp_2")
+
+        def in_range(v: Any) -> bool:
+            return start is None or start <= v.timestamp < end
+
+        if names == ["Device"]:
+            return self.devices
+        if names == ["Violation"] and entity is Violation:
+            device_id = params["device_id_1"]
+            return [v for v in self.violations if v.device_id == device_id and in_range(v)]
+        if "confidence_sum" in names:
+            return self._grouped([v for v in self.violations if in_range(v)])
+        if "total_cameras" in names:
+            return [SimpleNamespace(total_cameras=len(self.devices), active_cameras=0)]
+        return [0]
+
+    def _grouped(self, violations: list[Any]) -> list[Any]:
+        names = {d.id: d.name for d in self.devices}
+        groups: dict = defaultdict(lambda: [0, 0.0, None])
+        for v in violations:
+            group = groups[(v.device_id, v.status, v.type)]
+            group[0] += 1
+            group[1] += v.confidence
+            group[2] = v.timestamp if group[2] is None else max(group[2], v.timestamp)
+        return [
+            SimpleNamespace(
+                id=device_id,
+                name=names[device_id],
+                status=status,
+                type=vtype,
+                count=count,
+                confidence_sum=confidence_sum,
+                last_at=last_at,
+            )
+            for (device_id, status, vtype), (count, confidence_sum, last_at) in groups.items()
+        ]
+
+
+async def legacy_devices_status(db: Any, from_time: datetime, to_time: datetime) -> int:
+    """The previous per-device loop, for comparison (returns device count)."""
+    devices = (await db.execute(select(Device).where(Device.is_active.is_(True)))).scalars().all()
+    reported = 0
+    for device in devices:
+        stmt = select(Violation).where(
+            and_(
+                Violation.device_id == device.id,
+                Violation.timestamp >= from_time,
+                Violation.timestamp < to_time,
+            )
+        )
+        violations = (await db.execute(stmt)).scalars().all()
+        if not violations:
+            continue
+        by_status: dict = {}
+        by_type: dict = {}
+        for v in violations:
+            by_status[v.status.value] = by_status.get(v.status.value, 0) + 1
+            by_type[v.type.value] = by_type.get(v.type.value, 0) + 1
+        sum(v.confidence for v in violations) / len(violations)
+        max(v.timestamp for v in violations)
+        reported += 1
+    await db.execute(
+        select(func.count(func.distinct(StreamSession.device_id))).where(
+            StreamSession.state == StreamState.LIVE
+        )
+    )
+    return reported
+
+
+def build_fleet(devices: int, violations_per_device: int, seed: int = 7) -> tuple:
+    """Devices and violations spread over the last 24 hours."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    fleet = [SimpleNamespace(id=uuid.uuid4(), name=f"Camera {i}") for i in range(devices)]
+    rows = [
+        SimpleNamespace(
+            device_id=device.id,
+            status=rng.choice(list(ViolationStatus)),
+            type=rng.choice(list(ViolationType)),
+            confidence=rng.uniform(0.5, 1.0),
+            timestamp=now - timedelta(seconds=rng.uniform(0, 86_000)),
+        )
+        for device in fleet
+        for _ in range(violations_per_device)
+    ]
+    return fleet, rows
+
+
+async def run(device_counts: list[int], violations_per_device: int) -> list[dict]:
+    """Statements issued and rows returned for both implementations per fleet size."""
+    results = []
+    for count in device_counts:
+        fleet, rows = build_fleet(count, violations_per_device)
+        to_time = datetime.now(timezone.utc)
+        from_time = to_time - timedelta(hours=24)
+
+        for name, call in (
+            ("legacy", lambda db, start, end: legacy_devices_status(db, start, end)),
+            (
+                "grouped",
+                lambda db, start, end: get_devices_status(db, from_time=start, to_time=end),
+            ),
+        ):
+            db = RecordingSession(fleet, rows)
+            await call(db, from_time, to_time)
+            results.append({
+                "devices": count,
+                "implementation": name,
+                "statements": db.statements,
+                "rows": db.rows,
+            })
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Print statements and rows per fleet size."""
+    parser = argparse.ArgumentParser(description="Device analytics query-count benchmark")
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--violations", type=int, default=100, help="Violations per device")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.devices, args.violations))
+    print(f"{'devices':>8}  {'implementation':<14}{'statements':>11}{'rows':>9}")
+    for r in results:
+        print(
+            f"{r['devices']:>8}  {r['implementation']:<14}{r['statements']:>11}{r['rows']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,472 @@
+"""Inference loop simulator.
+
+Runs the real InferenceLoopService, InferenceBudget and RuntimeRouter against
+in-process fakes, so scheduler changes can be measured at 50 or 200 cameras
+on a laptop:
+
+- FakeVAS: a per-stream frame tap producing frames at a fixed fps, served
+  with configurable fetch latency (what GET /frame/latest does)
+- FakeRuntimeClient: a configurable latency distribution (lognormal around a
+  median) behind a fixed number of GPU slots, like the unified runtime
+- FakeDatabase: an in-memory session factory that counts writes
+
+Reported:
+- per-camera achieved fps (min / p50 / mean / max)
+- staleness: age of the frame when its result is available (p50 / p95 / p99)
+- scheduling fairness: Jain's index over per-camera fps, min/max ratio,
+  cameras that got no inference at all
+- DB write rate, GPU utilisation, and what the budget thinks it scheduled
+
+The budget's tunables are read from the environment at import time
+(RUTH_INFERENCE_TARGET_FPS, RUTH_INFERENCE_MIN_FPS,
+RUTH_INFERENCE_MAX_GPU_UTIL), so set them on the command line to try values.
+
+Usage:
+    python -m benchmarks.inference_loop_sim --cameras 50 --duration 30
+    python -m benchmarks.inference_loop_sim --cameras 200 --gpu-slots 1 \\
+        --runtime-latency-ms 90 --output sim.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import math
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Optional
+from uuid import UUID, uuid4
+
+import structlog
+from PIL import Image
+
+from app.integrations.unified_runtime.router import RuntimeRouter
+from app.integrations.unified_runtime.schemas import UnifiedInferenceResponse
+from app.models import StreamSession, Violation
+from app.services.inference_loop import InferenceLoopService
+
+
+@dataclass
+class SimulationConfig:
+    """Knobs for one simulation run."""
+
+    cameras: int = 50
+    duration_s: float = 30.0
+    warmup_s: float = 5.0
+    model_id: str = "fall_detection"
+    frame_width: int = 1280
+    frame_height: int = 720
+
+    # VAS frame tap
+    tap_fps: float = 2.0
+    vas_latency_ms: float = 15.0
+    vas_jitter_ms: float = 5.0
+
+    # Runtime: median GPU time per inference, lognormal spread, GPU slots
+    runtime_latency_ms: float = 85.0
+    runtime_latency_sigma: float = 0.25
+    runtime_overhead_ms: float = 10.0  # HTTP + decode outside the GPU slot
+    gpu_slots: int = 1
+
+    # Backend in-flight cap (None = InferenceLoopService default)
+    backend_concurrency: Optional[int] = None
+
+    violation_rate: float = 0.02
+    seed: int = 0
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+class Recorder:
+    """Collects per-camera samples inside the measurement window."""
+
+    def __init__(self, window_start: float, window_end: float) -> None:
+        self.window_start = window_start
+        self.window_end = window_end
+        self.inferences: dict[str, int] = {}
+        self.staleness_ms: dict[str, list[float]] = {}
+        self.db_writes: dict[str, int] = {}
+        self.gpu_busy_s = 0.0
+
+    def in_window(self, now: float) -> bool:
+        return self.window_start <= now < self.window_end
+
+    def inference(self, stream_id: str, staleness_s: float) -> None:
+        if not self.in_window(time.monotonic()):
+            return
+        self.inferences[stream_id] = self.inferences.get(stream_id, 0) + 1
+        self.staleness_ms.setdefault(stream_id, []).append(staleness_s * 1000)
+
+    def db_write(self, kind: str) -> None:
+        if self.in_window(time.monotonic()):
+            self.db_writes[kind] = self.db_writes.get(kind, 0) + 1
+
+    def gpu_busy(self, started: float, ended: float) -> None:
+        overlap = min(ended, self.window_end) - max(started, self.window_start)
+        if overlap > 0:
+            self.gpu_busy_s += overlap
+
+
+# =============================================================================
+# Fakes
+# =============================================================================
+
+
+def _jpeg_frame(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (90, 120, 150)).save(
+        buffer, format="JPEG", quality=85
+    )
+    return buffer.getvalue()
+
+
+class FakeVAS:
+    """Frame tap: each stream produces frames at tap_fps with its own phase."""
+
+    def __init__(self, config: SimulationConfig, rng: random.Random) -> None:
+        self._config = config
+        self._rng = rng
+        self._frame = _jpeg_frame(config.frame_width, config.frame_height)
+        self._phase: dict[str, float] = {}
+        self.served_capture_time: dict[str, float] = {}
+
+    def _latest_capture_time(self, stream_id: str, now: float) -> float:
+        period = 1.0 / self._config.tap_fps
+        phase = self._phase.setdefault(stream_id, self._rng.uniform(0, period))
+        return math.floor((now - phase) / period) * period + phase
+
+    async def get_latest_frame(
+        self, stream_id: str, max_age_ms: Optional[int] = None
+    ) -> tuple[bytes, int, int]:
+        delay = self._config.vas_latency_ms + self._rng.uniform(
+            -self._config.vas_jitter_ms, self._config.vas_jitter_ms
+        )
+        await asyncio.sleep(max(0.0, delay) / 1000)
+        self.served_capture_time[stream_id] = self._latest_capture_time(
+            stream_id, time.monotonic()
+        )
+        return self._frame, self._config.frame_width, self._config.frame_height
+
+    async def create_snapshot(self, stream_id: str, request: Any) -> Any:
+        await asyncio.sleep(self._config.vas_latency_ms / 1000)
+        return SimpleNamespace(id=f"snapshot-{uuid4()}")
+
+
+class FakeRuntimeClient:
+    """Unified runtime stand-in with a latency distribution and GPU slots."""
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        rng: random.Random,
+        vas: FakeVAS,
+        recorder: Recorder,
+    ) -> None:
+        self._config = config
+        self._rng = rng
+        self._vas = vas
+        self._recorder = recorder
+        self._gpu = asyncio.Semaphore(config.gpu_slots)
+
+    async def submit_inference(
+        self, model_id: str, frame_base64: str, stream_id: UUID, **kwargs: Any
+    ) -> UnifiedInferenceResponse:
+        await asyncio.sleep(self._config.runtime_overhead_ms / 1000)
+
+        gpu_s = self._rng.lognormvariate(
+            math.log(self._config.runtime_latency_ms / 1000),
+            self._config.runtime_latency_sigma,
+        )
+        async with self._gpu:
+            started = time.monotonic()
+            await asyncio.sleep(gpu_s)
+            ended = time.monotonic()
+        self._recorder.gpu_busy(started, ended)
+
+        key = str(stream_id)
+        self._recorder.inference(key, ended - self._vas.served_capture_time[key])
+
+        violation = self._rng.random() < self._config.violation_rate
+        total_ms = (ended - started) * 1000 + self._config.runtime_overhead_ms
+        return UnifiedInferenceResponse(
+            request_id=uuid4(),
+            status="success",
+            model_id=model_id,
+            model_version="1.0.0",
+            inference_time_ms=total_ms,
+            result={
+                "violation_detected": violation,
+                "confidence": 0.9 if violation else 0.1,
+                "detections": (
+                    [{"zone_id": "zone-1", "in_zone": True, "bbox": [10, 10, 50, 90]}]
+                    if violation
+                    else []
+                ),
+            },
+            timing={"inference_ms": gpu_s * 1000, "total_ms": total_ms},
+        )
+
+
+class FakeResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def scalar_one_or_none(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+
+class FakeSession:
+    """Just enough of AsyncSession for the inference loop."""
+
+    def __init__(self, database: "FakeDatabase") -> None:
+        self._database = database
+        self._pending: list[Any] = []
+
+    async def execute(self, statement: Any) -> FakeResult:
+        if getattr(statement, "is_update", False):
+            self._database.recorder.db_write("session_counter")
+            return FakeResult([])
+        entity = statement.column_descriptions[0].get("entity")
+        if entity is StreamSession:
+            return FakeResult(self._database.sessions)
+        return FakeResult([])
+
+    def add(self, instance: Any) -> None:
+        self._pending.append(instance)
+
+    async def commit(self) -> None:
+        for instance in self._pending:
+            kind = "violation" if isinstance(instance, Violation) else "evidence"
+            self._database.recorder.db_write(kind)
+        self._pending.clear()
+
+    async def refresh(self, instance: Any) -> None:
+        if getattr(instance, "id", None) is None:
+            instance.id = uuid4()
+
+    async def rollback(self) -> None:
+        self._pending.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeDatabase:
+    """In-memory stand-in for the DB session factory."""
+
+    def __init__(self, sessions: list[Any], recorder: Recorder) -> None:
+        self.sessions = sessions
+        self.recorder = recorder
+
+    async def session_factory(self) -> AsyncGenerator[FakeSession, None]:
+        session = FakeSession(self)
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def _stream_sessions(config: SimulationConfig) -> list[Any]:
+    sessions = []
+    for _ in range(config.cameras):
+        device_id = uuid4()
+        sessions.append(
+            SimpleNamespace(
+                id=uuid4(),
+                device_id=device_id,
+                # VAS publishes stream_id == device_id
+                vas_stream_id=str(device_id),
+                model_id=config.model_id,
+                model_version=None,
+                model_config=None,
+                inference_fps=None,
+                confidence_threshold=0.7,
+            )
+        )
+    return sessions
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def jain_fairness(values: list[float]) -> float:
+    """Jain's fairness index: 1.0 when all equal, 1/n when one gets everything."""
+    total = sum(values)
+    squares = sum(v * v for v in values)
+    if not values or squares == 0:
+        return 0.0
+    return round(total * total / (len(values) * squares), 4)
+
+
+async def run_simulation(config: SimulationConfig) -> dict[str, Any]:
+    """Run the inference loop for warmup + duration and return the report."""
+    rng = random.Random(config.seed)
+    started = time.monotonic()
+    recorder = Recorder(
+        window_start=started + config.warmup_s,
+        window_end=started + config.warmup_s + config.duration_s,
+    )
+    vas = FakeVAS(config, rng)
+    runtime = FakeRuntimeClient(config, rng, vas, recorder)
+    sessions = _stream_sessions(config)
+    database = FakeDatabase(sessions, recorder)
+
+    loop = InferenceLoopService(
+        runtime_router=RuntimeRouter(vas, unified_runtime_client=runtime),
+        vas_client=vas,
+        db_session_factory=database.session_factory,
+    )
+    if config.backend_concurrency is not None:
+        loop._gpu_slots = asyncio.Semaphore(config.backend_concurrency)
+
+    await loop.start()
+    try:
+        await asyncio.sleep(config.warmup_s + config.duration_s)
+        budget = loop._budget
+        scheduled_fps = budget.fps_for(config.model_id)
+        latency_ewma_ms = budget.latency_for(config.model_id) * 1000
+    finally:
+        await loop.stop()
+
+    return _report(config, recorder, sessions, scheduled_fps, latency_ewma_ms)
+
+
+def _report(
+    config: SimulationConfig,
+    recorder: Recorder,
+    sessions: list[Any],
+    scheduled_fps: float,
+    latency_ewma_ms: float,
+) -> dict[str, Any]:
+    duration = config.duration_s
+    per_camera_fps = [
+        recorder.inferences.get(s.vas_stream_id, 0) / duration for s in sessions
+    ]
+    staleness = [v for samples in recorder.staleness_ms.values() for v in samples]
+    total_inferences = sum(recorder.inferences.values())
+    total_writes = sum(recorder.db_writes.values())
+
+    return {
+        "config": asdict(config),
+        "aggregate": {
+            "inferences": total_inferences,
+            "throughput_fps": round(total_inferences / duration, 2),
+            "gpu_utilization": round(
+                recorder.gpu_busy_s / (duration * config.gpu_slots), 3
+            ),
+            "db_writes_per_second": round(total_writes / duration, 2),
+            "db_writes": dict(recorder.db_writes),
+        },
+        "per_camera_fps": {
+            "min": round(min(per_camera_fps), 3),
+            "p50": round(statistics.median(per_camera_fps), 3),
+            "mean": round(statistics.fmean(per_camera_fps), 3),
+            "max": round(max(per_camera_fps), 3),
+        },
+        "staleness_ms": {
+            "p50": round(_percentile(staleness, 50), 1),
+            "p95": round(_percentile(staleness, 95), 1),
+            "p99": round(_percentile(staleness, 99), 1),
+            "max": round(max(staleness, default=0.0), 1),
+        },
+        "fairness": {
+            "jain_index": jain_fairness(per_camera_fps),
+            "min_max_ratio": round(
+                min(per_camera_fps) / max(per_camera_fps), 3
+            ) if max(per_camera_fps) else 0.0,
+            "starved_cameras": sum(1 for fps in per_camera_fps if fps == 0),
+        },
+        "budget": {
+            "scheduled_fps": round(scheduled_fps, 3),
+            "latency_ewma_ms": round(latency_ewma_ms, 1),
+        },
+    }
+
+
+def _quiet_logging() -> None:
+    """The loop logs per inference; at 200 cameras that is the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR),
+        cache_logger_on_first_use=False,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run one simulation from the command line."""
+    defaults = SimulationConfig()
+    parser = argparse.ArgumentParser(description="Simulate the backend inference loop")
+    parser.add_argument("--cameras", type=int, default=defaults.cameras)
+    parser.add_argument("--duration", type=float, default=defaults.duration_s)
+    parser.add_argument("--warmup", type=float, default=defaults.warmup_s)
+    parser.add_argument("--tap-fps", type=float, default=defaults.tap_fps)
+    parser.add_argument("--vas-latency-ms", type=float, default=defaults.vas_latency_ms)
+    parser.add_argument(
+        "--runtime-latency-ms", type=float, default=defaults.runtime_latency_ms
+    )
+    parser.add_argument(
+        "--runtime-latency-sigma", type=float, default=defaults.runtime_latency_sigma
+    )
+    parser.add_argument(
+        "--runtime-overhead-ms", type=float, default=defaults.runtime_overhead_ms
+    )
+    parser.add_argument("--gpu-slots", type=int, default=defaults.gpu_slots)
+    parser.add_argument("--backend-concurrency", type=int, default=None)
+    parser.add_argument("--violation-rate", type=float, default=defaults.violation_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    config = SimulationConfig(
+        cameras=args.cameras,
+        duration_s=args.duration,
+        warmup_s=args.warmup,
+        tap_fps=args.tap_fps,
+        vas_latency_ms=args.vas_latency_ms,
+        runtime_latency_ms=args.runtime_latency_ms,
+        runtime_latency_sigma=args.runtime_latency_sigma,
+        runtime_overhead_ms=args.runtime_overhead_ms,
+        gpu_slots=args.gpu_slots,
+        backend_concurrency=args.backend_concurrency,
+        violation_rate=args.violation_rate,
+        seed=args.seed,
+    )
+
+    _quiet_logging()
+    report = asyncio.run(run_simulation(config))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
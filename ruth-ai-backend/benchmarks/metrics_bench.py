@@ -0,0 +1,120 @@
+"""Metrics microbenchmark.
+
+Measures the per-call cost of the metric updates the hot paths make
+(HTTP middleware, inference loop stage timings) against the previous
+design, reproduced here: a registry-wide RLock, label validation and a
+sorted label key per call, and a histogram update that walks every bucket.
+
+Usage:
+    python -m benchmarks.metrics_bench
+    python -m benchmarks.metrics_bench --iterations 500000
+"""
+
+import argparse
+import sys
+import threading
+import timeit
+from collections import defaultdict
+from typing import Callable, Optional
+
+from app.core.metrics import DEFAULT_BUCKETS, MetricsRegistry
+
+
+class LegacyHistogram:
+    """The previous Histogram.observe path, for comparison."""
+
+    def __init__(self, label_names: list[str]) -> None:
+        self.label_names = label_names
+        self.buckets = sorted(DEFAULT_BUCKETS)
+        self._lock = threading.RLock()
+        self._data: dict = {}
+
+    def observe(self, value: float, labels: dict[str, str]) -> None:
+        if set(labels.keys()) != set(self.label_names):
+            raise ValueError("labels")
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = {
+                    "buckets": {b: 0 for b in self.buckets},
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            data = self._data[key]
+            data["sum"] += value
+            data["count"] += 1
+            for bucket in self.buckets:
+                if value <= bucket:
+                    data["buckets"][bucket] += 1
+
+
+class LegacyCounter:
+    """The previous Counter.inc path, for comparison."""
+
+    def __init__(self, label_names: list[str]) -> None:
+        self.label_names = label_names
+        self._lock = threading.RLock()
+        self._values: dict = defaultdict(float)
+
+    def inc(self, value: float, labels: dict[str, str]) -> None:
+        if set(labels.keys()) != set(self.label_names):
+            raise ValueError("labels")
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] += value
+
+
+def _ns_per_call(fn: Callable[[], None], iterations: int) -> float:
+    best = min(timeit.repeat(fn, number=iterations, repeat=5))
+    return best / iterations * 1e9
+
+
+def run(iterations: int) -> dict[str, float]:
+    """Return nanoseconds per call for each scenario."""
+    registry = MetricsRegistry()
+    counter = registry.register_counter("bench_total", "", ["method", "path", "status"])
+    histogram = registry.register_histogram("bench_seconds", "", ["model_id", "stage"])
+    bound_counter = counter.labels(method="GET", path="/api/v1/devices", status="200")
+    bound_histogram = histogram.labels(model_id="fall_detection", stage="inference")
+
+    legacy_counter = LegacyCounter(["method", "path", "status"])
+    legacy_histogram = LegacyHistogram(["model_id", "stage"])
+    counter_labels = {"method": "GET", "path": "/api/v1/devices", "status": "200"}
+    histogram_labels = {"model_id": "fall_detection", "stage": "inference"}
+
+    scenarios = {
+        "counter.inc (legacy)": lambda: legacy_counter.inc(1.0, counter_labels),
+        "counter.labels().inc": lambda: counter.labels(**counter_labels).inc(),
+        "counter bound child .inc": lambda: bound_counter.inc(),
+        "histogram.observe (legacy)": lambda: legacy_histogram.observe(
+            0.083, histogram_labels
+        ),
+        "histogram.labels().observe": lambda: histogram.labels(
+            **histogram_labels
+        ).observe(0.083),
+        "histogram bound child .observe": lambda: bound_histogram.observe(0.083),
+        "scrape (to_prometheus)": lambda: histogram.to_prometheus(),
+    }
+    return {
+        name: round(
+            _ns_per_call(fn, iterations // 100 if "scrape" in name else iterations),
+            1,
+        )
+        for name, fn in scenarios.items()
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Print per-call cost for each scenario."""
+    parser = argparse.ArgumentParser(description="Metrics update microbenchmark")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    width = max(len(name) for name in results)
+    for name, ns in results.items():
+        print(f"{name:<{width}}  {ns:>9.1f} ns/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,7 @@ from app.models import (  # noqa: F401
     Evidence,
     StreamSession,
     Violation,
+    ViolationRollup,
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,84 @@
+"""queue bookmark analyses in Postgres with progress and resumption
+
+Bookmark analyses ran as FastAPI BackgroundTasks inside the request
+process: a restart lost them (rows stayed `running` forever) and nothing
+limited how many decoded at once. `bookmark_analyses` becomes the queue
+itself. Workers claim rows with SELECT ... FOR UPDATE SKIP LOCKED and hold
+them with a heartbeat; a running row whose heartbeat lapses is claimed
+again and resumes from its checkpoint.
+
+New columns:
+- request_key: sha256 of the submitted request, unique among pending and
+  running rows (partial unique index) so duplicate submits share a row
+- attempts, heartbeat_at: claim count and worker lease
+- progress_percent, processed_until_seconds, checkpoint: progress shown
+  to callers, and the per-frame results a resumed run starts from
+
+Existing rows get no request_key (never deduplicated). Rows left running
+by the old BackgroundTasks worker have no heartbeat and are picked up by
+the queue after upgrade.
+
+Revision ID: add_bookmark_analysis_queue
+Revises: partition_events_by_month
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_bookmark_analysis_queue"
+down_revision: Union[str, None] = "partition_events_by_month"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bookmark_analyses", sa.Column("request_key", sa.String(64), nullable=True)
+    )
+    op.add_column(
+        "bookmark_analyses",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "bookmark_analyses",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "bookmark_analyses", sa.Column("progress_percent", sa.Float(), nullable=True)
+    )
+    op.add_column(
+        "bookmark_analyses",
+        sa.Column("processed_until_seconds", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "bookmark_analyses",
+        sa.Column("checkpoint", postgresql.JSONB(), nullable=True),
+    )
+
+    op.create_index(
+        "uq_bookmark_analyses_active_request_key",
+        "bookmark_analyses",
+        ["request_key"],
+        unique=True,
+        postgresql_where=sa.text("state IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_bookmark_analyses_active_request_key", table_name="bookmark_analyses"
+    )
+    for column in (
+        "checkpoint",
+        "processed_until_seconds",
+        "progress_percent",
+        "heartbeat_at",
+        "attempts",
+        "request_key",
+    ):
+        op.drop_column("bookmark_analyses", column)
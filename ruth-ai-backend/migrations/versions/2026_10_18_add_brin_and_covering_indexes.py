@@ -0,0 +1,114 @@
+"""BRIN timestamp index on events, covering indexes for hot raw-table reads
+
+events is append-only at ~2 rows/s per camera, so its physical order
+follows `timestamp` almost exactly. That is the case BRIN is built for:
+one summary per 32 heap pages instead of one B-tree entry per row, so
+the index is a few hundred KB where the B-tree on `timestamp` was
+gigabytes, and inserts only touch it when a new page range starts. It
+replaces ix_events_timestamp for time-range scans; ordered listings
+already use ix_events_timestamp_id (add_keyset_pagination_indexes).
+
+violations gets no BRIN index. Rows are updated on every status
+transition, which scatters the newer tuple versions across the heap, and
+the table is small enough that a B-tree is cheap. Its time-range reads
+are aggregates instead — /analytics/devices/status, the raw edges of
+rollup reads (add_violation_rollups) and minute-level trends — which
+touch only device_id, type, status and confidence. The B-tree on
+(timestamp, id) now INCLUDEs those columns, so the aggregates run as
+index-only scans. The same key still serves keyset pagination, so it
+replaces ix_violations_timestamp_id, and the plain ix_violations_timestamp
+goes away as a strict prefix.
+
+The actionable-events lookup filters one device's events by event_type
+and confidence, newest first. ix_events_device_timestamp_id becomes
+(device_id, timestamp, id) INCLUDE (event_type, confidence), so that
+filter is evaluated on index tuples. Only matching rows are fetched from
+the heap.
+
+Index-only scans depend on the visibility map, so they rely on
+autovacuum keeping up. On events that holds because rows are never
+updated.
+
+Built CONCURRENTLY inside an autocommit block, like the previous
+revision.
+
+Revision ID: add_brin_and_covering_indexes
+Revises: add_keyset_pagination_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_brin_and_covering_indexes"
+down_revision: Union[str, None] = "add_keyset_pagination_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, dialect options)
+NEW_INDEXES = (
+    (
+        "ix_events_timestamp_brin",
+        "events",
+        ("timestamp",),
+        {"postgresql_using": "brin", "postgresql_with": {"pages_per_range": 32}},
+    ),
+    (
+        "ix_violations_timestamp_covering",
+        "violations",
+        ("timestamp", "id"),
+        {"postgresql_include": ["device_id", "type", "status", "confidence"]},
+    ),
+    (
+        "ix_events_device_timestamp_covering",
+        "events",
+        ("device_id", "timestamp", "id"),
+        {"postgresql_include": ["event_type", "confidence"]},
+    ),
+)
+
+# Superseded by the indexes above
+REPLACED_INDEXES = (
+    ("ix_events_timestamp", "events", ("timestamp",), {}),
+    ("ix_violations_timestamp", "violations", ("timestamp",), {}),
+    ("ix_violations_timestamp_id", "violations", ("timestamp", "id"), {}),
+    ("ix_events_device_timestamp_id", "events", ("device_id", "timestamp", "id"), {}),
+)
+
+
+def _create(indexes) -> None:
+    for name, table, columns, options in indexes:
+        op.create_index(
+            name,
+            table,
+            list(columns),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **options,
+        )
+
+
+def _drop(indexes) -> None:
+    for name, table, _, _ in indexes:
+        op.drop_index(
+            name,
+            table_name=table,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        _create(NEW_INDEXES)
+        _drop(REPLACED_INDEXES)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _create(REPLACED_INDEXES)
+        _drop(NEW_INDEXES)
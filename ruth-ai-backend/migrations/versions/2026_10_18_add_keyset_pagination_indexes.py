@@ -0,0 +1,126 @@
+"""index violations and events for keyset pagination on (timestamp, id)
+
+GET /violations and GET /events now page with a cursor on
+(timestamp DESC, id DESC) instead of OFFSET/LIMIT. A page is then a seek
+to the cursor followed by `limit` index entries, but only if an index
+ends in exactly (timestamp, id) after the equality-filtered columns;
+with (status, timestamp) alone Postgres still has to sort every row
+sharing a timestamp and cannot use the row-value comparison as an index
+bound.
+
+One index per filter combination the listings accept (btree indexes
+scan backwards, so ascending order serves the DESC listing):
+
+    violations: (timestamp, id)
+                (status, timestamp, id)
+                (device_id, timestamp, id)
+                (device_id, status, timestamp, id)
+    events:     (timestamp, id)
+                (event_type, timestamp, id)
+                (device_id, timestamp, id)
+                (device_id, event_type, timestamp, id)
+
+The existing (status, timestamp), (device_id, status, timestamp),
+(device_id, timestamp) and (device_id, event_type, timestamp) composites
+are strict prefixes of the new ones and are dropped once those exist, so
+write amplification only grows by the two (timestamp, id) and the
+(event_type, ...) / (device_id, timestamp, id) indexes.
+
+Built CONCURRENTLY so violation and event ingestion is not blocked on
+large tables; that cannot run inside a transaction, hence the
+autocommit block.
+
+Revision ID: add_keyset_pagination_indexes
+Revises: add_violation_rollups
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_keyset_pagination_indexes"
+down_revision: Union[str, None] = "add_violation_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns)
+NEW_INDEXES = (
+    ("ix_violations_timestamp_id", "violations", ("timestamp", "id")),
+    ("ix_violations_status_timestamp_id", "violations", ("status", "timestamp", "id")),
+    (
+        "ix_violations_device_timestamp_id",
+        "violations",
+        ("device_id", "timestamp", "id"),
+    ),
+    (
+        "ix_violations_device_status_timestamp_id",
+        "violations",
+        ("device_id", "status", "timestamp", "id"),
+    ),
+    ("ix_events_timestamp_id", "events", ("timestamp", "id")),
+    ("ix_events_type_timestamp_id", "events", ("event_type", "timestamp", "id")),
+    ("ix_events_device_timestamp_id", "events", ("device_id", "timestamp", "id")),
+    (
+        "ix_events_device_type_timestamp_id",
+        "events",
+        ("device_id", "event_type", "timestamp", "id"),
+    ),
+)
+
+# Superseded by a new index with the same leading columns
+REPLACED_INDEXES = (
+    ("ix_violations_status_timestamp", "violations", ("status", "timestamp")),
+    (
+        "ix_violations_device_status_timestamp",
+        "violations",
+        ("device_id", "status", "timestamp"),
+    ),
+    ("ix_events_device_timestamp", "events", ("device_id", "timestamp")),
+    (
+        "ix_events_device_type_timestamp",
+        "events",
+        ("device_id", "event_type", "timestamp"),
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.create_index(
+                name,
+                table,
+                list(columns),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                list(columns),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in NEW_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,153 @@
+"""add trigger-maintained violation rollups for analytics dashboards
+
+The analytics summary, time series and trends endpoints date_trunc and
+GROUP BY over the raw `violations` table on every dashboard load, so their
+latency grows with history. `violation_rollups` holds counts per
+(granularity, UTC bucket, device, type, status) for hourly and daily
+buckets; dashboards sum a bounded number of these rows instead.
+
+Maintained by triggers on `violations` rather than in ViolationService:
+violations are inserted from the inference loop, the event ingestion API
+and the service, and a trigger is the one place that sees every insert,
+status transition and delete (including device cascades) in the same
+transaction as the change. The update trigger only fires when a column
+that selects the rollup row actually changes.
+
+date_trunc(field, ts, 'UTC') needs Postgres 12+ (deployments run 15).
+
+Backfill: both granularities are aggregated from the existing rows in the
+same transaction that installs the triggers, so no violation is counted
+twice or missed.
+
+Revision ID: add_violation_rollups
+Revises: add_app_settings
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_violation_rollups"
+down_revision: Union[str, None] = "add_app_settings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATE_STATEMENTS = (
+    """
+    CREATE OR REPLACE FUNCTION violation_rollups_apply(
+        v_timestamp timestamptz,
+        v_device_id uuid,
+        v_type violation_type,
+        v_status violation_status,
+        v_delta integer
+    ) RETURNS void AS $$
+    BEGIN
+        INSERT INTO violation_rollups (granularity, bucket_start, device_id, type, status, count)
+        VALUES
+            ('hour', date_trunc('hour', v_timestamp, 'UTC'), v_device_id, v_type, v_status, v_delta),
+            ('day', date_trunc('day', v_timestamp, 'UTC'), v_device_id, v_type, v_status, v_delta)
+        ON CONFLICT (granularity, bucket_start, device_id, type, status)
+        DO UPDATE SET count = violation_rollups.count + EXCLUDED.count;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION violations_rollup_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM violation_rollups_apply(OLD.timestamp, OLD.device_id, OLD.type, OLD.status, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM violation_rollups_apply(NEW.timestamp, NEW.device_id, NEW.type, NEW.status, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER violations_rollup_insert_delete
+        AFTER INSERT OR DELETE ON violations
+        FOR EACH ROW EXECUTE FUNCTION violations_rollup_trigger()
+    """,
+    """
+    CREATE TRIGGER violations_rollup_update
+        AFTER UPDATE OF timestamp, device_id, type, status ON violations
+        FOR EACH ROW
+        WHEN (
+            OLD.timestamp IS DISTINCT FROM NEW.timestamp
+            OR OLD.device_id IS DISTINCT FROM NEW.device_id
+            OR OLD.type IS DISTINCT FROM NEW.type
+            OR OLD.status IS DISTINCT FROM NEW.status
+        )
+        EXECUTE FUNCTION violations_rollup_trigger()
+    """,
+)
+
+
+def upgrade() -> None:
+    """Create violation_rollups, backfill it and install the triggers."""
+    op.create_table(
+        "violation_rollups",
+        sa.Column("granularity", sa.String(8), nullable=False, comment="hour or day"),
+        sa.Column(
+            "bucket_start",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="UTC-aligned start of the bucket",
+        ),
+        sa.Column(
+            "device_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("devices.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "type",
+            postgresql.ENUM(name="violation_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="violation_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "granularity", "bucket_start", "device_id", "type", "status",
+            name="pk_violation_rollups",
+        ),
+    )
+
+    # Lock out writers between the backfill and the triggers going live
+    op.execute("LOCK TABLE violations IN SHARE ROW EXCLUSIVE MODE")
+
+    for granularity in ("hour", "day"):
+        op.execute(
+            f"""
+            INSERT INTO violation_rollups (granularity, bucket_start, device_id, type, status, count)
+            SELECT '{granularity}', date_trunc('{granularity}', timestamp, 'UTC'),
+                   device_id, type, status, count(*)
+            FROM violations
+            GROUP BY 2, device_id, type, status
+            """
+        )
+
+    for statement in CREATE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and table."""
+    op.execute("DROP TRIGGER IF EXISTS violations_rollup_update ON violations")
+    op.execute("DROP TRIGGER IF EXISTS violations_rollup_insert_delete ON violations")
+    op.execute("DROP FUNCTION IF EXISTS violations_rollup_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS violation_rollups_apply("
+        "timestamptz, uuid, violation_type, violation_status, integer)"
+    )
+    op.drop_table("violation_rollups")
@@ -0,0 +1,164 @@
+"""range-partition events by month on timestamp
+
+At 2 fps per camera `events` grows without bound and is never updated,
+so every time-range query, index and VACUUM pass works over the whole
+history. Declarative range partitioning by month turns that into one
+table per month:
+
+- queries filtered on `timestamp` (all listings, analytics and keyset
+  pages) only touch the matching months (partition pruning);
+- VACUUM and index maintenance only ever have real work in the current
+  month, since older partitions are frozen and all-visible;
+- retention becomes DETACH/DROP of whole months — metadata-only —
+  instead of a DELETE that rewrites, WAL-logs and vacuums every row
+  (app.services.event_partitions, off unless EVENT_RETENTION_MONTHS > 0).
+
+Partitions are named events_pYYYY_MM with UTC month bounds. This
+migration creates one per month from the oldest existing event through
+three months ahead; the backend's partition maintainer keeps creating
+them from then on. events_default catches anything outside the created
+range so an insert can never fail for want of a partition.
+
+The primary key becomes (id, timestamp): Postgres requires every unique
+constraint on a partitioned table to contain the partition key. Nothing
+references events.id, so no foreign key has to change. `violations` is
+deliberately NOT partitioned: events.violation_id and evidence.violation_id
+reference violations.id, which would have to become (id, timestamp) too,
+and violations are orders of magnitude fewer than events.
+
+Existing rows are copied into the partitioned table inside this
+migration's transaction. Event ingestion blocks for the duration of the
+copy, which scales with the table size, so run it in a maintenance
+window on large installs.
+
+Revision ID: partition_events_by_month
+Revises: add_brin_and_covering_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_events_by_month"
+down_revision: Union[str, None] = "add_brin_and_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Months after the current one to create up front
+MONTHS_AHEAD = 3
+
+# Every index on events as of add_brin_and_covering_indexes, rebuilt on the
+# new table after the copy: (name, column list and options)
+EVENT_INDEXES = (
+    ("ix_events_device_id", "(device_id)"),
+    ("ix_events_stream_session_id", "(stream_session_id)"),
+    ("ix_events_violation_id", "(violation_id)"),
+    ("ix_events_event_type", "(event_type)"),
+    (
+        "ix_events_timestamp_brin",
+        'USING brin ("timestamp") WITH (pages_per_range = 32)',
+    ),
+    ("ix_events_timestamp_id", '("timestamp", id)'),
+    ("ix_events_type_timestamp_id", '(event_type, "timestamp", id)'),
+    (
+        "ix_events_device_timestamp_covering",
+        '(device_id, "timestamp", id) INCLUDE (event_type, confidence)',
+    ),
+    (
+        "ix_events_device_type_timestamp_id",
+        '(device_id, event_type, "timestamp", id)',
+    ),
+)
+
+FOREIGN_KEYS = """
+    FOREIGN KEY (device_id) REFERENCES devices (id) ON DELETE CASCADE,
+    FOREIGN KEY (stream_session_id) REFERENCES stream_sessions (id) ON DELETE SET NULL,
+    FOREIGN KEY (violation_id) REFERENCES violations (id) ON DELETE SET NULL
+"""
+
+
+def _create_indexes() -> None:
+    for name, definition in EVENT_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON events {definition}")
+
+
+def upgrade() -> None:
+    op.execute("LOCK TABLE events IN EXCLUSIVE MODE")
+    op.execute("ALTER TABLE events RENAME TO events_unpartitioned")
+    op.execute(
+        "ALTER TABLE events_unpartitioned RENAME CONSTRAINT events_pkey "
+        "TO events_unpartitioned_pkey"
+    )
+
+    op.execute(
+        f"""
+        CREATE TABLE events (
+            LIKE events_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY (id, "timestamp"),
+            {FOREIGN_KEYS}
+        ) PARTITION BY RANGE ("timestamp")
+        """
+    )
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    # Month arithmetic on UTC wall-clock timestamps so bounds don't drift
+    # with the session time zone
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start timestamp;
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            SELECT date_trunc(
+                'month', coalesce(min("timestamp"), now()) AT TIME ZONE 'UTC'
+            )
+            INTO month_start
+            FROM events_unpartitioned;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF events FOR VALUES FROM (%L) TO (%L)',
+                    'events_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start AT TIME ZONE 'UTC',
+                    (month_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+
+    op.execute("INSERT INTO events SELECT * FROM events_unpartitioned")
+    op.execute("DROP TABLE events_unpartitioned")
+    _create_indexes()
+    op.execute("ANALYZE events")
+
+
+def downgrade() -> None:
+    op.execute("LOCK TABLE events IN EXCLUSIVE MODE")
+    op.execute("ALTER TABLE events RENAME TO events_partitioned")
+    op.execute(
+        "ALTER TABLE events_partitioned RENAME CONSTRAINT events_pkey "
+        "TO events_partitioned_pkey"
+    )
+
+    op.execute(
+        f"""
+        CREATE TABLE events (
+            LIKE events_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY (id),
+            {FOREIGN_KEYS}
+        )
+        """
+    )
+    op.execute("INSERT INTO events SELECT * FROM events_partitioned")
+    # Drops every attached partition; detached (archived) months are untouched
+    op.execute("DROP TABLE events_partitioned")
+    _create_indexes()
+    op.execute("ANALYZE events")
@@ -0,0 +1,351 @@
+"""Query-plan regression tests for the hot violation and event reads.
+
+Seeds a few hundred thousand rows spread over two months, VACUUM ANALYZEs
+them, then drives the real endpoint handlers through a session that
+EXPLAINs every statement before running it. A plan that falls back to a
+sequential scan of `violations` or `events` fails the test, so an index
+dropped by a migration or a query rewritten so it no longer matches one
+is caught here rather than in production latency.
+
+Tests:
+- Violation and event listings (every filter, first and later pages)
+- Analytics summary, trends and device status
+- Device status aggregate runs as an index-only scan on the covering index
+- Actionable-event lookups and raw time-range scans on events
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.api.v1.analytics import (
+    get_analytics_summary,
+    get_devices_status,
+    get_violations_trends,
+)
+from app.api.v1.events import list_events
+from app.api.v1.violations import list_violations
+from app.core.pagination import encode_cursor
+from app.models import Event, EventType
+from app.services.event_partitions import (
+    add_months,
+    create_partition_sql,
+    month_start,
+    partition_for,
+)
+
+# Tables whose sequential scan is a regression; small lookup tables
+# (devices, stream_sessions) are expected to be scanned. Scans of an events
+# partition (events_pYYYY_MM, events_default) count as scans of events.
+HOT_TABLES = {"violations", "events"}
+
+SEED_DAYS = 60
+SEED_DEVICES = 40
+SEED_VIOLATIONS = 120_000
+SEED_EVENTS = 400_000
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class ExplainingSession:
+    """AsyncSession proxy that records the plan of every statement it runs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.plans: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> Any:
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        conn = await self._session.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        self.plans.append((sql, result.scalar()[0]["Plan"]))
+        return await self._session.execute(stmt, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+def _relation(node: dict[str, Any]) -> str | None:
+    relation = node.get("Relation Name")
+    if relation is not None and relation.startswith("events_"):
+        return "events"
+    return relation
+
+
+def _nodes(plan: dict[str, Any]):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def assert_no_hot_seq_scans(db: ExplainingSession) -> None:
+    """Fail if any recorded plan sequentially scans a hot table."""
+    assert db.plans, "no statements were executed"
+    for sql, plan in db.plans:
+        for node in _nodes(plan):
+            relation = _relation(node)
+            if node["Node Type"] == "Seq Scan" and relation in HOT_TABLES:
+                pytest.fail(f"Seq Scan on {relation} for:\n{sql}")
+
+
+def scans_on(db: ExplainingSession, relation: str) -> list[tuple[str, str | None]]:
+    """(node type, index name) of every scan of a relation in recorded plans."""
+    return [
+        (node["Node Type"], node.get("Index Name"))
+        for _, plan in db.plans
+        for node in _nodes(plan)
+        if _relation(node) == relation
+    ]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_engine(test_engine: AsyncEngine) -> AsyncGenerator[AsyncEngine, None]:
+    """Seed two months of violations and events, then VACUUM ANALYZE."""
+    now = datetime.now(timezone.utc)
+    async with test_engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "TRUNCATE violation_rollups, evidence, events, violations, "
+            "stream_sessions, devices CASCADE"
+        )
+        # Monthly partitions for the seeded range, so nothing lands in default
+        month = month_start(now - timedelta(days=SEED_DAYS))
+        while month <= now:
+            await conn.exec_driver_sql(create_partition_sql(partition_for(month)))
+            month = add_months(month, 1)
+        await conn.exec_driver_sql(
+            f"""
+            INSERT INTO devices (id, vas_device_id, name, is_active)
+            SELECT gen_random_uuid(), 'plan-device-' || i, 'Camera ' || i, true
+            FROM generate_series(1, {SEED_DEVICES}) AS i
+            """
+        )
+        # Timestamps ascend with insertion order, as in production
+        await conn.exec_driver_sql(
+            f"""
+            INSERT INTO violations (
+                id, device_id, type, status, confidence, timestamp,
+                camera_name, model_id, model_version
+            )
+            SELECT
+                gen_random_uuid(),
+                d.id,
+                (ARRAY['fall_detected', 'ppe_violation'])[1 + i % 2]::violation_type,
+                (ARRAY['open', 'reviewed', 'dismissed', 'resolved'])[1 + i % 4]
+                    ::violation_status,
+                0.5 + (i % 50) / 100.0,
+                now() - interval '{SEED_DAYS} days'
+                    + (i * interval '{SEED_DAYS} days') / {SEED_VIOLATIONS},
+                d.name,
+                'fall_detection',
+                '1.0.0'
+            FROM generate_series(1, {SEED_VIOLATIONS}) AS i
+            JOIN (
+                SELECT id, name, row_number() OVER (ORDER BY id) - 1 AS n FROM devices
+            ) d ON d.n = i % {SEED_DEVICES}
+            """
+        )
+        await conn.exec_driver_sql(
+            f"""
+            INSERT INTO events (
+                id, device_id, event_type, confidence, timestamp,
+                model_id, model_version
+            )
+            SELECT
+                gen_random_uuid(),
+                d.id,
+                (ARRAY['no_fall', 'no_fall', 'no_fall', 'fall_detected'])[1 + i % 4]
+                    ::event_type,
+                (i % 100) / 100.0,
+                now() - interval '{SEED_DAYS} days'
+                    + (i * interval '{SEED_DAYS} days') / {SEED_EVENTS},
+                'fall_detection',
+                '1.0.0'
+            FROM generate_series(1, {SEED_EVENTS}) AS i
+            JOIN (
+                SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM devices
+            ) d ON d.n = i % {SEED_DEVICES}
+            """
+        )
+
+    autocommit = await test_engine.connect()
+    autocommit = await autocommit.execution_options(isolation_level="AUTOCOMMIT")
+    for table in ("devices", "violations", "violation_rollups", "events"):
+        await autocommit.exec_driver_sql(f"VACUUM ANALYZE {table}")
+    await autocommit.close()
+
+    yield test_engine
+
+    async with test_engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "TRUNCATE violation_rollups, evidence, events, violations, "
+            "stream_sessions, devices CASCADE"
+        )
+
+
+@pytest_asyncio.fixture
+async def db(seeded_engine: AsyncEngine) -> AsyncGenerator[ExplainingSession, None]:
+    """Explaining session over the seeded database."""
+    session_factory = async_sessionmaker(bind=seeded_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield ExplainingSession(session)
+        await session.rollback()
+
+
+@pytest_asyncio.fixture
+async def device_id(seeded_engine: AsyncEngine) -> uuid.UUID:
+    """Any seeded device."""
+    async with seeded_engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT id FROM devices LIMIT 1")
+        return result.scalar()
+
+
+def _day() -> tuple[datetime, datetime]:
+    to_time = datetime.now(timezone.utc)
+    return to_time - timedelta(hours=24), to_time
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestListingPlans:
+    """Violation and event listings stay on indexes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_filter", [None, "open"])
+    @pytest.mark.parametrize("by_camera", [False, True])
+    @pytest.mark.parametrize("deep", [False, True])
+    async def test_violation_listing(
+        self, db, device_id, status_filter, by_camera, deep
+    ):
+        cursor = None
+        if deep:
+            midpoint = datetime.now(timezone.utc) - timedelta(days=SEED_DAYS // 2)
+            cursor = encode_cursor(midpoint, uuid.uuid4())
+
+        await list_violations(
+            db,
+            violation_status=status_filter,
+            camera_id=device_id if by_camera else None,
+            device_id=None,
+            since=None,
+            until=None,
+            limit=100,
+            cursor=cursor,
+            offset=0,
+            include_total=False,
+        )
+
+        assert_no_hot_seq_scans(db)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event_type", [None, "fall_detected"])
+    @pytest.mark.parametrize("by_device", [False, True])
+    async def test_event_listing(self, db, device_id, event_type, by_device):
+        since, _ = _day()
+
+        await list_events(
+            db,
+            device_id=device_id if by_device else None,
+            event_type=event_type,
+            since=since,
+            limit=100,
+            cursor=None,
+            offset=0,
+            include_total=True,
+        )
+
+        assert_no_hot_seq_scans(db)
+
+
+class TestAnalyticsPlans:
+    """Dashboard aggregates stay on rollups and covering indexes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("granularity", ["hour", "day"])
+    async def test_summary(self, db, granularity):
+        from_time, to_time = _day()
+
+        await get_analytics_summary(
+            db, from_time=from_time, to_time=to_time, granularity=granularity
+        )
+
+        assert_no_hot_seq_scans(db)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("granularity", ["minute", "hour", "day"])
+    async def test_trends(self, db, device_id, granularity):
+        from_time, to_time = _day()
+
+        await get_violations_trends(
+            db,
+            from_time=from_time,
+            to_time=to_time,
+            granularity=granularity,
+            camera_id=str(device_id),
+            violation_type=None,
+        )
+
+        assert_no_hot_seq_scans(db)
+
+    @pytest.mark.asyncio
+    async def test_devices_status_is_index_only(self, db):
+        from_time, to_time = _day()
+
+        await get_devices_status(db, from_time=from_time, to_time=to_time)
+
+        assert_no_hot_seq_scans(db)
+        assert ("Index Only Scan", "ix_violations_timestamp_covering") in scans_on(
+            db, "violations"
+        )
+
+
+class TestEventScanPlans:
+    """Raw event reads outside the listing."""
+
+    @pytest.mark.asyncio
+    async def test_actionable_events_for_device(self, db, device_id):
+        since, _ = _day()
+        stmt = (
+            select(Event)
+            .where(
+                and_(
+                    Event.device_id == device_id,
+                    Event.event_type.in_([EventType.FALL_DETECTED]),
+                    Event.confidence >= 0.7,
+                    Event.timestamp >= since,
+                )
+            )
+            .order_by(Event.timestamp.desc())
+            .limit(100)
+        )
+
+        await db.execute(stmt)
+
+        assert_no_hot_seq_scans(db)
+
+    @pytest.mark.asyncio
+    async def test_time_range_aggregate(self, db):
+        from_time, to_time = _day()
+        stmt = select(func.avg(Event.inference_time_ms)).where(
+            and_(Event.timestamp >= from_time, Event.timestamp < to_time)
+        )
+
+        await db.execute(stmt)
+
+        assert_no_hot_seq_scans(db)
@@ -0,0 +1,356 @@
+"""Unit tests for the durable bookmark analysis queue.
+
+Tests:
+- Identical submissions share a dedup key; parameter changes do not
+- Claims lock with SKIP LOCKED and include running rows with a lapsed
+  heartbeat
+- Claiming marks the row running, counts the attempt and restores its
+  checkpoint; rows past max attempts are failed
+- Progress checkpoints only the prefix of finished frames
+- Shutdown releases a running job back to pending for resume
+- Writes are guarded by the claimed attempt; a heartbeat that matches no
+  row stops the run
+- A failing run (e.g. the result write) does not stop the worker
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import BookmarkAnalysis, BookmarkAnalysisState
+from app.schemas.bookmark_analysis import BookmarkAnalysisSubmitRequest
+from app.services import bookmark_analysis_queue, bookmark_analysis_worker
+from app.services.bookmark_analysis_queue import (
+    BookmarkAnalysisQueue,
+    claim_statement,
+    default_worker_count,
+)
+from app.services.bookmark_analysis_service import analysis_request_key
+from app.services.bookmark_analysis_worker import AnalysisJob, AnalysisProgress
+
+CORNERS = [[0, 0], [10, 0], [10, 10], [0, 10]]
+
+
+def _request(**parameters) -> BookmarkAnalysisSubmitRequest:
+    return BookmarkAnalysisSubmitRequest(
+        vas_bookmark_id="bookmark-1",
+        model_id="tank_overflow_monitoring",
+        parameters={"tank_corners": CORNERS, **parameters},
+    )
+
+
+def _row(**overrides) -> BookmarkAnalysis:
+    fields = {
+        "id": uuid.uuid4(),
+        "vas_bookmark_id": "bookmark-1",
+        "model_id": "tank_overflow_monitoring",
+        "parameters": {"sampling_fps": 2},
+        "state": BookmarkAnalysisState.PENDING,
+        "attempts": 0,
+    }
+    fields.update(overrides)
+    return BookmarkAnalysis(**fields)
+
+
+class FakeResult:
+    def __init__(self, row, rowcount=0):
+        self._row = row
+        self.rowcount = rowcount
+
+    def scalar_one_or_none(self):
+        return self._row
+
+
+class FakeSession:
+    """Hands out preset rows to claim queries and records updates."""
+
+    def __init__(self, rows, rowcount=1):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if stmt.is_select:
+            return FakeResult(self.rows.pop(0) if self.rows else None)
+        return FakeResult(None, self.rowcount)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+def _queue(session: FakeSession, **kwargs) -> BookmarkAnalysisQueue:
+    return BookmarkAnalysisQueue(
+        workers=1,
+        poll_seconds=1,
+        lease_seconds=30,
+        max_attempts=3,
+        session_factory=lambda: lambda: session,
+        **kwargs,
+    )
+
+
+class TestRequestKey:
+    """Tests for submission deduplication keys."""
+
+    def test_identical_requests_match(self):
+        a = _request(sampling_fps=2, alert_threshold=90)
+        b = _request(alert_threshold=90, sampling_fps=2)
+
+        assert analysis_request_key(a) == analysis_request_key(b)
+
+    def test_parameters_matter(self):
+        assert analysis_request_key(_request(sampling_fps=2)) != (
+            analysis_request_key(_request(sampling_fps=1))
+        )
+
+
+class TestClaim:
+    """Tests for claiming rows from the table."""
+
+    def test_statement_skips_locked_rows(self):
+        now = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+        sql = str(
+            claim_statement(now, timedelta(seconds=60)).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "heartbeat_at IS NULL" in sql
+        assert "ORDER BY bookmark_analyses.created_at" in sql
+
+    def test_default_workers_follow_cpu_count(self, monkeypatch):
+        monkeypatch.setattr(bookmark_analysis_queue.os, "cpu_count", lambda: 8)
+        assert default_worker_count() == 4
+
+        monkeypatch.setattr(bookmark_analysis_queue.os, "cpu_count", lambda: None)
+        assert default_worker_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_claim_marks_running_and_restores_checkpoint(self):
+        row = _row(
+            state=BookmarkAnalysisState.RUNNING,
+            attempts=1,
+            checkpoint={"results": [[0.0, 40.0], [0.5, None]], "duration_seconds": 10},
+        )
+        session = FakeSession([row])
+
+        job, progress = await _queue(session).claim()
+
+        assert row.state == BookmarkAnalysisState.RUNNING
+        assert row.attempts == 2
+        assert row.heartbeat_at is not None
+        assert row.started_at is not None
+        assert job.attempt == 2
+        assert job.parameters == {"sampling_fps": 2}
+        assert progress.results == [(0.0, 40.0), (0.5, None)]
+        assert progress.processed_until_seconds == 0.5
+        assert progress.percent == 5.0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_rows_are_failed(self):
+        exhausted = _row(state=BookmarkAnalysisState.RUNNING, attempts=3)
+        fresh = _row()
+        session = FakeSession([exhausted, fresh])
+
+        job, _ = await _queue(session).claim()
+
+        assert exhausted.state == BookmarkAnalysisState.FAILED
+        assert "3 attempts" in exhausted.error_message
+        assert job.id == fresh.id
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_claim(self):
+        assert await _queue(FakeSession([])).claim() is None
+
+
+class TestProgress:
+    """Tests for resumable progress."""
+
+    def test_only_finished_prefix_is_processed(self):
+        progress = AnalysisProgress(duration_seconds=4.0)
+        for ts in (0.0, 1.0, 2.0):
+            progress.submitted(ts)
+
+        progress.finished(1.0, 50.0)
+        assert progress.processed_until_seconds is None
+
+        progress.finished(0.0, 40.0)
+        assert progress.results == [(0.0, 40.0), (1.0, 50.0)]
+        assert progress.percent == 25.0
+
+    def test_checkpoint_round_trip(self):
+        progress = AnalysisProgress([(0.0, 40.0), (1.0, None)], duration_seconds=8)
+
+        restored = AnalysisProgress.from_checkpoint(progress.to_checkpoint())
+
+        assert restored.results == progress.results
+        assert restored.duration_seconds == 8
+
+
+def _job(attempt: int = 1) -> AnalysisJob:
+    return AnalysisJob(
+        id=uuid.uuid4(),
+        vas_bookmark_id="bookmark-1",
+        model_id="tank_overflow_monitoring",
+        model_version=None,
+        parameters={},
+        attempt=attempt,
+    )
+
+
+class TestRelease:
+    """Tests for shutdown while a job is running."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_requeued(self, monkeypatch):
+        started = asyncio.Event()
+
+        async def run_analysis(job, progress):
+            progress.submitted(0.0)
+            progress.finished(0.0, 40.0)
+            started.set()
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(bookmark_analysis_queue, "run_analysis", run_analysis)
+        session = FakeSession([])
+        job = _job()
+
+        task = asyncio.create_task(_queue(session)._run(job, AnalysisProgress()))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        (stmt,) = session.statements
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["state"] == BookmarkAnalysisState.PENDING
+        assert params["heartbeat_at"] is None
+        assert params["processed_until_seconds"] == 0.0
+        assert params["checkpoint"]["results"] == [[0.0, 40.0]]
+
+
+class TestLease:
+    """Tests for writes after another worker reclaimed the row."""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_guarded_by_attempt(self):
+        session = FakeSession([])
+
+        held = await _queue(session)._save_progress(_job(attempt=2), AnalysisProgress())
+
+        (stmt,) = session.statements
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "bookmark_analyses.attempts = " in sql
+        assert 2 in stmt.compile(dialect=postgresql.dialect()).params.values()
+        assert held
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_stops_the_run(self, monkeypatch):
+        cancelled = asyncio.Event()
+
+        async def run_analysis(job, progress):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        monkeypatch.setattr(bookmark_analysis_queue, "run_analysis", run_analysis)
+        session = FakeSession([], rowcount=0)
+        queue = BookmarkAnalysisQueue(
+            workers=1,
+            poll_seconds=1,
+            lease_seconds=0.03,
+            max_attempts=3,
+            session_factory=lambda: lambda: session,
+        )
+
+        await asyncio.wait_for(queue._run(_job(), AnalysisProgress()), timeout=5)
+
+        assert cancelled.is_set()
+        assert len(session.statements) == 1
+
+
+class TestWorkerResilience:
+    """Tests for errors escaping a single run."""
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failed_finalize(self, monkeypatch, tmp_path):
+        jobs = [_job(), _job()]
+        finalized = []
+        done = asyncio.Event()
+
+        async def claim():
+            if not jobs:
+                done.set()
+                return None
+            return jobs.pop(0), AnalysisProgress()
+
+        async def run_pipeline(**kwargs):
+            return {"stats": {"frames_analyzed": 1, "frames_skipped": 0}}
+
+        async def finalize_completed(db, job, summary):
+            finalized.append(job.id)
+            raise ConnectionError("database went away")
+
+        monkeypatch.setattr(bookmark_analysis_worker, "TEMP_DIR", tmp_path)
+        monkeypatch.setattr(bookmark_analysis_worker, "FINALIZE_RETRY_SECONDS", 0)
+        monkeypatch.setattr(
+            bookmark_analysis_worker,
+            "get_session_factory",
+            lambda: lambda: FakeSession([]),
+        )
+        monkeypatch.setattr(bookmark_analysis_worker, "_run_pipeline", run_pipeline)
+        monkeypatch.setattr(
+            bookmark_analysis_worker, "_finalize_completed", finalize_completed
+        )
+        queue = _queue(FakeSession([]))
+        monkeypatch.setattr(queue, "claim", claim)
+
+        worker = asyncio.create_task(queue._worker())
+        await asyncio.wait_for(done.wait(), timeout=5)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+        attempts = bookmark_analysis_worker.FINALIZE_ATTEMPTS
+        assert len(finalized) == 2 * attempts
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_run_error(self, monkeypatch):
+        jobs = [_job(), _job()]
+        ran = []
+        done = asyncio.Event()
+
+        async def claim():
+            if not jobs:
+                done.set()
+                return None
+            return jobs.pop(0), AnalysisProgress()
+
+        async def run_analysis(job, progress):
+            ran.append(job.id)
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(bookmark_analysis_queue, "run_analysis", run_analysis)
+        queue = _queue(FakeSession([]))
+        monkeypatch.setattr(queue, "claim", claim)
+
+        worker = asyncio.create_task(queue._worker())
+        await asyncio.wait_for(done.wait(), timeout=5)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+        assert len(ran) == 2
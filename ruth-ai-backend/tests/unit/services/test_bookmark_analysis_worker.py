@@ -0,0 +1,221 @@
+"""Unit tests for the bookmark analysis frame pipeline.
+
+Tests:
+- Frames are sampled at the requested fps with correct timestamps
+- A resumed job skips samples up to its checkpoint
+- The decode thread hands samples over a bounded queue (backpressure)
+- Leaving the stream early stops the decode thread
+- Decode errors surface from the stream
+- Inference runs several frames at once, bounded by the window, and the
+  results come back in timestamp order
+- The window grows while the runtime has headroom and halves when
+  requests queue
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from app.integrations.unified_runtime.schemas import RuntimeCapacity
+from app.services import bookmark_analysis_worker
+from app.services.bookmark_analysis_worker import (
+    _extract_frames,
+    _infer_in_window,
+    _InferenceWindow,
+    _stream_frames,
+)
+
+
+@pytest.fixture
+def video(tmp_path) -> Path:
+    """Three seconds of 10 fps video."""
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for i in range(30):
+        writer.write(np.full((24, 32, 3), i * 8, np.uint8))
+    writer.release()
+    return path
+
+
+class TestExtractFrames:
+    """Tests for sampling frames from a video file."""
+
+    def test_samples_at_requested_fps(self, video):
+        samples = list(_extract_frames(video, fps=2))
+
+        assert [ts for ts, _ in samples] == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5]
+        assert all(jpeg.startswith(b"\xff\xd8") for _, jpeg in samples)
+
+    def test_resume_skips_processed_samples(self, video):
+        samples = list(_extract_frames(video, fps=2, after_seconds=1.0))
+
+        assert [ts for ts, _ in samples] == [1.5, 2.0, 2.5]
+
+    def test_unreadable_file(self, tmp_path):
+        path = tmp_path / "broken.mp4"
+        path.write_bytes(b"not a video")
+
+        with pytest.raises(RuntimeError):
+            list(_extract_frames(path, fps=2))
+
+
+class TestStreamFrames:
+    """Tests for the decode thread to event loop hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_samples(self, video):
+        async with _stream_frames(video, 2) as frames:
+            streamed = [ts async for ts, _ in frames]
+
+        assert streamed == [ts for ts, _ in _extract_frames(video, 2)]
+
+    @pytest.mark.asyncio
+    async def test_decoder_waits_for_consumer(self, monkeypatch):
+        produced = []
+        finished = threading.Event()
+
+        def fake_extract(path, fps, after_seconds=None):
+            try:
+                for i in range(100):
+                    produced.append(i)
+                    yield float(i), b""
+            finally:
+                finished.set()
+
+        monkeypatch.setattr(bookmark_analysis_worker, "_extract_frames", fake_extract)
+
+        async with _stream_frames(Path("clip.mp4"), 2, maxsize=4) as frames:
+            first = await anext(frames)
+            await asyncio.sleep(0.2)
+
+            # One consumed, four queued, one blocked waiting for a slot
+            assert first == (0.0, b"")
+            assert len(produced) <= 6
+
+        # Leaving early stops the decoder instead of decoding the rest
+        assert finished.is_set()
+        assert len(produced) < 100
+
+    @pytest.mark.asyncio
+    async def test_decode_error_raised(self, tmp_path):
+        path = tmp_path / "broken.mp4"
+        path.write_bytes(b"not a video")
+
+        with pytest.raises(RuntimeError, match="cannot open"):
+            async with _stream_frames(path, 2) as frames:
+                async for _ in frames:
+                    pass
+
+
+async def _frames(count: int):
+    for i in range(count):
+        yield float(i), bytes([i])
+
+
+def _capacity(queue_depth: int = 0, utilization: float | None = 0.5):
+    return RuntimeCapacity(
+        free_slots=1, queue_depth=queue_depth, utilization=utilization
+    )
+
+
+class TestInferenceWindow:
+    """Tests for the adaptive in-flight limit."""
+
+    def test_grows_with_headroom_up_to_limit(self):
+        window = _InferenceWindow(limit=3)
+
+        for _ in range(5):
+            window.record(_capacity())
+
+        assert window.size == 3
+
+    def test_halves_when_runtime_queues(self):
+        window = _InferenceWindow(limit=8, initial=8)
+
+        window.record(_capacity(queue_depth=2))
+        assert window.size == 4
+        for _ in range(5):
+            window.record(_capacity(queue_depth=1))
+        assert window.size == 1
+
+    def test_holds_at_target_utilization(self):
+        window = _InferenceWindow(limit=8, initial=2)
+
+        window.record(_capacity(utilization=0.95))
+
+        assert window.size == 2
+
+    def test_no_signal_grows(self):
+        window = _InferenceWindow(limit=2)
+
+        window.record(None)
+        window.record(None)
+
+        assert window.size == 2
+
+
+class TestInferInWindow:
+    """Tests for concurrent submission and ordered reassembly."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_reordered(self):
+        in_flight = 0
+        peak = 0
+
+        async def infer(jpeg_bytes):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later frames finish first
+            await asyncio.sleep(0.01 * (10 - jpeg_bytes[0]))
+            in_flight -= 1
+            return jpeg_bytes[0]
+
+        window = _InferenceWindow(limit=4, initial=4)
+        results = await _infer_in_window(_frames(10), infer, window)
+
+        assert peak == 4
+        assert results == [(float(i), i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_window_shrinks_while_running(self):
+        in_flight = 0
+        peaks = []
+        window = _InferenceWindow(limit=4, initial=4)
+
+        async def infer(jpeg_bytes):
+            nonlocal in_flight
+            in_flight += 1
+            peaks.append(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            window.record(_capacity(queue_depth=1))
+            return jpeg_bytes[0]
+
+        await _infer_in_window(_frames(12), infer, window)
+
+        assert peaks[:4] == [1, 2, 3, 4]
+        assert max(peaks[-4:]) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_in_flight(self):
+        cancelled = []
+
+        async def infer(jpeg_bytes):
+            if jpeg_bytes[0] == 1:
+                raise RuntimeError("AI runtime unreachable")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(jpeg_bytes[0])
+                raise
+
+        window = _InferenceWindow(limit=3, initial=3)
+        with pytest.raises(RuntimeError, match="unreachable"):
+            await _infer_in_window(_frames(10), infer, window)
+
+        assert sorted(cancelled) == [0, 2]
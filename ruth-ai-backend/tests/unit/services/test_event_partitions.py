@@ -0,0 +1,198 @@
+"""Unit tests for monthly events partition maintenance.
+
+Tests:
+- Month arithmetic across year boundaries and from non-UTC timestamps
+- Partitions created for the current month plus the months ahead
+- Retention retires only whole months older than the window
+- maintain_partitions issues CREATE for missing months and DETACH/DROP
+  for expired ones, and prunes expired rows from the default partition
+  in a bounded batch
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import Event
+from app.services.event_partitions import (
+    Partition,
+    add_months,
+    create_partition_sql,
+    maintain_partitions,
+    month_start,
+    parse_partition,
+    partition_for,
+    partitions_to_create,
+    partitions_to_retire,
+    retire_partition_sql,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _utc(year: int, month: int) -> datetime:
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, rows, rowcount=0):
+        self._rows = rows
+        self.rowcount = rowcount
+
+    def all(self):
+        return self._rows
+
+
+class FakeConnection:
+    """Answers the partition listing and records DDL."""
+
+    def __init__(self, partitions: list[str], pruned: int = 0) -> None:
+        self.partitions = partitions
+        self.pruned = pruned
+        self.ddl: list[str] = []
+        self.params: list[dict | None] = []
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if "pg_inherits" in sql:
+            return FakeResult([(name,) for name in self.partitions])
+        self.ddl.append(sql)
+        self.params.append(params)
+        return FakeResult([], rowcount=self.pruned if sql.startswith("DELETE") else 0)
+
+
+class TestMonths:
+    """Tests for month helpers."""
+
+    def test_month_start_normalizes_to_utc(self):
+        # 00:30 on Nov 1 in UTC+2 is still October in UTC
+        ts = datetime(2026, 11, 1, 0, 30, tzinfo=timezone(timedelta(hours=2)))
+
+        assert month_start(ts) == _utc(2026, 10)
+
+    @pytest.mark.parametrize(
+        "months, expected",
+        [
+            (1, _utc(2027, 1)),
+            (-12, _utc(2025, 12)),
+            (-1, _utc(2026, 11)),
+            (0, _utc(2026, 12)),
+        ],
+    )
+    def test_add_months(self, months, expected):
+        assert add_months(_utc(2026, 12), months) == expected
+
+    def test_partition_names_round_trip(self):
+        partition = partition_for(NOW)
+
+        assert partition == Partition(
+            "events_p2026_10", _utc(2026, 10), _utc(2026, 11)
+        )
+        assert parse_partition(partition.name) == partition
+
+    @pytest.mark.parametrize(
+        "name", ["events_default", "events_p2026_13", "events_p26_1"]
+    )
+    def test_non_monthly_names_are_ignored(self, name):
+        assert parse_partition(name) is None
+
+
+class TestPlanning:
+    """Tests for which partitions to create and retire."""
+
+    def test_creates_current_and_ahead(self):
+        end_of_month = datetime(2026, 11, 30, 23, tzinfo=timezone.utc)
+
+        names = [p.name for p in partitions_to_create(end_of_month, 2)]
+
+        assert names == ["events_p2026_11", "events_p2026_12", "events_p2027_01"]
+
+    def test_retention_keeps_whole_months(self):
+        existing = [
+            "events_default",
+            "events_p2026_06",
+            "events_p2026_07",
+            "events_p2026_08",
+            "events_p2026_09",
+            "events_p2026_10",
+        ]
+
+        retired = partitions_to_retire(existing, NOW, retention_months=2)
+
+        # Keeps Aug and Sep in full, plus the current month
+        assert [p.name for p in retired] == ["events_p2026_06", "events_p2026_07"]
+
+    def test_retention_disabled(self):
+        assert partitions_to_retire(["events_p2000_01"], NOW, retention_months=0) == []
+
+    def test_ddl(self):
+        partition = partition_for(NOW)
+
+        assert create_partition_sql(partition) == (
+            "CREATE TABLE IF NOT EXISTS events_p2026_10 PARTITION OF events "
+            "FOR VALUES FROM ('2026-10-01T00:00:00+00:00') "
+            "TO ('2026-11-01T00:00:00+00:00')"
+        )
+        assert retire_partition_sql(partition, "detach") == (
+            "ALTER TABLE events DETACH PARTITION events_p2026_10"
+        )
+        assert retire_partition_sql(partition, "drop") == (
+            "DROP TABLE IF EXISTS events_p2026_10"
+        )
+
+
+class TestMaintainPartitions:
+    """Tests for one maintenance pass."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_and_detaches_expired(self):
+        conn = FakeConnection(["events_p2026_01", "events_p2026_10"])
+
+        created, retired, pruned = await maintain_partitions(
+            conn, now=NOW, months_ahead=2, retention_months=6
+        )
+
+        assert created == ["events_p2026_11", "events_p2026_12"]
+        assert retired == ["events_p2026_01"]
+        assert pruned == 0
+        assert conn.ddl[-1] == "ALTER TABLE events DETACH PARTITION events_p2026_01"
+
+    @pytest.mark.asyncio
+    async def test_drop_mode(self):
+        conn = FakeConnection(["events_p2025_01"])
+
+        await maintain_partitions(
+            conn, now=NOW, months_ahead=0, retention_months=1, retention_mode="drop"
+        )
+
+        assert "DROP TABLE IF EXISTS events_p2025_01" in conn.ddl
+
+    @pytest.mark.asyncio
+    async def test_default_partition_pruned_in_bounded_batch(self):
+        conn = FakeConnection(["events_default", "events_p2026_10"], pruned=500)
+
+        _, _, pruned = await maintain_partitions(
+            conn, now=NOW, months_ahead=0, retention_months=6, prune_batch=500
+        )
+
+        assert pruned == 500
+        assert conn.ddl[-1].startswith("DELETE FROM events_default")
+        assert "LIMIT :batch" in conn.ddl[-1]
+        assert conn.params[-1] == {"cutoff": _utc(2026, 4), "batch": 500}
+
+    @pytest.mark.asyncio
+    async def test_default_partition_kept_without_retention(self):
+        conn = FakeConnection(["events_default", "events_p2026_10"])
+
+        _, _, pruned = await maintain_partitions(conn, now=NOW, months_ahead=0)
+
+        assert pruned == 0
+        assert not any("events_default" in sql for sql in conn.ddl)
+
+    def test_model_is_partitioned_on_timestamp(self):
+        table = Event.__table__
+
+        partition_by = table.dialect_options["postgresql"]["partition_by"]
+
+        assert partition_by == 'RANGE ("timestamp")'
+        assert [c.name for c in table.primary_key.columns] == ["id", "timestamp"]
@@ -0,0 +1,234 @@
+"""Unit tests for background export jobs.
+
+Tests:
+- Dedup key ignores filter order and filters unused by an "all" scope
+- Identical submissions share a job; failed jobs are retried
+- Bounded queue refuses submissions beyond its size
+- Workers write results to the storage directory, failures are recorded
+- Expired jobs and their files are removed
+- Download endpoint serves whole files and byte ranges
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app.api.v1.analytics import download_export_job
+from app.schemas import ExportRequest
+from app.services.exceptions import (
+    ExportJobNotFoundError,
+    ExportJobNotReadyError,
+    ExportQueueFullError,
+)
+from app.services.export_jobs import (
+    ExportJobManager,
+    ExportJobState,
+    export_job_key,
+    set_export_job_manager,
+)
+from app.services.export_service import ExportFile, ExportService
+
+
+def _request(**overrides) -> ExportRequest:
+    body = {
+        "format": "csv",
+        "time_range": {
+            "from": "2026-10-01T00:00:00Z",
+            "to": "2026-10-18T00:00:00Z",
+        },
+    }
+    body.update(overrides)
+    return ExportRequest.model_validate(body)
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ExportJobManager(
+        storage_dir=tmp_path,
+        workers=1,
+        queue_size=2,
+        ttl_seconds=60,
+        session_factory=lambda: FakeSession,
+    )
+
+
+@pytest.fixture
+def fake_export(monkeypatch):
+    """Replace export generation with fixed chunks (or a failure)."""
+    outcome = {"chunks": [b"id,type\n", b"1,fall\n"], "error": None}
+
+    async def export_request(self, request):
+        if outcome["error"]:
+            raise outcome["error"]
+
+        async def chunks():
+            for chunk in outcome["chunks"]:
+                yield chunk
+
+        return ExportFile(chunks(), "text/csv", "ruth-ai-analytics-test.csv")
+
+    monkeypatch.setattr(ExportService, "export_request", export_request)
+    return outcome
+
+
+async def _drain(manager: ExportJobManager) -> None:
+    await manager.start()
+    await asyncio.wait_for(manager._queue.join(), timeout=5)
+    await manager.stop()
+
+
+class TestExportJobKey:
+    """Tests for request deduplication keys."""
+
+    def test_filter_order_is_ignored(self):
+        a = _request(scope={"all": False, "camera_ids": ["a", "b"]})
+        b = _request(scope={"all": False, "camera_ids": ["b", "a"]})
+
+        assert export_job_key(a) == export_job_key(b)
+
+    def test_filters_ignored_for_all_scope(self):
+        a = _request(scope={"all": True, "camera_ids": ["a"]})
+
+        assert export_job_key(a) == export_job_key(_request())
+
+    def test_same_instant_in_another_zone(self):
+        shifted = _request(
+            time_range={
+                "from": "2026-10-01T02:00:00+02:00",
+                "to": "2026-10-18T02:00:00+02:00",
+            }
+        )
+
+        assert export_job_key(shifted) == export_job_key(_request())
+
+    def test_format_and_options_matter(self):
+        key = export_job_key(_request())
+
+        assert export_job_key(_request(format="pdf")) != key
+        assert export_job_key(_request(options={"include_headers": False})) != key
+
+
+class TestSubmit:
+    """Tests for queueing and deduplication."""
+
+    def test_identical_requests_share_a_job(self, manager):
+        first = manager.submit(_request())
+
+        assert manager.submit(_request()) is first
+        assert manager._queue.qsize() == 1
+
+    def test_failed_job_is_retried(self, manager):
+        first = manager.submit(_request())
+        first.state = ExportJobState.FAILED
+
+        assert manager.submit(_request()).id != first.id
+
+    def test_queue_full(self, manager):
+        manager.submit(_request(format="csv"))
+        manager.submit(_request(format="xlsx"))
+
+        with pytest.raises(ExportQueueFullError):
+            manager.submit(_request(format="pdf"))
+
+    def test_unknown_job(self, manager):
+        with pytest.raises(ExportJobNotFoundError):
+            manager.get("missing")
+
+    def test_result_not_ready(self, manager):
+        job = manager.submit(_request())
+
+        with pytest.raises(ExportJobNotReadyError):
+            manager.get_result(job.id)
+
+
+class TestRun:
+    """Tests for workers and cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_completed_job_is_stored(self, manager, fake_export, tmp_path):
+        job = manager.submit(_request())
+
+        await _drain(manager)
+
+        assert job.state == ExportJobState.COMPLETED
+        assert job.path.parent == tmp_path
+        assert job.path.suffix == ".csv"
+        assert job.path.read_bytes() == b"id,type\n1,fall\n"
+        assert job.size_bytes == 15
+        assert job.expires_at - job.completed_at == timedelta(seconds=60)
+        assert manager.get_result(job.id) is job
+
+    @pytest.mark.asyncio
+    async def test_failed_job_leaves_no_file(self, manager, fake_export, tmp_path):
+        fake_export["error"] = RuntimeError("database went away")
+        job = manager.submit(_request())
+
+        await _drain(manager)
+
+        assert job.state == ExportJobState.FAILED
+        assert job.error == "database went away"
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_jobs_removed(self, manager, fake_export):
+        job = manager.submit(_request())
+        await _drain(manager)
+
+        removed = await manager.remove_expired(job.expires_at)
+
+        assert removed == [job.id]
+        assert not job.path.exists()
+        with pytest.raises(ExportJobNotFoundError):
+            manager.get(job.id)
+        assert manager.submit(_request()).id != job.id
+
+    @pytest.mark.asyncio
+    async def test_stale_results_removed_at_start(self, manager, tmp_path):
+        (tmp_path / "export-leftover.csv").write_bytes(b"old")
+        (tmp_path / "unrelated.txt").write_bytes(b"keep")
+
+        await manager.start()
+        await manager.stop()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["unrelated.txt"]
+
+
+class TestDownload:
+    """Tests for the download endpoint."""
+
+    @pytest.fixture
+    async def completed(self, manager, fake_export):
+        job = manager.submit(_request())
+        await _drain(manager)
+        set_export_job_manager(manager)
+        yield job
+        set_export_job_manager(None)
+
+    async def _body(self, response) -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    @pytest.mark.asyncio
+    async def test_whole_file(self, completed):
+        response = await download_export_job(completed.id, range_header=None)
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "15"
+        assert "ruth-ai-analytics-test.csv" in response.headers["content-disposition"]
+        assert await self._body(response) == b"id,type\n1,fall\n"
+
+    @pytest.mark.asyncio
+    async def test_resume_from_offset(self, completed):
+        response = await download_export_job(completed.id, range_header="bytes=8-")
+
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 8-14/15"
+        assert await self._body(response) == b"1,fall\n"
@@ -0,0 +1,250 @@
+"""Unit tests for ExportService.
+
+Tests:
+- CSV is produced batch by batch, header sent with the first batch
+- CSV column selection follows the export options
+- XLSX is written in write-only mode and streamed from a temp file
+- PDF reads only the tabulated rows and takes totals from the counts,
+  which come from daily rollups
+- Stream session and temp files are released when a client disconnects
+"""
+
+import csv
+import os
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, StringIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from openpyxl import load_workbook
+
+from app.models import ViolationStatus, ViolationType
+from app.services import export_service
+from app.services.export_service import (
+    CsvOptions,
+    ExportService,
+    format_csv_header,
+    format_csv_rows,
+)
+
+FROM_TIME = datetime(2026, 10, 1, tzinfo=timezone.utc)
+TO_TIME = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+def _row(i: int, confidence: float = 0.9):
+    return SimpleNamespace(
+        id=uuid.UUID(int=i),
+        type=ViolationType.FALL_DETECTED,
+        camera_name=f"Camera {i}",
+        status=ViolationStatus.OPEN,
+        confidence=confidence,
+        timestamp=TO_TIME - timedelta(minutes=i),
+        created_at=TO_TIME - timedelta(minutes=i),
+        reviewed_by=None,
+        reviewed_at=None,
+        bounding_boxes=[{"x": 1}],
+        model_id="fall_detection",
+        model_version="1.0.0",
+    )
+
+
+class FakeStreamResult:
+    def __init__(self, batches):
+        self._batches = batches
+
+    async def partitions(self):
+        for batch in self._batches:
+            yield batch
+
+
+class FakeSession:
+    """Session whose server-side cursor yields preset batches."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.statements = []
+        self.closed = False
+
+    async def stream(self, stmt):
+        self.statements.append(stmt)
+        return FakeStreamResult(self.batches)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+
+def _service(batches, counts=(), first_rows=()):
+    """ExportService over a fake stream session and a fake request session."""
+    stream_session = FakeSession(batches)
+
+    async def execute(stmt):
+        result = MagicMock()
+        # Grouped count query vs. the PDF's first rows
+        is_count = "sum" in str(stmt)
+        result.all.return_value = list(counts) if is_count else list(first_rows)
+        return result
+
+    db = MagicMock()
+    db.execute = execute
+    service = ExportService(db, session_factory=lambda: lambda: stream_session)
+    return service, stream_session
+
+
+async def _read(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+class TestCsv:
+    """Tests for CSV formatting and streaming."""
+
+    def test_columns_follow_options(self):
+        options = CsvOptions(include_timestamps=False, include_raw_confidence=True)
+
+        assert options.columns == [
+            "id",
+            "type",
+            "camera_name",
+            "status",
+            "confidence_raw",
+            "reviewed_by",
+            "reviewed_at",
+            "model_id",
+            "model_version",
+        ]
+
+    def test_rows_match_columns(self):
+        options = CsvOptions(include_bounding_boxes=True)
+
+        data = format_csv_rows([_row(1, 0.65)], options).decode()
+        (row,) = csv.reader(StringIO(data))
+
+        assert len(row) == len(options.columns)
+        assert row[options.columns.index("confidence_category")] == "Medium"
+        assert row[options.columns.index("bounding_boxes")] == '[{"x": 1}]'
+
+    @pytest.mark.asyncio
+    async def test_streams_one_chunk_per_batch(self):
+        service, session = _service([[_row(1), _row(2)], [_row(3)]])
+
+        export = await service.export_violations("csv", FROM_TIME, TO_TIME)
+        chunks = await _read(export.chunks)
+
+        header = format_csv_header(CsvOptions())
+        assert export.content_type == "text/csv"
+        assert export.filename.endswith(".csv")
+        assert len(chunks) == 2
+        assert chunks[0].startswith(header)
+        assert b"".join(chunks).count(b"\n") == 4
+        assert session.closed
+        # Rows read through a server-side cursor in fixed-size batches
+        options = session.statements[0].get_execution_options()
+        assert options["yield_per"] == export_service.EXPORT_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_header_only_when_nothing_matches(self):
+        service, _ = _service([])
+
+        export = await service.export_violations("csv", FROM_TIME, TO_TIME)
+
+        assert await _read(export.chunks) == [format_csv_header(CsvOptions())]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_releases_stream_session(self):
+        service, session = _service([[_row(1)], [_row(2)]])
+
+        export = await service.export_violations("csv", FROM_TIME, TO_TIME)
+        await anext(export.chunks)
+        await export.chunks.aclose()
+
+        assert session.closed
+
+
+class TestXlsx:
+    """Tests for the write-only XLSX export."""
+
+    @pytest.mark.asyncio
+    async def test_workbook_round_trips(self):
+        counts = [(ViolationStatus.OPEN, ViolationType.FALL_DETECTED, 3)]
+        service, _ = _service([[_row(1), _row(2)], [_row(3)]], counts=counts)
+
+        export = await service.export_violations("xlsx", FROM_TIME, TO_TIME)
+        workbook = load_workbook(BytesIO(b"".join(await _read(export.chunks))))
+
+        summary = workbook["Summary"]
+        assert summary["A4"].value == "Total Violations:"
+        assert summary["B4"].value == 3
+        assert (summary["A8"].value, summary["B8"].value) == ("Open", 3)
+        violations = workbook["Violations"]
+        assert violations.max_row == 4
+        assert violations["C2"].value == "Camera 1"
+        assert violations.freeze_panes == "A2"
+
+    @pytest.mark.asyncio
+    async def test_temp_file_removed(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(export_service.tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(export_service, "STREAM_CHUNK_SIZE", 512)
+        service, _ = _service([[_row(1)]])
+
+        export = await service.export_violations("xlsx", FROM_TIME, TO_TIME)
+        await anext(export.chunks)
+        assert len(os.listdir(tmp_path)) == 1
+        await export.chunks.aclose()
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestPdf:
+    """Tests for the PDF report."""
+
+    @pytest.mark.asyncio
+    async def test_reads_only_tabulated_rows(self):
+        counts = [
+            (ViolationStatus.OPEN, ViolationType.FALL_DETECTED, 250),
+            (ViolationStatus.RESOLVED, ViolationType.FALL_DETECTED, 50),
+        ]
+        service, session = _service([], counts=counts, first_rows=[_row(1)])
+
+        export = await service.export_violations("pdf", FROM_TIME, TO_TIME)
+        chunks = await _read(export.chunks)
+
+        assert export.content_type == "application/pdf"
+        assert chunks[0].startswith(b"%PDF")
+        assert session.statements == []
+
+    @pytest.mark.asyncio
+    async def test_counts_read_daily_rollups(self, monkeypatch):
+        original = export_service.violation_counts
+        granularities = []
+
+        def violation_counts(from_time, to_time, finest="hour"):
+            granularities.append(finest)
+            return original(from_time, to_time, finest)
+
+        monkeypatch.setattr(export_service, "violation_counts", violation_counts)
+        service, _ = _service([])
+
+        await service.export_violations("pdf", FROM_TIME, TO_TIME)
+
+        assert granularities == ["day"]
+
+    def test_counts_are_totalled(self):
+        status_counts = Counter({"open": 2})
+        pdf = export_service.build_pdf(
+            [], FROM_TIME, TO_TIME, status_counts, Counter({"fall_detected": 2})
+        )
+
+        assert pdf.startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_unsupported_format():
+    service, _ = _service([])
+
+    with pytest.raises(ValueError):
+        await service.export_violations("json", FROM_TIME, TO_TIME)
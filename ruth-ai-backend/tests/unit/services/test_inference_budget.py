@@ -0,0 +1,162 @@
+"""Unit tests for capacity-signal pacing in InferenceBudget.
+
+Tests:
+- X-Runtime-Capacity header parsing (including absent/malformed values)
+- Capacity signal surfaced through the client and router
+- Pacing from runtime service time instead of round-trip latency
+- Feedback gain follows utilization and backs off on queueing
+- Stale signals fall back to round-trip pacing
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.integrations.unified_runtime.client import UnifiedRuntimeClient
+from app.integrations.unified_runtime.frame_fetcher import FrameData
+from app.integrations.unified_runtime.router import RuntimeRouter
+from app.integrations.unified_runtime.schemas import RuntimeCapacity
+from app.services import inference_loop
+from app.services.inference_loop import InferenceBudget
+
+HEADER = "free=1;queue=0;util=0.40;svc=fall_detection:100.0,ppe_detection:295.0"
+
+
+def _budget(cameras: int) -> InferenceBudget:
+    budget = InferenceBudget()
+    for _ in range(cameras):
+        budget.register(uuid4())
+    return budget
+
+
+def _capacity(utilization=0.85, queue_depth=0, service_ms=100.0) -> RuntimeCapacity:
+    return RuntimeCapacity(
+        free_slots=1,
+        queue_depth=queue_depth,
+        utilization=utilization,
+        service_time_ms={"fall_detection": service_ms},
+    )
+
+
+class TestHeaderParsing:
+    """Tests for RuntimeCapacity.from_header."""
+
+    def test_full_header(self):
+        capacity = RuntimeCapacity.from_header(HEADER)
+
+        assert capacity.free_slots == 1
+        assert capacity.queue_depth == 0
+        assert capacity.utilization == 0.4
+        assert capacity.service_time_ms == {
+            "fall_detection": 100.0,
+            "ppe_detection": 295.0,
+        }
+
+    def test_optional_fields_absent(self):
+        capacity = RuntimeCapacity.from_header("free=2;queue=3")
+
+        assert capacity.utilization is None
+        assert capacity.service_time_ms == {}
+
+    @pytest.mark.parametrize("value", [None, "", "free=x;queue=0", "queue=0"])
+    def test_missing_or_malformed(self, value):
+        assert RuntimeCapacity.from_header(value) is None
+
+    @pytest.mark.asyncio
+    async def test_router_result_carries_capacity(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"X-Runtime-Capacity": HEADER},
+                json={
+                    "request_id": str(uuid4()),
+                    "status": "success",
+                    "model_id": "fall_detection",
+                    "model_version": "1.0.0",
+                    "inference_time_ms": 90.0,
+                },
+            )
+
+        client = UnifiedRuntimeClient(runtime_url="http://runtime", timeout=5)
+        client._client = httpx.AsyncClient(
+            base_url="http://runtime", transport=httpx.MockTransport(handler)
+        )
+        router = RuntimeRouter(MagicMock(), unified_runtime_client=client)
+        router.frame_fetcher.fetch_and_encode = AsyncMock(
+            return_value=FrameData(
+                base64_data="ZmFrZQ==",
+                format="jpeg",
+                width=640,
+                height=480,
+                size_bytes=4,
+            )
+        )
+
+        result = await router.submit_inference(
+            model_id="fall_detection", stream_id=uuid4()
+        )
+
+        assert result["capacity"].service_time_ms["fall_detection"] == 100.0
+
+
+class TestCapacityPacing:
+    """Tests for pacing from the runtime's capacity signal."""
+
+    def test_without_signal_uses_round_trip(self):
+        budget = _budget(4)
+        budget.record_latency("fall_detection", 0.3)
+
+        expected = inference_loop.MAX_GPU_UTILIZATION / (4 * 0.3)
+        assert budget.fps_for("fall_detection") == pytest.approx(
+            min(inference_loop.TARGET_FPS, expected)
+        )
+
+    def test_service_time_replaces_round_trip(self):
+        budget = _budget(8)
+        budget.record_latency("fall_detection", 0.3)
+        budget.record_capacity(_capacity(utilization=0.85, service_ms=100.0))
+
+        expected = inference_loop.TARGET_GPU_UTILIZATION / (8 * 0.1)
+        assert budget.fps_for("fall_detection") == pytest.approx(expected)
+
+    def test_headroom_raises_gain_and_overload_lowers_it(self):
+        budget = _budget(8)
+        for _ in range(20):
+            budget.record_capacity(_capacity(utilization=0.4))
+        raised = budget.gain
+
+        for _ in range(60):
+            budget.record_capacity(_capacity(utilization=1.0))
+
+        assert raised > 1.0
+        assert budget.gain < raised
+
+    def test_queueing_backs_off_even_when_utilization_is_low(self):
+        budget = _budget(8)
+        budget.record_capacity(_capacity(utilization=0.2, queue_depth=3))
+
+        assert budget.gain < 1.0
+
+    def test_gain_is_bounded(self):
+        budget = _budget(8)
+        for _ in range(1000):
+            budget.record_capacity(_capacity(utilization=0.0))
+
+        assert budget.gain == inference_loop.CAPACITY_GAIN_MAX
+
+    def test_stale_signal_falls_back(self, monkeypatch):
+        budget = _budget(4)
+        budget.record_latency("fall_detection", 0.3)
+        budget.record_capacity(_capacity(service_ms=10.0), now=0.0)
+        monkeypatch.setattr(
+            inference_loop.time,
+            "monotonic",
+            lambda: inference_loop.CAPACITY_SIGNAL_TTL_S + 1.0,
+        )
+
+        expected = inference_loop.MAX_GPU_UTILIZATION / (4 * 0.3)
+        assert budget.fps_for("fall_detection") == pytest.approx(
+            min(inference_loop.TARGET_FPS, expected)
+        )
@@ -0,0 +1,77 @@
+"""Unit tests for GET /analytics/devices/status.
+
+Tests:
+- Statement count is constant in the number of devices
+- Grouped rows fold into per-device totals, breakdowns and averages
+- Devices without violations in range are omitted, busiest first
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.analytics import get_devices_status
+from app.models import ViolationStatus, ViolationType
+from benchmarks.analytics_queries import RecordingSession, build_fleet
+
+
+def _window():
+    to_time = datetime.now(timezone.utc)
+    return to_time - timedelta(hours=24), to_time
+
+
+class TestDevicesStatus:
+    """Tests for the grouped device analytics query."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("devices", [1, 10, 100])
+    async def test_statement_count_is_constant(self, devices):
+        db = RecordingSession(*build_fleet(devices, violations_per_device=20))
+        from_time, to_time = _window()
+
+        response = await get_devices_status(db, from_time=from_time, to_time=to_time)
+
+        assert db.statements == 2
+        assert len(response.devices) == devices
+        assert response.summary.total_violations == devices * 20
+        assert response.summary.total_cameras == devices
+
+    @pytest.mark.asyncio
+    async def test_breakdowns_and_averages(self):
+        from_time, to_time = _window()
+        busy = SimpleNamespace(id=uuid4(), name="Dock")
+        quiet = SimpleNamespace(id=uuid4(), name="Gate")
+        idle = SimpleNamespace(id=uuid4(), name="Roof")
+        last = to_time - timedelta(minutes=5)
+
+        def violation(device, status, confidence, timestamp):
+            return SimpleNamespace(
+                device_id=device.id,
+                status=status,
+                type=ViolationType.FALL_DETECTED,
+                confidence=confidence,
+                timestamp=timestamp,
+            )
+
+        violations = [
+            violation(busy, ViolationStatus.OPEN, 0.9, last - timedelta(hours=1)),
+            violation(busy, ViolationStatus.OPEN, 0.7, last),
+            violation(busy, ViolationStatus.RESOLVED, 0.8, last - timedelta(hours=2)),
+            violation(quiet, ViolationStatus.DISMISSED, 0.6, last),
+            # Outside the window
+            violation(idle, ViolationStatus.OPEN, 0.9, from_time - timedelta(hours=1)),
+        ]
+        db = RecordingSession([busy, quiet, idle], violations)
+
+        response = await get_devices_status(db, from_time=from_time, to_time=to_time)
+
+        assert [d.camera_name for d in response.devices] == ["Dock", "Gate"]
+        dock = response.devices[0]
+        assert dock.violations_total == 3
+        assert dock.violations_by_status == {"open": 2, "resolved": 1}
+        assert dock.violations_by_type == {"fall_detected": 3}
+        assert dock.avg_confidence == 0.8
+        assert dock.last_violation_at == last
+        assert response.summary.total_violations == 4
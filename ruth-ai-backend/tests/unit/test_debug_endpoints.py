@@ -0,0 +1,78 @@
+"""Unit tests for the /debug profiling endpoints.
+
+Tests:
+- Routes hidden without INTERNAL_API_KEY, forbidden with a wrong key
+- Sampling profile returns collapsed stacks
+- Concurrent profiles are rejected
+- Task and executor dumps
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.internal import debug
+from app.core import profiling
+from app.core.config import get_settings
+
+API_KEY = "test-internal-key"
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(debug.router)
+    return app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("INTERNAL_API_KEY", API_KEY)
+    get_settings.cache_clear()
+    yield TestClient(_app(), headers={"X-Internal-API-Key": API_KEY})
+    monkeypatch.delenv("INTERNAL_API_KEY")
+    get_settings.cache_clear()
+
+
+class TestGuard:
+    """Tests for the internal API key guard."""
+
+    def test_hidden_without_key_configured(self, monkeypatch):
+        monkeypatch.delenv("INTERNAL_API_KEY", raising=False)
+        get_settings.cache_clear()
+
+        assert TestClient(_app()).get("/debug/tasks").status_code == 404
+
+    def test_wrong_key_forbidden(self, client):
+        response = client.get("/debug/tasks", headers={"X-Internal-API-Key": "x"})
+
+        assert response.status_code == 403
+
+
+class TestProfile:
+    """Tests for the profile, tasks and executors routes."""
+
+    def test_sample_returns_collapsed_stacks(self, client):
+        response = client.get(
+            "/debug/profile", params={"seconds": 0.1, "interval_ms": 5}
+        )
+
+        assert response.status_code == 200
+        assert int(response.headers["X-Profile-Samples"]) > 0
+        stack, count = response.text.splitlines()[0].rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+    def test_concurrent_profile_conflicts(self, client):
+        assert profiling._profile_lock.acquire(blocking=False)
+        try:
+            response = client.get("/debug/profile", params={"seconds": 0.05})
+        finally:
+            profiling._profile_lock.release()
+
+        assert response.status_code == 409
+
+    def test_tasks_and_executors(self, client):
+        tasks = client.get("/debug/tasks").json()
+        executors = client.get("/debug/executors").json()
+
+        assert tasks["count"] == len(tasks["tasks"]) >= 1
+        assert executors == {"default": executors["default"], "db_pool": None}
@@ -0,0 +1,96 @@
+"""Unit tests for FrameFetcher metadata extraction.
+
+Tests:
+- JPEG/PNG dimensions read from the image header
+- VAS header dimensions used for unrecognised formats
+- Sampled full-decode verification
+"""
+
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from app.integrations.unified_runtime.frame_fetcher import (
+    FrameFetcher,
+    read_image_header,
+)
+
+
+def _image_bytes(width: int, height: int, fmt: str = "JPEG", progressive: bool = False) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(
+        buffer, format=fmt, progressive=progressive
+    )
+    return buffer.getvalue()
+
+
+def _fetcher(image_bytes: bytes, header_dims=(None, None), **kwargs) -> FrameFetcher:
+    vas_client = MagicMock()
+    vas_client.get_latest_frame = AsyncMock(return_value=(image_bytes, *header_dims))
+    return FrameFetcher(vas_client, **kwargs)
+
+
+class TestReadImageHeader:
+    """Tests for header-only metadata parsing."""
+
+    def test_jpeg_dimensions(self):
+        assert read_image_header(_image_bytes(1280, 720)) == ("jpeg", 1280, 720)
+
+    def test_progressive_jpeg_dimensions(self):
+        data = _image_bytes(640, 480, progressive=True)
+        assert read_image_header(data) == ("jpeg", 640, 480)
+
+    def test_png_dimensions(self):
+        assert read_image_header(_image_bytes(320, 240, "PNG")) == ("png", 320, 240)
+
+    def test_unrecognised_data(self):
+        assert read_image_header(b"not an image") is None
+        assert read_image_header(b"\xff\xd8\xff") is None
+
+
+class TestFetchAndEncode:
+    """Tests for FrameFetcher.fetch_and_encode metadata handling."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_without_decoding(self):
+        fetcher = _fetcher(_image_bytes(1280, 720), header_dims=(1280, 720))
+
+        with patch("app.integrations.unified_runtime.frame_fetcher.Image.open") as image_open:
+            frame = await fetcher.fetch_and_encode(stream_id=uuid4())
+
+        image_open.assert_not_called()
+        assert (frame.format, frame.width, frame.height) == ("jpeg", 1280, 720)
+
+    @pytest.mark.asyncio
+    async def test_vas_dimensions_used_for_unknown_format(self):
+        fetcher = _fetcher(b"opaque frame bytes", header_dims=(1920, 1080))
+
+        frame = await fetcher.fetch_and_encode(stream_id=uuid4())
+
+        assert (frame.width, frame.height) == (1920, 1080)
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_without_vas_dimensions_is_rejected(self):
+        fetcher = _fetcher(b"opaque frame bytes")
+
+        with pytest.raises(ValueError, match="Invalid image data"):
+            await fetcher.fetch_and_encode(stream_id=uuid4())
+
+    @pytest.mark.asyncio
+    async def test_sampled_verification_decodes_frame(self):
+        fetcher = _fetcher(_image_bytes(640, 480), verify_sample_rate=1.0)
+
+        frame = await fetcher.fetch_and_encode(stream_id=uuid4())
+
+        assert (frame.width, frame.height) == (640, 480)
+
+    @pytest.mark.asyncio
+    async def test_sampled_verification_rejects_corrupt_frame(self):
+        data = _image_bytes(640, 480)
+        fetcher = _fetcher(data[: len(data) // 3], verify_sample_rate=1.0)
+
+        with pytest.raises(ValueError, match="Invalid image data"):
+            await fetcher.fetch_and_encode(stream_id=uuid4())
@@ -0,0 +1,56 @@
+"""Unit tests for the inference loop simulator.
+
+Tests:
+- A short run drives every camera through the real loop
+- Report carries fps, staleness, fairness and DB write rate
+- Jain's fairness index edge cases
+"""
+
+import pytest
+
+from benchmarks.inference_loop_sim import (
+    SimulationConfig,
+    jain_fairness,
+    run_simulation,
+)
+
+
+class TestSimulation:
+    """Tests for a short end-to-end simulation run."""
+
+    @pytest.mark.asyncio
+    async def test_short_run_reports_per_camera_metrics(self):
+        config = SimulationConfig(
+            cameras=4,
+            duration_s=1.5,
+            warmup_s=0.5,
+            vas_latency_ms=2.0,
+            vas_jitter_ms=1.0,
+            runtime_latency_ms=10.0,
+            runtime_overhead_ms=1.0,
+            violation_rate=0.0,
+        )
+
+        report = await run_simulation(config)
+
+        assert report["aggregate"]["throughput_fps"] > 0
+        assert report["per_camera_fps"]["min"] > 0
+        assert report["fairness"]["starved_cameras"] == 0
+        assert 0 < report["fairness"]["jain_index"] <= 1
+        assert report["staleness_ms"]["p95"] >= report["staleness_ms"]["p50"] > 0
+        assert report["aggregate"]["db_writes"]["session_counter"] > 0
+        assert report["aggregate"]["db_writes_per_second"] > 0
+        assert report["budget"]["scheduled_fps"] > 0
+
+
+class TestJainFairness:
+    """Tests for Jain's fairness index."""
+
+    def test_equal_shares_are_perfectly_fair(self):
+        assert jain_fairness([2.0, 2.0, 2.0]) == 1.0
+
+    def test_one_camera_taking_everything(self):
+        assert jain_fairness([4.0, 0.0, 0.0, 0.0]) == 0.25
+
+    def test_no_samples(self):
+        assert jain_fairness([0.0, 0.0]) == 0.0
@@ -0,0 +1,134 @@
+"""Unit tests for end-to-end inference timing and trace propagation.
+
+Tests:
+- Trace ID sent to the runtime as X-Request-ID
+- Runtime stage timings merged with backend fetch/encode/transport
+- Stage histograms recorded
+- Frame geometry adjusted for reduced-scale decode
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.core.metrics import inference_stage_latency_seconds
+from app.integrations.unified_runtime.client import UnifiedRuntimeClient
+from app.integrations.unified_runtime.frame_fetcher import FrameData
+from app.integrations.unified_runtime.router import RuntimeRouter
+
+
+RUNTIME_TIMING = {
+    "decode_ms": 4.0,
+    "preprocess_ms": 3.0,
+    "inference_ms": 80.0,
+    "postprocess_ms": 2.0,
+    "total_ms": 90.0,
+}
+
+
+def _runtime_payload(**overrides):
+    payload = {
+        "request_id": str(uuid4()),
+        "status": "success",
+        "model_id": "fall_detection",
+        "model_version": "1.0.0",
+        "inference_time_ms": 90.0,
+        "result": {"violation_detected": False},
+        "timing": RUNTIME_TIMING,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _client(handler) -> UnifiedRuntimeClient:
+    client = UnifiedRuntimeClient(runtime_url="http://runtime", timeout=5)
+    client._client = httpx.AsyncClient(
+        base_url="http://runtime", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _router(client: UnifiedRuntimeClient, width: int = 1920, height: int = 1080) -> RuntimeRouter:
+    router = RuntimeRouter(MagicMock(), unified_runtime_client=client)
+    router.frame_fetcher.fetch_and_encode = AsyncMock(
+        return_value=FrameData(
+            base64_data="ZmFrZQ==",
+            format="jpeg",
+            width=width,
+            height=height,
+            size_bytes=4,
+            fetch_ms=12.0,
+            encode_ms=1.5,
+        )
+    )
+    return router
+
+
+class TestTracePropagation:
+    """Tests for trace ID propagation to the runtime."""
+
+    @pytest.mark.asyncio
+    async def test_trace_id_sent_as_request_id_header(self):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["trace_id"] = request.headers.get("X-Request-ID")
+            return httpx.Response(
+                200, json=_runtime_payload(trace_id=seen["trace_id"])
+            )
+
+        result = await _router(_client(handler)).submit_inference(
+            model_id="fall_detection", stream_id=uuid4()
+        )
+
+        assert seen["trace_id"]
+        assert result["trace_id"] == seen["trace_id"]
+
+
+class TestStageTiming:
+    """Tests for the merged stage breakdown."""
+
+    @pytest.mark.asyncio
+    async def test_backend_and_runtime_stages_are_merged(self):
+        client = _client(lambda request: httpx.Response(200, json=_runtime_payload()))
+
+        result = await _router(client).submit_inference(
+            model_id="fall_detection", stream_id=uuid4()
+        )
+
+        timing = result["timing"]
+        assert timing["fetch_ms"] == 12.0
+        assert timing["encode_ms"] == 1.5
+        assert timing["inference_ms"] == 80.0
+        assert timing["transport_ms"] >= 0
+        assert timing["round_trip_ms"] >= timing["transport_ms"]
+
+        samples = inference_stage_latency_seconds.to_prometheus()
+        assert any('stage="inference"' in line for line in samples)
+        assert not any('stage="total"' in line for line in samples)
+
+    @pytest.mark.asyncio
+    async def test_runtime_without_timing_still_reports_backend_stages(self):
+        client = _client(
+            lambda request: httpx.Response(200, json=_runtime_payload(timing=None))
+        )
+
+        result = await _router(client).submit_inference(
+            model_id="fall_detection", stream_id=uuid4()
+        )
+
+        assert set(result["timing"]) == {"fetch_ms", "encode_ms", "round_trip_ms"}
+
+    @pytest.mark.asyncio
+    async def test_frame_geometry_follows_decode_scale(self):
+        client = _client(
+            lambda request: httpx.Response(200, json=_runtime_payload(decode_scale=4))
+        )
+
+        result = await _router(client, width=1920, height=1082).submit_inference(
+            model_id="fall_detection", stream_id=uuid4()
+        )
+
+        assert (result["frame_width"], result["frame_height"]) == (480, 271)
@@ -0,0 +1,67 @@
+"""Unit tests for the event loop lag monitor.
+
+Tests:
+- Heartbeat records lag into event_loop_lag_seconds
+- Blocking the loop shows up as lag
+- Watchdog names the coroutine that stalled the loop
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopMonitor
+from app.core.metrics import event_loop_lag_seconds, event_loop_stalls_total
+
+
+def _lag_count() -> int:
+    return event_loop_lag_seconds.labels().snapshot()[2]
+
+
+def _lag_samples_over(bucket: float) -> int:
+    cumulative, _, count = event_loop_lag_seconds.labels().snapshot()
+    return count - cumulative[event_loop_lag_seconds.buckets.index(bucket)]
+
+
+async def blocking_handler() -> None:
+    """Stands in for sync CPU work done on the loop (e.g. PIL decode)."""
+    time.sleep(0.3)
+
+
+class TestLoopMonitor:
+    """Tests for the heartbeat and stall watchdog."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_records_lag(self):
+        before = _lag_count()
+        monitor = LoopMonitor(interval=0.02)
+        monitor.start()
+        await asyncio.sleep(0.15)
+        await monitor.stop()
+
+        assert _lag_count() - before >= 3
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_as_lag(self):
+        before = _lag_samples_over(0.1)
+        monitor = LoopMonitor(interval=0.02)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await blocking_handler()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert _lag_samples_over(0.1) - before >= 1
+
+    @pytest.mark.asyncio
+    async def test_watchdog_names_stalling_coroutine(self):
+        monitor = LoopMonitor(interval=0.02, stall_threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(blocking_handler(), name="slow-handler")
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        samples = "\n".join(event_loop_stalls_total.to_prometheus())
+        assert 'coro="blocking_handler"' in samples
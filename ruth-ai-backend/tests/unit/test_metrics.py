@@ -0,0 +1,91 @@
+"""Unit tests for the metrics registry.
+
+Tests:
+- Label children are cached and validated
+- Histogram buckets are cumulative in exposition
+- Updates from many threads are not lost
+- Legacy labels= calls still work
+"""
+
+import threading
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+class TestLabels:
+    """Tests for label children."""
+
+    def test_children_are_cached(self, registry):
+        counter = registry.register_counter("c_total", "c", ["a", "b"])
+
+        assert counter.labels(a="1", b="2") is counter.labels(b="2", a="1")
+
+    def test_wrong_label_names_rejected(self, registry):
+        counter = registry.register_counter("c_total", "c", ["a"])
+
+        with pytest.raises(ValueError):
+            counter.labels(b="1")
+        with pytest.raises(ValueError):
+            counter.labels(a="1", b="2")
+
+    def test_missing_labels_are_ignored_on_legacy_calls(self, registry):
+        gauge = registry.register_gauge("g", "g", ["a"])
+
+        gauge.set(5)
+        gauge.set(3, {"a": "x"})
+        gauge.inc(2, {"a": "x"})
+
+        assert gauge.to_prometheus()[2:] == ['g{a="x"} 5']
+
+
+class TestHistogram:
+    """Tests for histogram exposition."""
+
+    def test_buckets_are_cumulative(self, registry):
+        histogram = registry.register_histogram("h", "h", ["op"], [0.1, 1.0])
+        child = histogram.labels(op="x")
+        for value in (0.05, 0.1, 0.5, 5.0):
+            child.observe(value)
+
+        assert histogram.to_prometheus()[2:] == [
+            'h_bucket{op="x",le="0.1"} 2',
+            'h_bucket{op="x",le="1.0"} 3',
+            'h_bucket{op="x",le="+Inf"} 4',
+            'h_sum{op="x"} 5.65',
+            'h_count{op="x"} 4',
+        ]
+
+    def test_unlabeled_histogram(self, registry):
+        histogram = registry.register_histogram("h", "h", [], [1.0])
+        histogram.observe(0.5)
+
+        assert 'h_bucket{le="1.0"} 1' in histogram.to_prometheus()
+
+
+class TestConcurrency:
+    """Tests for concurrent updates."""
+
+    def test_no_lost_increments(self, registry):
+        counter = registry.register_counter("c_total", "c", ["a"])
+        histogram = registry.register_histogram("h", "h", ["a"])
+
+        def work():
+            for _ in range(10_000):
+                counter.labels(a="x").inc()
+                histogram.labels(a="x").observe(0.01)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counter.labels(a="x").value == 40_000
+        assert histogram.labels(a="x").snapshot()[2] == 40_000
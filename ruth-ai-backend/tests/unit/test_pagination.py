@@ -0,0 +1,234 @@
+"""Unit tests for keyset pagination.
+
+Tests:
+- Cursor encode/decode round trip and malformed tokens
+- cursor and offset cannot be combined
+- Keyset statement seeks on (timestamp, id) and fetches one look-ahead row
+- Look-ahead row produces next_cursor; the last page has none
+- GET /violations and /events return next_cursor and skip the count on request
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.events import list_events
+from app.api.v1.violations import list_violations
+from app.core.errors import ValidationAPIError
+from app.core.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    resolve_cursor,
+    split_page,
+)
+from app.models import Event, EventType, Violation, ViolationStatus, ViolationType
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    """Minimal AsyncSession result over canned rows."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeSession:
+    """Returns a count for COUNT statements and canned rows otherwise."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if "count(*)" in str(stmt):
+            return FakeResult([len(self.rows)])
+        return FakeResult(self.rows)
+
+
+def _violation(minutes_ago: int):
+    timestamp = NOW - timedelta(minutes=minutes_ago)
+    return SimpleNamespace(
+        id=uuid4(),
+        type=ViolationType.FALL_DETECTED,
+        status=ViolationStatus.OPEN,
+        device_id=uuid4(),
+        camera_name="Dock",
+        confidence=0.9,
+        timestamp=timestamp,
+        model_id="fall_detection",
+        model_version="1.0.0",
+        bounding_boxes=None,
+        reviewed_by=None,
+        reviewed_at=None,
+        resolution_notes=None,
+        evidence=[],
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def _event(minutes_ago: int):
+    timestamp = NOW - timedelta(minutes=minutes_ago)
+    return SimpleNamespace(
+        id=uuid4(),
+        device_id=uuid4(),
+        stream_session_id=None,
+        event_type=EventType.FALL_DETECTED,
+        confidence=0.9,
+        timestamp=timestamp,
+        model_id="fall_detection",
+        model_version="1.0.0",
+        bounding_boxes=None,
+        frame_id=None,
+        inference_time_ms=None,
+        violation_id=None,
+        created_at=timestamp,
+    )
+
+
+class TestCursor:
+    """Tests for cursor tokens."""
+
+    def test_round_trip(self):
+        row_id = uuid4()
+
+        token = encode_cursor(NOW, row_id)
+
+        assert decode_cursor(token) == Cursor(NOW, row_id)
+        assert "=" not in token
+
+    @pytest.mark.parametrize(
+        "token", ["", "not-base64!", "Zm9v", encode_cursor(NOW, uuid4())[:-6]]
+    )
+    def test_malformed(self, token):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+
+    def test_resolve_rejects_bad_cursor(self):
+        with pytest.raises(ValidationAPIError):
+            resolve_cursor("Zm9v")
+
+    def test_resolve_rejects_cursor_with_offset(self):
+        with pytest.raises(ValidationAPIError):
+            resolve_cursor(encode_cursor(NOW, uuid4()), offset=100)
+
+    def test_resolve_without_cursor(self):
+        assert resolve_cursor(None, offset=100) is None
+
+
+class TestKeysetPage:
+    """Tests for the keyset statement and page splitting."""
+
+    def test_seeks_past_cursor(self):
+        cursor = Cursor(NOW, uuid4())
+        stmt = keyset_page(
+            select(Violation), Violation.timestamp, Violation.id, cursor, 50
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "(violations.timestamp, violations.id) <" in sql
+        assert "ORDER BY violations.timestamp DESC, violations.id DESC" in sql
+        assert stmt._limit == 51
+
+    def test_first_page_has_no_seek(self):
+        stmt = keyset_page(select(Event), Event.timestamp, Event.id, None, 10)
+
+        assert "WHERE" not in str(stmt)
+
+    def test_look_ahead_row_yields_cursor(self):
+        rows = [_violation(i) for i in range(4)]
+
+        page, next_cursor = split_page(rows, 3)
+
+        assert page == rows[:3]
+        assert decode_cursor(next_cursor) == Cursor(rows[2].timestamp, rows[2].id)
+
+    @pytest.mark.parametrize("count", [0, 2, 3])
+    def test_last_page_has_no_cursor(self, count):
+        page, next_cursor = split_page([_violation(i) for i in range(count)], 3)
+
+        assert len(page) == count
+        assert next_cursor is None
+
+
+class TestListingEndpoints:
+    """Tests for cursor pagination on the listing endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_violations_page_with_cursor(self):
+        db = FakeSession([_violation(i) for i in range(3)])
+
+        response = await list_violations(
+            db,
+            violation_status=None,
+            camera_id=None,
+            device_id=None,
+            since=None,
+            until=None,
+            limit=2,
+            cursor=None,
+            offset=0,
+            include_total=True,
+        )
+
+        assert len(response.items) == 2
+        assert response.total == 3
+        assert decode_cursor(response.next_cursor).id == response.items[-1].id
+
+    @pytest.mark.asyncio
+    async def test_violations_without_total_skip_count(self):
+        db = FakeSession([_violation(0)])
+
+        response = await list_violations(
+            db,
+            violation_status=None,
+            camera_id=None,
+            device_id=None,
+            since=None,
+            until=None,
+            limit=10,
+            cursor=encode_cursor(NOW, uuid4()),
+            offset=0,
+            include_total=False,
+        )
+
+        assert response.total is None
+        assert response.next_cursor is None
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_events_page_with_cursor(self):
+        db = FakeSession([_event(i) for i in range(5)])
+
+        response = await list_events(
+            db,
+            device_id=None,
+            event_type=None,
+            since=None,
+            limit=4,
+            cursor=None,
+            offset=0,
+            include_total=True,
+        )
+
+        assert len(response.events) == 4
+        assert response.total == 5
+        assert response.next_cursor is not None
@@ -0,0 +1,155 @@
+"""Unit tests for violation rollup reads.
+
+Tests:
+- Window planning into raw edges, hourly and daily rollup segments
+- Hour-granularity reads never use daily rollups
+- Compiled counts query reads violation_rollups and filters the raw edges
+- Rollup triggers are installed with the metadata on PostgreSQL
+"""
+
+from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import DDL
+
+from app.models import Base, ViolationType
+from app.models.violation_rollup import ROLLUP_CREATE_STATEMENTS
+from app.services.violation_rollups import (
+    Segment,
+    ceil_bucket,
+    floor_bucket,
+    plan_segments,
+    violation_counts,
+)
+
+
+def _at(day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(2026, 10, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestBuckets:
+    """Tests for bucket alignment helpers."""
+
+    def test_floor_and_ceil(self):
+        ts = _at(5, 13, 20)
+
+        assert floor_bucket(ts, "hour") == _at(5, 13)
+        assert ceil_bucket(ts, "hour") == _at(5, 14)
+        assert floor_bucket(ts, "day") == _at(5)
+        assert ceil_bucket(ts, "day") == _at(6)
+
+    def test_aligned_timestamp_is_its_own_ceiling(self):
+        assert ceil_bucket(_at(5, 13), "hour") == _at(5, 13)
+
+    def test_naive_is_utc_and_offsets_are_normalized(self):
+        plus_two = timezone(timedelta(hours=2))
+
+        assert floor_bucket(datetime(2026, 10, 5, 13, 20), "hour") == _at(5, 13)
+        assert floor_bucket(datetime(2026, 10, 5, 1, 30, tzinfo=plus_two), "day") == _at(4)
+
+
+class TestPlanSegments:
+    """Tests for splitting a window across rollups and raw rows."""
+
+    def test_aligned_window_is_all_rollups(self):
+        assert plan_segments(_at(5, 10), _at(5, 14)) == [
+            Segment("hour", _at(5, 10), _at(5, 14)),
+        ]
+
+    def test_ragged_edges_come_from_raw_rows(self):
+        assert plan_segments(_at(5, 10, 15), _at(5, 14, 45)) == [
+            Segment("raw", _at(5, 10, 15), _at(5, 11)),
+            Segment("hour", _at(5, 11), _at(5, 14)),
+            Segment("raw", _at(5, 14), _at(5, 14, 45)),
+        ]
+
+    def test_window_inside_one_hour_is_raw(self):
+        assert plan_segments(_at(5, 10, 15), _at(5, 10, 45)) == [
+            Segment("raw", _at(5, 10, 15), _at(5, 10, 45)),
+        ]
+
+    def test_day_finest_uses_daily_rollups_for_whole_days(self):
+        assert plan_segments(_at(3, 22, 30), _at(6, 2), finest="day") == [
+            Segment("raw", _at(3, 22, 30), _at(3, 23)),
+            Segment("hour", _at(3, 23), _at(4)),
+            Segment("day", _at(4), _at(6)),
+            Segment("hour", _at(6), _at(6, 2)),
+        ]
+
+    def test_hour_finest_never_uses_daily_rollups(self):
+        segments = plan_segments(_at(3, 22, 30), _at(6, 2), finest="hour")
+
+        assert {s.source for s in segments} == {"raw", "hour"}
+
+    def test_day_finest_without_a_whole_day_uses_hours(self):
+        assert plan_segments(_at(5, 1), _at(5, 23), finest="day") == [
+            Segment("hour", _at(5, 1), _at(5, 23)),
+        ]
+
+    def test_segments_cover_the_window(self):
+        start, end = _at(1, 7, 13), _at(9, 18, 2)
+        segments = plan_segments(start, end, finest="day")
+
+        assert segments[0].start == start
+        assert segments[-1].end == end
+        for before, after in pairwise(segments):
+            assert before.end == after.start
+
+    def test_empty_window(self):
+        assert plan_segments(_at(5, 10), _at(5, 10)) == []
+
+
+class TestViolationCounts:
+    """Tests for the stitched counts subquery."""
+
+    def test_reads_rollups_and_raw_edges(self):
+        counts = violation_counts(_at(3, 22, 30), _at(6, 2), finest="day")
+        sql = _sql(select(counts.c.status, func.sum(counts.c.count)).group_by(counts.c.status))
+
+        assert "FROM violation_rollups" in sql
+        assert "FROM violations" in sql
+        assert sql.count("UNION ALL") == 3
+
+    def test_aligned_window_skips_raw_table(self):
+        counts = violation_counts(_at(5), _at(6), finest="day")
+
+        assert "FROM violations" not in _sql(select(counts))
+
+    def test_filters_apply_to_every_part(self):
+        counts = violation_counts(
+            _at(5, 10, 15),
+            _at(5, 14, 45),
+            device_id=uuid4(),
+            violation_type=ViolationType.FALL_DETECTED,
+        )
+        sql = _sql(select(counts))
+
+        assert sql.count("violations.device_id =") == 2
+        assert sql.count("violation_rollups.device_id =") == 1
+        assert sql.count("violation_rollups.type =") == 1
+
+    def test_empty_window_still_selects(self):
+        counts = violation_counts(_at(5, 10), _at(5, 10))
+
+        assert "FROM violations" in _sql(select(counts))
+
+
+class TestRollupDDL:
+    """Tests for trigger installation with the metadata."""
+
+    def test_triggers_created_after_tables(self):
+        listeners = [
+            fn.__self__ if hasattr(fn, "__self__") else fn
+            for fn in Base.metadata.dispatch.after_create
+        ]
+        statements = [ddl.statement for ddl in listeners if isinstance(ddl, DDL)]
+
+        for statement in ROLLUP_CREATE_STATEMENTS:
+            assert statement in statements